@@ -4,11 +4,6 @@ from ...application.errors.errors import ResourceNotFoundError
 from ...domain.entities.warehouse_dto import WarehouseDTO
 from ...domain.repositories.warehouse_repository import WarehouseRepository
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 
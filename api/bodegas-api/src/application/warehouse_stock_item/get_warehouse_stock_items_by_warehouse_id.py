@@ -1,13 +1,10 @@
 import logging
 
+from ..errors.errors import ValidationApiError
+from ...domain.entities.page_dto import PageDTO, page_size
 from ...domain.entities.warehouse_stock_item_dto import WarehouseStockItemDTO
 from ...domain.repositories.warehouse_stock_item_repository import WarehouseStockItemRepository
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -37,4 +34,20 @@ class GetWarehouseStockItemsByWarehouseId:
         warehouse_stock_items = self.warehouse_stock_item_repository.get_by_warehouse_id(warehouse_id)
         
         logger.debug(f"[GET_WAREHOUSE_STOCK_ITEMS_BY_WAREHOUSE_ID] Successfully retrieved {len(warehouse_stock_items)} warehouse stock items for warehouse ID: {warehouse_id}")
-        return warehouse_stock_items
\ No newline at end of file
+        return warehouse_stock_items
+
+    def execute_page(self, warehouse_id: str, limit: str = None, cursor: str = None) -> PageDTO:
+        """
+        Execute the use case to retrieve a page of the warehouse stock items of a given warehouse.
+
+        :param warehouse_id: ID of the warehouse
+        :param limit: Requested page size, capped at the maximum page size
+        :param cursor: Cursor returned with the previous page, None for the first page
+        :return: Page of warehouse stock item DTOs
+        """
+        logger.debug(f"[GET_WAREHOUSE_STOCK_ITEMS_BY_WAREHOUSE_ID] Starting retrieval of a page of warehouse stock items for warehouse ID: {warehouse_id}")
+        try:
+            return self.warehouse_stock_item_repository.get_page_by_warehouse_id(warehouse_id, page_size(limit), cursor)
+        except ValueError as e:
+            logger.error(f"[GET_WAREHOUSE_STOCK_ITEMS_BY_WAREHOUSE_ID] Invalid page request: {e}")
+            raise ValidationApiError
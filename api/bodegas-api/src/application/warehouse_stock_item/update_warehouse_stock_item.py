@@ -4,11 +4,6 @@ from ...application.errors.errors import ResourceNotFoundError
 from ...domain.entities.warehouse_stock_item_dto import WarehouseStockItemDTO
 from ...domain.repositories.warehouse_stock_item_repository import WarehouseStockItemRepository
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from ..entities.page_dto import PageDTO
 from ..entities.warehouse_stock_item_dto import WarehouseStockItemDTO
 
 
@@ -34,6 +35,17 @@ class WarehouseStockItemRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_page_by_warehouse_id(self, warehouse_id: str, limit: int, cursor: str = None) -> PageDTO:
+        """
+        Retrieves a page of the warehouse stock items of a given warehouse.
+        :param warehouse_id: ID of the warehouse
+        :param limit: Maximum number of stock items of the page
+        :param cursor: Cursor returned with the previous page, None for the first page
+        :return: PageDTO of WarehouseStockItemDTO objects
+        """
+        pass
+
     @abstractmethod
     def get_by_item_id(self, item_id: str) -> list[WarehouseStockItemDTO]:
         """
@@ -1,25 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
 import requests
 
-from ...domain.exceptions.authentication_error import AuthenticationError
 from ...domain.ports.token_validator import TokenValidatorPort
+from ...domain.exceptions.authentication_error import AuthenticationError
 
 
 class TokenValidatorAdapter(TokenValidatorPort):
     """
     Adapter for validating JWT tokens using an external authentication service.
+
+    When a signing key is configured the token signature and expiry are verified locally,
+    and the user information returned by the authentication service is cached per token
+    until the token expires. The external service is only called on a cache miss; when it
+    rejects a correctly signed token, every cached token of that user is revoked.
     """
 
-    def __init__(self, auth_service_url: str):
+    def __init__(self, auth_service_url: str, secret_key: str = None, algorithm: str = "HS256",
+                 cache_size: int = 1024, cache_ttl: int = 300):
         """
         Initializes the adapters with the URL of the authentication service.
         :param auth_service_url: URL of the authentication service.
+        :param secret_key: Key used to sign the tokens. If None, every token is validated remotely.
+        :param algorithm: Algorithm used to sign the tokens.
+        :param cache_size: Maximum number of tokens kept in the cache.
+        :param cache_ttl: Maximum number of seconds a token is kept in the cache.
         """
         self.auth_service_url = auth_service_url
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
 
     def validate_token(self, token: str) -> dict:
         """
-        Validates a JWT token using the external authentication service.
+        Validates a JWT token, locally when a signing key is configured, otherwise
+        using the external authentication service.
+        :param token: JWT token to validate.
+        :return: User information dictionary if valid.
+        :raises AuthenticationError: If token is invalid.
+        """
+        if not self.secret_key:
+            return self._fetch_user(token)
+
+        claims = self._verify_token(token)
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(token)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(token)
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+
+        user_data = self._fetch_user(token, claims.get('email'))
+        expires_at = min(claims['exp'], now + self.cache_ttl)
+
+        with self._lock:
+            self._cache[token] = (expires_at, user_data)
+            self._cache.move_to_end(token)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return dict(user_data)
+
+    def revoke_user(self, email: str) -> None:
+        """
+        Removes every cached token of a user, so the next request is validated remotely.
+        :param email: Email of the revoked user.
+        """
+        with self._lock:
+            revoked = [token for token, (_, user_data) in self._cache.items() if user_data.get('email') == email]
+            for token in revoked:
+                del self._cache[token]
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+        :return: Dictionary with the hits, misses and current size of the cache.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache)}
+
+    def register_metrics(self, registry) -> None:
+        """
+        Publish the cache counters as metrics of a registry, read when the metrics are scraped.
+        """
+        def sample(key):
+            return lambda: [({}, self.stats()[key])]
+
+        registry.collector("auth_token_cache_hits_total", "counter", "Tokens validated from the cache",
+                           sample("hits"))
+        registry.collector("auth_token_cache_misses_total", "counter", "Tokens validated by the users API",
+                           sample("misses"))
+        registry.collector("auth_token_cache_entries", "gauge", "Tokens kept in the cache", sample("size"))
+
+    def _verify_token(self, token: str) -> dict:
+        """
+        Verifies the signature and expiry of a JWT token.
+        :param token: JWT token to verify.
+        :return: Token claims.
+        :raises AuthenticationError: If the signature is invalid or the token expired.
+        """
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm], options={'require': ['exp']})
+        except jwt.InvalidTokenError as e:
+            self._evict(token)
+            raise AuthenticationError(f"Invalid token: {str(e)}")
+
+    def _fetch_user(self, token: str, email: str = None) -> dict:
+        """
+        Gets the user information of a token from the external authentication service.
         :param token: JWT token to validate.
+        :param email: Email of the token claims, whose cached tokens are revoked if the service rejects the user.
         :return: User information dictionary if valid.
         :raises AuthenticationError: If token is invalid.
         """
@@ -29,8 +130,15 @@ class TokenValidatorAdapter(TokenValidatorPort):
             response = requests.get(f"{self.auth_service_url}/me", headers=headers)
 
             if response.status_code != 200:
+                self._evict(token)
+                if email and response.status_code < 500:
+                    self.revoke_user(email)
                 raise AuthenticationError(f"Token validation failed: {response.status_code}")
 
             return response.json()
         except requests.RequestException as e:
-            raise AuthenticationError(f"Error connecting to users API: {str(e)}")
\ No newline at end of file
+            raise AuthenticationError(f"Error connecting to users API: {str(e)}")
+
+    def _evict(self, token: str) -> None:
+        with self._lock:
+            self._cache.pop(token, None)
@@ -2,14 +2,10 @@ import logging
 
 from ..dao.warehouse_stock_item_dao import WarehouseStockItemDAO
 from ..mapper.warehouse_stock_item_mapper import WarehouseStockItemMapper
+from ...domain.entities.page_dto import PageDTO
 from ...domain.entities.warehouse_stock_item_dto import WarehouseStockItemDTO
 from ...domain.repositories.warehouse_stock_item_repository import WarehouseStockItemRepository
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +47,15 @@ class WarehouseStockItemAdapter(WarehouseStockItemRepository):
             f"[GET_BY_WAREHOUSE] Retrieved {len(stock_item_list)} stock items | Sold Items: {sum(1 for item in stock_item_list if item.sold)}")
         return WarehouseStockItemMapper.to_dto_list(stock_item_list)
 
+    def get_page_by_warehouse_id(self, warehouse_id: str, limit: int, cursor: str = None) -> PageDTO:
+        """
+        Retrieves a page of the warehouse stock items of a given warehouse.
+        """
+        logger.debug(f"[GET_PAGE_BY_WAREHOUSE] Beginning retrieval of {limit} stock items for Warehouse ID: {warehouse_id}")
+        stock_item_list, next_cursor = WarehouseStockItemDAO.get_page_by_warehouse_id(warehouse_id, limit, cursor)
+        logger.debug(f"[GET_PAGE_BY_WAREHOUSE] Retrieved {len(stock_item_list)} stock items | Last page: {next_cursor is None}")
+        return PageDTO(WarehouseStockItemMapper.to_dto_list(stock_item_list), next_cursor)
+
     def get_by_item_id(self, item_id: str) -> list[WarehouseStockItemDTO]:
         """
         Retrieves all warehouse stock items for a given abstract product.
@@ -1,3 +1,4 @@
+from .pagination import paginate
 from ..database.declarative_base import Session
 from ..model.warehouse_stock_item_model import WarehouseStockItemModel
 
@@ -88,6 +89,20 @@ class WarehouseStockItemDAO:
         session.close()
         return stock_items
 
+    @classmethod
+    def get_page_by_warehouse_id(cls, warehouse_id: str, limit: int,
+                                 cursor: str = None) -> tuple[list[WarehouseStockItemModel], str | None]:
+        """
+        Get a page of the warehouse stock item records of a warehouse.
+        :param warehouse_id: ID of the warehouse to retrieve stock items for.
+        :param limit: Maximum number of stock items of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :return: Tuple of (stock items, cursor of the next page)
+        """
+        with Session() as session:
+            query = session.query(WarehouseStockItemModel).filter(WarehouseStockItemModel.warehouse_id == warehouse_id)
+            return paginate(query, [WarehouseStockItemModel.warehouse_stock_item_id], limit, cursor)
+
     @classmethod
     def get_by_item_id(cls, item_id: str) -> list[WarehouseStockItemModel]:
         """
@@ -0,0 +1,224 @@
+"""
+Database runtime of a service: the SQLAlchemy engine with its pool settings, the unit of work of the requests
+and messages, and the pool metrics, configured from the environment.
+
+Sessions opened inside a unit of work share a single connection, checked out of the pool on first use and
+returned when the unit of work ends, so a use case checks out one connection however many DAO calls it makes.
+Each session still commits, rolls back and closes on its own; only the connection is shared. Outside a unit of
+work every session checks out its own connection, as before.
+
+Each service is built on its own, so the services keep an identical copy of this module in
+src/infrastructure/database.
+
+Environment:
+    DATABASE_URL: URL of the database, otherwise built from DB_USER, DB_PASSWORD, DB_HOST, DB_PORT and DB_NAME
+    DB_POOL_SIZE: Connections kept open by the pool, 5 by default
+    DB_MAX_OVERFLOW: Connections opened beyond the pool size under load, 10 by default
+    DB_POOL_TIMEOUT: Seconds to wait for a connection before failing, 30 by default
+    DB_POOL_RECYCLE: Seconds after which a connection is replaced, 1800 by default, -1 to keep them
+    DB_POOL_PRE_PING: Test the connections on checkout, true by default
+    DB_STATEMENT_TIMEOUT_MS: Milliseconds a statement may run on PostgreSQL, 0 (no limit) by default
+"""
+import contextvars
+import os
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+
+def database_url(environ=None) -> str:
+    """URL of the database of the service"""
+    environ = os.environ if environ is None else environ
+    url = environ.get('DATABASE_URL')
+    if not url:
+        url = (f"postgresql://{environ.get('DB_USER')}:{environ.get('DB_PASSWORD')}"
+               f"@{environ.get('DB_HOST')}:{environ.get('DB_PORT')}/{environ.get('DB_NAME')}")
+    return url
+
+
+class PoolStats:
+    """Checkouts of the connection pool, the time they waited for a connection and the saturation of the pool"""
+
+    def __init__(self, capacity: int = None):
+        self.capacity = capacity
+        self.engine = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record_checkout(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def to_dict(self) -> dict:
+        pool = self.engine.pool if self.engine is not None else None
+        checked_out = pool.checkedout() if isinstance(pool, QueuePool) else None
+        return {
+            "size": pool.size() if isinstance(pool, QueuePool) else None,
+            "capacity": self.capacity,
+            "checkedOut": checked_out,
+            "overflow": max(pool.overflow(), 0) if isinstance(pool, QueuePool) else None,
+            "saturation": round(checked_out / self.capacity, 4) if checked_out is not None and self.capacity else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "averageWaitSeconds": round(self.wait_seconds / self.checkouts, 6) if self.checkouts else None,
+            "maxWaitSeconds": round(self.max_wait_seconds, 6),
+        }
+
+
+def _measured_pool_class(stats: PoolStats):
+    """Queue pool timing its checkouts; the pool recreated by engine.dispose keeps the class, so the stats too"""
+
+    class MeasuredQueuePool(QueuePool):
+
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except exc.TimeoutError:
+                stats.record_checkout(time.perf_counter() - start, timed_out=True)
+                raise
+            stats.record_checkout(time.perf_counter() - start)
+            return connection
+
+    return MeasuredQueuePool
+
+
+class _UnitOfWork:
+    """Connection shared by the sessions of a unit of work, checked out on first use"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.connection = None
+
+    def connect(self):
+        if self.connection is None or self.connection.closed:
+            self.connection = self.engine.connect()
+        return self.connection
+
+    def close(self) -> None:
+        if self.connection is not None:
+            # Rolls back what a failed use case left open before returning the connection to the pool
+            self.connection.close()
+            self.connection = None
+
+
+class DatabaseRuntime:
+    """
+    Engine and sessions of the service.
+
+    Args:
+        url: URL of the database, from the environment by default
+        environ: Settings, os.environ by default
+    """
+
+    def __init__(self, url: str = None, environ=None):
+        environ = os.environ if environ is None else environ
+        self.url = url or database_url(environ)
+        url = make_url(self.url)
+        backend = url.get_backend_name()
+
+        options = {"pool_pre_ping": environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'}
+        # An in-memory SQLite database lives in its connection, it keeps the single connection pool of SQLAlchemy
+        if backend == 'sqlite' and url.database in (None, '', ':memory:'):
+            self.stats = PoolStats()
+        else:
+            pool_size = int(environ.get('DB_POOL_SIZE', 5))
+            max_overflow = int(environ.get('DB_MAX_OVERFLOW', 10))
+            self.stats = PoolStats(pool_size + max(max_overflow, 0))
+            options.update(poolclass=_measured_pool_class(self.stats), pool_size=pool_size,
+                           max_overflow=max_overflow, pool_timeout=float(environ.get('DB_POOL_TIMEOUT', 30)),
+                           pool_recycle=int(environ.get('DB_POOL_RECYCLE', 1800)))
+
+        statement_timeout = int(environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+        if statement_timeout and backend == 'postgresql':
+            options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+
+        self.engine = create_engine(self.url, **options)
+        self.stats.engine = self.engine
+        self._sessions = sessionmaker(bind=self.engine)
+        self._unit_of_work = contextvars.ContextVar(f"unit_of_work_{id(self)}", default=None)
+
+    def session(self, **options):
+        """
+        Open a session, on the connection of the current unit of work if there is one.
+        While another session keeps a transaction open on that connection the new session gets its own
+        connection, so it never joins a transaction it would not commit.
+        """
+        unit_of_work = self._unit_of_work.get()
+        if unit_of_work is not None and "bind" not in options:
+            connection = unit_of_work.connect()
+            if not connection.in_transaction():
+                options["bind"] = connection
+        return self._sessions(**options)
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Share one connection between the sessions opened in the block, e.g. the DAO calls of a use case.
+        A unit of work inside another one joins it.
+        """
+        if self._unit_of_work.get() is not None:
+            yield
+            return
+
+        unit_of_work = _UnitOfWork(self.engine)
+        token = self._unit_of_work.set(unit_of_work)
+        try:
+            yield
+        finally:
+            self._unit_of_work.reset(token)
+            unit_of_work.close()
+
+    def init_app(self, app) -> None:
+        """
+        Run each request of a Flask application in a unit of work.
+        """
+        from flask import g
+
+        @app.before_request
+        def begin_unit_of_work():
+            g.unit_of_work = ExitStack()
+            g.unit_of_work.enter_context(self.unit_of_work())
+
+        @app.teardown_request
+        def end_unit_of_work(error=None):
+            unit_of_work = g.pop('unit_of_work', None)
+            if unit_of_work is not None:
+                unit_of_work.close()
+
+    def register_metrics(self, registry) -> None:
+        """
+        Publish the pool statistics as metrics of a registry, read when the metrics are scraped.
+        """
+        def sample(key):
+            return lambda: [({}, self.stats.to_dict()[key])]
+
+        registry.collector("db_pool_checked_out_connections", "gauge", "Connections checked out of the pool",
+                           sample("checkedOut"))
+        registry.collector("db_pool_saturation_ratio", "gauge", "Checked out connections over the pool capacity",
+                           sample("saturation"))
+        registry.collector("db_pool_checkouts_total", "counter", "Connections checked out of the pool",
+                           sample("checkouts"))
+        registry.collector("db_pool_checkout_timeouts_total", "counter", "Checkouts that gave up waiting",
+                           sample("timeouts"))
+        registry.collector("db_pool_checkout_wait_seconds_total", "counter", "Seconds the checkouts waited",
+                           lambda: [({}, self.stats.wait_seconds)])
+        registry.collector("db_pool_checkout_wait_seconds_max", "gauge", "Longest wait of a checkout",
+                           sample("maxWaitSeconds"))
+
+    def dispose(self) -> None:
+        """
+        Close the connections of the pool, e.g. before forking or when the process exits.
+        """
+        self.engine.dispose()
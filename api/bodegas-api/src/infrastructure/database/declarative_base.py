@@ -5,9 +5,10 @@ Declarative base for SQLAlchemy models.
 import os
 import sys
 
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+
+from .database_runtime import DatabaseRuntime
+from ..monitoring.metrics import REGISTRY
 
 # Check if we're running tests
 is_test = 'pytest' in sys.modules
@@ -35,8 +36,12 @@ else:
 
         db_path = f'postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
 
-engine = create_engine(db_path)
-Session = sessionmaker(bind=engine)
+# Engine of the service, with the pool settings of the environment
+database = DatabaseRuntime(db_path)
+engine = database.engine
+Session = database.session
+unit_of_work = database.unit_of_work
+database.register_metrics(REGISTRY)
 
 Base = declarative_base()
 
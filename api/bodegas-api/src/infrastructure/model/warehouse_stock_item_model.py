@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, Float, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Float, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -14,6 +14,10 @@ class WarehouseStockItemModel(Base):
     """
 
     __tablename__ = 'warehouse_stock_item'
+    __table_args__ = (
+        # Sort key of the paginated stock of a warehouse
+        Index('ix_warehouse_stock_item_warehouse_id_id', 'warehouse_id', 'warehouse_stock_item_id'),
+    )
 
     warehouse_stock_item_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     warehouse_id = Column(UUID(as_uuid=True), ForeignKey('warehouse.id'), nullable=False)
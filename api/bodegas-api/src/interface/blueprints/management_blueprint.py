@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify
 
+from ...infrastructure.database.declarative_base import database
+
 management_blueprint = Blueprint('management', __name__)
 
 
@@ -8,4 +10,12 @@ def health_check():
     """
     Endpoint to check the health of the service.
     """
-    return jsonify({"status": "healthy"}), 200
\ No newline at end of file
+    return jsonify({"status": "healthy"}), 200
+
+
+@management_blueprint.route('/health/database', methods=['GET'])
+def database_pool():
+    """
+    Connection pool of the service: checkouts, the time they waited for a connection and the pool saturation.
+    """
+    return jsonify(database.stats.to_dict()), 200
@@ -13,11 +13,6 @@ from ...application.errors.errors import ValidationApiError, ResourceNotFoundErr
 from ...domain.entities.warehouse_dto import WarehouseDTO
 from ...infrastructure.adapters.warehouse_adapter import WarehouseAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 
 warehouse_adapter = WarehouseAdapter()
 
@@ -12,11 +12,6 @@ from ...application.errors.errors import ValidationApiError, ResourceNotFoundErr
 from ...domain.entities.warehouse_stock_item_dto import WarehouseStockItemDTO
 from ...infrastructure.adapters.warehouse_stock_item_adapter import WarehouseStockItemAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 
 warehouse_stock_item_adapter = WarehouseStockItemAdapter()
 
@@ -121,6 +116,10 @@ def get_warehouse_stock_items_by_warehouse(warehouse_id):
 
     logging.debug("starting warehouse stock items retrieval process for warehouse_id: %s", warehouse_id)
     use_case = GetWarehouseStockItemsByWarehouseId(warehouse_stock_item_adapter)
+    if 'limit' in request.args or 'cursor' in request.args:
+        page = use_case.execute_page(warehouse_id, request.args.get('limit'), request.args.get('cursor'))
+        return jsonify(page.to_dict()), 200
+
     warehouse_stock_items = use_case.execute(warehouse_id)
     return jsonify([item.to_dict() for item in warehouse_stock_items]), 200
 
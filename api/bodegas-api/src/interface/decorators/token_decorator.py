@@ -7,8 +7,16 @@ from ...application.errors.errors import ApiError
 from ...domain.exceptions.authentication_error import AuthenticationError
 from ...infrastructure.config.container import DependencyContainer
 
+
+def _get_container() -> DependencyContainer:
+    """Container of the app, built once for an app created without one so its token cache is kept"""
+    if not hasattr(current_app, 'container'):
+        current_app.container = DependencyContainer()
+    return current_app.container
+
+
 # Create a proxy to access the dependency container
-container = LocalProxy(lambda: current_app.container if hasattr(current_app, 'container') else DependencyContainer())
+container = LocalProxy(_get_container)
 
 
 def token_required(authorized_roles=None):
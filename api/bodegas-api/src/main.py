@@ -1,17 +1,38 @@
 import logging
+import os
 
 from dotenv import load_dotenv
 from flask import Flask, jsonify
 
 loaded = load_dotenv('.env.development')
 
-from .infrastructure.database.declarative_base import Base, engine
+from .infrastructure.config.container import DependencyContainer
+from .infrastructure.database.declarative_base import Base, database, engine
 from .interface.blueprints.management_blueprint import management_blueprint
 from .interface.blueprints.warehouse_blueprint import warehouse_blueprint
 from .interface.blueprints.warehouse_stock_item_blueprint import warehouse_stock_item_blueprint
 from .application.errors.errors import ApiError
+from .infrastructure.monitoring.metrics import init_metrics
+from .application.utils.structured_logging import configure_logging
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging('bodegas-api')
+
+
+def create_schema():
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    logging.debug(">> Create schema")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+
+def shutdown(timeout=30):
+    """
+    Release the resources of the process, called by the server when a worker exits.
+    :param timeout: Seconds the shutdown may wait, in total.
+    """
+    engine.dispose()
 
 
 def create_app():
@@ -20,14 +41,19 @@ def create_app():
     """
     logging.debug('warehouses microservice started')
     app = Flask(__name__)
+    # One connection checkout per request, however many DAO calls it makes
+    database.init_app(app)
+    init_metrics(app)
+    # One token validator per process, so the requests share its cache
+    app.container = DependencyContainer()
 
     app.register_blueprint(management_blueprint)
     app.register_blueprint(warehouse_blueprint)
     app.register_blueprint(warehouse_stock_item_blueprint)
 
-    # Create schema
-    logging.debug(">> Create schema")
-    Base.metadata.create_all(engine)
+    # Under gunicorn the master created the schema before forking the workers
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        create_schema()
 
     @app.errorhandler(ApiError)
     def handle_error(error):
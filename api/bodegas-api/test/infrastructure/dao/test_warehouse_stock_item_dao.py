@@ -188,6 +188,26 @@ class TestWarehouseStockItemDAO:
         mock_session.close.assert_called_once()
         assert result == mock_stock_items
 
+    @patch('src.infrastructure.dao.warehouse_stock_item_dao.paginate')
+    @patch('src.infrastructure.dao.warehouse_stock_item_dao.Session')
+    def test_get_page_by_warehouse_id(self, mock_session_class, mock_paginate):
+        """Test get_page_by_warehouse_id method"""
+        # Arrange
+        mock_session = MagicMock()
+        mock_session_class.return_value.__enter__.return_value = mock_session
+        mock_stock_items = [MagicMock(spec=WarehouseStockItemModel)]
+        mock_paginate.return_value = (mock_stock_items, "next-cursor")
+
+        # Act
+        result = WarehouseStockItemDAO.get_page_by_warehouse_id("w123", 10, "cursor")
+
+        # Assert
+        mock_session.query.assert_called_once_with(WarehouseStockItemModel)
+        query, sort_columns, limit, cursor = mock_paginate.call_args[0]
+        assert query == mock_session.query.return_value.filter.return_value
+        assert (limit, cursor) == (10, "cursor")
+        assert result == (mock_stock_items, "next-cursor")
+
     @patch('src.infrastructure.dao.warehouse_stock_item_dao.Session')
     def test_get_by_item_id(self, mock_session_class):
         """Test get_by_item_id method"""
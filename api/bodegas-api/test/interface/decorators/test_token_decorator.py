@@ -0,0 +1,47 @@
+import time
+
+import jwt
+from flask import Flask, jsonify
+from unittest.mock import MagicMock, patch
+
+from src.interface.decorators.token_decorator import token_required
+
+SECRET_KEY = "test-secret-key-for-token-validation"
+USER_DATA = {"id": "u1", "name": "Test User", "phone": "123", "email": "user@test.com", "role": "DIRECTIVO"}
+
+
+def build_token():
+    now = int(time.time())
+    payload = {"iat": now, "exp": now + 1800, "email": USER_DATA["email"], "role": USER_DATA["role"]}
+    return jwt.encode(payload, SECRET_KEY, algorithm="HS256")
+
+
+def ok_response():
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = dict(USER_DATA)
+    return response
+
+
+class TestTokenDecorator:
+    """Test suite for the token_required decorator"""
+
+    @patch.dict('os.environ', {'JWT_KEY': SECRET_KEY})
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_requests_share_the_token_cache(self, mock_get):
+        """Test a token is only validated remotely once across the requests of the app"""
+        mock_get.return_value = ok_response()
+        app = Flask(__name__)
+
+        @app.route('/protected')
+        @token_required(['DIRECTIVO'])
+        def protected():
+            return jsonify({"ok": True})
+
+        headers = {'Authorization': f'Bearer {build_token()}'}
+        with app.test_client() as client:
+            first = client.get('/protected', headers=headers)
+            second = client.get('/protected', headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        mock_get.assert_called_once()
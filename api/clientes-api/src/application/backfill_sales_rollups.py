@@ -0,0 +1,40 @@
+import logging
+from datetime import date
+
+from .errors.errors import InvalidFormatError
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillSalesRollups:
+    """
+    Use case for rebuilding the daily sales rollups from the existing orders.
+    """
+
+    def __init__(self, sales_rollups_repository):
+        self.sales_rollups_repository = sales_rollups_repository
+
+    def execute(self, start_date: str = None, end_date: str = None) -> int:
+        """
+        Rebuild the rollups of a range of days, or of the whole history when no range is given.
+        :param start_date: First day to rebuild in format 'YYYY-MM-DD'.
+        :param end_date: Last day to rebuild in format 'YYYY-MM-DD'.
+        :return: Number of rollup rows written.
+        """
+        start, end = self._parse_date(start_date), self._parse_date(end_date)
+        if start and end and start > end:
+            raise InvalidFormatError("La fecha inicial debe ser anterior a la fecha final.")
+
+        logger.debug(f"Rebuilding sales rollups from {start or 'the first order'} to {end or 'the last order'}")
+        rows = self.sales_rollups_repository.rebuild(start, end)
+        logger.info(f"Sales rollups rebuilt with {rows} rows")
+        return rows
+
+    @staticmethod
+    def _parse_date(value: str) -> date | None:
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise InvalidFormatError("Las fechas deben tener el formato AAAA-MM-DD.")
@@ -1,32 +1,30 @@
-import logging
 import uuid
+from datetime import datetime, timezone
 
+from .errors.errors import PaymentGatewayUnavailableError
 from .utils.validation_utils import validate
 from ..domain.entities.client_info_dto import ClientInfoDTO
 from ..domain.entities.order_details_dto import OrderDetailsDTO
 from ..domain.entities.order_dto import OrderDTO
+from ..domain.entities.outbox_message_dto import OutboxMessageDTO
 from ..domain.entities.payment_dto import PaymentDTO
+from .utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class CreateOrder:
     """
     Use case for creating a purchase.
+    The messages of a completed order are saved with it, in the outbox, and published in the background.
     """
 
-    def __init__(self, order_repository, payments_port, messaging_port):
+    def __init__(self, order_repository, payments_port):
         self.order_repository = order_repository
         self.payments_port = payments_port
-        self.messaging_port = messaging_port
 
     def execute(self, order_data, salesman_id):
-        logging.debug("Starting purchase creation process...")
+        logger.debug("Starting purchase creation process...")
         # Validate the purchase data
         validate(order_data)
 
@@ -47,7 +45,7 @@ class CreateOrder:
             currency=order_data['currency'],
             salesman_id=salesman_id if salesman_id else None,
             status='PENDIENTE',
-            created_at=None,
+            created_at=datetime.now(timezone.utc).isoformat(),
             updated_at=None
         )
 
@@ -83,20 +81,21 @@ class CreateOrder:
         order_dto.order_details = list_order_details
         order_dto.client_info = client_info_dto
 
+        # Messages of the order, saved in its transaction so they are not lost if the messaging system is down
+        outbox_messages = []
+        if order_dto.status == 'COMPLETADO':
+            outbox_messages = [
+                self._update_products_stock_message(order_dto.order_details),
+                self._order_initiated_message(order_dto.to_dict())
+            ]
+
         # Create the purchase
-        logging.debug(f"Purchase data: {order_dto.to_dict()}")
-        purchase = self.order_repository.add(order_dto)
-        logging.debug(f"Purchase created with ID: {purchase.id} and status: {purchase.status}")
+        logger.debug("Purchase data", order=order_dto.to_dict)
+        purchase = self.order_repository.add(order_dto, outbox_messages)
+        logger.debug("Purchase created with ID: %s and status: %s", purchase.id, purchase.status)
 
         order_message = purchase.to_dict()
-        # Send messages
-        if purchase.status == 'COMPLETADO':
-            self._update_products_stock(purchase.order_details)
-            self._produce_order(order_message)
-
-        # Create the DTO to send to pedidos-api
-
-        logging.debug(f"Order created with detail: {order_message}")
+        logger.debug("Order created", order=order_message)
         operation_status = 402 if purchase.status == 'FALLIDO' else 201
         return order_message, operation_status
 
@@ -105,8 +104,9 @@ class CreateOrder:
         Process the payment using the payment port.
         :param payment_info: The payment information to process.
         :return: The response from the payment processing.
+        :raises PaymentGatewayUnavailableError: If the payment gateway did not process the payment.
         """
-        logging.debug("Processing payment...")
+        logger.debug("Processing payment...")
         payload = {
             "amount": payment_info['amount'],
             "cardNumber": payment_info['cardNumber'],
@@ -116,11 +116,12 @@ class CreateOrder:
         }
         result = self.payments_port.process_payment(payload)
         if result is None:
+            # The order is not saved when the payment could not be attempted
             logger.error("Payment processing failed.")
-            return None
+            raise PaymentGatewayUnavailableError
 
-        logger.info(
-            f'Payment executed with transaction ID {result["transactionReference"]} and result: {result["status"]}')
+        logger.info("Payment executed with transaction ID %s and result: %s", result["transactionReference"],
+                    result["status"])
 
         # Update the payment DTO with the response
         payment_dto = PaymentDTO(
@@ -138,12 +139,11 @@ class CreateOrder:
 
         return payment_dto
 
-    def _update_products_stock(self, order_details: list[OrderDetailsDTO]):
+    def _update_products_stock_message(self, order_details: list[OrderDetailsDTO]) -> OutboxMessageDTO:
         """
-        Update the stock of products after a successful purchase.
+        Message to update the stock of products after a successful purchase.
         :param order_details: List of order details containing product IDs and quantities.
         """
-        logging.debug("Updating product stock...")
         products_dict = list[dict]()
         for item in order_details:
             detail = {
@@ -155,22 +155,21 @@ class CreateOrder:
         message = {
             "products": products_dict,
         }
-        logging.debug(f"Stock update message: {message}")
-        self.messaging_port.send_message(
+        logger.debug("Stock update message", message=message)
+        return OutboxMessageDTO(
+            id=str(uuid.uuid4()),
             exchange="update_stock_exchange",
             routing_key="update_stock_routing_key",
             message=message
         )
-        logging.debug("Product stock update message sent.")
 
-    def _produce_order(self, order_info: dict):
+    def _order_initiated_message(self, order_info: dict) -> OutboxMessageDTO:
         """
-        Produce the order to the messaging system.
+        Message to produce the order to pedidos-api.
         :param order_info: The order info produce.
         """
-        logging.debug("Producing order to messaging system...")
         payment_data = order_info.get('payment')
-        order_details_data = order_info.get('orderDetails', [])
+        order_details_data = order_info.get('orderDetails') or []
 
         order_items = list()
         for detail in order_details_data:
@@ -204,11 +203,10 @@ class CreateOrder:
             "order": order_data
         }
 
-        logging.debug(f"Producing order {message}")
-
-        self.messaging_port.send_message(
+        logger.debug("Order message", message=message)
+        return OutboxMessageDTO(
+            id=str(uuid.uuid4()),
             exchange="order_initiated_exchange",
             routing_key="order_initiated_routing_key",
             message=message
         )
-        logging.debug("Order produced to messaging system.")
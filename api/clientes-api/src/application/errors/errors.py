@@ -28,4 +28,14 @@ class OrderNotExistsError(ApiError):
 
 class OrdersNotFoundError(ApiError):
     code = 404
-    description = "No se encontraron pedidos para el cliente consultado."
\ No newline at end of file
+    description = "No se encontraron pedidos para el cliente consultado."
+
+
+class ReportJobNotExistsError(ApiError):
+    code = 404
+    description = "El reporte solicitado no existe."
+
+
+class PaymentGatewayUnavailableError(ApiError):
+    code = 503
+    description = "La pasarela de pagos no está disponible. Intente más tarde."
@@ -1,32 +1,63 @@
 import logging
+import os
 import uuid
 from datetime import datetime
 
+from .utils.local_storage import LocalStorage
 from .utils.upload_to_storage import UploadToStorage
+from .utils.validation_utils import validate_report_filters
 from ..domain.entities.reports.order_reports_dto import OrderReportsDTO
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
+REPORT_FILE_FORMATS = ('xlsx', 'csv', 'csv.gz')
+
 
 class GenerateReports:
     """
     Use case for generating reports.
     """
 
-    def __init__(self, order_reports_repository, report_queries_adapter):
+    def __init__(self, order_reports_repository, report_queries_adapter, report_storage=None):
         self.order_reports_repository = order_reports_repository
         self.report_queries_adapter = report_queries_adapter
+        self.report_storage = report_storage
 
     def execute(self, data: dict) -> dict:
         """
         Generate reports based on the provided parameters.
         :param data: Dictionary containing report parameters.
         :return: Dictionary containing the generated report.
+        :raises ValidationApiError: If the report dates are missing or invalid.
+        """
+        validate_report_filters(data.get('filters'))
+        report_record, report_data = self._generate(data, stream=False)
+
+        return {
+            'id': report_record.report_id,
+            'userId': report_record.user_id,
+            'name': report_record.report_name,
+            'date': report_record.report_date,
+            'url': report_record.url,
+            'reportData': report_data
+        }
+
+    def generate(self, data: dict) -> OrderReportsDTO:
+        """
+        Generate a report based on the provided parameters, without returning its rows.
+        The rows are streamed from the database to the report file, so they are never held in memory at once.
+        :param data: Dictionary containing report parameters.
+        :return: The record of the generated report.
+        """
+        report_record, _ = self._generate(data, stream=True)
+        return report_record
+
+    def _generate(self, data: dict, stream: bool) -> tuple[OrderReportsDTO, list]:
+        """
+        Generate the report file, store it and save its record.
+        :param data: Dictionary containing report parameters.
+        :param stream: Whether to stream the rows instead of loading them in a list.
+        :return: Tuple of (record of the report, rows of the report)
         """
         logger.debug("Generating reports for user ID: %s", data.get('userId'))
 
@@ -34,17 +65,16 @@ class GenerateReports:
         # Generate report according to report type
         report_date = datetime.utcnow().isoformat()
         report_name = 'CCP_' + data.get('type') + '_' + data.get('userId') + '_' + report_date.translate(
-            str.maketrans('', '', ':-')) + '.xlsx'
+            str.maketrans('', '', ':-')) + '.' + self._report_file_format()
 
-        report_metadata = self._generate_report_data(data)
+        report_metadata = self._generate_report_data(data, stream)
         report_data = report_metadata.get('data', [])
         report_headers = report_metadata.get('headers')
         logger.debug(f"Generated report data: {report_name}")
 
         # Store generated report on Cloud Storage
         logger.debug("Storing report on remote directory...")
-        upload_to_storage = UploadToStorage()
-        report_url = upload_to_storage.upload_report(
+        report_url = self._report_storage().upload_report(
             file_name=report_name,
             headers=report_headers,
             data=report_data
@@ -64,20 +94,35 @@ class GenerateReports:
         # Save the report record in the database
         logger.debug(f"Saving report record: {order_report}")
         report_record = self.order_reports_repository.add(order_report)
+        return report_record, report_data
 
-        return {
-            'id': report_record.report_id,
-            'userId': report_record.user_id,
-            'name': report_record.report_name,
-            'date': report_record.report_date,
-            'url': report_record.url,
-            'reportData': report_data
-        }
+    def _report_storage(self):
+        """
+        Storage of the report files: the injected one, a local directory when REPORTS_STORAGE is 'local',
+        Cloud Storage otherwise.
+        """
+        if self.report_storage:
+            return self.report_storage
+        if os.environ.get('REPORTS_STORAGE') == 'local':
+            return LocalStorage(os.environ.get('REPORTS_LOCAL_DIR', 'reports'))
+        return UploadToStorage()
 
-    def _generate_report_data(self, data: dict) -> dict:
+    @staticmethod
+    def _report_file_format() -> str:
+        """
+        Format of the report files, set by REPORTS_FILE_FORMAT: xlsx (default), csv or csv.gz.
+        """
+        file_format = os.environ.get('REPORTS_FILE_FORMAT', 'xlsx')
+        if file_format not in REPORT_FILE_FORMATS:
+            logger.warning(f"Unknown report file format {file_format}, using xlsx.")
+            return 'xlsx'
+        return file_format
+
+    def _generate_report_data(self, data: dict, stream: bool) -> dict:
         """
         Generate the report data based on the provided parameters.
         :param data: Dictionary containing report parameters.
+        :param stream: Whether to stream the rows instead of loading them in a list.
         :return: List of dictionaries containing the report data.
         """
         # Implement the logic to generate the report data based on the parameters
@@ -90,18 +135,27 @@ class GenerateReports:
         if report_type == 'VENTAS_POR_MES':
             metadata = self.report_queries_adapter.get_monthly_sales(
                 start_date=filters.get('startDate'),
-                end_date=filters.get('endDate')
+                end_date=filters.get('endDate'),
+                stream=stream
             )
         elif report_type == 'PRODUCTOS_MAS_VENDIDOS':
             metadata = self.report_queries_adapter.get_monthly_product_sales(
                 start_date=filters.get('startDate'),
-                end_date=filters.get('endDate')
+                end_date=filters.get('endDate'),
+                stream=stream
             )
         elif report_type == 'VENTAS_POR_VENDEDOR':
             metadata = self.report_queries_adapter.get_monthly_sales_by_salesman(
                 start_date=filters.get('startDate'),
                 end_date=filters.get('endDate'),
-                salesman_id=filters.get('salesmanId')
+                salesman_id=filters.get('salesmanId'),
+                stream=stream
+            )
+        elif report_type == 'RESUMEN_POR_VENDEDOR':
+            metadata = self.report_queries_adapter.get_sales_summary_per_salesman(
+                start_date=filters.get('startDate'),
+                end_date=filters.get('endDate'),
+                stream=stream
             )
         else:
             logger.warning("Unknown report type: %s", report_type)
@@ -3,11 +3,6 @@ import logging
 from ..domain.entities.order_dto import OrderDTO
 from .errors.errors import OrderNotExistsError
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 class GetOrderById:
@@ -1,13 +1,9 @@
 import logging
 
 from ..domain.entities.order_dto import OrderDTO
-from .errors.errors import OrderNotExistsError
+from .errors.errors import OrderNotExistsError, ValidationApiError
+from ..domain.entities.page_dto import PageDTO, page_size
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 class GetOrderBySalesmanId:
@@ -18,19 +14,37 @@ class GetOrderBySalesmanId:
     def __init__(self, order_repository):
         self.order_repository = order_repository
 
-    def execute(self, salesman_id: str) -> list[OrderDTO]:
+    def execute(self, salesman_id: str, summary: bool = False) -> list[OrderDTO]:
         """
         Get an order by its ID.
         :param salesman_id : The unique identifier of the salesman whose orders are to be retrieved.
+        :param summary: True to get only the summary columns of the orders.
         :return: The order associated with the given ID.
         """
         logger.debug("Starting process to get order by salesman...")
 
         # Fetch the order from the repository
-        order = self.order_repository.get_orders_by_salesman(salesman_id)
+        order = self.order_repository.get_orders_by_salesman(salesman_id, summary)
         if not order:
             logger.debug(f"Order associated to salesman {salesman_id} not found.")
             raise OrderNotExistsError
 
         logger.debug(f"Order fetched successfully: {order}")
-        return order
\ No newline at end of file
+        return order
+
+    def execute_page(self, salesman_id: str, limit: str = None, cursor: str = None,
+                     summary: bool = False) -> PageDTO:
+        """
+        Get a page of the orders of a salesman, from the newest to the oldest.
+        :param salesman_id: The unique identifier of the salesman whose orders are to be retrieved.
+        :param limit: Requested page size, capped at the maximum page size.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to get only the summary columns of the orders.
+        :return: A page of orders associated with the salesman.
+        """
+        logger.debug(f"Getting a page of orders for salesman {salesman_id}, limit: {limit}, cursor: {cursor}")
+        try:
+            return self.order_repository.get_orders_page_by_salesman(salesman_id, page_size(limit), cursor, summary)
+        except ValueError as e:
+            logger.error(f"Invalid page request: {e}")
+            raise ValidationApiError
@@ -0,0 +1,29 @@
+import logging
+
+from .errors.errors import ReportJobNotExistsError
+from ..domain.entities.reports.report_job_dto import ReportJobDTO
+
+logger = logging.getLogger(__name__)
+
+
+class GetReportJob:
+    """
+    Use case for checking the status of a report job.
+    """
+
+    def __init__(self, report_jobs_repository):
+        self.report_jobs_repository = report_jobs_repository
+
+    def execute(self, job_id: str) -> ReportJobDTO:
+        """
+        Get a report job by its ID.
+        :param job_id: The unique identifier of the job.
+        :return: The report job.
+        """
+        logger.debug(f"Retrieving report job {job_id}")
+        report_job = self.report_jobs_repository.get_by_id(job_id)
+        if report_job is None:
+            logger.debug(f"Report job {job_id} not found.")
+            raise ReportJobNotExistsError
+
+        return report_job
@@ -1,11 +1,6 @@
 import logging
 from ..domain.entities.reports.order_reports_dto import OrderReportsDTO
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 class GetReportsByUser:
@@ -1,12 +1,8 @@
 import logging
 
-from .errors.errors import OrdersNotFoundError
+from .errors.errors import OrdersNotFoundError, ValidationApiError
+from ..domain.entities.page_dto import PageDTO, page_size
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 
@@ -18,19 +14,36 @@ class ListOrders:
     def __init__(self, order_repository):
         self.order_repository = order_repository
 
-    def execute(self, client_id):
+    def execute(self, client_id, summary: bool = False):
         """
         List all orders for a given client ID.
         :param client_id: The unique identifier of the client whose orders are to be listed.
+        :param summary: True to list only the summary columns of the orders.
         :return: A list of orders associated with the client.
         """
         logger.debug("Starting order listing process...")
 
         # Fetch the orders from the repository
-        orders = self.order_repository.get_orders_by_client(client_id)
+        orders = self.order_repository.get_orders_by_client(client_id, summary)
         if not orders:
             logger.debug(f"No orders found for client {client_id}.")
             raise OrdersNotFoundError
 
         logger.debug(f"Orders fetched for client {client_id}: {len(orders)} orders found.")
-        return orders
\ No newline at end of file
+        return orders
+
+    def execute_page(self, client_id, limit: str = None, cursor: str = None, summary: bool = False) -> PageDTO:
+        """
+        List a page of the orders of a given client ID, from the newest to the oldest.
+        :param client_id: The unique identifier of the client whose orders are to be listed.
+        :param limit: Requested page size, capped at the maximum page size.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to list only the summary columns of the orders.
+        :return: A page of orders associated with the client.
+        """
+        logger.debug(f"Listing a page of orders for client {client_id}, limit: {limit}, cursor: {cursor}")
+        try:
+            return self.order_repository.get_orders_page_by_client(client_id, page_size(limit), cursor, summary)
+        except ValueError as e:
+            logger.error(f"Invalid page request: {e}")
+            raise ValidationApiError
@@ -0,0 +1,63 @@
+import logging
+
+from .generate_reports import GenerateReports
+from ..domain.entities.reports.report_job_dto import ReportJobDTO, ReportJobStatusEnum
+
+logger = logging.getLogger(__name__)
+
+PROCESSABLE_STATUSES = (ReportJobStatusEnum.PENDIENTE.value, ReportJobStatusEnum.EN_PROCESO.value)
+
+
+class ProcessReportJob:
+    """
+    Use case for generating a queued report.
+    """
+
+    def __init__(self, report_jobs_repository, order_reports_repository, report_queries_adapter, messaging_port,
+                 report_storage=None):
+        self.report_jobs_repository = report_jobs_repository
+        self.messaging_port = messaging_port
+        self.generate_reports = GenerateReports(order_reports_repository, report_queries_adapter, report_storage)
+
+    def process(self, message: dict) -> ReportJobDTO | None:
+        """
+        Generate the report of a job and notify its completion.
+        A failed report is recorded on the job instead of being retried. A job still in process is generated
+        again: its message is only delivered again when the worker generating it died before acknowledging it.
+        :param message: Message with the ID of the job.
+        :return: The finished report job, None if the job does not exist or was already processed.
+        """
+        job_id = message.get('jobId')
+        report_job = self.report_jobs_repository.get_by_id(job_id)
+        if report_job is None or report_job.status not in PROCESSABLE_STATUSES:
+            logger.warning(f"Report job {job_id} not found or already processed, skipping it.")
+            return None
+        if report_job.status == ReportJobStatusEnum.EN_PROCESO.value:
+            logger.warning(f"Report job {job_id} was interrupted while in process, generating it again.")
+
+        logger.debug(f"Generating report of job {job_id}...")
+        self.report_jobs_repository.update_status(job_id, ReportJobStatusEnum.EN_PROCESO.value)
+        try:
+            report = self.generate_reports.generate({
+                'userId': report_job.user_id,
+                'type': report_job.report_type,
+                'filters': report_job.filters or {}
+            })
+            report_job = self.report_jobs_repository.update_status(
+                job_id, ReportJobStatusEnum.COMPLETADO.value, report_id=str(report.report_id), url=report.url)
+        except Exception as e:
+            logger.error(f"Error generating report of job {job_id}: {str(e)}")
+            report_job = self.report_jobs_repository.update_status(
+                job_id, ReportJobStatusEnum.FALLIDO.value, error=str(e))
+
+        self.messaging_port.send_message(
+            exchange="report_jobs_completed_exchange",
+            routing_key="report_jobs_completed_routing_key",
+            message={
+                "jobId": job_id,
+                "userId": report_job.user_id,
+                "status": report_job.status,
+                "url": report_job.url
+            }
+        )
+        return report_job
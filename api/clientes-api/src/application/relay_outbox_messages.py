@@ -0,0 +1,45 @@
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Messages published per batch, and seconds before a claimed message not confirmed is published again
+OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', 100))
+OUTBOX_LEASE_SECONDS = int(os.environ.get('OUTBOX_LEASE_SECONDS', 30))
+
+
+class RelayOutboxMessages:
+    """
+    Use case for publishing the messages saved in the outbox with their orders.
+    A message is deleted only once the messaging system confirms it, so it is delivered at least once:
+    consumers may receive it twice if the relay stops between the confirmation and the delete.
+    """
+
+    def __init__(self, outbox_repository, messaging_port, batch_size=OUTBOX_BATCH_SIZE,
+                 lease_seconds=OUTBOX_LEASE_SECONDS):
+        self.outbox_repository = outbox_repository
+        self.messaging_port = messaging_port
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+
+    def execute(self) -> int:
+        """
+        Publish a batch of pending messages.
+        :return: Number of messages published, 0 if there were none or the batch was not confirmed.
+        """
+        messages = self.outbox_repository.claim_pending(self.batch_size, self.lease_seconds)
+        if not messages:
+            return 0
+
+        published = self.messaging_port.send_many(
+            [(message.exchange, message.routing_key, message.message) for message in messages]
+        )
+        if not published:
+            # The messages are published again when their lease expires
+            logger.error(f"Outbox batch of {len(messages)} messages not confirmed, retrying in "
+                         f"{self.lease_seconds} seconds")
+            return 0
+
+        self.outbox_repository.delete([message.id for message in messages])
+        logger.debug(f"{len(messages)} outbox messages published")
+        return len(messages)
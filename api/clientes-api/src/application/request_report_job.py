@@ -0,0 +1,53 @@
+import logging
+import uuid
+
+from .errors.errors import InternalServerError, ValidationApiError
+from .utils.validation_utils import validate_report_filters
+from ..domain.entities.reports.report_job_dto import ReportJobDTO, ReportJobStatusEnum
+
+logger = logging.getLogger(__name__)
+
+REPORT_TYPES = ('VENTAS_POR_MES', 'PRODUCTOS_MAS_VENDIDOS', 'VENTAS_POR_VENDEDOR', 'RESUMEN_POR_VENDEDOR')
+
+
+class RequestReportJob:
+    """
+    Use case for requesting a report to be generated in the background.
+    """
+
+    def __init__(self, report_jobs_repository, messaging_port):
+        self.report_jobs_repository = report_jobs_repository
+        self.messaging_port = messaging_port
+
+    def execute(self, data: dict) -> ReportJobDTO:
+        """
+        Register a report job and queue it for the report workers.
+        :param data: Dictionary containing report parameters.
+        :return: The pending report job.
+        """
+        if not data.get('userId') or data.get('type') not in REPORT_TYPES:
+            logger.error(f"Invalid report request: {data}")
+            raise ValidationApiError("Se requiere el usuario y un tipo de reporte válido.")
+        validate_report_filters(data.get('filters'))
+
+        report_job = self.report_jobs_repository.add(ReportJobDTO(
+            job_id=str(uuid.uuid4()),
+            user_id=data['userId'],
+            report_type=data['type'],
+            filters=data.get('filters', {}),
+            status=ReportJobStatusEnum.PENDIENTE.value
+        ))
+        logger.debug(f"Report job {report_job.job_id} registered, queueing it...")
+
+        sent = self.messaging_port.send_message(
+            exchange="report_jobs_exchange",
+            routing_key="report_jobs_routing_key",
+            message={"jobId": report_job.job_id}
+        )
+        if not sent:
+            logger.error(f"Report job {report_job.job_id} could not be queued.")
+            self.report_jobs_repository.update_status(report_job.job_id, ReportJobStatusEnum.FALLIDO.value,
+                                                      error="No fue posible encolar el reporte.")
+            raise InternalServerError
+
+        return report_job
@@ -1,25 +1,32 @@
-import io
+import csv
+import datetime
+import gzip
+import itertools
 import logging
 import os
 import tempfile
+from decimal import Decimal
 from pathlib import Path
+from typing import Iterable
 
-import pandas as pd
+import xlsxwriter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
+# Rows used to estimate the width of the Excel columns
+WIDTH_SAMPLE_SIZE = 100
+
+CELL_TYPES = (str, int, float, Decimal, bool, datetime.datetime, datetime.date, datetime.time)
+
 
 class CreateReportFile:
     """
     Class to create a report file.
+    The rows are written as they are read, so the data can be a generator streaming them from the database.
+    The format is taken from the file name: .csv, .csv.gz or Excel otherwise.
     """
 
-    def __init__(self, file_name: str, headers: str, data: list):
+    def __init__(self, file_name: str, headers: str, data: Iterable):
         self.file_name = file_name
         self.headers = headers.split(',') if isinstance(headers, str) else headers
         self.data = data
@@ -28,7 +35,7 @@ class CreateReportFile:
 
     def create_file(self) -> str:
         """
-        Create an Excel report file in a structured reports directory.
+        Create a report file in a structured reports directory.
         :return: Path to the created file
         """
         logging.debug(f"Creating report file: {self.file_name}")
@@ -41,46 +48,93 @@ class CreateReportFile:
             # Create full file path in reports directory
             file_path = os.path.join(self.reports_dir, self.file_name)
 
-            # Convert list of dictionaries to DataFrame
-            df = pd.DataFrame(self.data)
-
-            # If headers were provided, rename the columns
-            if len(self.headers) == len(df.columns):
-                df.columns = self.headers
-
-            # Write DataFrame to Excel with formatting
-            with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-                df.to_excel(writer, sheet_name='Report', index=False)
-
-                # Get the xlsxwriter objects
-                workbook = writer.book
-                worksheet = writer.sheets['Report']
-
-                # Add header formatting
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'bg_color': '#D7E4BC',
-                    'border': 1
-                })
-
-                # Apply header format
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-
-                # Auto-adjust columns' width
-                for i, col in enumerate(df.columns):
-                    column_width = max(df[col].astype(str).map(len).max(), len(col)) + 2
-                    worksheet.set_column(i, i, column_width)
-
-            logging.debug(f"Excel report successfully created at: {file_path}")
+            rows = iter(self.data)
+            sample = list(itertools.islice(rows, WIDTH_SAMPLE_SIZE))
+            headers = self._column_headers(sample)
+            rows = itertools.chain(sample, rows)
+
+            if self.file_name.endswith('.csv.gz'):
+                with gzip.open(file_path, 'wt', newline='') as report_file:
+                    total = self._write_csv(report_file, headers, rows)
+            elif self.file_name.endswith('.csv'):
+                with open(file_path, 'w', newline='') as report_file:
+                    total = self._write_csv(report_file, headers, rows)
+            else:
+                total = self._write_excel(file_path, headers, sample, rows)
+
+            logging.debug(f"Report with {total} rows successfully created at: {file_path}")
             return file_path
 
         except Exception as e:
-            logging.error(f"Error creating Excel report: {str(e)}")
+            logging.error(f"Error creating report: {str(e)}")
             raise Exception(f"Failed to create report file: {str(e)}")
 
+    def _column_headers(self, sample: list) -> list:
+        """
+        Headers of the report: the provided ones when they match the columns of the rows, the row keys otherwise.
+        """
+        if not sample or not isinstance(sample[0], dict) or len(self.headers) == len(sample[0]):
+            return self.headers
+        return list(sample[0].keys())
+
+    def _write_csv(self, report_file, headers: list, rows: Iterable) -> int:
+        """
+        Write the rows in CSV format.
+        :return: Number of written rows
+        """
+        writer = csv.writer(report_file)
+        writer.writerow(headers)
+        total = 0
+        for row in rows:
+            writer.writerow(self._row_values(row))
+            total += 1
+        return total
+
+    def _write_excel(self, file_path: str, headers: list, sample: list, rows: Iterable) -> int:
+        """
+        Write the rows to an Excel file in constant memory mode, which flushes every row to disk once the next one
+        is written. Column widths are estimated from the sample rows.
+        :return: Number of written rows
+        """
+        workbook = xlsxwriter.Workbook(file_path, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'remove_timezone': True
+        })
+        try:
+            worksheet = workbook.add_worksheet('Report')
+
+            # Add header formatting
+            header_format = workbook.add_format({
+                'bold': True,
+                'text_wrap': True,
+                'valign': 'top',
+                'bg_color': '#D7E4BC',
+                'border': 1
+            })
+
+            # Adjust columns' width to the sample
+            sample_values = [self._row_values(row) for row in sample]
+            for i, header in enumerate(headers):
+                column_width = max([len(str(values[i])) for values in sample_values if i < len(values)] + [len(header)])
+                worksheet.set_column(i, i, column_width + 2)
+
+            worksheet.write_row(0, 0, headers, header_format)
+            total = 0
+            for total, row in enumerate(rows, start=1):
+                worksheet.write_row(total, 0, self._row_values(row))
+        finally:
+            workbook.close()
+        return total
+
+    @staticmethod
+    def _row_values(row) -> list:
+        """
+        Values of a row, with the types unsupported by the writers (e.g. UUID) converted to strings.
+        """
+        values = row.values() if isinstance(row, dict) else row
+        return [value if value is None or isinstance(value, CELL_TYPES) else str(value) for value in values]
+
     def cleanup_temp_file(self, file_path: str) -> None:
         """
         Remove temporary file after upload to GCS.
@@ -0,0 +1,44 @@
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from .create_report_file import CreateReportFile
+from ...domain.ports.report_storage_port import ReportStoragePort
+
+logger = logging.getLogger(__name__)
+
+
+class LocalStorage(ReportStoragePort):
+    """
+    Stores the reports in a local directory instead of Cloud Storage, for local environments and tests.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def upload_report(self, file_name, headers, data) -> str:
+        """
+        Creates an Excel report and moves it to the local directory.
+
+        Args:
+            file_name: Name for the report file
+            headers: Column headers for the report
+            data: List of data records
+
+        Returns:
+            file:// URL of the stored file
+        """
+        try:
+            report_creator = CreateReportFile(file_name, headers, data)
+            file_path = report_creator.create_file()
+
+            os.makedirs(self.directory, exist_ok=True)
+            destination = self.directory / file_name
+            shutil.move(file_path, destination)
+            logger.info(f"Report stored at: {destination}")
+
+            return destination.resolve().as_uri()
+        except Exception as e:
+            logger.error(f"Error in local upload_report process: {str(e)}")
+            raise Exception(f"Failed to create and store report: {str(e)}")
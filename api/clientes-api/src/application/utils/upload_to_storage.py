@@ -4,18 +4,14 @@ from flask.cli import load_dotenv
 from google.cloud import storage
 
 from .create_report_file import CreateReportFile
+from ...domain.ports.report_storage_port import ReportStoragePort
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
 
-class UploadToStorage:
+class UploadToStorage(ReportStoragePort):
     def __init__(self, storage_client=None):
         # Initialize storage client if not provided
         self.storage_client = storage_client or storage.Client()
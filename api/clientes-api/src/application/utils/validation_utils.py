@@ -1,10 +1,6 @@
 import logging
+from datetime import date
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 from ..errors.errors import InvalidFormatError, ValidationApiError
@@ -69,6 +65,31 @@ def validate(order_data):
     logger.debug("Order data validation completed successfully.")
 
 
+def validate_report_filters(filters):
+    """
+    Validate the date range every report is filtered by.
+    :param filters: The filters of the report, with startDate and endDate in YYYY-MM-DD format.
+    :raises ValidationApiError: If a date is missing.
+    :raises InvalidFormatError: If a date is not in YYYY-MM-DD format or the range ends before it starts.
+    """
+    if not isinstance(filters, dict):
+        logger.error("Invalid report filters format: Expected a dictionary")
+        raise ValidationApiError("Se requieren las fechas inicial y final del reporte.")
+
+    dates = {}
+    for field_name in ('startDate', 'endDate'):
+        _validate_present(filters.get(field_name), field_name)
+        try:
+            dates[field_name] = date.fromisoformat(filters[field_name])
+        except (TypeError, ValueError):
+            logger.error(f"Invalid format for {field_name}: {filters[field_name]} is not a valid date")
+            raise InvalidFormatError("Las fechas deben tener el formato AAAA-MM-DD.")
+
+    if dates['startDate'] > dates['endDate']:
+        logger.error(f"Invalid report range: {filters['startDate']} is after {filters['endDate']}")
+        raise InvalidFormatError("La fecha inicial debe ser anterior a la fecha final.")
+
+
 def _validate_order_details(order_details, field_name="orderDetails"):
     """
     Validate array of order details.
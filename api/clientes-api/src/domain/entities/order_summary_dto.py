@@ -0,0 +1,36 @@
+class OrderSummaryDTO:
+
+    def __init__(self, id: str, client_id: str, salesman_id: str, status: str, total: float, currency: str,
+                 created_at: str):
+        """
+        Initialize an OrderSummaryDTO object, the columns of an order shown in the order lists.
+        :param id: The unique identifier of the order.
+        :param client_id: The unique identifier of the client associated with the order.
+        :param salesman_id: The unique identifier of the salesman associated with the order.
+        :param status: The status of the order (e.g., 'PENDIENTE', 'COMPLETADO').
+        :param total: The total amount of the order.
+        :param currency: The currency of the order (e.g., 'USD', 'EUR').
+        :param created_at: The date and time when the order was created.
+        """
+        self.id = id
+        self.client_id = client_id
+        self.salesman_id = salesman_id
+        self.status = status
+        self.total = total
+        self.currency = currency
+        self.created_at = created_at
+
+    def to_dict(self):
+        """
+        Convert the OrderSummaryDTO object to a dictionary.
+        :return: A dictionary representation of the OrderSummaryDTO object.
+        """
+        return {
+            "id": self.id,
+            "clientId": self.client_id,
+            "salesmanId": self.salesman_id,
+            "status": self.status,
+            "total": self.total,
+            "currency": self.currency,
+            "createdAt": self.created_at
+        }
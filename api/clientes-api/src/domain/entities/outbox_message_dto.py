@@ -0,0 +1,36 @@
+class OutboxMessageDTO:
+    """
+    OutboxMessageDTO is a Data Transfer Object (DTO) that represents a message saved with an order,
+    waiting to be published to the messaging system.
+    """
+
+    def __init__(self, id: str, exchange: str, routing_key: str, message: dict, attempts: int = 0,
+                 created_at: str = None):
+        """
+        Initialize an OutboxMessageDTO object with the given parameters.
+        :param id: The unique identifier of the message.
+        :param exchange: The exchange to publish the message to.
+        :param routing_key: The routing key of the message.
+        :param message: The body of the message.
+        :param attempts: The number of times the message was handed to the messaging system.
+        :param created_at: The date and time when the message was saved.
+        """
+        self.id = id
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self.message = message
+        self.attempts = attempts
+        self.created_at = created_at
+
+    def to_dict(self):
+        """
+        Convert the OutboxMessageDTO object to a dictionary.
+        """
+        return {
+            "id": self.id,
+            "exchange": self.exchange,
+            "routingKey": self.routing_key,
+            "message": self.message,
+            "attempts": self.attempts,
+            "createdAt": self.created_at
+        }
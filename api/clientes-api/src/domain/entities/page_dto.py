@@ -0,0 +1,70 @@
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PageDTO:
+    def __init__(self,
+                 items: list,
+                 next_cursor: str = None):
+        """
+        Initiates a PageDTO instance with the given parameters.
+
+        Args:
+            items (list): The items of the page.
+            next_cursor (str): Cursor of the next page, None if this is the last page.
+        """
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __repr__(self):
+        return f"Page(items={len(self.items)}, next_cursor={self.next_cursor})"
+
+    def to_dict(self):
+        """
+        Cast a PageDTO instance to a dictionary.
+        """
+        return {
+            "items": [item.to_dict() for item in self.items],
+            "nextCursor": self.next_cursor
+        }
+
+
+def page_size(limit) -> int:
+    """
+    Parses the requested page size, capped at MAX_PAGE_SIZE.
+    :param limit: The requested page size, DEFAULT_PAGE_SIZE if None.
+    :return: The page size.
+    :raises ValueError: If the page size is not a positive integer.
+    """
+    if limit is None or limit == '':
+        return DEFAULT_PAGE_SIZE
+
+    size = int(limit)
+    if size < 1:
+        raise ValueError("The page size must be a positive integer.")
+    return min(size, MAX_PAGE_SIZE)
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encodes the sort key of the last item of a page as an opaque cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Decodes a cursor created by encode_cursor.
+    :raises ValueError: If the cursor is not valid.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor.")
+    return values
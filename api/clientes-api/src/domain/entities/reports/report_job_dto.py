@@ -0,0 +1,57 @@
+import enum
+
+
+class ReportJobStatusEnum(enum.Enum):
+    PENDIENTE = 'PENDIENTE'
+    EN_PROCESO = 'EN PROCESO'
+    COMPLETADO = 'COMPLETADO'
+    FALLIDO = 'FALLIDO'
+
+
+class ReportJobDTO:
+    """
+    ReportJobDTO is a Data Transfer Object (DTO) that represents a report generated in the background.
+    """
+    def __init__(self, job_id: str, user_id: str, report_type: str, filters: dict, status: str,
+                 report_id: str = None, url: str = None, error: str = None, created_at: str = None,
+                 updated_at: str = None):
+        """
+        Initialize a ReportJobDTO object with the given parameters.
+        :param job_id: The unique identifier of the job.
+        :param user_id: The unique identifier of the user who requested the report.
+        :param report_type: The type of the report (e.g., 'VENTAS_POR_MES').
+        :param filters: The filters of the report.
+        :param status: The status of the job (e.g., 'PENDIENTE', 'COMPLETADO').
+        :param report_id: The unique identifier of the generated report, once completed.
+        :param url: The URL where the generated report can be accessed, once completed.
+        :param error: The reason of the failure, if the job failed.
+        :param created_at: The date and time when the job was requested.
+        :param updated_at: The date and time of the last status change.
+        """
+        self.job_id = job_id
+        self.user_id = user_id
+        self.report_type = report_type
+        self.filters = filters
+        self.status = status
+        self.report_id = report_id
+        self.url = url
+        self.error = error
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def to_dict(self):
+        """
+        Convert the ReportJobDTO object to a dictionary.
+        """
+        return {
+            "jobId": self.job_id,
+            "userId": self.user_id,
+            "type": self.report_type,
+            "filters": self.filters,
+            "status": self.status,
+            "reportId": self.report_id,
+            "url": self.url,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+        }
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class ReportStoragePort(ABC):
+    """Port defining where the generated report files are stored"""
+
+    @abstractmethod
+    def upload_report(self, file_name, headers, data) -> str:
+        """
+        Create a report file and store it.
+        :param file_name: Name for the report file.
+        :param headers: Column headers for the report.
+        :param data: List of data records.
+        :return: URL of the stored file.
+        """
+        pass
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
 
 from ..entities.order_dto import OrderDTO
+from ..entities.order_summary_dto import OrderSummaryDTO
+from ..entities.outbox_message_dto import OutboxMessageDTO
+from ..entities.page_dto import PageDTO
 
 
 class OrdersRepository(ABC):
 
     @abstractmethod
-    def get_orders_by_client(self, client_id: str) -> list[OrderDTO]:
-        """Get all orders given a client ID"""
+    def get_orders_by_client(self, client_id: str, summary: bool = False) -> list[OrderDTO | OrderSummaryDTO]:
+        """Get all orders given a client ID, only their summary columns if summary is True"""
         pass
 
     @abstractmethod
@@ -16,8 +19,8 @@ class OrdersRepository(ABC):
         pass
 
     @abstractmethod
-    def add(self, order: OrderDTO) -> OrderDTO | None:
-        """Add a new order"""
+    def add(self, order: OrderDTO, outbox_messages: list[OutboxMessageDTO] = None) -> OrderDTO | None:
+        """Add a new order, with the messages to publish once it is saved"""
         pass
 
     @abstractmethod
@@ -26,6 +29,18 @@ class OrdersRepository(ABC):
         pass
 
     @abstractmethod
-    def get_orders_by_salesman(self, salesman_id: str) -> list[OrderDTO]:
-        """Get all orders given a salesman ID"""
+    def get_orders_by_salesman(self, salesman_id: str, summary: bool = False) -> list[OrderDTO | OrderSummaryDTO]:
+        """Get all orders given a salesman ID, only their summary columns if summary is True"""
+        pass
+
+    @abstractmethod
+    def get_orders_page_by_client(self, client_id: str, limit: int, cursor: str = None,
+                                  summary: bool = False) -> PageDTO:
+        """Get a page of the orders of a client, from the newest to the oldest"""
+        pass
+
+    @abstractmethod
+    def get_orders_page_by_salesman(self, salesman_id: str, limit: int, cursor: str = None,
+                                    summary: bool = False) -> PageDTO:
+        """Get a page of the orders of a salesman, from the newest to the oldest"""
         pass
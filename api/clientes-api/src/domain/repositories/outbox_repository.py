@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+from ..entities.outbox_message_dto import OutboxMessageDTO
+
+
+class OutboxRepository(ABC):
+
+    @abstractmethod
+    def claim_pending(self, limit: int, lease_seconds: int) -> list[OutboxMessageDTO]:
+        """
+        Claim the oldest messages waiting to be published.
+        :param limit: Maximum number of messages to claim.
+        :param lease_seconds: Seconds before an unconfirmed message can be claimed again.
+        :return: List of the claimed OutboxMessageDTO.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, message_ids: list[str]) -> int:
+        """
+        Delete the messages confirmed by the messaging system.
+        :param message_ids: IDs of the messages to delete.
+        :return: Number of deleted messages.
+        """
+        pass
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+from ..entities.reports.report_job_dto import ReportJobDTO
+
+
+class ReportJobsRepository(ABC):
+
+    @abstractmethod
+    def add(self, dto: ReportJobDTO) -> ReportJobDTO:
+        """
+        Add a new report job to the repository.
+        :param dto: The ReportJobDTO instance to add.
+        :return: The added ReportJobDTO instance.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_id(self, job_id: str) -> ReportJobDTO | None:
+        """
+        Get a report job by ID.
+        :param job_id: The ID of the report job.
+        :return: The ReportJobDTO instance if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def update_status(self, job_id: str, status: str, report_id: str = None, url: str = None,
+                      error: str = None) -> ReportJobDTO | None:
+        """
+        Update the status of a report job.
+        :param job_id: The ID of the report job.
+        :param status: The new status of the job.
+        :param report_id: The ID of the generated report, once completed.
+        :param url: The URL of the generated report, once completed.
+        :param error: The reason of the failure, if the job failed.
+        :return: The updated ReportJobDTO instance, None if the job does not exist.
+        """
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+
+class SalesRollupsRepository(ABC):
+
+    @abstractmethod
+    def rebuild(self, start_date: date = None, end_date: date = None) -> int:
+        """
+        Recompute the daily sales rollups of a range of days from the orders.
+        :param start_date: First day to rebuild, None to start from the first order.
+        :param end_date: Last day to rebuild, None to rebuild up to the last order.
+        :return: Number of rollup rows written.
+        """
+        pass
@@ -1,6 +1,10 @@
 from ..dao.order_dao import OrderDAO
 from ..mapper.order_mapper import OrderMapper
+from ..mapper.outbox_message_mapper import OutboxMessageMapper
 from ...domain.entities.order_dto import OrderDTO
+from ...domain.entities.order_summary_dto import OrderSummaryDTO
+from ...domain.entities.outbox_message_dto import OutboxMessageDTO
+from ...domain.entities.page_dto import PageDTO
 from ...domain.repositories.orders_repository import OrdersRepository
 
 
@@ -9,15 +13,15 @@ class OrdersAdapter(OrdersRepository):
     Adapter class to interact with the OrderDAO and convert between OrderDTO and OrderModel.
     """
 
-    def get_orders_by_client(self, client_id: str) -> list[OrderDTO]:
-        return OrderMapper.to_dto_single_list(OrderDAO.find_by_client_id(client_id))
+    def get_orders_by_client(self, client_id: str, summary: bool = False) -> list[OrderDTO | OrderSummaryDTO]:
+        return self._to_dto_list(OrderDAO.find_by_client_id(client_id, summary), summary)
 
     def get_by_id(self, id: str) -> OrderDTO | None:
         order = OrderDAO.get_order_by_id(id)
         return OrderMapper.to_dto(order) if order else None
 
-    def add(self, order: OrderDTO) -> OrderDTO | None:
-        order_id = OrderDAO.save(OrderMapper.to_model(order))
+    def add(self, order: OrderDTO, outbox_messages: list[OutboxMessageDTO] = None) -> OrderDTO | None:
+        order_id = OrderDAO.save(OrderMapper.to_model(order), OutboxMessageMapper.to_model_list(outbox_messages))
         returned = OrderDAO.get_order_by_id(order_id)
         return OrderMapper.to_dto(returned) if returned else None
 
@@ -25,5 +29,19 @@ class OrdersAdapter(OrdersRepository):
         updated = OrderDAO.update(OrderMapper.to_model(order))
         return OrderMapper.to_dto(updated) if updated else None
 
-    def get_orders_by_salesman(self, salesman_id: str) -> list[OrderDTO]:
-        return OrderMapper.to_dto_single_list(OrderDAO.find_by_salesman_id(salesman_id))
+    def get_orders_by_salesman(self, salesman_id: str, summary: bool = False) -> list[OrderDTO | OrderSummaryDTO]:
+        return self._to_dto_list(OrderDAO.find_by_salesman_id(salesman_id, summary), summary)
+
+    def get_orders_page_by_client(self, client_id: str, limit: int, cursor: str = None,
+                                  summary: bool = False) -> PageDTO:
+        orders, next_cursor = OrderDAO.find_page_by_client_id(client_id, limit, cursor, summary)
+        return PageDTO(self._to_dto_list(orders, summary), next_cursor)
+
+    def get_orders_page_by_salesman(self, salesman_id: str, limit: int, cursor: str = None,
+                                    summary: bool = False) -> PageDTO:
+        orders, next_cursor = OrderDAO.find_page_by_salesman_id(salesman_id, limit, cursor, summary)
+        return PageDTO(self._to_dto_list(orders, summary), next_cursor)
+
+    @staticmethod
+    def _to_dto_list(orders: list, summary: bool) -> list[OrderDTO | OrderSummaryDTO]:
+        return OrderMapper.to_summary_dto_list(orders) if summary else OrderMapper.to_dto_list(orders)
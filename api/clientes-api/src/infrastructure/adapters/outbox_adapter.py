@@ -0,0 +1,13 @@
+from ..dao.outbox_dao import OutboxDAO
+from ..mapper.outbox_message_mapper import OutboxMessageMapper
+from ...domain.entities.outbox_message_dto import OutboxMessageDTO
+from ...domain.repositories.outbox_repository import OutboxRepository
+
+
+class OutboxAdapter(OutboxRepository):
+
+    def claim_pending(self, limit: int, lease_seconds: int) -> list[OutboxMessageDTO]:
+        return OutboxMessageMapper.to_dto_list(OutboxDAO.claim_pending(limit, lease_seconds))
+
+    def delete(self, message_ids: list[str]) -> int:
+        return OutboxDAO.delete(message_ids)
@@ -0,0 +1,19 @@
+from ..dao.report_job_dao import ReportJobDAO
+from ..mapper.report_job_mapper import ReportJobMapper
+from ...domain.entities.reports.report_job_dto import ReportJobDTO
+from ...domain.repositories.report_jobs_repository import ReportJobsRepository
+
+
+class ReportJobsAdapter(ReportJobsRepository):
+
+    def add(self, dto: ReportJobDTO) -> ReportJobDTO:
+        report_job = ReportJobDAO.save(ReportJobMapper.to_model(dto))
+        return ReportJobMapper.to_dto(report_job)
+
+    def get_by_id(self, job_id: str) -> ReportJobDTO | None:
+        return ReportJobMapper.to_dto(ReportJobDAO.get_by_id(job_id))
+
+    def update_status(self, job_id: str, status: str, report_id: str = None, url: str = None,
+                      error: str = None) -> ReportJobDTO | None:
+        report_job = ReportJobDAO.update_status(job_id, status, report_id=report_id, url=url, error=error)
+        return ReportJobMapper.to_dto(report_job)
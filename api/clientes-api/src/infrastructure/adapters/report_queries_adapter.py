@@ -7,30 +7,43 @@ class ReportQueriesAdapter:
     def __init__(self):
         self.report_queries_dao = ReportQueriesDao()
 
-    def get_monthly_product_sales(self, start_date, end_date):
+    def get_monthly_product_sales(self, start_date, end_date, stream=False):
         """
         Get monthly product sales report using native SQL.
         :param start_date: Start date for the report in format 'YYYY-MM-DD'
         :param end_date: End date for the report in format 'YYYY-MM-DD'
+        :param stream: Whether to stream the rows instead of loading them in a list
         :return: Dictionary with report data containing product sales information
         """
-        return self.report_queries_dao.get_monthly_product_sales(start_date, end_date)
+        return self.report_queries_dao.get_monthly_product_sales(start_date, end_date, stream)
 
-    def get_monthly_sales(self, start_date, end_date):
+    def get_monthly_sales(self, start_date, end_date, stream=False):
         """
         Get monthly sales report using native SQL.
         :param start_date: Start date for the report in format 'YYYY-MM-DD'
         :param end_date: End date for the report in format 'YYYY-MM-DD'
+        :param stream: Whether to stream the rows instead of loading them in a list
         :return: Dictionary with report data containing sales information
         """
-        return self.report_queries_dao.get_monthly_sales(start_date, end_date)
+        return self.report_queries_dao.get_monthly_sales(start_date, end_date, stream)
 
-    def get_monthly_sales_by_salesman(self, start_date, end_date, salesman_id):
+    def get_monthly_sales_by_salesman(self, start_date, end_date, salesman_id, stream=False):
         """
         Get monthly sales by salesman report using native SQL.
         :param start_date: Start date for the report in format 'YYYY-MM-DD'
         :param end_date: End date for the report in format 'YYYY-MM-DD'
         :param salesman_id: ID of the salesman
+        :param stream: Whether to stream the rows instead of loading them in a list
         :return: Dictionary with report data containing sales information by salesman
         """
-        return self.report_queries_dao.get_sales_per_salesman(start_date, end_date, salesman_id)
\ No newline at end of file
+        return self.report_queries_dao.get_sales_per_salesman(start_date, end_date, salesman_id, stream)
+
+    def get_sales_summary_per_salesman(self, start_date, end_date, stream=False):
+        """
+        Get the orders and sales of every salesman from the daily sales rollups.
+        :param start_date: Start date for the report in format 'YYYY-MM-DD'
+        :param end_date: End date for the report in format 'YYYY-MM-DD'
+        :param stream: Whether to stream the rows instead of loading them in a list
+        :return: Dictionary with report data containing the sales of each salesman
+        """
+        return self.report_queries_dao.get_sales_summary_per_salesman(start_date, end_date, stream)
@@ -0,0 +1,10 @@
+from datetime import date
+
+from ..dao.sales_rollup_dao import SalesRollupDAO
+from ...domain.repositories.sales_rollups_repository import SalesRollupsRepository
+
+
+class SalesRollupsAdapter(SalesRollupsRepository):
+
+    def rebuild(self, start_date: date = None, end_date: date = None) -> int:
+        return SalesRollupDAO.rebuild(start_date, end_date)
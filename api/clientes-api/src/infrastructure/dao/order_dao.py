@@ -1,24 +1,69 @@
 from datetime import datetime, timezone
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from .pagination import paginate
+from .sales_rollup_dao import SalesRollupDAO
 from ..database.declarative_base import Session
 from ..model.order_model import OrderModel
+from ..model.outbox_message_model import OutboxMessageModel
+
+# Columns of an order shown in the order lists
+SUMMARY_COLUMNS = [
+    OrderModel.id,
+    OrderModel.client_id,
+    OrderModel.salesman_id,
+    OrderModel.status,
+    OrderModel.total,
+    OrderModel.currency,
+    OrderModel.created_at,
+]
 
 
 class OrderDAO:
 
     @classmethod
-    def find_by_client_id(cls, client_id: str) -> list[OrderModel]:
+    def _list_query(cls, session, summary: bool = False):
+        """
+        Query of an order list.
+        :param session: Session of the query.
+        :param summary: True to select only the summary columns, without relationships.
+        :return: The query, the relationships of the orders are loaded with one query each.
+        """
+        if summary:
+            return session.query(*SUMMARY_COLUMNS)
+
+        return session.query(OrderModel).options(
+            selectinload(OrderModel.order_details),
+            selectinload(OrderModel.client_info),
+            selectinload(OrderModel.payment)
+        )
+
+    @classmethod
+    def find_by_client_id(cls, client_id: str, summary: bool = False) -> list:
         """
         Find all orders by client ID.
         :param client_id: ID of the client to find orders for.
-        :return: List of OrderModel if found.
+        :param summary: True to find only the summary columns of the orders.
+        :return: List of OrderModel, or of rows of the summary columns, if found.
         """
-        session = Session()
-        orders = session.query(OrderModel).filter(OrderModel.client_id == client_id).all()
-        session.close()
-        return orders
+        with Session() as session:
+            return cls._list_query(session, summary).filter(OrderModel.client_id == client_id).all()
+
+    @classmethod
+    def find_page_by_client_id(cls, client_id: str, limit: int, cursor: str = None,
+                               summary: bool = False) -> tuple[list, str | None]:
+        """
+        Find a page of the orders of a client, from the newest to the oldest.
+        :param client_id: ID of the client to find orders for.
+        :param limit: Maximum number of orders of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to find only the summary columns of the orders.
+        :return: Tuple of (orders, cursor of the next page)
+        """
+        with Session() as session:
+            query = cls._list_query(session, summary).filter(OrderModel.client_id == client_id)
+            return paginate(query, [OrderModel.created_at, OrderModel.id], limit, cursor, descending=True)
 
     @classmethod
     def get_by_id(cls, order_id: str) -> OrderModel | None:
@@ -33,15 +78,19 @@ class OrderDAO:
         return order
 
     @classmethod
-    def save(cls, order: OrderModel) -> str:
+    def save(cls, order: OrderModel, outbox_messages: list[OutboxMessageModel] = None) -> str:
         """
-        Save a new order to the database.
+        Save a new order to the database and add it to the sales rollups.
         :param order: OrderModel to save.
+        :param outbox_messages: Messages of the order, relayed to the messaging system once it is committed.
         :return: ID of the saved order.
         """
         session = Session()
-        order.created_at = datetime.now(timezone.utc)
+        order.created_at = order.created_at or datetime.now(timezone.utc)
         session.add(order)
+        # The sales rollups and the outbox messages are saved in the same transaction as the order
+        SalesRollupDAO.add_order(session, order)
+        session.add_all(outbox_messages or [])
         session.commit()
         session.refresh(order)
         session.close()
@@ -78,13 +127,27 @@ class OrderDAO:
             return order
 
     @classmethod
-    def find_by_salesman_id(cls, salesman_id: str) -> list[OrderModel]:
+    def find_by_salesman_id(cls, salesman_id: str, summary: bool = False) -> list:
         """
         Find all orders by salesman ID.
         :param salesman_id: ID of the salesman to find orders for.
-        :return: List of OrderModel if found.
+        :param summary: True to find only the summary columns of the orders.
+        :return: List of OrderModel, or of rows of the summary columns, if found.
         """
-        session = Session()
-        orders = session.query(OrderModel).filter(OrderModel.salesman_id == salesman_id).all()
-        session.close()
-        return orders
+        with Session() as session:
+            return cls._list_query(session, summary).filter(OrderModel.salesman_id == salesman_id).all()
+
+    @classmethod
+    def find_page_by_salesman_id(cls, salesman_id: str, limit: int, cursor: str = None,
+                                 summary: bool = False) -> tuple[list, str | None]:
+        """
+        Find a page of the orders of a salesman, from the newest to the oldest.
+        :param salesman_id: ID of the salesman to find orders for.
+        :param limit: Maximum number of orders of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to find only the summary columns of the orders.
+        :return: Tuple of (orders, cursor of the next page)
+        """
+        with Session() as session:
+            query = cls._list_query(session, summary).filter(OrderModel.salesman_id == salesman_id)
+            return paginate(query, [OrderModel.created_at, OrderModel.id], limit, cursor, descending=True)
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta, timezone
+
+from ..database.declarative_base import Session
+from ..model.outbox_message_model import OutboxMessageModel
+
+
+class OutboxDAO:
+    """
+    OutboxDAO is a data access object for the OutboxMessageModel.
+    The messages are saved by OrderDAO in the transaction of their order, and relayed from here.
+    """
+
+    @classmethod
+    def claim_pending(cls, limit: int, lease_seconds: int) -> list[OutboxMessageModel]:
+        """
+        Claim the oldest messages ready to be relayed. A claimed message is not returned again until its lease
+        expires, so several relays can run at once and a message not confirmed in time is relayed again.
+        :param limit: Maximum number of messages to claim.
+        :param lease_seconds: Seconds the messages are claimed for.
+        :return: List of the claimed OutboxMessageModel.
+        """
+        now = datetime.now(timezone.utc)
+        with Session() as session:
+            messages = session.query(OutboxMessageModel) \
+                .filter(OutboxMessageModel.available_at <= now) \
+                .order_by(OutboxMessageModel.available_at, OutboxMessageModel.created_at) \
+                .limit(limit) \
+                .with_for_update(skip_locked=True) \
+                .all()
+
+            for message in messages:
+                message.attempts += 1
+                message.available_at = now + timedelta(seconds=lease_seconds)
+            session.commit()
+            for message in messages:
+                session.refresh(message)
+            return messages
+
+    @classmethod
+    def delete(cls, message_ids: list[str]) -> int:
+        """
+        Delete relayed messages.
+        :param message_ids: IDs of the messages to delete.
+        :return: Number of deleted messages.
+        """
+        if not message_ids:
+            return 0
+
+        with Session() as session:
+            deleted = session.query(OutboxMessageModel) \
+                .filter(OutboxMessageModel.id.in_(message_ids)) \
+                .delete(synchronize_session=False)
+            session.commit()
+            return deleted
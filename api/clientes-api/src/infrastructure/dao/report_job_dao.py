@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+
+from ..database.declarative_base import Session
+from ..model.report_job_model import ReportJobModel
+
+
+class ReportJobDAO:
+    """
+    ReportJobDAO is a data access object for the ReportJobModel.
+    It provides methods to interact with the report jobs in the database.
+    """
+
+    @classmethod
+    def save(cls, report_job: ReportJobModel) -> ReportJobModel:
+        """
+        Save a new report job to the database.
+        :param report_job: ReportJobModel to save.
+        :return: The saved ReportJobModel.
+        """
+        with Session() as session:
+            report_job.created_at = datetime.now(timezone.utc)
+            session.add(report_job)
+            session.commit()
+            session.refresh(report_job)
+            return report_job
+
+    @classmethod
+    def get_by_id(cls, job_id: str) -> ReportJobModel | None:
+        """
+        Get a report job by ID.
+        :param job_id: ID of the report job to find.
+        :return: ReportJobModel if found, None otherwise.
+        """
+        with Session() as session:
+            return session.query(ReportJobModel).filter(ReportJobModel.id == job_id).first()
+
+    @classmethod
+    def update_status(cls, job_id: str, status: str, **fields) -> ReportJobModel | None:
+        """
+        Update the status of a report job.
+        :param job_id: ID of the report job to update.
+        :param status: New status of the job.
+        :param fields: Other columns to update (report_id, url, error).
+        :return: The updated ReportJobModel, None if the job does not exist.
+        """
+        with Session() as session:
+            report_job = session.query(ReportJobModel).filter(ReportJobModel.id == job_id).first()
+            if report_job is None:
+                return None
+
+            report_job.status = status
+            for column, value in fields.items():
+                setattr(report_job, column, value)
+            report_job.updated_at = datetime.now(timezone.utc)
+            session.commit()
+            session.refresh(report_job)
+            return report_job
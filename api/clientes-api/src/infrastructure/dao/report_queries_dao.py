@@ -1,11 +1,17 @@
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from sqlalchemy import text
 
 from ..database.declarative_base import Session
 
+# Rows fetched per round trip when a report is streamed from a server-side cursor
+REPORT_FETCH_SIZE = int(os.environ.get('REPORT_FETCH_SIZE', 1000))
+
+SALES_COLUMNS = ["orderId", "createdAt", "quantity", "subtotal", "tax", "total", "currency", "status"]
+
+
 class ReportQueriesDao:
 
     def __init__(self):
@@ -13,12 +19,13 @@ class ReportQueriesDao:
         self.queries_dir = Path(__file__).parent.parent / "resources" / "queries"
         os.makedirs(self.queries_dir, exist_ok=True)
 
-    def get_monthly_product_sales(self, start_date, end_date):
+    def get_monthly_product_sales(self, start_date, end_date, stream=False):
         """
-        Get monthly product sales report using native SQL.
+        Get monthly product sales report from the daily product sales rollup.
 
         :param start_date: Start date for the report in format 'YYYY-MM-DD'
         :param end_date: End date for the report in format 'YYYY-MM-DD'
+        :param stream: Whether to stream the rows from a server-side cursor instead of loading them in a list
         :return: Dictionary with report data containing product sales information
         """
         try:
@@ -28,20 +35,13 @@ class ReportQueriesDao:
                 query = query_file.read()
 
             # Execute query with parameters
-            result = self.session.execute(
-                text(query),
-                {"start_date": start_date, "end_date": end_date}
+            report_data = self._rows(
+                query,
+                {"start_date": start_date, "end_date": end_date},
+                ["productId", "totalQuantity", "totalSales"],
+                stream
             )
 
-            # Convert results to list of dictionaries
-            report_data = []
-            for row in result:
-                report_data.append({
-                    "productId": row[0],
-                    "totalQuantity": row[1],
-                    "totalSales": row[2]
-                })
-
             # Create report metadata
             report_metadata = {
                 "report_type": "monthly_product_sales",
@@ -50,7 +50,7 @@ class ReportQueriesDao:
                     "end_date": end_date
                 },
                 "generated_at": datetime.now().isoformat(),
-                "total_records": len(report_data),
+                "total_records": None if stream else len(report_data),
                 "headers": "Product ID,Total Quantity,Total Sales",
                 "data": report_data
             }
@@ -61,12 +61,13 @@ class ReportQueriesDao:
             self.session.rollback()
             raise Exception(f"Error generating monthly product sales report: {str(e)}")
 
-    def get_monthly_sales(self, start_date, end_date):
+    def get_monthly_sales(self, start_date, end_date, stream=False):
         """
         Get monthly sales report using native SQL.
 
         :param start_date: Start date for the report in format 'YYYY-MM-DD'
         :param end_date: End date for the report in format 'YYYY-MM-DD'
+        :param stream: Whether to stream the rows from a server-side cursor instead of loading them in a list
         :return: Dictionary with report data containing sales information
         """
         try:
@@ -76,25 +77,13 @@ class ReportQueriesDao:
                 query = query_file.read()
 
             # Execute query with parameters
-            result = self.session.execute(
-                text(query),
-                {"start_date": start_date, "end_date": end_date}
+            report_data = self._rows(
+                query,
+                {"start_date": start_date, "end_date_exclusive": self._day_after(end_date)},
+                SALES_COLUMNS,
+                stream
             )
 
-            # Convert results to list of dictionaries
-            report_data = []
-            for row in result:
-                report_data.append({
-                    "orderId": row[0],
-                    "createdAt": row[1],
-                    "quantity": row[2],
-                    "subtotal": row[3],
-                    "tax": row[4],
-                    "total": row[5],
-                    "currency": row[6],
-                    "status": row[7]
-                })
-
             # Create report metadata
             report_metadata = {
                 "report_type": "monthly_sales",
@@ -103,7 +92,7 @@ class ReportQueriesDao:
                     "end_date": end_date
                 },
                 "generated_at": datetime.now().isoformat(),
-                "total_records": len(report_data),
+                "total_records": None if stream else len(report_data),
                 "headers": "Order ID,Created At,Quantity,Subtotal,Tax,Total,Currency,Status",
                 "data": report_data
             }
@@ -114,13 +103,14 @@ class ReportQueriesDao:
             self.session.rollback()
             raise Exception(f"Error generating monthly sales report: {str(e)}")
 
-    def get_sales_per_salesman(self, start_date, end_date, salesman_id):
+    def get_sales_per_salesman(self, start_date, end_date, salesman_id, stream=False):
         """
         Get sales per salesman report using native SQL.
 
         :param start_date: Start date for the report in format 'YYYY-MM-DD'
         :param end_date: End date for the report in format 'YYYY-MM-DD'
         :param salesman_id: Salesman ID to filter the report
+        :param stream: Whether to stream the rows from a server-side cursor instead of loading them in a list
         :return: Dictionary with report data containing sales information
         """
         try:
@@ -130,25 +120,13 @@ class ReportQueriesDao:
                 query = query_file.read()
 
             # Execute query with parameters
-            result = self.session.execute(
-                text(query),
-                {"start_date": start_date, "end_date": end_date, "salesman_id": salesman_id}
+            report_data = self._rows(
+                query,
+                {"start_date": start_date, "end_date_exclusive": self._day_after(end_date), "salesman_id": salesman_id},
+                SALES_COLUMNS,
+                stream
             )
 
-            # Convert results to list of dictionaries
-            report_data = []
-            for row in result:
-                report_data.append({
-                    "orderId": row[0],
-                    "createdAt": row[1],
-                    "quantity": row[2],
-                    "subtotal": row[3],
-                    "tax": row[4],
-                    "total": row[5],
-                    "currency": row[6],
-                    "status": row[7]
-                })
-
             # Create report metadata
             report_metadata = {
                 "report_type": "sales_per_salesman",
@@ -158,7 +136,7 @@ class ReportQueriesDao:
                     "salesman_id": salesman_id
                 },
                 "generated_at": datetime.now().isoformat(),
-                "total_records": len(report_data),
+                "total_records": None if stream else len(report_data),
                 "headers": "Order ID,Created At,Quantity,Subtotal,Tax,Total,Currency,Status",
                 "data": report_data
             }
@@ -167,4 +145,95 @@ class ReportQueriesDao:
 
         except Exception as e:
             self.session.rollback()
-            raise Exception(f"Error generating sales per salesman report: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error generating sales per salesman report: {str(e)}")
+
+    def get_sales_summary_per_salesman(self, start_date, end_date, stream=False):
+        """
+        Get the orders and sales of every salesman from the daily salesman sales rollup.
+
+        :param start_date: Start date for the report in format 'YYYY-MM-DD'
+        :param end_date: End date for the report in format 'YYYY-MM-DD'
+        :param stream: Whether to stream the rows from a server-side cursor instead of loading them in a list
+        :return: Dictionary with report data containing the sales of each salesman
+        """
+        try:
+            # Read SQL query from file
+            query_path = self.queries_dir / "sales_summary_per_salesman.sql"
+            with open(query_path, 'r') as query_file:
+                query = query_file.read()
+
+            # Execute query with parameters
+            report_data = self._rows(
+                query,
+                {"start_date": start_date, "end_date": end_date},
+                ["salesmanId", "totalOrders", "totalSales"],
+                stream
+            )
+
+            # Create report metadata
+            report_metadata = {
+                "report_type": "sales_summary_per_salesman",
+                "filters": {
+                    "start_date": start_date,
+                    "end_date": end_date
+                },
+                "generated_at": datetime.now().isoformat(),
+                "total_records": None if stream else len(report_data),
+                "headers": "Salesman ID,Total Orders,Total Sales",
+                "data": report_data
+            }
+
+            return report_metadata
+
+        except Exception as e:
+            self.session.rollback()
+            raise Exception(f"Error generating sales summary per salesman report: {str(e)}")
+
+    @staticmethod
+    def _day_after(end_date):
+        """
+        Exclusive upper bound of the detail reports, so the range on created_at can use its index.
+
+        :param end_date: Last day of the report in format 'YYYY-MM-DD'
+        :return: The following day in format 'YYYY-MM-DD', or None without an end date, which matches no rows
+        """
+        if not end_date:
+            return None
+        return (date.fromisoformat(end_date) + timedelta(days=1)).isoformat()
+
+    def _rows(self, query, params, columns, stream):
+        """
+        Execute a report query and map its rows to dictionaries.
+
+        :param query: Native SQL query
+        :param params: Parameters of the query
+        :param columns: Keys of the row dictionaries, in the order of the selected columns
+        :param stream: Whether to return a generator reading a server-side cursor instead of a list
+        :return: List or generator of dictionaries
+        """
+        if stream:
+            return self._stream_rows(query, params, columns)
+
+        result = self.session.execute(text(query), params)
+        return [dict(zip(columns, row)) for row in result]
+
+    def _stream_rows(self, query, params, columns):
+        """
+        Yield the rows of a report query fetching REPORT_FETCH_SIZE rows at a time, so only one batch is held in
+        memory. The query runs when the first row is requested.
+        """
+        result = None
+        try:
+            result = self.session.execute(
+                text(query),
+                params,
+                execution_options={"stream_results": True, "yield_per": REPORT_FETCH_SIZE}
+            )
+            for row in result:
+                yield dict(zip(columns, row))
+        except Exception as e:
+            self.session.rollback()
+            raise Exception(f"Error streaming report rows: {str(e)}")
+        finally:
+            if result is not None:
+                result.close()
@@ -0,0 +1,106 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..database.declarative_base import Session
+from ..model.daily_product_sales_model import DailyProductSalesModel
+from ..model.daily_salesman_sales_model import DailySalesmanSalesModel
+from ..model.order_details_model import OrderDetailsModel
+from ..model.order_model import OrderModel
+
+# Insert statements supporting ON CONFLICT DO UPDATE, per database dialect
+UPSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+class SalesRollupDAO:
+    """
+    SalesRollupDAO keeps the daily sales rollups of the reports: per product and per salesman.
+    """
+
+    @classmethod
+    def add_order(cls, session, order: OrderModel) -> None:
+        """
+        Add an order to the rollups of its day, in the session saving the order so both are committed together.
+        :param session: Session saving the order.
+        :param order: OrderModel being saved, with its details.
+        """
+        day = order.created_at.date()
+
+        products = defaultdict(lambda: [0, 0])
+        for detail in order.order_details:
+            products[detail.product_id][0] += detail.quantity
+            products[detail.product_id][1] += detail.total_price
+
+        for product_id, (quantity, sales) in products.items():
+            cls._increment(session, DailyProductSalesModel, {'day': day, 'product_id': product_id},
+                           total_quantity=quantity, total_sales=sales)
+
+        if order.salesman_id:
+            cls._increment(session, DailySalesmanSalesModel, {'day': day, 'salesman_id': order.salesman_id},
+                           total_orders=1, total_sales=order.total)
+
+    @classmethod
+    def rebuild(cls, start_date: date = None, end_date: date = None) -> int:
+        """
+        Recompute the rollups of a range of days from the orders.
+        :param start_date: First day to rebuild, None to start from the first order.
+        :param end_date: Last day to rebuild, None to rebuild up to the last order.
+        :return: Number of rollup rows written.
+        """
+        day = func.date(OrderModel.created_at)
+        order_filters = []
+        if start_date:
+            order_filters.append(OrderModel.created_at >= start_date)
+        if end_date:
+            order_filters.append(OrderModel.created_at < end_date + timedelta(days=1))
+
+        with Session() as session:
+            for model in (DailyProductSalesModel, DailySalesmanSalesModel):
+                query = session.query(model)
+                if start_date:
+                    query = query.filter(model.day >= start_date)
+                if end_date:
+                    query = query.filter(model.day <= end_date)
+                query.delete(synchronize_session=False)
+
+            product_sales = select(
+                day,
+                OrderDetailsModel.product_id,
+                func.sum(OrderDetailsModel.quantity),
+                func.sum(OrderDetailsModel.total_price)
+            ).join(OrderModel, OrderModel.id == OrderDetailsModel.order_id) \
+                .where(OrderModel.created_at.isnot(None), *order_filters) \
+                .group_by(day, OrderDetailsModel.product_id)
+            products = session.execute(insert(DailyProductSalesModel).from_select(
+                ['day', 'product_id', 'total_quantity', 'total_sales'], product_sales))
+
+            salesman_sales = select(
+                day,
+                OrderModel.salesman_id,
+                func.count(OrderModel.id),
+                func.sum(OrderModel.total)
+            ).where(OrderModel.created_at.isnot(None), OrderModel.salesman_id.isnot(None), *order_filters) \
+                .group_by(day, OrderModel.salesman_id)
+            salesmen = session.execute(insert(DailySalesmanSalesModel).from_select(
+                ['day', 'salesman_id', 'total_orders', 'total_sales'], salesman_sales))
+
+            session.commit()
+            return products.rowcount + salesmen.rowcount
+
+    @classmethod
+    def _increment(cls, session, model, keys: dict, **amounts) -> None:
+        """
+        Add amounts to the row of a rollup, creating it if it does not exist, in a single statement.
+        """
+        upsert = UPSERTS[session.get_bind().dialect.name]
+        statement = upsert(model).values(**keys, **amounts)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={column: getattr(model, column) + statement.excluded[column] for column in amounts}
+        )
+        session.execute(statement)
@@ -4,6 +4,7 @@ from .client_info_mapper import ClientInfoMapper
 from .order_details_mapper import OrderDetailsMapper
 from .payment_mapper import PaymentMapper
 from ...domain.entities.order_dto import OrderDTO
+from ...domain.entities.order_summary_dto import OrderSummaryDTO
 from ...infrastructure.model.order_model import OrderModel
 
 
@@ -76,6 +77,26 @@ class OrderMapper:
 
         return dto
 
+    @staticmethod
+    def to_summary_dto(row) -> OrderSummaryDTO | None:
+        """
+        Convert a row of the summary columns of an order to OrderSummaryDTO.
+        :param row: The row with the summary columns of an OrderModel.
+        :return: An OrderSummaryDTO instance.
+        """
+        if row is None:
+            return None
+
+        return OrderSummaryDTO(
+            id=row.id,
+            client_id=row.client_id,
+            salesman_id=row.salesman_id,
+            status=row.status.value,
+            total=row.total,
+            currency=row.currency,
+            created_at=row.created_at.isoformat() if row.created_at else None,
+        )
+
     @staticmethod
     def to_model(dto: OrderDTO) -> OrderModel | None:
         """
@@ -125,3 +146,12 @@ class OrderMapper:
         :return: A list of OrderDTO instances.
         """
         return [OrderMapper.to_single_dto(model) for model in models]
+
+    @staticmethod
+    def to_summary_dto_list(rows: list) -> list[OrderSummaryDTO]:
+        """
+        Convert a list of rows of the summary columns of an order to a list of OrderSummaryDTO.
+        :param rows: The rows with the summary columns of OrderModel.
+        :return: A list of OrderSummaryDTO instances.
+        """
+        return [OrderMapper.to_summary_dto(row) for row in rows]
@@ -0,0 +1,53 @@
+from ...domain.entities.outbox_message_dto import OutboxMessageDTO
+from ...infrastructure.model.outbox_message_model import OutboxMessageModel
+
+
+class OutboxMessageMapper:
+    """
+    Mapper class to convert between OutboxMessageModel and OutboxMessageDTO.
+    """
+
+    @staticmethod
+    def to_dto(model: OutboxMessageModel) -> OutboxMessageDTO | None:
+        """
+        Convert OutboxMessageModel to OutboxMessageDTO.
+        :param model: The OutboxMessageModel instance to convert.
+        :return: An OutboxMessageDTO instance.
+        """
+        if model is None:
+            return None
+
+        return OutboxMessageDTO(
+            id=model.id,
+            exchange=model.exchange,
+            routing_key=model.routing_key,
+            message=model.payload,
+            attempts=model.attempts,
+            created_at=model.created_at.isoformat() if model.created_at else None
+        )
+
+    @staticmethod
+    def to_model(dto: OutboxMessageDTO) -> OutboxMessageModel | None:
+        """
+        Convert OutboxMessageDTO to OutboxMessageModel.
+        :param dto: The OutboxMessageDTO instance to convert.
+        :return: An OutboxMessageModel instance.
+        """
+        if dto is None:
+            return None
+
+        return OutboxMessageModel(
+            id=dto.id,
+            exchange=dto.exchange,
+            routing_key=dto.routing_key,
+            payload=dto.message,
+            attempts=dto.attempts
+        )
+
+    @staticmethod
+    def to_dto_list(models: list[OutboxMessageModel]) -> list[OutboxMessageDTO]:
+        return [OutboxMessageMapper.to_dto(model) for model in models]
+
+    @staticmethod
+    def to_model_list(dtos: list[OutboxMessageDTO]) -> list[OutboxMessageModel]:
+        return [OutboxMessageMapper.to_model(dto) for dto in dtos or []]
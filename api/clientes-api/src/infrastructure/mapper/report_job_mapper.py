@@ -0,0 +1,52 @@
+from ...domain.entities.reports.report_job_dto import ReportJobDTO
+from ...infrastructure.model.report_job_model import ReportJobModel
+
+
+class ReportJobMapper:
+    """
+    Mapper class to convert between ReportJobModel and ReportJobDTO.
+    """
+
+    @staticmethod
+    def to_dto(model: ReportJobModel) -> ReportJobDTO | None:
+        """
+        Convert ReportJobModel to ReportJobDTO.
+        :param model: The ReportJobModel instance to convert.
+        :return: A ReportJobDTO instance.
+        """
+        if model is None:
+            return None
+
+        return ReportJobDTO(
+            job_id=model.id,
+            user_id=model.user_id,
+            report_type=model.type,
+            filters=model.filters,
+            status=model.status,
+            report_id=model.report_id,
+            url=model.url,
+            error=model.error,
+            created_at=model.created_at.isoformat() if model.created_at else None,
+            updated_at=model.updated_at.isoformat() if model.updated_at else None
+        )
+
+    @staticmethod
+    def to_model(dto: ReportJobDTO) -> ReportJobModel | None:
+        """
+        Convert ReportJobDTO to ReportJobModel.
+        :param dto: The ReportJobDTO instance to convert.
+        :return: A ReportJobModel instance.
+        """
+        if dto is None:
+            return None
+
+        return ReportJobModel(
+            id=dto.job_id,
+            user_id=dto.user_id,
+            type=dto.report_type,
+            filters=dto.filters,
+            status=dto.status,
+            report_id=dto.report_id,
+            url=dto.url,
+            error=dto.error
+        )
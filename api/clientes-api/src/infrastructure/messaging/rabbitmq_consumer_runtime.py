@@ -0,0 +1,352 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+import pika
+
+from ..database.declarative_base import unit_of_work
+from ..monitoring.metrics import REGISTRY
+
+# Defaults of every consumer, tunable per deployment
+CONSUMER_WORKERS = int(os.environ.get('RABBITMQ_CONSUMER_WORKERS', 4))
+CONSUMER_PREFETCH = int(os.environ.get('RABBITMQ_CONSUMER_PREFETCH', 16))
+CONSUMER_MAX_RETRIES = int(os.environ.get('RABBITMQ_CONSUMER_MAX_RETRIES', 3))
+CONSUMER_ACK_BATCH_SIZE = int(os.environ.get('RABBITMQ_CONSUMER_ACK_BATCH_SIZE', 8))
+
+# Seconds between two flushes of the pending acks, and between two samples of the queue backlog
+ACK_FLUSH_INTERVAL = 0.2
+BACKLOG_SAMPLE_INTERVAL = 10
+RECONNECT_DELAY = 5
+
+RETRIES_HEADER = 'x-retries'
+ERROR_HEADER = 'x-error'
+
+# Counters of every consumer of the process, by queue
+CONSUMER_STATS = {}
+_RUNTIMES = []
+
+
+def _outcome_samples():
+    return [({"queue": queue_name, "outcome": outcome}, getattr(stats, outcome))
+            for queue_name, stats in list(CONSUMER_STATS.items())
+            for outcome in ("succeeded", "retried", "dead_lettered")]
+
+
+def _queue_samples(attribute):
+    return lambda: [({"queue": queue_name}, getattr(stats, attribute))
+                    for queue_name, stats in list(CONSUMER_STATS.items())]
+
+
+# Read from the stats of the consumers when the metrics are scraped
+REGISTRY.collector("rabbitmq_consumed_messages_total", "counter", "Messages processed by the consumers, by outcome",
+                   _outcome_samples)
+REGISTRY.collector("rabbitmq_received_messages_total", "counter", "Messages received by the consumers",
+                   _queue_samples("received"))
+REGISTRY.collector("rabbitmq_consumer_backlog_messages", "gauge", "Messages ready in the queue at the last sample",
+                   _queue_samples("backlog"))
+
+
+class ConsumerStats:
+    """Throughput and lag counters of a queue consumer"""
+
+    def __init__(self, queue_name):
+        self.queue = queue_name
+        self.started_at = time.monotonic()
+        self.received = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        # Messages ready in the queue at the last sample, and seconds from delivery to ack of the last message
+        self.backlog = None
+        self.last_latency = None
+        self._lock = threading.Lock()
+
+    def increment(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def to_dict(self):
+        processed = self.succeeded + self.retried + self.dead_lettered
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "queue": self.queue,
+            "received": self.received,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "deadLettered": self.dead_lettered,
+            "inFlight": self.received - processed,
+            "messagesPerSecond": round(processed / elapsed, 3),
+            "backlog": self.backlog,
+            "lastLatencySeconds": self.last_latency
+        }
+
+
+class _Delivery:
+    def __init__(self, generation, delivery_tag, properties, body):
+        self.generation = generation
+        self.delivery_tag = delivery_tag
+        self.properties = properties
+        self.body = body
+        self.received_at = time.monotonic()
+
+
+class RabbitMQConsumerRuntime:
+    """
+    Consumes a queue with a pool of worker threads.
+
+    The connection thread owns the channel, because pika connections are not thread safe: it receives up to
+    `prefetch` unacked messages, hands them to the workers and acks the finished ones in batches. A failed message
+    is published again to the queue up to `max_retries` times, then to the `<queue>.dead-letter` queue, so a poison
+    message does not loop forever. `stop` stops receiving and waits for the messages in progress.
+    """
+
+    def __init__(self, connection_manager, queue_name, callback, exchange=None, routing_key=None,
+                 exchange_type='direct', workers=None, prefetch=None, max_retries=None, ack_batch_size=None):
+        self.logger = logging.getLogger(__name__)
+        self.connection_manager = connection_manager
+        self.queue = queue_name
+        self.dead_letter_queue = f"{queue_name}.dead-letter"
+        self.callback = callback
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self.exchange_type = exchange_type
+        self.workers = workers or CONSUMER_WORKERS
+        self.prefetch = max(prefetch or CONSUMER_PREFETCH, self.workers)
+        self.max_retries = CONSUMER_MAX_RETRIES if max_retries is None else max_retries
+        self.ack_batch_size = min(ack_batch_size or CONSUMER_ACK_BATCH_SIZE, self.prefetch)
+        self.stats = ConsumerStats(queue_name)
+
+        self._deliveries = queue.Queue()
+        self._results = queue.Queue()
+        self._stopping = threading.Event()
+        self._generation = 0
+        self._connection = None
+        self._channel = None
+        self._in_flight = set()
+        self._completed = set()
+        # Finished messages acked one by one, ahead of the finished prefix of the delivery tags
+        self._acked = set()
+        self._next_ack = 1
+        self._last_flush = time.monotonic()
+        self._threads = []
+
+    def start(self):
+        """
+        Start the workers and the connection thread.
+        :return: The connection thread
+        """
+        for index in range(self.workers):
+            worker = threading.Thread(target=self._work, name=f"{self.queue}-worker-{index}", daemon=True)
+            worker.start()
+            self._threads.append(worker)
+
+        consumer_thread = threading.Thread(target=self._run, name=f"{self.queue}-consumer", daemon=True)
+        consumer_thread.start()
+        self._threads.append(consumer_thread)
+
+        CONSUMER_STATS[self.queue] = self.stats
+        _RUNTIMES.append(self)
+        self.logger.info(f"Consuming {self.queue} with {self.workers} workers and prefetch {self.prefetch}")
+        return consumer_thread
+
+    def stop(self, timeout=30):
+        """
+        Stop receiving messages, finish and ack the messages in progress and stop the workers.
+        :param timeout: Seconds to wait for the messages in progress, in total for every thread.
+        """
+        deadline = time.monotonic() + timeout
+        self._stopping.set()
+        if self in _RUNTIMES:
+            _RUNTIMES.remove(self)
+        consumer_thread = self._threads[-1] if self._threads else None
+        if consumer_thread:
+            consumer_thread.join(_remaining(deadline))
+        for _ in range(self.workers):
+            self._deliveries.put(None)
+        for worker in self._threads[:-1]:
+            worker.join(_remaining(deadline))
+        self.logger.info(f"Stopped consuming {self.queue}: {self.stats.to_dict()}")
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                self._consume()
+            except Exception as e:
+                self.logger.error(f"Consumer error on {self.queue}: {str(e)}")
+                self._release_connection()
+                if not self._stopping.wait(RECONNECT_DELAY):
+                    self.logger.info(f"Attempting to restart consumer of {self.queue}...")
+
+    def _consume(self):
+        self._connection = self.connection_manager.get_connection()
+        self._channel = self._connection.channel()
+        # Delivery tags restart on a new channel; results of the previous one are dropped, the broker redelivers them
+        self._generation += 1
+        self._in_flight = set()
+        self._completed = set()
+        self._acked = set()
+        self._next_ack = 1
+
+        self._channel.queue_declare(queue=self.queue, durable=True)
+        self._channel.queue_declare(queue=self.dead_letter_queue, durable=True)
+        if self.exchange and self.routing_key:
+            self._channel.exchange_declare(exchange=self.exchange, exchange_type=self.exchange_type, durable=True)
+            self._channel.queue_bind(queue=self.queue, exchange=self.exchange, routing_key=self.routing_key)
+
+        self._channel.basic_qos(prefetch_count=self.prefetch)
+        consumer_tag = self._channel.basic_consume(queue=self.queue, on_message_callback=self._on_message)
+        self.logger.info(f"Started consuming from queue: {self.queue}")
+
+        last_sample = 0
+        while not self._stopping.is_set():
+            self._connection.process_data_events(time_limit=ACK_FLUSH_INTERVAL)
+            self._drain_results()
+            if time.monotonic() - last_sample >= BACKLOG_SAMPLE_INTERVAL:
+                self.stats.backlog = self._channel.queue_declare(queue=self.queue, durable=True,
+                                                                 passive=True).method.message_count
+                last_sample = time.monotonic()
+
+        # Graceful shutdown: stop the deliveries and wait for the messages already handed to the workers
+        self._channel.basic_cancel(consumer_tag)
+        deadline = time.monotonic() + ACK_FLUSH_INTERVAL * 50
+        while self._in_flight and time.monotonic() < deadline:
+            self._connection.process_data_events(time_limit=ACK_FLUSH_INTERVAL)
+            self._drain_results()
+        self._flush_acks(force=True)
+        self._release_connection()
+
+    def _on_message(self, channel, method, properties, body):
+        self.stats.increment('received')
+        self._in_flight.add(method.delivery_tag)
+        self._deliveries.put(_Delivery(self._generation, method.delivery_tag, properties, body))
+
+    def _work(self):
+        while True:
+            delivery = self._deliveries.get()
+            if delivery is None:
+                return
+
+            error = None
+            try:
+                # The DAO calls of a message share one database connection
+                with unit_of_work():
+                    self.callback(json.loads(delivery.body))
+            except Exception as e:
+                error = e
+            self._results.put((delivery, error))
+
+            # Wake up the connection thread to ack the message
+            connection = self._connection
+            if connection is not None and connection.is_open:
+                try:
+                    connection.add_callback_threadsafe(self._drain_results)
+                except Exception as e:
+                    self.logger.debug(f"Could not wake up the consumer of {self.queue}: {str(e)}")
+
+    def _drain_results(self):
+        """Handle the messages finished by the workers, in the connection thread"""
+        while True:
+            try:
+                delivery, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if delivery.generation != self._generation:
+                continue
+
+            if error is None:
+                self.stats.increment('succeeded')
+            else:
+                self._handle_failure(delivery, error)
+            self.stats.last_latency = time.monotonic() - delivery.received_at
+            self._in_flight.discard(delivery.delivery_tag)
+            self._completed.add(delivery.delivery_tag)
+
+        pending = len(self._completed)
+        if pending and (pending >= self.ack_batch_size or not self._in_flight
+                        or time.monotonic() - self._last_flush >= ACK_FLUSH_INTERVAL):
+            self._flush_acks()
+
+    def _handle_failure(self, delivery, error):
+        """Publish a failed message again to the queue, or to the dead letter queue once out of retries"""
+        headers = dict((delivery.properties.headers if delivery.properties else None) or {})
+        retries = headers.get(RETRIES_HEADER, 0)
+        poison = isinstance(error, json.JSONDecodeError)
+
+        if poison or retries >= self.max_retries:
+            self.logger.error(f"Message of {self.queue} dead-lettered after {retries} retries: {str(error)}")
+            headers[ERROR_HEADER] = str(error)[:500]
+            target = self.dead_letter_queue
+            self.stats.increment('dead_lettered')
+        else:
+            self.logger.warning(f"Message of {self.queue} failed, retry {retries + 1}/{self.max_retries}: "
+                                f"{str(error)}")
+            headers[RETRIES_HEADER] = retries + 1
+            target = self.queue
+            self.stats.increment('retried')
+
+        self._channel.basic_publish(
+            exchange='',
+            routing_key=target,
+            body=delivery.body,
+            properties=pika.BasicProperties(
+                delivery_mode=2,  # Make message persistent
+                content_type='application/json',
+                headers=headers
+            )
+        )
+
+    def _flush_acks(self, force=False):
+        """
+        Ack the finished messages: the finished prefix of the delivery tags with a single multiple ack,
+        the messages finished out of order one by one.
+        """
+        if not self._completed or self._channel is None:
+            return
+
+        last_contiguous = None
+        while self._next_ack in self._completed or self._next_ack in self._acked:
+            if self._next_ack in self._completed:
+                self._completed.discard(self._next_ack)
+                last_contiguous = self._next_ack
+            else:
+                self._acked.discard(self._next_ack)
+            self._next_ack += 1
+        if last_contiguous is not None:
+            self._channel.basic_ack(delivery_tag=last_contiguous, multiple=True)
+
+        if force or not self._in_flight or len(self._completed) >= self.ack_batch_size:
+            for delivery_tag in sorted(self._completed):
+                self._channel.basic_ack(delivery_tag=delivery_tag)
+            self._acked |= self._completed
+            self._completed = set()
+        self._last_flush = time.monotonic()
+
+    def _release_connection(self):
+        if self._channel is not None and self._channel.is_open:
+            try:
+                self._channel.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing consumer channel of {self.queue}: {str(e)}")
+        if self._connection is not None:
+            self.connection_manager.return_connection(self._connection)
+        self._channel = None
+        self._connection = None
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until a deadline of time.monotonic, never negative"""
+    return max(0.0, deadline - time.monotonic())
+
+
+def stop_consumers(timeout=30):
+    """Gracefully stop every consumer of the process, within timeout seconds in total"""
+    deadline = time.monotonic() + timeout
+    for runtime in list(_RUNTIMES):
+        runtime.stop(_remaining(deadline))
+
+
+atexit.register(stop_consumers)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, Float, Date
+
+from ..database.declarative_base import Base
+
+
+class DailyProductSalesModel(Base):
+    """
+    DailyProductSalesModel is a SQLAlchemy model with the quantity and sales of a product in a day,
+    kept up to date as the orders are saved.
+    """
+    __tablename__ = 'daily_product_sales'
+
+    day = Column(Date, primary_key=True, nullable=False)
+    product_id = Column(String, primary_key=True, nullable=False)
+    total_quantity = Column(Float, nullable=False, default=0)
+    total_sales = Column(Float, nullable=False, default=0)
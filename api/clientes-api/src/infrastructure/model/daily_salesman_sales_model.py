@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Float, Date, Integer, Index
+
+from ..database.declarative_base import Base
+
+
+class DailySalesmanSalesModel(Base):
+    """
+    DailySalesmanSalesModel is a SQLAlchemy model with the orders and sales of a salesman in a day,
+    kept up to date as the orders are saved.
+    """
+    __tablename__ = 'daily_salesman_sales'
+    __table_args__ = (
+        # Range scans of the days of a salesman
+        Index('ix_daily_salesman_sales_salesman_id_day', 'salesman_id', 'day'),
+    )
+
+    day = Column(Date, primary_key=True, nullable=False)
+    salesman_id = Column(String, primary_key=True, nullable=False)
+    total_orders = Column(Integer, nullable=False, default=0)
+    total_sales = Column(Float, nullable=False, default=0)
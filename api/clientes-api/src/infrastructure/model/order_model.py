@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 
 import sqlalchemy
-from sqlalchemy import Column, String, Float, DateTime
+from sqlalchemy import Column, String, Float, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from ..database.declarative_base import Base
@@ -21,6 +21,13 @@ class OrderModel(Base):
     Order model for SQLAlchemy.
     """
     __tablename__ = 'orders'
+    __table_args__ = (
+        # Sort keys of the paginated listings of a client and of a salesman
+        Index('ix_orders_client_id_created_at_id', 'client_id', 'created_at', 'id'),
+        Index('ix_orders_salesman_id_created_at_id', 'salesman_id', 'created_at', 'id'),
+        # Date range of the sales reports
+        Index('ix_orders_created_at', 'created_at'),
+    )
 
     id = Column(String, primary_key=True, nullable=False)
     client_id = Column(String, nullable=False)
@@ -31,7 +38,7 @@ class OrderModel(Base):
     currency = Column(String, nullable=False)
     salesman_id = Column(String, nullable=True)
     status = Column(sqlalchemy.Enum(OrderStatusEnum), default=OrderStatusEnum.PENDIENTE)
-    created_at = Column(DateTime, nullable=True, default=datetime.utcnow())
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=True)
 
     # Relationships
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime, Integer, JSON, Index
+
+from ..database.declarative_base import Base
+
+
+class OutboxMessageModel(Base):
+    """
+    OutboxMessageModel is a SQLAlchemy model that represents the messages saved in the transaction of an order,
+    deleted once the messaging system confirms them.
+    """
+    __tablename__ = 'outbox_messages'
+    __table_args__ = (
+        # Messages ready to be relayed, oldest first
+        Index('ix_outbox_messages_available_at_created_at', 'available_at', 'created_at'),
+    )
+
+    id = Column(String, primary_key=True, nullable=False)
+    exchange = Column(String, nullable=False)
+    routing_key = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    # A relay claims a message until this date; it is relayed again if not confirmed by then
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=True, default=datetime.utcnow)
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime, JSON
+
+from ..database.declarative_base import Base
+
+
+class ReportJobModel(Base):
+    """
+    ReportJobModel is a SQLAlchemy model that represents the reports generated in the background.
+    """
+    __tablename__ = 'report_jobs'
+
+    id = Column(String, primary_key=True, nullable=False)
+    user_id = Column(String, nullable=False)
+    type = Column(String, nullable=False)
+    filters = Column(JSON, nullable=True)
+    status = Column(String, nullable=False)
+    report_id = Column(String, nullable=True)
+    url = Column(String, nullable=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=True, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=True)
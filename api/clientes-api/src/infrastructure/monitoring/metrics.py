@@ -0,0 +1,271 @@
+"""
+Metrics of a service in the Prometheus text format, aggregated in process and served on /metrics.
+
+init_metrics instruments the Flask requests (latency by route), the SQL statements of every SQLAlchemy engine
+(latency by operation) and the outbound HTTP calls made with requests (latency by upstream host). Other modules
+add their counters, histograms and collectors to REGISTRY: collectors are called only when /metrics is scraped,
+so statistics kept elsewhere, e.g. by the consumers or the connection pool, cost nothing in between.
+
+Metrics are kept per process: with several gunicorn workers each one serves its own.
+
+Each service is built on its own, so the services keep an identical copy of this module in their source tree:
+src/infrastructure/monitoring in the hexagonal APIs, src in entregas-api and src/utils in the BFFs.
+
+Environment:
+    METRICS_ENABLED: false to serve no /metrics and skip the instrumentation, true by default
+"""
+import bisect
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds, from a cached read to a slow upstream call
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count, by label values"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(labels.get(label, "") for label in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_labels(self.labels, key)} {_number(value)}" for key, value in values]
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets, by label values"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(labels.get(label, "") for label in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # Count of each bucket (the last one is +Inf), then the sum of the values
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            values = [(key, list(series)) for key, series in self._values.items()]
+
+        lines = []
+        for key, series in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = 'le="%s"' % _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+class Collector:
+    """Metric read from elsewhere when scraped: collect returns (labels, value) pairs"""
+
+    def __init__(self, name: str, kind: str, documentation: str, collect):
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.collect = collect
+
+    def samples(self):
+        lines = []
+        for labels, value in self.collect():
+            if value is not None:
+                lines.append(f"{self.name}{_labels(labels.keys(), labels.values())} {_number(value)}")
+        return lines
+
+
+class Registry:
+    """Metrics of the process, by name"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None and not isinstance(metric, Collector):
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labels=()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def collector(self, name: str, kind: str, documentation: str, collect) -> Collector:
+        """Register, or replace, a metric read by calling collect when scraped"""
+        return self._register(Collector(name, kind, documentation, collect))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                lines.append(f"# {metric.name} unavailable: {_escape(e)}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_SERVER_DURATION = REGISTRY.histogram(
+    "http_server_request_duration_seconds", "Latency of the requests served, by route",
+    ("method", "route", "status"))
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds", "Latency of the SQL statements, by operation", ("operation",))
+HTTP_CLIENT_DURATION = REGISTRY.histogram(
+    "http_client_request_duration_seconds", "Latency of the outbound HTTP calls, by upstream",
+    ("upstream", "method", "status"))
+
+_instrumented = set()
+_instrument_lock = threading.Lock()
+
+
+def metrics_enabled(environ=None) -> bool:
+    environ = os.environ if environ is None else environ
+    return environ.get("METRICS_ENABLED", "true").lower() == "true"
+
+
+def _once(name: str) -> bool:
+    """True the first time a name is given, so global instrumentation is installed once per process"""
+    with _instrument_lock:
+        if name in _instrumented:
+            return False
+        _instrumented.add(name)
+        return True
+
+
+def instrument_sqlalchemy() -> None:
+    """Time the statements of every SQLAlchemy engine of the process"""
+    if not _once("sqlalchemy"):
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("query_started_at")
+        if started:
+            operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+            DB_QUERY_DURATION.observe(time.perf_counter() - started.pop(), operation=operation)
+
+
+def instrument_requests() -> None:
+    """Time the outbound HTTP calls made with requests, by upstream host"""
+    try:
+        import requests
+    except ImportError:
+        return
+    if not _once("requests"):
+        return
+
+    send = requests.Session.send
+
+    def timed_send(self, request, **kwargs):
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = send(self, request, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            HTTP_CLIENT_DURATION.observe(time.perf_counter() - start, upstream=urlsplit(request.url).netloc,
+                                         method=request.method, status=status)
+
+    requests.Session.send = timed_send
+
+
+def init_metrics(app, environ=None) -> bool:
+    """
+    Instrument a Flask application and serve its metrics on /metrics.
+
+    Returns:
+        False if the metrics are disabled by METRICS_ENABLED
+    """
+    if not metrics_enabled(environ):
+        return False
+    from flask import Response, g, request
+
+    instrument_sqlalchemy()
+    instrument_requests()
+
+    @app.before_request
+    def start_timer():
+        g.request_started_at = time.perf_counter()
+
+    @app.after_request
+    def observe_request(response):
+        started = g.pop("request_started_at", None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+            HTTP_SERVER_DURATION.observe(time.perf_counter() - started, method=request.method, route=route,
+                                         status=str(response.status_code))
+        return response
+
+    def metrics():
+        return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+    app.add_url_rule("/metrics", "metrics", metrics, methods=["GET"])
+    return True
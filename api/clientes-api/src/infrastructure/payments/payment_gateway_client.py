@@ -0,0 +1,194 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import jwt
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+
+# Seconds to open a connection to the gateway and to wait for its response
+CONNECT_TIMEOUT = float(os.environ.get('PAYMENT_GATEWAY_CONNECT_TIMEOUT', 2))
+READ_TIMEOUT = float(os.environ.get('PAYMENT_GATEWAY_READ_TIMEOUT', 10))
+# Attempts to open a connection again, safe because nothing was sent to the gateway yet
+CONNECT_RETRIES = int(os.environ.get('PAYMENT_GATEWAY_CONNECT_RETRIES', 1))
+POOL_SIZE = int(os.environ.get('PAYMENT_GATEWAY_POOL_SIZE', 10))
+FAILURE_THRESHOLD = int(os.environ.get('PAYMENT_GATEWAY_FAILURE_THRESHOLD', 5))
+RESET_TIMEOUT = float(os.environ.get('PAYMENT_GATEWAY_RESET_TIMEOUT', 30))
+# Lifetime of a token whose expiry is unknown, and seconds before its expiry a token is renewed
+TOKEN_TTL = int(os.environ.get('PAYMENT_GATEWAY_TOKEN_TTL', 300))
+TOKEN_REFRESH_MARGIN = int(os.environ.get('PAYMENT_GATEWAY_TOKEN_REFRESH_MARGIN', 30))
+
+# Latency samples kept to compute the percentiles
+LATENCY_WINDOW = 1000
+
+# Counters of the calls to the payment gateway, by operation
+GATEWAY_STATS = {}
+
+
+class PaymentGatewayError(Exception):
+    """Raised when the payment gateway cannot be reached or fails"""
+
+
+class LatencyStats:
+    """Calls, failures and latency percentiles of the calls to the gateway"""
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.failures += int(failed)
+            self._latencies.append(seconds)
+
+    def record_rejected(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def to_dict(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+        return {
+            "operation": self.operation,
+            "calls": self.calls,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "p50Seconds": self._percentile(latencies, 0.5),
+            "p95Seconds": self._percentile(latencies, 0.95),
+            "p99Seconds": self._percentile(latencies, 0.99),
+            "maxSeconds": latencies[-1] if latencies else None
+        }
+
+    @staticmethod
+    def _percentile(latencies, quantile):
+        if not latencies:
+            return None
+        return round(latencies[min(int(len(latencies) * quantile), len(latencies) - 1)], 4)
+
+
+class PaymentGatewayClient:
+    """
+    Client of the payment gateway shared by the requests of the process.
+
+    Requests go through a pool of keep-alive connections with connect and read timeouts. The access token is
+    reused until shortly before it expires. A circuit breaker rejects the calls while the gateway keeps failing,
+    so the orders fail fast instead of waiting for the timeouts.
+    """
+
+    def __init__(self, base_url, client_id, client_secret, connect_timeout=CONNECT_TIMEOUT,
+                 read_timeout=READ_TIMEOUT, pool_size=POOL_SIZE, connect_retries=CONNECT_RETRIES,
+                 circuit_breaker=None):
+        self.logger = logging.getLogger(__name__)
+        self.base_url = base_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.timeout = (connect_timeout, read_timeout)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(FAILURE_THRESHOLD, RESET_TIMEOUT)
+
+        # POSTs are only retried when the connection could not be opened
+        retries = Retry(total=connect_retries, connect=connect_retries, read=0, status=0, other=0,
+                        allowed_methods=None, backoff_factor=0.1)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._token = None
+        self._token_expires_at = 0
+        self._token_lock = threading.Lock()
+        self.stats = {operation: GATEWAY_STATS.setdefault(operation, LatencyStats(operation))
+                      for operation in ('auth', 'payment')}
+
+    def create_payment(self, payload: dict) -> requests.Response:
+        """
+        Create a payment, renewing the access token once if the gateway reports it expired.
+        :param payload: Payment information.
+        :return: The response of the gateway, 201 if approved and 402 if rejected.
+        :raises CircuitOpenError: If the gateway is failing and the payment was not attempted.
+        :raises PaymentGatewayError: If the gateway could not be reached or failed.
+        """
+        response = self._call('payment', 'POST', '/payments', json=payload, headers=self._headers())
+        if response.status_code == 401 and "expired" in response.text.lower():
+            self.logger.info("Payment gateway token expired, renewing it")
+            self._invalidate_token()
+            response = self._call('payment', 'POST', '/payments', json=payload, headers=self._headers())
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _headers(self) -> dict:
+        return {
+            'Authorization': f'Bearer {self._access_token()}',
+            'Content-Type': 'application/json'
+        }
+
+    def _access_token(self) -> str:
+        """Current access token, requested again when it is about to expire"""
+        with self._token_lock:
+            if self._token is None or time.time() >= self._token_expires_at - TOKEN_REFRESH_MARGIN:
+                self._authenticate()
+            return self._token
+
+    def _invalidate_token(self) -> None:
+        with self._token_lock:
+            self._token = None
+
+    def _authenticate(self) -> None:
+        self.logger.info("Obtaining JWT token from payment gateway...")
+        response = self._call('auth', 'POST', '/auth/token',
+                              json={"client_id": self.client_id, "client_secret": self.client_secret})
+        if response.status_code != 200:
+            raise PaymentGatewayError(
+                f"Failed to authenticate with payment gateway: {response.status_code} - {response.text}")
+
+        data = response.json()
+        self._token = data['access_token']
+        self._token_expires_at = time.time() + self._token_lifetime(data)
+
+    def _token_lifetime(self, data: dict) -> float:
+        """Seconds the token is valid: expires_in of the response, the exp claim of the token, or TOKEN_TTL"""
+        if data.get('expires_in'):
+            return float(data['expires_in'])
+        try:
+            claims = jwt.decode(data['access_token'], options={"verify_signature": False})
+            if 'exp' in claims:
+                return claims['exp'] - time.time()
+        except jwt.PyJWTError:
+            pass
+        return TOKEN_TTL
+
+    def _call(self, operation: str, method: str, path: str, **kwargs) -> requests.Response:
+        """Call the gateway through the circuit breaker, recording the latency of the call"""
+        stats = self.stats[operation]
+        try:
+            self.circuit_breaker.before_call()
+        except CircuitOpenError:
+            stats.record_rejected()
+            raise
+
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            stats.record(time.monotonic() - started, failed=True)
+            self.circuit_breaker.record_failure()
+            raise PaymentGatewayError(f"Error connecting to payment gateway: {str(e)}") from e
+
+        failed = response.status_code >= 500
+        stats.record(time.monotonic() - started, failed=failed)
+        if failed:
+            self.circuit_breaker.record_failure()
+            raise PaymentGatewayError(f"Payment gateway error: {response.status_code} - {response.text}")
+        self.circuit_breaker.record_success()
+        return response
@@ -1,14 +1,12 @@
 SELECT 
-    od.product_id, 
-    sum(od.quantity) as total_quantity, 
-    sum(od.total_price) as total_sales
+    ps.product_id, 
+    sum(ps.total_quantity) as total_quantity, 
+    sum(ps.total_sales) as total_sales
 FROM 
-    order_details od
-JOIN 
-    orders o ON o.id = od.order_id
+    daily_product_sales ps
 WHERE 
-    date(o.created_at) BETWEEN :start_date AND :end_date
+    ps.day BETWEEN :start_date AND :end_date
 GROUP BY 
-    od.product_id
+    ps.product_id
 ORDER BY 
-    sum(od.quantity) DESC
\ No newline at end of file
+    sum(ps.total_quantity) DESC
\ No newline at end of file
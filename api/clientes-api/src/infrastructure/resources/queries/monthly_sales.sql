@@ -10,6 +10,7 @@ SELECT
 FROM
 	orders o
 WHERE
-	date(o.created_at) BETWEEN :start_date AND :end_date
+	o.created_at >= :start_date
+	AND o.created_at < :end_date_exclusive
 ORDER BY
     o.created_at
\ No newline at end of file
@@ -10,7 +10,8 @@ SELECT
 FROM
 	orders o
 WHERE
-	date(o.created_at) BETWEEN :start_date AND :end_date
+	o.created_at >= :start_date
+	AND o.created_at < :end_date_exclusive
 	AND salesman_id = :salesman_id
 ORDER BY
     o.created_at
\ No newline at end of file
@@ -0,0 +1,12 @@
+SELECT
+	ss.salesman_id,
+	sum(ss.total_orders) as total_orders,
+	sum(ss.total_sales) as total_sales
+FROM
+	daily_salesman_sales ss
+WHERE
+	ss.day BETWEEN :start_date AND :end_date
+GROUP BY
+	ss.salesman_id
+ORDER BY
+    sum(ss.total_sales) DESC
\ No newline at end of file
@@ -10,22 +10,26 @@ from ...application.list_orders  import ListOrders
 from ...application.errors.errors import ValidationApiError
 from ...infrastructure.adapters.orders_adapter import OrdersAdapter
 from ...infrastructure.adapters.payments_adapter import PaymentsAdapter
-from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 orders_adapter = OrdersAdapter()
 payments_adapter = PaymentsAdapter()
-messaging_port_adapter = RabbitMQMessagingPortAdapter()
 
 clients_blueprint = Blueprint('clients', __name__, url_prefix='/api/v1/clients')
 
 
+def summary_view() -> bool:
+    """
+    Checks the view requested for an order list: 'full' (default) or 'summary'.
+    """
+    view = request.args.get('view', 'full')
+    if view not in ('full', 'summary'):
+        logger.error(f"Invalid order list view: {view}")
+        raise ValidationApiError
+    return view == 'summary'
+
+
 @clients_blueprint.route('/orders', methods=['POST'])
 @token_required(['CLIENTE', 'VENDEDOR', 'DIRECTIVO'])
 def create_order():
@@ -39,7 +43,7 @@ def create_order():
         logger.error("No data provided in request.")
         raise ValidationApiError
 
-    use_case = CreateOrder(orders_adapter, payments_adapter, messaging_port_adapter)
+    use_case = CreateOrder(orders_adapter, payments_adapter)
     response, status = use_case.execute(data, salesman_id)
     return jsonify(response), status
 
@@ -56,7 +60,12 @@ def list_orders():
 
     logger.debug("Starting order listing process...")
     use_case = ListOrders(orders_adapter)
-    orders = use_case.execute(client_id)
+    summary = summary_view()
+    if 'limit' in request.args or 'cursor' in request.args:
+        page = use_case.execute_page(client_id, request.args.get('limit'), request.args.get('cursor'), summary)
+        return jsonify(page.to_dict()), 200
+
+    orders = use_case.execute(client_id, summary)
     return jsonify([order.to_dict() for order in orders]), 200
 
 @clients_blueprint.route('/orders/<order_id>', methods=['GET'])
@@ -85,5 +94,10 @@ def get_orders_by_salesman_id(salesman_id):
         return jsonify({'msg': 'Salesman ID is required.'}), 400
     logger.debug("Starting process to get orders by salesman ID...")
     use_case = GetOrderBySalesmanId(orders_adapter)
-    orders = use_case.execute(salesman_id)
+    summary = summary_view()
+    if 'limit' in request.args or 'cursor' in request.args:
+        page = use_case.execute_page(salesman_id, request.args.get('limit'), request.args.get('cursor'), summary)
+        return jsonify(page.to_dict()), 200
+
+    orders = use_case.execute(salesman_id, summary)
     return jsonify([order.to_dict() for order in orders]), 200
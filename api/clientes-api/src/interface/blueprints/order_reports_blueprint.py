@@ -4,21 +4,33 @@ from flask import Blueprint, jsonify, request
 
 from ..decorator.token_decorator import token_required
 from ...application.generate_reports import GenerateReports
+from ...application.get_report_job import GetReportJob
 from ...application.get_reports_by_user import GetReportsByUser
+from ...application.request_report_job import RequestReportJob
 from ...infrastructure.adapters.order_reports_adapter import OrderReportsAdapter
+from ...infrastructure.adapters.report_jobs_adapter import ReportJobsAdapter
 from ...infrastructure.adapters.report_queries_adapter import ReportQueriesAdapter
+from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 order_reports_adapter = OrderReportsAdapter()
 report_queries_adapter = ReportQueriesAdapter()
+report_jobs_adapter = ReportJobsAdapter()
 reports_blueprint = Blueprint('reports', __name__, url_prefix='/api/v1/reports')
 
+_messaging_port_adapter = None
+
+
+def messaging_port_adapter():
+    """
+    Connection to RabbitMQ of the report jobs, opened on the first request that needs it.
+    """
+    global _messaging_port_adapter
+    if _messaging_port_adapter is None:
+        _messaging_port_adapter = RabbitMQMessagingPortAdapter()
+    return _messaging_port_adapter
+
 @reports_blueprint.route('/generate', methods=['POST'])
 @token_required(['DIRECTIVO'])
 def generate_report():
@@ -48,4 +60,33 @@ def get_reports_by_user(user_id: str):
     logger.debug("Retrieving reports for user ID: %s", user_id)
     use_case = GetReportsByUser(order_reports_adapter)
     reports = use_case.execute(user_id)
-    return jsonify([report.to_dict() for report in reports]), 200
\ No newline at end of file
+    return jsonify([report.to_dict() for report in reports]), 200
+
+
+@reports_blueprint.route('/jobs', methods=['POST'])
+@token_required(['DIRECTIVO'])
+def request_report_job():
+    """
+    Endpoint to request a report to be generated in the background.
+    """
+    logger.debug("Starting report job request...")
+    data = request.get_json()
+    if not data:
+        logger.error("No data provided in request.")
+        return jsonify({'msg': 'Data is required.'}), 400
+
+    use_case = RequestReportJob(report_jobs_adapter, messaging_port_adapter())
+    report_job = use_case.execute(data)
+    return jsonify(report_job.to_dict()), 202
+
+
+@reports_blueprint.route('/jobs/<string:job_id>', methods=['GET'])
+@token_required(['DIRECTIVO'])
+def get_report_job(job_id: str):
+    """
+    Endpoint to check the status of a report job.
+    """
+    logger.debug("Retrieving report job: %s", job_id)
+    use_case = GetReportJob(report_jobs_adapter)
+    report_job = use_case.execute(job_id)
+    return jsonify(report_job.to_dict()), 200
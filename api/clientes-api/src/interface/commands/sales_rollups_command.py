@@ -0,0 +1,19 @@
+import click
+
+from ...application.backfill_sales_rollups import BackfillSalesRollups
+from ...application.errors.errors import ApiError
+from ...infrastructure.adapters.sales_rollups_adapter import SalesRollupsAdapter
+
+
+@click.command('backfill-sales-rollups')
+@click.option('--start-date', default=None, help='First day to rebuild (YYYY-MM-DD), the first order by default.')
+@click.option('--end-date', default=None, help='Last day to rebuild (YYYY-MM-DD), the last order by default.')
+def backfill_sales_rollups_command(start_date, end_date):
+    """
+    Rebuild the daily sales rollups of the reports from the existing orders.
+    """
+    try:
+        rows = BackfillSalesRollups(SalesRollupsAdapter()).execute(start_date, end_date)
+    except ApiError as error:
+        raise click.BadParameter(error.description)
+    click.echo(f"Sales rollups rebuilt with {rows} rows.")
@@ -0,0 +1,54 @@
+import logging
+import os
+import threading
+
+from ...application.relay_outbox_messages import RelayOutboxMessages
+from ...infrastructure.adapters.outbox_adapter import OutboxAdapter
+from ...infrastructure.database.declarative_base import unit_of_work
+from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two polls of the outbox when it is empty
+OUTBOX_POLL_INTERVAL = float(os.environ.get('OUTBOX_POLL_INTERVAL', 1))
+
+
+class OutboxRelay:
+    """
+    Interface for the Outbox Relay, the worker publishing the messages saved with the orders.
+    """
+
+    def __init__(self):
+        self.messaging_port = RabbitMQMessagingPortAdapter()
+        self.relay = RelayOutboxMessages(OutboxAdapter(), self.messaging_port)
+        self._stopping = threading.Event()
+
+    def start_relaying(self) -> threading.Thread:
+        """
+        Start publishing the outbox messages in a background thread.
+        :return: The relay thread
+        """
+        thread = threading.Thread(target=self._run, name="outbox-relay", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """
+        Stop the relay after the batch in progress.
+        """
+        self._stopping.set()
+
+    def _run(self) -> None:
+        logger.info("Outbox relay started")
+        while not self._stopping.is_set():
+            try:
+                # A batch is claimed, published and marked on one database connection
+                with unit_of_work():
+                    published = self.relay.execute()
+            except Exception as e:
+                logger.error(f"Error relaying outbox messages: {str(e)}")
+                published = 0
+
+            # A full batch means more messages are waiting
+            if published < self.relay.batch_size:
+                self._stopping.wait(OUTBOX_POLL_INTERVAL)
@@ -0,0 +1,49 @@
+import logging
+
+from ...application.process_report_job import ProcessReportJob
+from ...infrastructure.adapters.order_reports_adapter import OrderReportsAdapter
+from ...infrastructure.adapters.report_jobs_adapter import ReportJobsAdapter
+from ...infrastructure.adapters.report_queries_adapter import ReportQueriesAdapter
+from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class ReportJobsConsumer:
+    """
+    Interface for the Report Jobs Consumer, the worker generating the reports requested in the background.
+    """
+
+    def __init__(self):
+        self.messaging_port = RabbitMQMessagingPortAdapter()
+        self.processor = ProcessReportJob(
+            ReportJobsAdapter(),
+            OrderReportsAdapter(),
+            ReportQueriesAdapter(),
+            self.messaging_port
+        )
+
+    def process_message(self, message: dict) -> None:
+        """
+        Process a message received from the queue.
+        :param message: The message received from RabbitMQ
+        """
+        try:
+            self.processor.process(message)
+        except Exception as e:
+            logger.error(f"Error processing report job message: {str(e)}")
+            # Let the consumer retry the message and dead-letter it once out of retries
+            raise
+
+    def start_consuming(self) -> None:
+        """
+        Start consuming messages from the RabbitMQ queue.
+        """
+        self.messaging_port.consume_messages(
+            queue="report_jobs_queue",
+            callback=self.process_message,
+            exchange="report_jobs_exchange",
+            routing_key="report_jobs_routing_key",
+            # The report queries share a single database session, so the jobs are generated one at a time
+            workers=1
+        )
@@ -1,4 +1,7 @@
 import logging
+import os
+import threading
+import time
 
 from dotenv import load_dotenv
 from flask import Flask, jsonify
@@ -8,10 +11,57 @@ loaded = load_dotenv('.env.development')
 from .interface.blueprints.management_blueprint import management_blueprint
 from .interface.blueprints.clients_blueprint import clients_blueprint
 from .interface.blueprints.order_reports_blueprint import reports_blueprint
+from .interface.commands.sales_rollups_command import backfill_sales_rollups_command
+from .interface.consumer.outbox_relay import OutboxRelay
+from .interface.consumer.report_jobs_consumer import ReportJobsConsumer
 from .application.errors.errors import ApiError
-from .infrastructure.database.declarative_base import Base, engine
+from .application.utils.structured_logging import configure_logging
+from .infrastructure.config.container import DependencyContainer
+from .infrastructure.database.declarative_base import Base, database, engine
+from .infrastructure.messaging.rabbitmq_consumer_runtime import stop_consumers
+from .infrastructure.monitoring.metrics import init_metrics
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging('clientes-api')
+
+# Relay of the process and its thread, stopped on shutdown
+_outbox_relay = None
+_outbox_relay_thread = None
+
+
+def create_schema():
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    logging.debug(">> Create schema")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+
+def initialize_rabbitmq_consumers():
+    """Initialize all RabbitMQ consumers"""
+    global _outbox_relay, _outbox_relay_thread
+
+    # Create and start the report jobs worker
+    report_jobs_consumer = ReportJobsConsumer()
+    report_jobs_consumer.start_consuming()
+
+    # Start publishing the messages saved with the orders
+    _outbox_relay = OutboxRelay()
+    _outbox_relay_thread = _outbox_relay.start_relaying()
+
+
+def shutdown(timeout=30):
+    """
+    Stop the consumers after the messages in progress and release the connections of the process,
+    called by the server when a worker exits.
+    :param timeout: Seconds the shutdown may wait, in total.
+    """
+    deadline = time.monotonic() + timeout
+    if _outbox_relay is not None:
+        _outbox_relay.stop()
+        _outbox_relay_thread.join(timeout)
+    stop_consumers(max(0.0, deadline - time.monotonic()))
+    engine.dispose()
 
 
 def create_app():
@@ -20,14 +70,29 @@ def create_app():
     """
     logging.debug('clients microservice started')
     app = Flask(__name__)
+    # One connection checkout per request, however many DAO calls it makes
+    database.init_app(app)
+    init_metrics(app)
+    # One token validator per process, so the requests share its cache
+    app.container = DependencyContainer()
 
     app.register_blueprint(management_blueprint)
     app.register_blueprint(clients_blueprint)
     app.register_blueprint(reports_blueprint)
+    app.cli.add_command(backfill_sales_rollups_command)
 
-    # Create schema
-    logging.debug(">> Create schema")
-    Base.metadata.create_all(engine)
+    # Under gunicorn the master created the schema before forking the workers
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        create_schema()
+
+    # Initialize the consumer
+    logging.debug(">> Initialize the consumer")
+    # Start consumers in a separate thread to not block the main application
+    consumer_thread = threading.Thread(
+        target=initialize_rabbitmq_consumers,
+        daemon=True
+    )
+    consumer_thread.start()
 
     @app.errorhandler(ApiError)
     def handle_error(error):
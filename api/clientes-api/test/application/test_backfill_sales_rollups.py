@@ -0,0 +1,40 @@
+import unittest
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.application.backfill_sales_rollups import BackfillSalesRollups
+from src.application.errors.errors import InvalidFormatError
+
+
+class TestBackfillSalesRollups(unittest.TestCase):
+    def setUp(self):
+        self.sales_rollups_repository = MagicMock()
+        self.sales_rollups_repository.rebuild.return_value = 12
+        self.backfill_sales_rollups = BackfillSalesRollups(self.sales_rollups_repository)
+
+    def test_execute_rebuilds_range(self):
+        # Execute
+        result = self.backfill_sales_rollups.execute("2023-01-01", "2023-01-31")
+
+        # Verify
+        self.assertEqual(result, 12)
+        self.sales_rollups_repository.rebuild.assert_called_once_with(date(2023, 1, 1), date(2023, 1, 31))
+
+    def test_execute_rebuilds_whole_history(self):
+        # Execute
+        self.backfill_sales_rollups.execute()
+
+        # Verify
+        self.sales_rollups_repository.rebuild.assert_called_once_with(None, None)
+
+    def test_execute_raises_error_with_invalid_range(self):
+        # Execute & Verify
+        with self.assertRaises(InvalidFormatError):
+            self.backfill_sales_rollups.execute("01/01/2023")
+        with self.assertRaises(InvalidFormatError):
+            self.backfill_sales_rollups.execute("2023-02-01", "2023-01-01")
+        self.sales_rollups_repository.rebuild.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
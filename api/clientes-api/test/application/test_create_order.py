@@ -4,6 +4,7 @@ import uuid
 from datetime import datetime
 
 from src.application.create_order import CreateOrder
+from src.application.errors.errors import PaymentGatewayUnavailableError
 from src.domain.entities.order_dto import OrderDTO
 from src.domain.entities.payment_dto import PaymentDTO
 from src.domain.entities.client_info_dto import ClientInfoDTO
@@ -14,12 +15,10 @@ class TestCreateOrder(unittest.TestCase):
     def setUp(self):
         self.order_repository = Mock()
         self.payments_port = Mock()
-        self.messaging_port = Mock()
 
         self.create_order = CreateOrder(
             order_repository=self.order_repository,
-            payments_port=self.payments_port,
-            messaging_port=self.messaging_port
+            payments_port=self.payments_port
         )
 
         # Sample order data
@@ -65,7 +64,7 @@ class TestCreateOrder(unittest.TestCase):
         self.payment_response = {
             'id': str(uuid.uuid4()),
             'transactionReference': 'tx123456',
-            'status': 'APROBADO',
+            'status': 'APPROVED',
             'cardNumber': '4111111111111111',
             'timestamp': datetime.now().isoformat()
         }
@@ -126,15 +125,18 @@ class TestCreateOrder(unittest.TestCase):
         self.payments_port.process_payment.assert_called_once()
         self.order_repository.add.assert_called_once()
 
-        # Check messaging was called twice (stock update and order production)
-        self.assertEqual(self.messaging_port.send_message.call_count, 2)
+        # Check the order was saved with two outbox messages (stock update and order production)
+        outbox_messages = self.order_repository.add.call_args[0][1]
+        self.assertEqual(len(outbox_messages), 2)
 
         # Verify the exchange and routing keys
-        stock_call, order_call = self.messaging_port.send_message.call_args_list
-        self.assertEqual(stock_call[1]['exchange'], 'update_stock_exchange')
-        self.assertEqual(stock_call[1]['routing_key'], 'update_stock_routing_key')
-        self.assertEqual(order_call[1]['exchange'], 'order_initiated_exchange')
-        self.assertEqual(order_call[1]['routing_key'], 'order_initiated_routing_key')
+        stock_message, order_message = outbox_messages
+        self.assertEqual(stock_message.exchange, 'update_stock_exchange')
+        self.assertEqual(stock_message.routing_key, 'update_stock_routing_key')
+        self.assertEqual(order_message.exchange, 'order_initiated_exchange')
+        self.assertEqual(order_message.routing_key, 'order_initiated_routing_key')
+        self.assertEqual(order_message.message['order']['orderDate'],
+                         self.order_repository.add.call_args[0][0].created_at)
 
         # Check the status code
         self.assertEqual(status_code, 201)
@@ -164,8 +166,8 @@ class TestCreateOrder(unittest.TestCase):
         self.payments_port.process_payment.assert_called_once()
         self.order_repository.add.assert_called_once()
 
-        # Check no messages were sent (should not update stock or produce order)
-        self.messaging_port.send_message.assert_not_called()
+        # Check no messages were saved (should not update stock or produce order)
+        self.assertEqual(self.order_repository.add.call_args[0][1], [])
 
         # Check the status code indicates payment required
         self.assertEqual(status_code, 402)
@@ -207,8 +209,8 @@ class TestCreateOrder(unittest.TestCase):
         called_dto = self.order_repository.add.call_args[0][0]
         self.assertIsNone(called_dto.salesman_id)
 
-        # Verify both messaging calls were made (stock update and order production)
-        self.assertEqual(self.messaging_port.send_message.call_count, 2)
+        # Verify both messages were saved (stock update and order production)
+        self.assertEqual(len(self.order_repository.add.call_args[0][1]), 2)
 
     @patch('uuid.uuid4')
     @patch('src.application.create_order.validate')
@@ -220,10 +222,13 @@ class TestCreateOrder(unittest.TestCase):
         self.payments_port.process_payment.return_value = None
 
         # Execute with expectation of error
-        with self.assertRaises(AttributeError):  # Assuming None payment causes an AttributeError
+        with self.assertRaises(PaymentGatewayUnavailableError):
             self.create_order.execute(self.order_data, 'salesman123')
 
-    def test_update_products_stock(self):
+        # Verify the order was not saved
+        self.order_repository.add.assert_not_called()
+
+    def test_update_products_stock_message(self):
         # Setup
         order_details = [
             OrderDetailsDTO(
@@ -247,25 +252,21 @@ class TestCreateOrder(unittest.TestCase):
         ]
 
         # Execute
-        self.create_order._update_products_stock(order_details)
-
-        # Verify
-        self.messaging_port.send_message.assert_called_once()
-        kwargs = self.messaging_port.send_message.call_args[1]
+        outbox_message = self.create_order._update_products_stock_message(order_details)
 
         # Check exchange and routing key
-        self.assertEqual(kwargs['exchange'], 'update_stock_exchange')
-        self.assertEqual(kwargs['routing_key'], 'update_stock_routing_key')
+        self.assertEqual(outbox_message.exchange, 'update_stock_exchange')
+        self.assertEqual(outbox_message.routing_key, 'update_stock_routing_key')
 
         # Check message content
-        message = kwargs['message']
+        message = outbox_message.message
         self.assertEqual(len(message['products']), 2)
         self.assertEqual(message['products'][0]['productId'], 'product123')
         self.assertEqual(message['products'][0]['quantity'], 3)
         self.assertEqual(message['products'][1]['productId'], 'product456')
         self.assertEqual(message['products'][1]['quantity'], 1)
 
-    def test_produce_order(self):
+    def test_order_initiated_message(self):
         # Setup
         order_info = {
             'id': str(uuid.uuid4()),
@@ -290,18 +291,14 @@ class TestCreateOrder(unittest.TestCase):
         }
 
         # Execute
-        self.create_order._produce_order(order_info)
-
-        # Verify
-        self.messaging_port.send_message.assert_called_once()
-        kwargs = self.messaging_port.send_message.call_args[1]
+        outbox_message = self.create_order._order_initiated_message(order_info)
 
         # Check exchange and routing key
-        self.assertEqual(kwargs['exchange'], 'order_initiated_exchange')
-        self.assertEqual(kwargs['routing_key'], 'order_initiated_routing_key')
+        self.assertEqual(outbox_message.exchange, 'order_initiated_exchange')
+        self.assertEqual(outbox_message.routing_key, 'order_initiated_routing_key')
 
         # Check message content
-        message = kwargs['message']
+        message = outbox_message.message
         self.assertIn('order', message)
         order = message['order']
         self.assertEqual(order['id'], order_info['id'])
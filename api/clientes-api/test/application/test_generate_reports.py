@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from datetime import datetime
 import uuid
 
+from src.application.errors.errors import ValidationApiError
 from src.application.generate_reports import GenerateReports
 from src.domain.entities.reports.order_reports_dto import OrderReportsDTO
 
@@ -77,7 +78,8 @@ class TestGenerateReports(unittest.TestCase):
         # Verify the report query adapter was called with correct params
         self.report_queries_adapter.get_monthly_sales.assert_called_once_with(
             start_date="2023-01-01",
-            end_date="2023-01-31"
+            end_date="2023-01-31",
+            stream=False
         )
 
         # Verify upload was called with correct params
@@ -243,4 +245,18 @@ class TestGenerateReports(unittest.TestCase):
         self.assertTrue("Failed to upload file" in str(context.exception))
 
         # Verify repository was not called (since upload failed)
-        self.order_reports_repository.add.assert_not_called()
\ No newline at end of file
+        self.order_reports_repository.add.assert_not_called()
+
+    def test_execute_without_end_date_is_rejected(self):
+        # Test data
+        request_data = {
+            "userId": self.user_id,
+            "type": "VENTAS_POR_MES",
+            "filters": {"startDate": "2023-01-01"}
+        }
+
+        # Verify the report is rejected before querying the orders
+        with self.assertRaises(ValidationApiError):
+            self.generate_reports.execute(request_data)
+
+        self.report_queries_adapter.get_monthly_sales.assert_not_called()
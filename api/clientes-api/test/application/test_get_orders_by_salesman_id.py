@@ -39,7 +39,7 @@ class TestGetOrderBySalesmanId(unittest.TestCase):
         result = self.get_orders_by_salesman.execute(self.sample_salesman_id)
 
         # Verify
-        self.order_repository.get_orders_by_salesman.assert_called_once_with(self.sample_salesman_id)
+        self.order_repository.get_orders_by_salesman.assert_called_once_with(self.sample_salesman_id, False)
         self.assertEqual(result, self.mock_orders)
         self.assertEqual(len(result), 3)
 
@@ -56,7 +56,7 @@ class TestGetOrderBySalesmanId(unittest.TestCase):
             self.get_orders_by_salesman.execute(self.sample_salesman_id)
 
         # Ensure repository was called with correct ID
-        self.order_repository.get_orders_by_salesman.assert_called_once_with(self.sample_salesman_id)
+        self.order_repository.get_orders_by_salesman.assert_called_once_with(self.sample_salesman_id, False)
 
     @patch('src.application.get_orders_by_salesman_id.logger')
     def test_execute_logs_debug_messages(self, mock_logger):
@@ -93,7 +93,7 @@ class TestGetOrderBySalesmanId(unittest.TestCase):
             self.get_orders_by_salesman.execute(empty_id)
 
         # Ensure repository was called with empty ID
-        self.order_repository.get_orders_by_salesman.assert_called_once_with(empty_id)
+        self.order_repository.get_orders_by_salesman.assert_called_once_with(empty_id, False)
 
 
 if __name__ == '__main__':
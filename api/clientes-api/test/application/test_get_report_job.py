@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.application.errors.errors import ReportJobNotExistsError
+from src.application.get_report_job import GetReportJob
+from src.domain.entities.reports.report_job_dto import ReportJobDTO
+
+
+class TestGetReportJob(unittest.TestCase):
+    def setUp(self):
+        self.report_jobs_repository = MagicMock()
+        self.get_report_job = GetReportJob(self.report_jobs_repository)
+
+    def test_execute_returns_job(self):
+        # Setup
+        report_job = ReportJobDTO("job-1", "user123", "VENTAS_POR_MES", {}, "COMPLETADO", "report-1", "report_url")
+        self.report_jobs_repository.get_by_id.return_value = report_job
+
+        # Execute
+        result = self.get_report_job.execute("job-1")
+
+        # Verify
+        self.report_jobs_repository.get_by_id.assert_called_once_with("job-1")
+        self.assertEqual(result.to_dict()["url"], "report_url")
+        self.assertNotIn("reportData", result.to_dict())
+
+    def test_execute_raises_error_when_job_not_exists(self):
+        # Setup
+        self.report_jobs_repository.get_by_id.return_value = None
+
+        # Execute & Verify
+        with self.assertRaises(ReportJobNotExistsError):
+            self.get_report_job.execute("job-1")
+
+
+if __name__ == '__main__':
+    unittest.main()
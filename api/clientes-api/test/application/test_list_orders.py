@@ -5,7 +5,8 @@ import logging
 
 from src.application.list_orders import ListOrders
 from src.domain.entities.order_dto import OrderDTO
-from src.application.errors.errors import OrdersNotFoundError
+from src.application.errors.errors import OrdersNotFoundError, ValidationApiError
+from src.domain.entities.page_dto import PageDTO
 
 
 class TestListOrders(unittest.TestCase):
@@ -39,7 +40,7 @@ class TestListOrders(unittest.TestCase):
         result = self.list_orders.execute(self.sample_client_id)
 
         # Verify
-        self.order_repository.get_orders_by_client.assert_called_once_with(self.sample_client_id)
+        self.order_repository.get_orders_by_client.assert_called_once_with(self.sample_client_id, False)
         self.assertEqual(result, self.mock_orders)
         self.assertEqual(len(result), 3)
 
@@ -56,7 +57,7 @@ class TestListOrders(unittest.TestCase):
             self.list_orders.execute(self.sample_client_id)
 
         # Ensure repository was called with correct ID
-        self.order_repository.get_orders_by_client.assert_called_once_with(self.sample_client_id)
+        self.order_repository.get_orders_by_client.assert_called_once_with(self.sample_client_id, False)
 
     @patch('src.application.list_orders.logger')
     def test_execute_logs_debug_messages(self, mock_logger):
@@ -93,7 +94,37 @@ class TestListOrders(unittest.TestCase):
             self.list_orders.execute(empty_id)
 
         # Ensure repository was called with empty ID
-        self.order_repository.get_orders_by_client.assert_called_once_with(empty_id)
+        self.order_repository.get_orders_by_client.assert_called_once_with(empty_id, False)
+
+    def test_execute_summary(self):
+        # Setup
+        self.order_repository.get_orders_by_client.return_value = self.mock_orders
+
+        # Execute
+        result = self.list_orders.execute(self.sample_client_id, summary=True)
+
+        # Verify only the summary columns are requested
+        self.order_repository.get_orders_by_client.assert_called_once_with(self.sample_client_id, True)
+        self.assertEqual(result, self.mock_orders)
+
+    def test_execute_page_returns_page(self):
+        # Setup
+        page = PageDTO(self.mock_orders[:2], "next-cursor")
+        self.order_repository.get_orders_page_by_client.return_value = page
+
+        # Execute
+        result = self.list_orders.execute_page(self.sample_client_id, "2", None)
+
+        # Verify an empty or partial page is not an error
+        self.order_repository.get_orders_page_by_client.assert_called_once_with(self.sample_client_id, 2, None, False)
+        self.assertEqual(result, page)
+
+    def test_execute_page_with_invalid_limit(self):
+        # Execute and verify
+        with self.assertRaises(ValidationApiError):
+            self.list_orders.execute_page(self.sample_client_id, "many", None)
+
+        self.order_repository.get_orders_page_by_client.assert_not_called()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.application.process_report_job import ProcessReportJob
+from src.application.utils.local_storage import LocalStorage
+from src.domain.entities.reports.report_job_dto import ReportJobDTO
+
+
+class TestProcessReportJob(unittest.TestCase):
+    def setUp(self):
+        self.report_jobs_repository = MagicMock()
+        self.report_jobs_repository.get_by_id.return_value = ReportJobDTO(
+            job_id="job-1",
+            user_id="user123",
+            report_type="VENTAS_POR_MES",
+            filters={"startDate": "2023-01-01", "endDate": "2023-12-31"},
+            status="PENDIENTE"
+        )
+        self.report_jobs_repository.update_status.side_effect = (
+            lambda job_id, status, report_id=None, url=None, error=None: ReportJobDTO(
+                job_id, "user123", "VENTAS_POR_MES", {}, status, report_id, url, error))
+        self.order_reports_repository = MagicMock()
+        self.order_reports_repository.add.side_effect = lambda dto: dto
+        self.report_queries_adapter = MagicMock()
+        self.report_queries_adapter.get_monthly_sales.return_value = {
+            "headers": ["month", "sales"],
+            "data": iter([{"month": "January", "sales": 1000}, {"month": "February", "sales": 1500}])
+        }
+        self.messaging_port = MagicMock()
+        self.reports_dir = tempfile.TemporaryDirectory()
+        self.process_report_job = ProcessReportJob(
+            self.report_jobs_repository,
+            self.order_reports_repository,
+            self.report_queries_adapter,
+            self.messaging_port,
+            LocalStorage(self.reports_dir.name)
+        )
+
+    def tearDown(self):
+        self.reports_dir.cleanup()
+
+    def test_process_generates_report_and_notifies(self):
+        # Execute
+        report_job = self.process_report_job.process({"jobId": "job-1"})
+
+        # Verify the report file was stored and the job completed
+        self.assertEqual(report_job.status, "COMPLETADO")
+        self.assertTrue(report_job.url.startswith("file://"))
+        self.assertEqual(len(os.listdir(self.reports_dir.name)), 1)
+        self.report_queries_adapter.get_monthly_sales.assert_called_once_with(
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            stream=True
+        )
+
+        # Verify the notification does not carry the report rows
+        message = self.messaging_port.send_message.call_args[1]['message']
+        self.assertEqual(message, {"jobId": "job-1", "userId": "user123", "status": "COMPLETADO",
+                                   "url": report_job.url})
+
+    def test_process_marks_job_failed(self):
+        # Setup
+        self.report_queries_adapter.get_monthly_sales.side_effect = Exception("Database error")
+
+        # Execute
+        report_job = self.process_report_job.process({"jobId": "job-1"})
+
+        # Verify
+        self.assertEqual(report_job.status, "FALLIDO")
+        self.assertEqual(report_job.error, "Database error")
+        self.order_reports_repository.add.assert_not_called()
+        self.messaging_port.send_message.assert_called_once()
+
+    def test_process_skips_processed_job(self):
+        # Setup
+        self.report_jobs_repository.get_by_id.return_value.status = "COMPLETADO"
+
+        # Execute
+        result = self.process_report_job.process({"jobId": "job-1"})
+
+        # Verify a redelivered message does not generate the report again
+        self.assertIsNone(result)
+        self.report_jobs_repository.update_status.assert_not_called()
+        self.messaging_port.send_message.assert_not_called()
+
+    def test_process_generates_interrupted_job_again(self):
+        # Setup: the worker died while generating the report, so the message was delivered again
+        self.report_jobs_repository.get_by_id.return_value.status = "EN PROCESO"
+
+        # Execute
+        report_job = self.process_report_job.process({"jobId": "job-1"})
+
+        # Verify the job is not left in process
+        self.assertEqual(report_job.status, "COMPLETADO")
+        self.assertEqual(len(os.listdir(self.reports_dir.name)), 1)
+        self.messaging_port.send_message.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
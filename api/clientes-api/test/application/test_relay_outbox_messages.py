@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.application.relay_outbox_messages import RelayOutboxMessages
+from src.domain.entities.outbox_message_dto import OutboxMessageDTO
+
+
+class TestRelayOutboxMessages(unittest.TestCase):
+    def setUp(self):
+        self.outbox_repository = MagicMock()
+        self.messaging_port = MagicMock()
+        self.relay = RelayOutboxMessages(self.outbox_repository, self.messaging_port, batch_size=10,
+                                         lease_seconds=30)
+        self.messages = [
+            OutboxMessageDTO(id="message1", exchange="update_stock_exchange",
+                             routing_key="update_stock_routing_key", message={"products": []}),
+            OutboxMessageDTO(id="message2", exchange="order_initiated_exchange",
+                             routing_key="order_initiated_routing_key", message={"order": {"id": "order1"}})
+        ]
+
+    def test_execute_publishes_batch_and_deletes_confirmed_messages(self):
+        self.outbox_repository.claim_pending.return_value = self.messages
+        self.messaging_port.send_many.return_value = True
+
+        # Execute
+        published = self.relay.execute()
+
+        # Verify
+        self.assertEqual(published, 2)
+        self.outbox_repository.claim_pending.assert_called_once_with(10, 30)
+        self.messaging_port.send_many.assert_called_once_with([
+            ("update_stock_exchange", "update_stock_routing_key", {"products": []}),
+            ("order_initiated_exchange", "order_initiated_routing_key", {"order": {"id": "order1"}})
+        ])
+        self.outbox_repository.delete.assert_called_once_with(["message1", "message2"])
+
+    def test_execute_keeps_messages_not_confirmed(self):
+        self.outbox_repository.claim_pending.return_value = self.messages
+        self.messaging_port.send_many.return_value = False
+
+        # Execute
+        published = self.relay.execute()
+
+        # Verify the messages are left in the outbox to be published again
+        self.assertEqual(published, 0)
+        self.outbox_repository.delete.assert_not_called()
+
+    def test_execute_without_pending_messages(self):
+        self.outbox_repository.claim_pending.return_value = []
+
+        # Execute
+        published = self.relay.execute()
+
+        # Verify
+        self.assertEqual(published, 0)
+        self.messaging_port.send_many.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
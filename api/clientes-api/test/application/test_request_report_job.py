@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.application.errors.errors import InternalServerError, InvalidFormatError, ValidationApiError
+from src.application.request_report_job import RequestReportJob
+
+
+class TestRequestReportJob(unittest.TestCase):
+    def setUp(self):
+        self.report_jobs_repository = MagicMock()
+        self.report_jobs_repository.add.side_effect = lambda dto: dto
+        self.messaging_port = MagicMock()
+        self.messaging_port.send_message.return_value = True
+        self.request_report_job = RequestReportJob(self.report_jobs_repository, self.messaging_port)
+        self.request_data = {
+            "userId": "user123",
+            "type": "VENTAS_POR_MES",
+            "filters": {"startDate": "2023-01-01", "endDate": "2023-12-31"}
+        }
+
+    def test_execute_registers_and_queues_job(self):
+        # Execute
+        report_job = self.request_report_job.execute(self.request_data)
+
+        # Verify
+        self.assertEqual(report_job.status, "PENDIENTE")
+        self.assertEqual(report_job.report_type, "VENTAS_POR_MES")
+        self.assertEqual(report_job.filters, self.request_data["filters"])
+        self.messaging_port.send_message.assert_called_once_with(
+            exchange="report_jobs_exchange",
+            routing_key="report_jobs_routing_key",
+            message={"jobId": report_job.job_id}
+        )
+
+    def test_execute_rejects_unknown_report_type(self):
+        # Execute & Verify
+        with self.assertRaises(ValidationApiError):
+            self.request_report_job.execute({"userId": "user123", "type": "UNKNOWN_REPORT_TYPE"})
+
+        self.report_jobs_repository.add.assert_not_called()
+        self.messaging_port.send_message.assert_not_called()
+
+    def test_execute_marks_job_failed_when_not_queued(self):
+        # Setup
+        self.messaging_port.send_message.return_value = False
+
+        # Execute & Verify
+        with self.assertRaises(InternalServerError):
+            self.request_report_job.execute(self.request_data)
+
+        job_id, status = self.report_jobs_repository.update_status.call_args[0]
+        self.assertEqual(status, "FALLIDO")
+
+
+    def test_execute_rejects_missing_dates(self):
+        # Execute & Verify
+        with self.assertRaises(ValidationApiError):
+            self.request_report_job.execute({**self.request_data, "filters": {"startDate": "2023-01-01"}})
+
+        self.report_jobs_repository.add.assert_not_called()
+        self.messaging_port.send_message.assert_not_called()
+
+    def test_execute_rejects_invalid_dates(self):
+        for filters in ({"startDate": "2023-01-01", "endDate": "31/12/2023"},
+                        {"startDate": "2023-12-31", "endDate": "2023-01-01"}):
+            with self.subTest(filters=filters):
+                with self.assertRaises(InvalidFormatError):
+                    self.request_report_job.execute({**self.request_data, "filters": filters})
+
+        self.report_jobs_repository.add.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
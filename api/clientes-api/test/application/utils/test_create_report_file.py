@@ -1,8 +1,10 @@
-import os
+import csv
+import gzip
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from src.application.utils.create_report_file import CreateReportFile
 
@@ -32,55 +34,44 @@ class TestCreateReportFile(unittest.TestCase):
         report_creator = CreateReportFile(self.file_name, headers_str, self.data)
         self.assertEqual(report_creator.headers, ["ID", "Name", "Value"])
 
-    @patch('os.makedirs')
-    @patch('pandas.DataFrame')
-    @patch('pandas.ExcelWriter')
-    def test_create_file(self, mock_excel_writer, mock_dataframe, mock_makedirs):
-        """Test the file creation process"""
-        # Setup mocks
-        mock_df = MagicMock()
-        mock_dataframe.return_value = mock_df
-
-        # Create a proper mock for DataFrame columns that has a values attribute
-        columns_mock = MagicMock()
-        columns_mock.values = self.headers
-        mock_df.columns = columns_mock
-
-        mock_writer = MagicMock()
-        mock_excel_writer.return_value.__enter__.return_value = mock_writer
-
-        mock_workbook = MagicMock()
-        mock_writer.book = mock_workbook
-
-        mock_worksheet = MagicMock()
-        mock_writer.sheets = {'Report': mock_worksheet}
+    def test_create_file(self):
+        """Test the Excel file is written with the headers and every row"""
+        # Call method with a generator, as the streamed reports do
+        result_path = CreateReportFile(self.file_name, self.headers, (row for row in self.data)).create_file()
 
-        # Create a property to capture the actual path used
-        actual_path = None
-
-        # Mock the actual file path construction rather than patching a non-existent attribute
-        original_join = os.path.join
-
-        def mock_path_join(*args):
-            nonlocal actual_path
-            actual_path = original_join(*args)
-            return actual_path
-
-        with patch('os.path.join', side_effect=mock_path_join):
-            # Call method
-            result_path = self.report_creator.create_file()
+        # Assertions
+        try:
+            with zipfile.ZipFile(result_path) as workbook:
+                sheet = workbook.read('xl/worksheets/sheet1.xml').decode()
+            for value in ["ID", "Name", "Value", "Test1", "Test2"]:
+                self.assertIn(f"<t>{value}</t>", sheet)
+            self.assertIn("<v>200</v>", sheet)
+            self.assertIn('<row r="3"', sheet)
+            # Columns are sized from the sample rows
+            self.assertIn('<col min="1" max="1" width="4.7109375" customWidth="1"/>', sheet)
+        finally:
+            self.report_creator.cleanup_temp_file(result_path)
+
+    def test_create_csv_gz_file(self):
+        """Test the report is written as gzip compressed CSV"""
+        # Call method
+        report_creator = CreateReportFile("test_report.csv.gz", "ID,Name,Value", iter(self.data))
+        result_path = report_creator.create_file()
 
         # Assertions
-        mock_dataframe.assert_called_once_with(self.data)
-        mock_df.to_excel.assert_called_once_with(mock_writer, sheet_name='Report', index=False)
-        self.assertEqual(result_path, actual_path)
+        try:
+            with gzip.open(result_path, 'rt', newline='') as report_file:
+                self.assertEqual(list(csv.reader(report_file)),
+                                 [["ID", "Name", "Value"], ["1", "Test1", "100"], ["2", "Test2", "200"]])
+        finally:
+            report_creator.cleanup_temp_file(result_path)
 
     @patch('os.makedirs')
-    @patch('pandas.DataFrame')
-    def test_create_file_with_exception(self, mock_dataframe, mock_makedirs):
+    @patch('src.application.utils.create_report_file.xlsxwriter.Workbook')
+    def test_create_file_with_exception(self, mock_workbook, mock_makedirs):
         """Test error handling during file creation"""
         # Setup mock to raise exception
-        mock_dataframe.side_effect = Exception("Test exception")
+        mock_workbook.side_effect = Exception("Test exception")
 
         # Assertions
         with self.assertRaises(Exception) as context:
@@ -0,0 +1,206 @@
+"""
+Benchmark of the checkout in clientes-api: the CreateOrder use case (validation, payment, insert of the order
+with its outbox messages) at a given concurrency, then the relay of the outbox messages, plus micro-benchmarks
+of validate, the order mapper and the insert of an order.
+
+The database is a SQLite file unless --database-url points to PostgreSQL; payments go to the local fake
+gateway and the outbox is relayed to an in-memory broker. The relayed messages can be written to a file, the
+input of the benchmarks of pedidos-api and productos-api.
+
+Run from the root of the service:
+    python -m test.benchmark.checkout_benchmark --orders 500 --concurrency 8 --output clientes.json
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import uuid
+
+from .benchmark_runner import micro_benchmark, quiet_logging, report, run_stage, sqlite_stand_in, write_report
+
+ORDER_INITIATED_EXCHANGE = "order_initiated_exchange"
+UPDATE_STOCK_EXCHANGE = "update_stock_exchange"
+
+
+def catalog(seed: int, size: int) -> list[str]:
+    """IDs of the products ordered, the same for a seed in every stage of the checkout"""
+    generator = random.Random(seed)
+    return [str(uuid.UUID(int=generator.getrandbits(128), version=4)) for _ in range(size)]
+
+
+def order_requests(seed: int, count: int, products: list[str], lines: int) -> list[dict]:
+    """Order requests as sent by the BFF, generated from the seed so every run orders the same"""
+    generator = random.Random(seed)
+    requests = []
+    for index in range(count):
+        details = []
+        for product_id in generator.sample(products, min(lines, len(products))):
+            quantity = generator.randint(1, 3)
+            unit_price = round(generator.uniform(5, 200), 2)
+            details.append({
+                "productId": product_id,
+                "quantity": quantity,
+                "unitPrice": unit_price,
+                "totalPrice": round(unit_price * quantity, 2),
+                "currency": "USD",
+            })
+        subtotal = round(sum(detail["totalPrice"] for detail in details), 2)
+        tax = round(subtotal * 0.19, 2)
+        requests.append({
+            "clientId": f"client-{index % 50}",
+            "quantity": sum(detail["quantity"] for detail in details),
+            "subtotal": subtotal,
+            "tax": tax,
+            "total": round(subtotal + tax, 2),
+            "currency": "USD",
+            "payment": {
+                "amount": round(subtotal + tax, 2),
+                "cardNumber": "4111111111111111",
+                "cvv": "123",
+                "expiryDate": "12/30",
+                "currency": "USD",
+            },
+            "clientInfo": {
+                "name": f"Cliente {index}",
+                "address": "Calle 1 # 2-3",
+                "phone": "3001234567",
+                "email": f"cliente{index}@example.com",
+            },
+            "orderDetails": details,
+        })
+    return requests
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=500, help="Orders created, after the warmup")
+    parser.add_argument("--concurrency", type=int, default=8, help="Orders created at the same time")
+    parser.add_argument("--warmup", type=int, default=20, help="Orders created before measuring")
+    parser.add_argument("--lines", type=int, default=3, help="Products per order")
+    parser.add_argument("--products", type=int, default=200, help="Products of the catalog")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--payment-delay", type=float, default=0, help="Seconds the fake gateway takes per payment")
+    parser.add_argument("--database-url", help="Database of the benchmark, a new SQLite file by default")
+    parser.add_argument("--number", type=int, default=1000, help="Calls per round of the micro-benchmarks")
+    parser.add_argument("--messages-out", help="File to write the relayed messages to, by exchange")
+    parser.add_argument("--output", help="File to write the report to, stdout by default")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> dict:
+    arguments = parse_arguments(argv)
+    quiet_logging(arguments.log_level)
+    # The engine of the service is created from the environment when its modules are imported
+    directory = tempfile.mkdtemp(prefix="clientes-benchmark-")
+    os.environ["DATABASE_URL"] = arguments.database_url or f"sqlite:///{directory}/clientes.db"
+    os.environ.setdefault("DB_POOL_SIZE", str(arguments.concurrency))
+
+    from src.application.create_order import CreateOrder
+    from src.application.relay_outbox_messages import RelayOutboxMessages
+    from src.application.utils.validation_utils import validate
+    from src.domain.ports.messaging_port import MessagingPort
+    from src.infrastructure.adapters.orders_adapter import OrdersAdapter
+    from src.infrastructure.adapters.outbox_adapter import OutboxAdapter
+    from src.infrastructure.adapters.payments_adapter import PaymentsAdapter
+    from src.infrastructure.dao.order_dao import OrderDAO
+    from src.infrastructure.database.declarative_base import Base, engine, unit_of_work
+    from src.infrastructure.mapper.order_mapper import OrderMapper
+    from src.infrastructure.payments.payment_gateway_client import PaymentGatewayClient
+    from ..infrastructure.messaging.in_memory_broker import InMemoryBroker
+    from ..infrastructure.payments.fake_payment_gateway import FakePaymentGateway
+
+    class BrokerMessagingPort(MessagingPort):
+        """Publishes to the in-memory broker, in a queue per exchange"""
+
+        def __init__(self, broker):
+            self.broker = broker
+
+        def send_message(self, exchange, routing_key, message):
+            self.broker.publish(exchange, json.dumps(message))
+            return True
+
+        def send_many(self, messages):
+            for exchange, routing_key, message in messages:
+                self.send_message(exchange, routing_key, message)
+            return True
+
+        def consume_messages(self, queue, callback, exchange=None, routing_key=None, workers=None):
+            raise NotImplementedError
+
+    sqlite_stand_in(Base.metadata, engine)
+    Base.metadata.create_all(engine)
+    gateway = FakePaymentGateway().start()
+    gateway.payment_delay = arguments.payment_delay
+    broker = InMemoryBroker()
+    try:
+        payments = PaymentsAdapter(PaymentGatewayClient(gateway.url, "benchmark", "secret",
+                                                        pool_size=arguments.concurrency))
+        create_order = CreateOrder(OrdersAdapter(), payments)
+        relay = RelayOutboxMessages(OutboxAdapter(), BrokerMessagingPort(broker))
+
+        def place(order_data):
+            with unit_of_work():
+                _, status = create_order.execute(order_data, "salesman-1")
+            if status != 201:
+                raise RuntimeError(f"Order not completed, status {status}")
+
+        def relay_all(_):
+            with unit_of_work():
+                while relay.execute():
+                    pass
+
+        products = catalog(arguments.seed, arguments.products)
+        requests = order_requests(arguments.seed, arguments.orders + arguments.warmup, products, arguments.lines)
+        stages = {
+            "clientes.create_order": run_stage(place, requests, arguments.concurrency, arguments.warmup),
+            "clientes.relay_outbox": run_stage(relay_all, [None]),
+        }
+
+        # Micro-benchmarks on an order of the run
+        sample = requests[0]
+        order = OrdersAdapter().get_orders_by_client(sample["clientId"])[0]
+        order_model = OrderDAO.get_order_by_id(order.id)
+
+        def insert_order():
+            copy = OrderMapper.to_dto(order_model)
+            copy.id = str(uuid.uuid4())
+            copy.payment.id = str(uuid.uuid4())
+            for detail in copy.order_details:
+                detail.id = str(uuid.uuid4())
+            OrderDAO.save(OrderMapper.to_model(copy))
+
+        micro = {
+            "clientes.validate": micro_benchmark(lambda: validate(sample), arguments.number),
+            "clientes.order_mapper.to_model": micro_benchmark(lambda: OrderMapper.to_model(order),
+                                                              arguments.number),
+            "clientes.order_mapper.to_dto": micro_benchmark(lambda: OrderMapper.to_dto(order_model),
+                                                            arguments.number),
+            "clientes.order_dao.save": micro_benchmark(insert_order, max(arguments.number // 10, 1)),
+        }
+    finally:
+        gateway.stop()
+        engine.dispose()
+
+    if arguments.messages_out:
+        messages = {exchange: [json.loads(body) for _, body in broker.messages(exchange)]
+                    for exchange in (ORDER_INITIATED_EXCHANGE, UPDATE_STOCK_EXCHANGE)}
+        with open(arguments.messages_out, "w") as file:
+            json.dump(messages, file)
+
+    # The relay publishes every message in one operation, its throughput is the one of the messages
+    relayed = stages["clientes.relay_outbox"]
+    relayed["messages"] = sum(
+        len(broker.messages(exchange)) for exchange in (ORDER_INITIATED_EXCHANGE, UPDATE_STOCK_EXCHANGE))
+    relayed["messagesPerSecond"] = round(relayed["messages"] / relayed["wallSeconds"], 2)
+    parameters = {key: getattr(arguments, key) for key in
+                  ("orders", "concurrency", "warmup", "lines", "products", "seed", "payment_delay", "number")}
+    parameters["database"] = engine.url.get_backend_name()
+    result = report("clientes-api", parameters, stages, micro)
+    write_report(result, arguments.output)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import unittest
+import uuid
+
+from sqlalchemy import Column, DateTime, MetaData, Table, create_engine, insert, select
+from sqlalchemy.dialects.postgresql import UUID
+
+from .benchmark_runner import compare, micro_benchmark, percentile, run_stage, sqlite_stand_in, summarize
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+
+    def test_percentile_interpolates_between_ranks(self):
+        values = [1, 2, 3, 4]
+
+        self.assertEqual(percentile(values, 0.5), 2.5)
+        self.assertAlmostEqual(percentile(values, 0.99), 3.97)
+        self.assertEqual(percentile(values, 1), 4)
+        self.assertIsNone(percentile([], 0.5))
+
+    def test_summary_in_milliseconds_and_operations_per_second(self):
+        summary = summarize([0.002, 0.001, 0.003], failures=1, wall_seconds=0.5)
+
+        self.assertEqual(summary["operations"], 3)
+        self.assertEqual(summary["failures"], 1)
+        self.assertEqual(summary["p50Ms"], 2.0)
+        self.assertEqual(summary["maxMs"], 3.0)
+        self.assertEqual(summary["throughputPerSecond"], 6.0)
+
+    def test_stage_skips_the_warmup_and_counts_the_failures(self):
+        calls = []
+
+        def operation(item):
+            calls.append(item)
+            if item == 3:
+                raise ValueError("failed")
+
+        summary = run_stage(operation, [0, 1, 2, 3, 4], concurrency=2, warmup=2)
+
+        self.assertEqual(sorted(calls), [0, 1, 2, 3, 4])
+        self.assertEqual(summary["operations"], 2)
+        self.assertEqual(summary["failures"], 1)
+        self.assertIn("failed", summary["firstFailure"])
+
+    def test_micro_benchmark_reports_the_time_of_a_call(self):
+        result = micro_benchmark(lambda: None, number=10, repeat=3)
+
+        self.assertEqual(result["calls"], 30)
+        self.assertLessEqual(result["bestUs"], result["medianUs"])
+
+    def test_compare_reports_the_slower_stages(self):
+        baseline = {"parameters": {"orders": 10},
+                    "stages": {"stage": {"p95Ms": 10.0, "throughputPerSecond": 100.0}},
+                    "micro": {"micro": {"bestUs": 5.0}}}
+        current = {"parameters": {"orders": 10},
+                   "stages": {"stage": {"p95Ms": 12.0, "throughputPerSecond": 80.0}},
+                   "micro": {"micro": {"bestUs": 5.5}}}
+
+        self.assertEqual(len(compare(current, baseline, tolerance=0.15)), 2)
+        self.assertEqual(compare(baseline, baseline), [])
+        self.assertIn("parameters differ", compare(dict(current, parameters={"orders": 20}), baseline)[0])
+
+    def test_sqlite_stand_in_takes_the_values_postgresql_takes(self):
+        metadata = MetaData()
+        table = Table("items", metadata, Column("id", UUID(as_uuid=True), primary_key=True),
+                      Column("created_at", DateTime))
+        engine = create_engine("sqlite://")
+        sqlite_stand_in(metadata, engine)
+        metadata.create_all(engine)
+        item_id = uuid.uuid4()
+
+        with engine.begin() as connection:
+            connection.execute(insert(table), [{"id": str(item_id), "created_at": "2025-01-01T10:00:00"}])
+            row = connection.execute(select(table)).one()
+
+        self.assertEqual(row.id, item_id)
+        self.assertEqual(row.created_at.year, 2025)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.infrastructure.dao.order_dao import OrderDAO
+from src.infrastructure.database.declarative_base import Base, Session, engine
+# Imported only to register the models OrderModel has relationships with, which order_dao does not import
+from src.infrastructure.model.client_info_model import ClientInfoModel  # noqa: F401
+from src.infrastructure.model.order_model import OrderModel
+from src.infrastructure.model.payment_model import PaymentModel  # noqa: F401
+
+
+def build_order(order_id, client_id, created_at):
+    return OrderModel(id=order_id, client_id=client_id, quantity="1", subtotal=10.0, tax=1.9, total=11.9,
+                      currency="COP", created_at=created_at)
+
+
+class TestOrderDAOPagination(unittest.TestCase):
+    """Keyset pagination of the orders of a client, on a real database"""
+
+    def setUp(self):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        with Session() as session:
+            # Orders created in the same second share their sort date, the id breaks the tie
+            session.add_all([build_order(f"order-{index:02d}", "client-1", start + timedelta(seconds=index // 3))
+                             for index in range(23)])
+            session.add_all([build_order(f"other-{index:02d}", "client-2", start) for index in range(5)])
+            session.commit()
+
+    def walk(self, limit, summary):
+        ids, cursor, pages = [], None, 0
+        while True:
+            rows, cursor = OrderDAO.find_page_by_client_id("client-1", limit, cursor, summary=summary)
+            ids.extend(row.id for row in rows)
+            pages += 1
+            if cursor is None:
+                return ids, pages
+
+    def test_pages_cover_every_order_once_from_the_newest(self):
+        for summary in (True, False):
+            with self.subTest(summary=summary):
+                ids, pages = self.walk(limit=4, summary=summary)
+
+                with Session() as session:
+                    expected = [order.id for order in session.query(OrderModel)
+                                .filter(OrderModel.client_id == "client-1")
+                                .order_by(OrderModel.created_at.desc(), OrderModel.id.desc())]
+                self.assertEqual(len(expected), 23)
+                self.assertEqual(ids, expected)
+                self.assertEqual(len(set(ids)), len(ids))
+                self.assertEqual(pages, 6)
+
+    def test_page_size_equal_to_the_orders_has_no_next_page(self):
+        rows, cursor = OrderDAO.find_page_by_client_id("client-1", 23, summary=True)
+
+        self.assertEqual(len(rows), 23)
+        self.assertIsNone(cursor)
+
+    def test_order_without_date_gets_one_on_save(self):
+        order = build_order("order-new", "client-1", None)
+
+        OrderDAO.save(order)
+
+        with Session() as session:
+            self.assertIsNotNone(session.get(OrderModel, "order-new").created_at)
+        ids, _ = self.walk(limit=5, summary=True)
+        self.assertEqual(ids[0], "order-new")
+
+
+if __name__ == '__main__':
+    unittest.main()
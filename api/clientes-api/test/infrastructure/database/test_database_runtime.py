@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import text
+
+from src.infrastructure.database.database_runtime import DatabaseRuntime, database_url
+
+
+class TestDatabaseRuntime(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.database = DatabaseRuntime(f"sqlite:///{os.path.join(self.directory, 'test.db')}",
+                                        environ={'DB_POOL_SIZE': '2', 'DB_MAX_OVERFLOW': '1'})
+        with self.database.session() as session:
+            session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            session.commit()
+
+    def tearDown(self):
+        self.database.dispose()
+        shutil.rmtree(self.directory)
+
+    def insert(self, item_id):
+        session = self.database.session()
+        session.execute(text("INSERT INTO items (id) VALUES (:id)"), {"id": item_id})
+        session.commit()
+        session.close()
+
+    def count(self):
+        with self.database.session() as session:
+            return session.execute(text("SELECT COUNT(*) FROM items")).scalar()
+
+    def test_unit_of_work_checks_out_one_connection(self):
+        checkouts = self.database.stats.checkouts
+
+        with self.database.unit_of_work():
+            for item_id in range(5):
+                self.insert(item_id)
+            with self.database.unit_of_work():
+                self.insert(5)
+
+        self.assertEqual(self.database.stats.checkouts, checkouts + 1)
+        self.assertEqual(self.count(), 6)
+
+    def test_sessions_outside_a_unit_of_work_check_out_their_own_connection(self):
+        checkouts = self.database.stats.checkouts
+
+        self.insert(1)
+        self.insert(2)
+
+        self.assertEqual(self.database.stats.checkouts, checkouts + 2)
+
+    def test_session_does_not_join_a_transaction_left_open(self):
+        with self.database.unit_of_work():
+            open_session = self.database.session()
+            open_session.execute(text("SELECT COUNT(*) FROM items"))
+            self.insert(1)
+            open_session.close()
+
+        self.assertEqual(self.count(), 1)
+
+    def test_unit_of_work_rolls_back_what_is_not_committed(self):
+        with self.database.unit_of_work():
+            session = self.database.session()
+            session.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+        self.assertEqual(self.count(), 0)
+
+    def test_stats(self):
+        with self.database.unit_of_work():
+            self.insert(1)
+            stats = self.database.stats.to_dict()
+
+        self.assertEqual(stats["capacity"], 3)
+        self.assertEqual(stats["checkedOut"], 1)
+        self.assertAlmostEqual(stats["saturation"], 1 / 3, places=3)
+        self.assertGreaterEqual(stats["checkouts"], 2)
+        self.assertIsNotNone(stats["averageWaitSeconds"])
+
+    def test_database_url(self):
+        self.assertEqual(database_url({'DATABASE_URL': 'sqlite://'}), 'sqlite://')
+        self.assertEqual(database_url({'DB_USER': 'user', 'DB_PASSWORD': 'secret', 'DB_HOST': 'db',
+                                       'DB_PORT': '5432', 'DB_NAME': 'clients'}),
+                         'postgresql://user:secret@db:5432/clients')
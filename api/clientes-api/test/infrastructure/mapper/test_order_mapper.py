@@ -157,5 +157,24 @@ class TestOrderMapper(unittest.TestCase):
             self.assertEqual(result[1], self.mock_order_dto)
 
 
+    def test_to_summary_dto(self):
+        # Execute
+        result = OrderMapper.to_summary_dto(self.mock_order_model)
+
+        # Verify
+        self.assertEqual(result.to_dict(), {
+            "id": "order123",
+            "clientId": "client456",
+            "salesmanId": "sales789",
+            "status": "PENDIENTE",
+            "total": 110.0,
+            "currency": "USD",
+            "createdAt": "2023-01-01T12:00:00"
+        })
+
+    def test_to_summary_dto_none(self):
+        # Execute & Verify
+        self.assertIsNone(OrderMapper.to_summary_dto(None))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
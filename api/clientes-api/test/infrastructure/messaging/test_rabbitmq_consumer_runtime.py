@@ -0,0 +1,127 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.infrastructure.messaging.rabbitmq_consumer_runtime import CONSUMER_STATS, RETRIES_HEADER, ERROR_HEADER, \
+    RabbitMQConsumerRuntime
+from .in_memory_broker import InMemoryBroker, InMemoryConnection
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached")
+        time.sleep(0.01)
+
+
+class TestRabbitMQConsumerRuntime(unittest.TestCase):
+
+    def setUp(self):
+        self.broker = InMemoryBroker()
+        self.connection = InMemoryConnection(self.broker)
+        self.connection_manager = MagicMock()
+        self.connection_manager.get_connection.return_value = self.connection
+        self.runtime = None
+
+    def tearDown(self):
+        if self.runtime:
+            self.runtime.stop(timeout=5)
+
+    def start(self, callback, **kwargs):
+        self.runtime = RabbitMQConsumerRuntime(self.connection_manager, "test_queue", callback, **kwargs)
+        self.runtime.start()
+        return self.runtime
+
+    def publish(self, count):
+        for index in range(count):
+            self.broker.publish("test_queue", json.dumps({"id": index}))
+
+    def test_messages_are_processed_concurrently(self):
+        # Every worker blocks until all of them are processing a message
+        barrier = threading.Barrier(4, timeout=5)
+        processed = []
+        self.publish(8)
+
+        runtime = self.start(lambda message: processed.append(barrier.wait() is not None), workers=4, prefetch=8)
+
+        wait_until(lambda: runtime.stats.succeeded == 8)
+        self.assertEqual(len(processed), 8)
+        wait_until(lambda: not self.connection.channels[0].unacked)
+        self.assertEqual(CONSUMER_STATS["test_queue"].to_dict()["inFlight"], 0)
+
+    def test_failed_message_is_retried_then_dead_lettered(self):
+        callback = MagicMock(side_effect=Exception("Processing failed"))
+        self.publish(1)
+
+        runtime = self.start(callback, workers=2, max_retries=2)
+
+        wait_until(lambda: runtime.stats.dead_lettered == 1)
+        self.assertEqual(callback.call_count, 3)
+        self.assertEqual(runtime.stats.retried, 2)
+        properties, body = self.broker.messages("test_queue.dead-letter")[0]
+        self.assertEqual(json.loads(body), {"id": 0})
+        self.assertEqual(properties.headers[RETRIES_HEADER], 2)
+        self.assertEqual(properties.headers[ERROR_HEADER], "Processing failed")
+        wait_until(lambda: not self.connection.channels[0].unacked)
+        self.assertEqual(self.broker.messages("test_queue"), [])
+
+    def test_invalid_json_is_dead_lettered_without_retries(self):
+        callback = MagicMock()
+        self.broker.publish("test_queue", "not json")
+
+        runtime = self.start(callback, workers=1)
+
+        wait_until(lambda: runtime.stats.dead_lettered == 1)
+        callback.assert_not_called()
+        self.assertEqual(runtime.stats.retried, 0)
+
+    def test_acks_are_batched(self):
+        self.publish(32)
+
+        runtime = self.start(MagicMock(), workers=1, prefetch=16, ack_batch_size=8)
+
+        wait_until(lambda: runtime.stats.succeeded == 32)
+        wait_until(lambda: not self.connection.channels[0].unacked)
+        self.assertLess(self.broker.ack_frames, 32)
+
+    def test_stop_acks_messages_in_progress(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_callback(message):
+            started.set()
+            release.wait(5)
+
+        self.publish(1)
+        runtime = self.start(slow_callback, workers=1)
+        started.wait(5)
+
+        # Stop while the message is being processed
+        threading.Timer(0.3, release.set).start()
+        runtime.stop(timeout=5)
+
+        self.assertEqual(runtime.stats.succeeded, 1)
+        self.assertEqual(self.connection.channels[0].unacked, {})
+        self.assertEqual(self.broker.messages("test_queue"), [])
+        self.connection_manager.return_connection.assert_called_once_with(self.connection)
+
+
+    def test_stop_waits_timeout_in_total(self):
+        release = threading.Event()
+        self.publish(3)
+        runtime = self.start(lambda message: release.wait(5), workers=3, prefetch=3)
+        wait_until(lambda: CONSUMER_STATS["test_queue"].to_dict()["inFlight"] == 3)
+
+        # Every worker is stuck: the wait is shared by them instead of repeated for each one
+        started = time.monotonic()
+        runtime.stop(timeout=0.5)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 1.2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakePaymentGateway:
+    """
+    Local payment gateway for the client tests, listening on a free port of localhost.
+    The behavior of the payments can be changed between calls: status, delay or an expired token.
+    """
+
+    def __init__(self, expires_in=3600):
+        self.expires_in = expires_in
+        self.payment_status = 201
+        self.payment_delay = 0
+        self.expire_tokens = False
+        self.tokens = []
+        self.auth_calls = 0
+        self.payment_calls = 0
+        self.client_ports = set()
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        gateway = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with gateway._lock:
+                    gateway.client_ports.add(self.client_address[1])
+                if self.path == '/auth/token':
+                    self._auth(body)
+                elif self.path == '/payments':
+                    self._payment(body)
+                else:
+                    self._reply(404, {"msg": "Not found"})
+
+            def _auth(self, body):
+                with gateway._lock:
+                    gateway.auth_calls += 1
+                    token = f"token-{gateway.auth_calls}"
+                    gateway.tokens.append(token)
+                self._reply(200, {"access_token": token, "expires_in": gateway.expires_in})
+
+            def _payment(self, body):
+                with gateway._lock:
+                    gateway.payment_calls += 1
+                    payment = gateway.payment_calls
+                if gateway.payment_delay:
+                    time.sleep(gateway.payment_delay)
+                token = self.headers.get('Authorization', '').removeprefix('Bearer ')
+                if gateway.expire_tokens or token != gateway.tokens[-1]:
+                    gateway.expire_tokens = False
+                    self._reply(401, {"msg": "Token expired"})
+                    return
+                self._reply(gateway.payment_status, {
+                    "id": f"payment-{payment}",
+                    "transactionReference": f"tx-{payment}",
+                    "status": "APPROVED" if gateway.payment_status == 201 else "REJECTED",
+                    "cardNumber": body["cardNumber"][-4:],
+                    "timestamp": "2025-01-01T00:00:00"
+                })
+
+            def _reply(self, status, data):
+                payload = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
@@ -0,0 +1,136 @@
+import unittest
+
+from src.infrastructure.adapters.payments_adapter import PaymentsAdapter
+from src.infrastructure.payments.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.infrastructure.payments.payment_gateway_client import PaymentGatewayClient, PaymentGatewayError
+from .fake_payment_gateway import FakePaymentGateway
+
+PAYMENT = {"amount": 119.0, "cardNumber": "4111111111111111", "cvv": "123", "expiryDate": "12/30",
+           "currency": "COP"}
+
+
+class TestPaymentGatewayClient(unittest.TestCase):
+
+    def setUp(self):
+        self.gateway = FakePaymentGateway().start()
+        self.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        self.client = PaymentGatewayClient(self.gateway.url, "client", "secret", connect_timeout=1,
+                                           read_timeout=0.2, circuit_breaker=self.circuit_breaker)
+
+    def tearDown(self):
+        self.client.close()
+        self.gateway.stop()
+
+    def test_token_and_connection_are_reused(self):
+        # Execute
+        for _ in range(3):
+            response = self.client.create_payment(PAYMENT)
+            self.assertEqual(response.status_code, 201)
+
+        # Verify a single token and a single keep-alive connection were used
+        self.assertEqual(self.gateway.auth_calls, 1)
+        self.assertEqual(self.gateway.payment_calls, 3)
+        self.assertEqual(len(self.gateway.client_ports), 1)
+
+    def test_token_is_renewed_before_expiry(self):
+        # Tokens expire within the refresh margin
+        self.gateway.expires_in = 10
+
+        self.client.create_payment(PAYMENT)
+        self.client.create_payment(PAYMENT)
+
+        self.assertEqual(self.gateway.auth_calls, 2)
+
+    def test_expired_token_is_renewed_and_payment_retried(self):
+        self.client.create_payment(PAYMENT)
+        self.gateway.expire_tokens = True
+
+        response = self.client.create_payment(PAYMENT)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.gateway.auth_calls, 2)
+
+    def test_read_timeout_opens_circuit(self):
+        self.client.create_payment(PAYMENT)
+        self.gateway.payment_delay = 0.5
+
+        # Two timeouts open the circuit
+        for _ in range(2):
+            with self.assertRaises(PaymentGatewayError):
+                self.client.create_payment(PAYMENT)
+
+        # Verify the next payment fails fast without calling the gateway
+        with self.assertRaises(CircuitOpenError):
+            self.client.create_payment(PAYMENT)
+        self.assertEqual(self.gateway.payment_calls, 3)
+        self.assertEqual(self.client.stats['payment'].rejected, 1)
+        self.assertEqual(self.client.stats['payment'].failures, 2)
+
+    def test_server_errors_open_circuit_and_trial_call_closes_it(self):
+        clock = [0]
+        self.client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=lambda: clock[0])
+        self.gateway.payment_status = 503
+
+        for _ in range(2):
+            with self.assertRaises(PaymentGatewayError):
+                self.client.create_payment(PAYMENT)
+        self.assertEqual(self.client.circuit_breaker.state, CircuitBreaker.OPEN)
+
+        # After the reset timeout a trial call goes through
+        clock[0] = 31
+        self.gateway.payment_status = 201
+        response = self.client.create_payment(PAYMENT)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.client.circuit_breaker.state, CircuitBreaker.CLOSED)
+
+    def test_rejected_payment_does_not_open_circuit(self):
+        self.gateway.payment_status = 402
+
+        for _ in range(3):
+            self.assertEqual(self.client.create_payment(PAYMENT).status_code, 402)
+
+        self.assertEqual(self.circuit_breaker.state, CircuitBreaker.CLOSED)
+
+    def test_latency_is_recorded(self):
+        self.client.create_payment(PAYMENT)
+
+        stats = self.client.stats['payment'].to_dict()
+        self.assertGreaterEqual(stats['calls'], 1)
+        self.assertIsNotNone(stats['p95Seconds'])
+
+
+class TestPaymentsAdapter(unittest.TestCase):
+
+    def setUp(self):
+        self.gateway = FakePaymentGateway().start()
+        self.client = PaymentGatewayClient(self.gateway.url, "client", "secret", read_timeout=0.2,
+                                           circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+        self.adapter = PaymentsAdapter(self.client)
+
+    def tearDown(self):
+        self.client.close()
+        self.gateway.stop()
+
+    def test_process_payment_returns_gateway_response(self):
+        result = self.adapter.process_payment(PAYMENT)
+
+        self.assertEqual(result['status'], 'APPROVED')
+        self.assertEqual(result['transactionReference'], 'tx-1')
+
+    def test_process_payment_returns_rejection(self):
+        self.gateway.payment_status = 402
+
+        self.assertEqual(self.adapter.process_payment(PAYMENT)['status'], 'REJECTED')
+
+    def test_process_payment_returns_none_when_gateway_unavailable(self):
+        self.gateway.payment_delay = 0.5
+
+        self.assertIsNone(self.adapter.process_payment(PAYMENT))
+        # The circuit is open, the gateway is not called again
+        self.assertIsNone(self.adapter.process_payment(PAYMENT))
+        self.assertEqual(self.gateway.payment_calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.interface.consumer.report_jobs_consumer import ReportJobsConsumer
+from src.infrastructure.messaging.rabbitmq_consumer_runtime import RETRIES_HEADER, RabbitMQConsumerRuntime
+from ...infrastructure.messaging.in_memory_broker import InMemoryBroker, InMemoryConnection
+from ...infrastructure.messaging.test_rabbitmq_consumer_runtime import wait_until
+
+
+class TestReportJobsConsumer(unittest.TestCase):
+
+    def setUp(self):
+        with patch('src.interface.consumer.report_jobs_consumer.ReportJobsAdapter'), \
+                patch('src.interface.consumer.report_jobs_consumer.OrderReportsAdapter'), \
+                patch('src.interface.consumer.report_jobs_consumer.ReportQueriesAdapter'), \
+                patch('src.interface.consumer.report_jobs_consumer.RabbitMQMessagingPortAdapter'):
+            self.consumer = ReportJobsConsumer()
+        self.report_jobs_repository = self.consumer.processor.report_jobs_repository
+        self.report_jobs_repository.get_by_id.side_effect = Exception("Database error")
+        self.runtime = None
+
+    def tearDown(self):
+        if self.runtime:
+            self.runtime.stop(timeout=5)
+
+    def test_process_message_raises_when_the_job_cannot_be_read(self):
+        with self.assertRaises(Exception):
+            self.consumer.process_message({"jobId": "job-1"})
+
+        self.report_jobs_repository.update_status.assert_not_called()
+
+    def test_failed_job_message_is_retried_then_dead_lettered(self):
+        broker = InMemoryBroker()
+        connection_manager = MagicMock()
+        connection_manager.get_connection.return_value = InMemoryConnection(broker)
+        broker.publish("report_jobs_queue", json.dumps({"jobId": "job-1"}))
+
+        self.runtime = RabbitMQConsumerRuntime(connection_manager, "report_jobs_queue",
+                                               self.consumer.process_message, workers=1, max_retries=2)
+        self.runtime.start()
+
+        wait_until(lambda: self.runtime.stats.dead_lettered == 1)
+        self.assertEqual(self.runtime.stats.succeeded, 0)
+        self.assertEqual(self.runtime.stats.retried, 2)
+        self.assertEqual(self.report_jobs_repository.get_by_id.call_count, 3)
+        properties, body = broker.messages("report_jobs_queue.dead-letter")[0]
+        self.assertEqual(json.loads(body), {"jobId": "job-1"})
+        self.assertEqual(properties.headers[RETRIES_HEADER], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,29 @@ from flask import Flask, jsonify
 # Load environment variables
 loaded = load_dotenv('.env.development')
 
-logging.basicConfig(level=logging.DEBUG)
-
 from .models.models import db
 from .blueprints.seller_blueprints import seller_blueprint
 from .blueprints.customer_blueprints import customer_blueprint
 from .config import config
+from .metrics import init_metrics
+from .structured_logging import configure_logging
+
+configure_logging('entregas-api')
+
+
+def create_schema(config_name=None):
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    if config_name is None:
+        config_name = os.environ.get('FLASK_ENV', 'default')
+
+    app = Flask(__name__)
+    app.config.from_object(config[config_name])
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.engine.dispose()
 
 
 def create_app(config_name=None):
@@ -24,6 +41,7 @@ def create_app(config_name=None):
 
     logging.debug(f'deliveries microservice started in {config_name} mode')
     app = Flask(__name__)
+    init_metrics(app)
 
     # Load configuration
     app.config.from_object(config[config_name])
@@ -31,9 +49,10 @@ def create_app(config_name=None):
     # Initialize extensions
     db.init_app(app)
 
-    # Create database tables if they don't exist
-    with app.app_context():
-        db.create_all()
+    # Create database tables if they don't exist, unless the gunicorn master already did
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        with app.app_context():
+            db.create_all()
 
     # Register blueprints
     app.register_blueprint(seller_blueprint)
@@ -8,11 +8,6 @@ from .errors.errors import InvalidFormatError
 from .utils import constants
 from ..domain.entities.manufacturer_dto import ManufacturerDTO
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 
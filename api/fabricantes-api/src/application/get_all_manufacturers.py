@@ -1,12 +1,9 @@
 import logging
 
+from .errors.errors import ValidationApiError
 from ..domain.entities.manufacturer_dto import ManufacturerDTO
+from ..domain.entities.page_dto import PageDTO, page_size
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 
@@ -29,3 +26,17 @@ class GetAllManufacturers:
         """
         logging.debug("Retrieving all manufacturers...")
         return self.manufacturer_repository.get_all()
+
+    def execute_page(self, limit: str = None, cursor: str = None) -> PageDTO:
+        """
+        Retrieves a page of manufacturers from the repository.
+        :param limit: Requested page size, capped at the maximum page size.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :return: A PageDTO of ManufacturerDTO objects.
+        """
+        logging.debug(f"Retrieving a page of manufacturers, limit: {limit}, cursor: {cursor}")
+        try:
+            return self.manufacturer_repository.get_page(page_size(limit), cursor)
+        except ValueError as e:
+            logging.error(f"Invalid page request: {e}")
+            raise ValidationApiError
@@ -2,11 +2,6 @@ import logging
 from ..domain.entities.manufacturer_dto import ManufacturerDTO
 from .errors.errors import ManufacturerNotExistsError
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 class GetManufacturerById:
@@ -5,11 +5,6 @@ from .errors.errors import InvalidFormatError, ManufacturerNotExistsError
 from .utils import constants
 from ..domain.entities.manufacturer_dto import ManufacturerDTO
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,257 @@
+"""
+Logging of the services, configured from the environment.
+
+Records are written one per line, as JSON objects (LOG_FORMAT=json, the default) or as text. Loggers from
+get_logger take structured fields as keyword arguments, evaluated only when the record is emitted: a callable
+field is called then, so payloads are not serialized for the records dropped by the level or by the sampling.
+Fields and messages holding card data or credentials are redacted.
+
+Each service is built on its own, so the services keep an identical copy of this module in their source tree:
+src/application/utils in the hexagonal APIs, src in entregas-api and src/utils in the BFFs.
+
+Environment:
+    LOG_LEVEL: Level of the root logger, INFO by default
+    LOG_LEVELS: Levels of single loggers, e.g. "src.adapters=DEBUG,pika=WARNING"
+    LOG_FORMAT: json or text
+    LOG_SAMPLE_RATES: Fraction of the DEBUG and INFO records kept per logger, e.g. "src.adapters=0.1"
+    LOG_REDACT_FIELDS: Names of more fields to redact, comma separated
+"""
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+
+REDACTED = "***"
+REDACT_FIELDS = ("cardNumber", "cvv", "cvc", "securityCode", "password", "client_secret", "access_token",
+                 "refresh_token", "Authorization")
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+TEXT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _normalize(field: str) -> str:
+    return field.lower().replace("_", "").replace("-", "")
+
+
+def _parse_pairs(value: str) -> dict:
+    """Parse "name=value,name=value" settings"""
+    pairs = {}
+    for item in (value or "").split(","):
+        name, _, setting = item.partition("=")
+        if name.strip() and setting.strip():
+            pairs[name.strip()] = setting.strip()
+    return pairs
+
+
+class Redactor:
+    """Masks the values of sensitive fields, in structured fields and in free text"""
+
+    def __init__(self, fields=REDACT_FIELDS):
+        self.fields = {_normalize(field) for field in fields}
+        names = "|".join(sorted({re.escape(field) for field in fields}, key=len, reverse=True))
+        # name, optional quote, ':' or '=', optional quote, then the value up to a delimiter
+        self.pattern = re.compile(rf"""((?:{names})['"]?\s*[:=]\s*['"]?)[^'",}}\s]+""", re.IGNORECASE)
+
+    def redact(self, value):
+        if isinstance(value, dict):
+            return {key: REDACTED if isinstance(key, str) and _normalize(key) in self.fields else self.redact(item)
+                    for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.redact(item) for item in value]
+        return value
+
+    def redact_text(self, text: str) -> str:
+        return self.pattern.sub(rf"\g<1>{REDACTED}", text)
+
+
+class Sampler:
+    """
+    Keeps a fraction of the DEBUG and INFO records of each logger, e.g. 1 in 10 for a rate of 0.1.
+    The rate of a logger is the one of its closest configured ancestor; warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: dict = None):
+        self.configure(rates or {})
+
+    def configure(self, rates: dict) -> None:
+        self.rates = {name: float(rate) for name, rate in rates.items()}
+        self._every = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def keep(self, name: str, level: int) -> bool:
+        if level >= logging.WARNING or not self.rates:
+            return True
+
+        every = self._every.get(name)
+        if every is None:
+            every = self._every[name] = self._every_of(name)
+        if every == 1:
+            return True
+        if every == 0:
+            return False
+        with self._lock:
+            count = self._counters.get(name, 0)
+            self._counters[name] = count + 1
+        return count % every == 0
+
+    def _every_of(self, name: str) -> int:
+        """Keep one record in every n, 0 to drop them all"""
+        candidate = name
+        while True:
+            if candidate in self.rates:
+                rate = self.rates[candidate]
+                if rate >= 1:
+                    return 1
+                return round(1 / rate) if rate > 0 else 0
+            if "." not in candidate:
+                return 1
+            candidate = candidate.rsplit(".", 1)[0]
+
+
+_SAMPLER = Sampler()
+
+
+class SamplingFilter(logging.Filter):
+    """Samples the records of the plain loggers, the structured loggers sample before creating the record"""
+
+    def __init__(self, sampler: Sampler):
+        super().__init__()
+        self.sampler = sampler
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "sampled", False) or self.sampler.keep(record.name, record.levelno)
+
+
+def _resolve(fields: dict) -> dict:
+    """Evaluate the lazy fields"""
+    resolved = {}
+    for key, value in fields.items():
+        try:
+            resolved[key] = value() if callable(value) else value
+        except Exception as e:
+            resolved[key] = f"<unavailable: {e}>"
+    return resolved
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the structured fields under "fields\""""
+
+    def __init__(self, redactor: Redactor, service: str = None):
+        super().__init__()
+        self.redactor = redactor
+        self.service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": self.redactor.redact_text(record.getMessage()),
+        }
+        if self.service:
+            entry["service"] = self.service
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry["fields"] = self.redactor.redact(_resolve(fields))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """The usual text line, followed by the structured fields as key=value"""
+
+    def __init__(self, redactor: Redactor):
+        super().__init__(TEXT_FORMAT, TEXT_DATE_FORMAT)
+        self.redactor = redactor
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = self.redactor.redact(_resolve(getattr(record, "fields", None) or {}))
+        if fields:
+            line += " " + " ".join(f"{key}={json.dumps(value, default=str)}" for key, value in fields.items())
+        return self.redactor.redact_text(line)
+
+
+class StructuredLogger:
+    """
+    Logger taking a message and structured fields. Nothing is evaluated for the records dropped by the level or
+    the sampling: pass payloads as callables, e.g. logger.debug("order received", order=order_dto.to_dict).
+    Positional arguments are %-formatted lazily, as with the standard loggers.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.logger = logging.getLogger(name)
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message, /, *args, exc_info=None, **fields):
+        self._log(logging.DEBUG, message, args, fields, exc_info)
+
+    def info(self, message, /, *args, exc_info=None, **fields):
+        self._log(logging.INFO, message, args, fields, exc_info)
+
+    def warning(self, message, /, *args, exc_info=None, **fields):
+        self._log(logging.WARNING, message, args, fields, exc_info)
+
+    def error(self, message, /, *args, exc_info=None, **fields):
+        self._log(logging.ERROR, message, args, fields, exc_info)
+
+    def exception(self, message, /, *args, exc_info=True, **fields):
+        self._log(logging.ERROR, message, args, fields, exc_info)
+
+    def _log(self, level, message, args, fields, exc_info):
+        if not self.logger.isEnabledFor(level) or not _SAMPLER.keep(self.name, level):
+            return
+        self.logger.log(level, message, *args, exc_info=exc_info, extra={"fields": fields, "sampled": True},
+                        stacklevel=3)
+
+
+_LOGGERS = {}
+
+
+def get_logger(name: str) -> StructuredLogger:
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS.setdefault(name, StructuredLogger(name))
+    return logger
+
+
+def configure_logging(service: str = None, stream=None, environ=None) -> logging.Handler:
+    """
+    Configure the logging of the process from the environment, replacing the handlers of the root logger.
+
+    Args:
+        service: Name of the service, added to the JSON records
+        stream: Stream the records are written to, stdout by default
+        environ: Settings, os.environ by default
+
+    Returns:
+        The handler of the root logger
+    """
+    environ = os.environ if environ is None else environ
+    redactor = Redactor(REDACT_FIELDS + tuple(
+        field.strip() for field in environ.get("LOG_REDACT_FIELDS", "").split(",") if field.strip()))
+    _SAMPLER.configure(_parse_pairs(environ.get("LOG_SAMPLE_RATES")))
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if environ.get("LOG_FORMAT", "json").lower() == "text":
+        handler.setFormatter(TextFormatter(redactor))
+    else:
+        handler.setFormatter(JsonFormatter(redactor, service))
+    handler.addFilter(SamplingFilter(_SAMPLER))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(environ.get("LOG_LEVEL", "INFO").upper())
+    for name, level in _parse_pairs(environ.get("LOG_LEVELS")).items():
+        logging.getLogger(name).setLevel(level.upper())
+    return handler
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from ..entities.manufacturer_dto import ManufacturerDTO
+from ..entities.page_dto import PageDTO
 
 
 class ManufacturerRepository(ABC):
@@ -10,6 +11,11 @@ class ManufacturerRepository(ABC):
         """Get all manufacturers"""
         pass
 
+    @abstractmethod
+    def get_page(self, limit: int, cursor: str = None) -> PageDTO:
+        """Get a page of manufacturers sorted by name"""
+        pass
+
     @abstractmethod
     def get_by_id(self, id: str) -> ManufacturerDTO:
         """Get manufacturer by ID"""
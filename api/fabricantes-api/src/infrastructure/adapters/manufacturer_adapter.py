@@ -1,6 +1,7 @@
 from ..dao.manufacturer_dao import ManufacturerDAO
 from ..mapper.manufacturer_mapper import ManufacturerMapper
 from ...domain.entities.manufacturer_dto import ManufacturerDTO
+from ...domain.entities.page_dto import PageDTO
 from ...domain.repositories.manufacturer_repository import ManufacturerRepository
 
 
@@ -9,6 +10,10 @@ class ManufacturerAdapter(ManufacturerRepository):
     def get_all(self) -> list[ManufacturerDTO]:
         return ManufacturerMapper.to_dto_list(ManufacturerDAO.find_all())
 
+    def get_page(self, limit: int, cursor: str = None) -> PageDTO:
+        manufacturers, next_cursor = ManufacturerDAO.find_page(limit, cursor)
+        return PageDTO(ManufacturerMapper.to_dto_list(manufacturers), next_cursor)
+
     def get_by_id(self, id: str) -> ManufacturerDTO | None:
         manufacturer = ManufacturerDAO.find_by_id(id)
         return ManufacturerMapper.to_dto(manufacturer) if manufacturer else None
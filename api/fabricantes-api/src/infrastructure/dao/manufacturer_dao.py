@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 
 
 from ..database.declarative_base import Session
+from .pagination import paginate
 from ..model.manufacturer_model import ManufacturerModel
 
 
@@ -35,6 +36,18 @@ class ManufacturerDAO:
         session.close()
         return manufacturers
 
+    @classmethod
+    def find_page(cls, limit: int, cursor: str = None) -> tuple[list[ManufacturerModel], str | None]:
+        """
+        Obtain a page of manufacturers sorted by name.
+        :param limit: Maximum number of manufacturers of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :return: Tuple of (manufacturers, cursor of the next page)
+        """
+        with Session() as session:
+            return paginate(session.query(ManufacturerModel), [ManufacturerModel.name, ManufacturerModel.id],
+                            limit, cursor)
+
     @classmethod
     def find_by_id(cls, manufacturer_id: str) -> ManufacturerModel | None:
         """
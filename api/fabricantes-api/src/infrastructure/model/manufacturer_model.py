@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 
 import sqlalchemy
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 
 from ..database.declarative_base import Base
@@ -20,6 +20,10 @@ class ManufacturerModel(Base):
     manufacturer model for SQLAlchemy.
     """
     __tablename__ = 'manufacturers'
+    __table_args__ = (
+        # Sort key of the paginated listing
+        Index('ix_manufacturers_name_id', 'name', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     nit = Column(String, nullable=False, unique=True)
@@ -13,11 +13,6 @@ from ...application.bulk_create_manufacturers import BulkCreateManufacturers
 from ...domain.entities.manufacturer_dto import ManufacturerDTO
 from ...infrastructure.adapters.manufacturer_adapter import ManufacturerAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 manufacturers_blueprint = Blueprint('manufacturer', __name__, url_prefix='/api/v1/manufacturers')
@@ -53,6 +48,10 @@ def create_manufacturer():
 @token_required
 def get_all_manufacturer():
     use_case = GetAllManufacturers(manufacturers_adapter)
+    if 'limit' in request.args or 'cursor' in request.args:
+        page = use_case.execute_page(request.args.get('limit'), request.args.get('cursor'))
+        return jsonify(page.to_dict()), 200
+
     manufacturers = use_case.execute()
     return jsonify([manufacturer.__dict__ for manufacturer in manufacturers]), 200
 
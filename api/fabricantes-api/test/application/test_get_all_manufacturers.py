@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch
 from datetime import datetime
 
 from src.domain.entities.manufacturer_dto import ManufacturerDTO
+from src.domain.entities.page_dto import PageDTO
+from src.application.errors.errors import ValidationApiError
 from src.application.get_all_manufacturers import GetAllManufacturers
 
 
@@ -112,3 +114,26 @@ class TestGetAllManufacturers:
             get_all_manufacturers_usecase.execute()
 
         manufacturer_repository_mock.get_all.assert_called_once()
+
+    def test_get_manufacturers_page(self, get_all_manufacturers_usecase,
+                                    manufacturer_repository_mock,
+                                    sample_manufacturers):
+        # Arrange
+        manufacturer_repository_mock.get_page.return_value = PageDTO(sample_manufacturers[:2], "next-cursor")
+
+        # Act
+        result = get_all_manufacturers_usecase.execute_page("2", None)
+
+        # Assert
+        manufacturer_repository_mock.get_page.assert_called_once_with(2, None)
+        assert result.to_dict()["nextCursor"] == "next-cursor"
+        assert [item["id"] for item in result.to_dict()["items"]] == ["test-id-1", "test-id-2"]
+
+    def test_get_manufacturers_page_invalid_cursor(self, get_all_manufacturers_usecase,
+                                                   manufacturer_repository_mock):
+        # Arrange
+        manufacturer_repository_mock.get_page.side_effect = ValueError("Invalid cursor.")
+
+        # Act & Assert
+        with pytest.raises(ValidationApiError):
+            get_all_manufacturers_usecase.execute_page(None, "not-a-cursor")
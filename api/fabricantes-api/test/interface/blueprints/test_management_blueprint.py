@@ -17,3 +17,11 @@ class TestManagementBlueprint:
 
         assert response.status_code == 200
         assert data['status'] == 'UP'
+
+    def test_database_pool(self, client):
+        response = client.get('/health/database')
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data['checkouts'] >= 0
+        assert 'saturation' in data
@@ -30,4 +30,23 @@ class InvalidTokenError(ApiError):
 
 class ForbiddenError(ApiError):
     code = 403
-    description = "Forbidden."
\ No newline at end of file
+    description = "Forbidden."
+
+class UploadNotFoundError(ApiError):
+    code = 404
+    description = "La carga del video no existe."
+
+
+class UploadOffsetMismatchError(ApiError):
+    code = 409
+    description = "El rango no continúa la carga del video."
+
+
+class UploadIncompleteError(ApiError):
+    code = 409
+    description = "La carga del video no está completa."
+
+
+class UploadTooLargeError(ApiError):
+    code = 413
+    description = "El video supera el tamaño máximo permitido."
@@ -6,6 +6,7 @@ from src.domain.models.video import Video, VideoStatus
 from src.domain.ports.video_repository import VideoRepository
 from src.domain.ports.storage_service import StorageService
 from src.domain.ports.video_analyzer_service import VideoAnalyzerService
+from src.domain.ports.analysis_job_queue import AnalysisJobQueue
 
 
 class VideoProcessor:
@@ -14,10 +15,13 @@ class VideoProcessor:
         video_repository: VideoRepository,
         storage_service: StorageService,
         analyzer_service: VideoAnalyzerService,
+        job_queue: Optional[AnalysisJobQueue] = None,
     ):
         self.video_repository = video_repository
         self.storage_service = storage_service
         self.analyzer_service = analyzer_service
+        # Without a queue, every video is analyzed in a thread of its own
+        self.job_queue = job_queue
     
     def upload_video(self, file_data: BinaryIO, filename: str) -> Video:
         """
@@ -33,6 +37,19 @@ class VideoProcessor:
         # Upload file to storage
         gcs_url = self.storage_service.upload_file(file_data, filename)
         
+        return self.register_video(filename, gcs_url)
+    
+    def register_video(self, filename: str, gcs_url: str) -> Video:
+        """
+        Save the metadata of a video already in storage and start its processing
+        
+        Args:
+            filename: The name of the file
+            gcs_url: The URL of the file in storage
+            
+        Returns:
+            The saved video entity
+        """
         # Create and save video entity
         video = Video(
             filename=filename,
@@ -44,23 +61,32 @@ class VideoProcessor:
         
         saved_video = self.video_repository.save(video)
         
-        # Start asynchronous processing of the video in a separate thread
-        self._process_video_async(saved_video.id)
+        if self.job_queue:
+            # Analyzed by the worker pool, which survives a restart of the process
+            self.job_queue.enqueue(saved_video.id)
+        else:
+            # Start asynchronous processing of the video in a separate thread
+            self._process_video_async(saved_video.id)
         
         return saved_video
     
-    def process_video(self, video_id: str) -> None:
+    def process_video(self, video_id: str, final_attempt: bool = True) -> bool:
         """
         Process a video with Vertex AI
         
         Args:
             video_id: The ID of the video to process
+            final_attempt: Whether a failed analysis marks the video as failed; otherwise the video stays
+                processing, to be analyzed again
+            
+        Returns:
+            False if the analysis failed and is to be attempted again, True otherwise
         """
         # Get video from repository
         video = self.video_repository.get_by_id(video_id)
         
         if not video:
-            return
+            return True
         
         # Update status to processing
         video.status = VideoStatus.PROCESSING
@@ -68,18 +94,22 @@ class VideoProcessor:
         self.video_repository.update(video)
         
         # Analyze video with Vertex AI
+        error = None
         try:
             analysis_result = self.analyzer_service.analyze_video(video.gcs_url)
-            
-            # Update video with analysis result
-            video.analysis_result = analysis_result
-            video.status = VideoStatus.COMPLETED if analysis_result else VideoStatus.FAILED
         except Exception as e:
-            video.status = VideoStatus.FAILED
-            video.analysis_result = f"Error analyzing video: {str(e)}"
+            analysis_result = None
+            error = f"Error analyzing video: {str(e)}"
+        
+        if not analysis_result and not final_attempt:
+            return False
         
+        # Update video with analysis result
+        video.analysis_result = error or analysis_result
+        video.status = VideoStatus.COMPLETED if analysis_result else VideoStatus.FAILED
         video.updated_at = datetime.utcnow()
         self.video_repository.update(video)
+        return True
     
     def get_video_status(self, video_id: str) -> Optional[Video]:
         """
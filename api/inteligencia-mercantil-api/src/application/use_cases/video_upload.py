@@ -0,0 +1,162 @@
+import os
+import uuid
+from datetime import datetime
+from typing import BinaryIO
+
+from src.application.errors.errors import (
+    InvalidFormatError,
+    UploadIncompleteError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+    ValidationApiError,
+)
+from src.application.use_cases.video_processor import VideoProcessor
+from src.domain.models.upload_session import UploadSession, UploadStatus
+from src.domain.models.video import Video
+from src.domain.ports.resumable_storage import ResumableStorage
+from src.domain.ports.upload_session_repository import UploadSessionRepository
+
+DEFAULT_MAX_UPLOAD_SIZE = 5 * 1024 * 1024 * 1024
+
+
+class ResumableVideoUpload:
+    """
+    Upload of a video in ranges: start opens a session in storage, upload_range streams the next bytes to it, and
+    finalize registers the video once every byte was received. A client that lost its connection asks for the
+    status of the upload and sends again from the bytes received.
+    """
+
+    def __init__(
+        self,
+        upload_repository: UploadSessionRepository,
+        storage: ResumableStorage,
+        video_processor: VideoProcessor,
+        max_upload_size: int = None,
+    ):
+        self.upload_repository = upload_repository
+        self.storage = storage
+        self.video_processor = video_processor
+        self.max_upload_size = max_upload_size or int(os.getenv("VIDEO_MAX_UPLOAD_SIZE", DEFAULT_MAX_UPLOAD_SIZE))
+
+    def start(self, filename: str, total_size: int, content_type: str) -> UploadSession:
+        """
+        Open the upload of a video
+
+        Args:
+            filename: The name of the file
+            total_size: The size of the file in bytes
+            content_type: The media type of the file
+
+        Returns:
+            The upload session
+        """
+        if not filename or not isinstance(total_size, int) or isinstance(total_size, bool):
+            raise ValidationApiError
+        if total_size <= 0:
+            raise InvalidFormatError
+        if total_size > self.max_upload_size:
+            raise UploadTooLargeError
+
+        upload_id = str(uuid.uuid4())
+        object_name = f"{upload_id}/{filename}"
+        upload = UploadSession(
+            id=upload_id,
+            filename=filename,
+            content_type=content_type or "application/octet-stream",
+            total_size=total_size,
+            object_name=object_name,
+            storage_handle=self.storage.start_upload(object_name, content_type, total_size),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        return self.upload_repository.save(upload)
+
+    def upload_range(self, upload_id: str, stream: BinaryIO, offset: int, length: int,
+                     total_size: int) -> UploadSession:
+        """
+        Stream the next range of a video to storage
+
+        Args:
+            upload_id: The ID of the upload
+            stream: The bytes of the range
+            offset: The position of the range in the file, the number of bytes received so far
+            length: The number of bytes of the range
+            total_size: The size of the file, as given when the upload was started
+
+        Returns:
+            The upload session, with the bytes received
+        """
+        upload = self._get(upload_id)
+        if upload.status == UploadStatus.COMPLETED or total_size != upload.total_size:
+            raise UploadOffsetMismatchError
+        if length <= 0 or offset + length > upload.total_size:
+            raise InvalidFormatError
+        if offset + length < upload.total_size and length % self.storage.chunk_granularity:
+            raise InvalidFormatError
+
+        if offset != upload.received_bytes:
+            # The bytes of an interrupted request may have been persisted after it was recorded
+            upload = self._reconcile(upload)
+            if offset != upload.received_bytes:
+                raise UploadOffsetMismatchError
+
+        received = self.storage.upload_range(upload.storage_handle, stream, offset, length, upload.total_size)
+        return self._record(upload, received)
+
+    def status(self, upload_id: str) -> UploadSession:
+        """
+        Get an upload, with the bytes persisted by storage
+
+        Args:
+            upload_id: The ID of the upload
+        """
+        upload = self._get(upload_id)
+        if upload.status == UploadStatus.COMPLETED:
+            return upload
+        return self._reconcile(upload)
+
+    def finalize(self, upload_id: str) -> Video:
+        """
+        Register the video of a complete upload and start its processing. Finalizing it again returns the same video.
+
+        Args:
+            upload_id: The ID of the upload
+
+        Returns:
+            The saved video entity
+        """
+        upload = self._get(upload_id)
+        if upload.status == UploadStatus.COMPLETED:
+            return self.video_processor.get_video_status(upload.video_id)
+
+        if not upload.is_complete:
+            upload = self._reconcile(upload)
+            if not upload.is_complete:
+                raise UploadIncompleteError
+
+        gcs_url = self.storage.complete_upload(upload.storage_handle, upload.object_name)
+        video = self.video_processor.register_video(upload.filename, gcs_url)
+
+        upload.status = UploadStatus.COMPLETED
+        upload.video_id = video.id
+        upload.updated_at = datetime.utcnow()
+        self.upload_repository.update(upload)
+        return video
+
+    def _get(self, upload_id: str) -> UploadSession:
+        upload = self.upload_repository.get_by_id(upload_id)
+        if not upload:
+            raise UploadNotFoundError
+        return upload
+
+    def _reconcile(self, upload: UploadSession) -> UploadSession:
+        received = self.storage.persisted_bytes(upload.storage_handle, upload.total_size)
+        if received == upload.received_bytes:
+            return upload
+        return self._record(upload, received)
+
+    def _record(self, upload: UploadSession, received: int) -> UploadSession:
+        upload.received_bytes = received
+        upload.updated_at = datetime.utcnow()
+        return self.upload_repository.update(upload)
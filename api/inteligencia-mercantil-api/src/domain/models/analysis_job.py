@@ -0,0 +1,27 @@
+from enum import Enum
+from dataclasses import dataclass, field
+from typing import Optional
+from datetime import datetime
+
+
+class AnalysisJobStatus(Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+@dataclass
+class AnalysisJob:
+    """
+    Analysis of a video waiting in the queue, or in progress. A running job is leased to a worker until
+    lease_expires_at: once expired, the worker is deemed dead and the job is claimed again.
+    """
+    video_id: str
+    status: AnalysisJobStatus = AnalysisJobStatus.PENDING
+    attempts: int = 0
+    available_at: datetime = field(default_factory=datetime.utcnow)
+    lease_expires_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
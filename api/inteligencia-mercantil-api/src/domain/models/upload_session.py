@@ -0,0 +1,32 @@
+from enum import Enum
+from dataclasses import dataclass, field
+from typing import Optional
+from datetime import datetime, UTC
+
+
+class UploadStatus(Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+
+@dataclass
+class UploadSession:
+    """
+    Resumable upload of a video: the bytes are received in ranges, in order, and streamed to the storage session
+    identified by storage_handle. The video is created once every byte was received.
+    """
+    id: Optional[str] = None
+    filename: str = ""
+    content_type: str = "application/octet-stream"
+    total_size: int = 0
+    received_bytes: int = 0
+    object_name: str = ""
+    storage_handle: str = ""
+    status: UploadStatus = UploadStatus.IN_PROGRESS
+    video_id: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def is_complete(self) -> bool:
+        return self.received_bytes == self.total_size
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.models.analysis_job import AnalysisJob
+
+
+class AnalysisJobQueue(ABC):
+    """Durable queue of the videos to analyze, shared by the workers of every process"""
+
+    @abstractmethod
+    def enqueue(self, video_id: str) -> AnalysisJob:
+        """Queue the analysis of a video"""
+        pass
+
+    @abstractmethod
+    def claim(self, lease_seconds: int) -> Optional[AnalysisJob]:
+        """
+        Take the next job due, or whose lease expired, for lease_seconds
+
+        Returns:
+            The job, with its attempts counting this one, or None if no job is due
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job: AnalysisJob) -> None:
+        """Remove a finished job from the queue"""
+        pass
+
+    @abstractmethod
+    def retry(self, job: AnalysisJob, error: str, delay_seconds: float) -> None:
+        """Release a failed job, due again after delay_seconds"""
+        pass
+
+    @abstractmethod
+    def fail(self, job: AnalysisJob, error: str) -> None:
+        """Give up a job that failed every attempt"""
+        pass
+
+    @abstractmethod
+    def recover(self) -> int:
+        """
+        Queue the videos waiting for an analysis without a job, left by a crash between the save of a video and
+        its queueing, or uploaded before the queue existed
+
+        Returns:
+            The number of jobs queued
+        """
+        pass
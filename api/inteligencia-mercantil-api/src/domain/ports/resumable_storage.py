@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+
+class ResumableStorage(ABC):
+    """
+    Storage receiving a file in ranges, streamed as they arrive: only a bounded buffer of each range is held in
+    memory, and an interrupted upload resumes from the bytes the storage persisted.
+    """
+
+    # Ranges other than the last one must hold a multiple of this number of bytes
+    chunk_granularity: int = 1
+    # Bytes of a range held in memory at once, the size of the ranges clients are asked to send
+    buffer_size: int
+
+    @abstractmethod
+    def start_upload(self, object_name: str, content_type: str, total_size: int) -> str:
+        """
+        Open an upload session
+
+        Args:
+            object_name: The name of the file in storage
+            content_type: The media type of the file
+            total_size: The size of the file in bytes
+
+        Returns:
+            The handle of the session, passed to the other methods
+        """
+        pass
+
+    @abstractmethod
+    def upload_range(self, handle: str, stream: BinaryIO, offset: int, length: int, total_size: int) -> int:
+        """
+        Stream a range of the file to the session
+
+        Args:
+            handle: The handle of the session
+            stream: The bytes of the range, read as they are sent
+            offset: The position of the range in the file
+            length: The number of bytes of the range
+            total_size: The size of the file in bytes
+
+        Returns:
+            The number of bytes of the file persisted so far
+        """
+        pass
+
+    @abstractmethod
+    def persisted_bytes(self, handle: str, total_size: int) -> int:
+        """
+        Get the number of bytes of the file persisted by the session, from where an upload resumes
+
+        Args:
+            handle: The handle of the session
+            total_size: The size of the file in bytes
+        """
+        pass
+
+    @abstractmethod
+    def complete_upload(self, handle: str, object_name: str) -> str:
+        """
+        Close a session whose bytes were all persisted
+
+        Args:
+            handle: The handle of the session
+            object_name: The name of the file in storage
+
+        Returns:
+            The URL of the file
+        """
+        pass
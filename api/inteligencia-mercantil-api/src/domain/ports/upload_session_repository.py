@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.models.upload_session import UploadSession
+
+
+class UploadSessionRepository(ABC):
+    @abstractmethod
+    def save(self, upload: UploadSession) -> UploadSession:
+        """Save an upload session to the repository"""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, upload_id: str) -> Optional[UploadSession]:
+        """Get an upload session by its ID"""
+        pass
+
+    @abstractmethod
+    def update(self, upload: UploadSession) -> UploadSession:
+        """Update an upload session in the repository"""
+        pass
@@ -0,0 +1,88 @@
+import logging
+import os
+import re
+from typing import BinaryIO
+
+import requests
+from google.cloud import storage
+from src.application.errors.exceptions import StorageServiceError
+from src.domain.ports.resumable_storage import ResumableStorage
+
+# GCS takes the bytes of a resumable session in multiples of 256 KiB, but for the last ones
+GCS_CHUNK_GRANULARITY = 256 * 1024
+# Status of a resumable session that has not received every byte yet
+RESUME_INCOMPLETE = 308
+
+
+class GCSResumableStorage(ResumableStorage):
+    """
+    Resumable uploads to a GCS bucket. A range is sent to the session in pieces of buffer_size bytes, one PUT each,
+    so the memory of an upload stays bounded whatever the size of the video.
+    """
+
+    chunk_granularity = GCS_CHUNK_GRANULARITY
+
+    def __init__(self, buffer_size: int):
+        if buffer_size <= 0 or buffer_size % GCS_CHUNK_GRANULARITY:
+            raise ValueError(f"The buffer size must be a positive multiple of {GCS_CHUNK_GRANULARITY} bytes")
+        self.buffer_size = buffer_size
+        self.bucket_name = os.getenv("GCS_BUCKET_NAME", "").strip("'").strip('"')
+        if not self.bucket_name:
+            raise ValueError("GCS_BUCKET_NAME environment variable is not set or empty")
+        self.client = storage.Client()
+        self.bucket = self.client.bucket(self.bucket_name)
+        # The URI of a session authorizes its requests, they reuse the connections of a single session
+        self.http = requests.Session()
+
+    def start_upload(self, object_name: str, content_type: str, total_size: int) -> str:
+        try:
+            blob = self.bucket.blob(object_name)
+            return blob.create_resumable_upload_session(content_type=content_type, size=total_size)
+        except Exception as e:
+            logging.error(f"Error starting the upload of {object_name}: {type(e).__name__}: {str(e)}")
+            raise StorageServiceError(f"Could not start the upload of {object_name}") from e
+
+    def upload_range(self, handle: str, stream: BinaryIO, offset: int, length: int, total_size: int) -> int:
+        end = offset + length
+        position = offset
+        while position < end:
+            piece = stream.read(min(self.buffer_size, end - position))
+            if not piece:
+                # The client stopped sending: the upload resumes from the bytes persisted by the session
+                break
+            persisted = self._put(handle, piece, position, total_size)
+            if persisted != position + len(piece):
+                return persisted
+            position = persisted
+        return position
+
+    def persisted_bytes(self, handle: str, total_size: int) -> int:
+        response = self._request(handle, b"", {"Content-Range": f"bytes */{total_size}"})
+        return self._persisted(response, total_size)
+
+    def complete_upload(self, handle: str, object_name: str) -> str:
+        # The session closes itself with its last byte
+        return f"gs://{self.bucket_name}/{object_name}"
+
+    def _put(self, handle: str, piece: bytes, position: int, total_size: int) -> int:
+        content_range = f"bytes {position}-{position + len(piece) - 1}/{total_size}"
+        response = self._request(handle, piece, {"Content-Range": content_range})
+        return self._persisted(response, total_size)
+
+    def _request(self, handle: str, body: bytes, headers: dict) -> requests.Response:
+        try:
+            return self.http.put(handle, data=body, headers=headers, timeout=(10, 120))
+        except requests.RequestException as e:
+            logging.error(f"Error sending to the upload session: {type(e).__name__}: {str(e)}")
+            raise StorageServiceError("Could not reach the upload session") from e
+
+    @staticmethod
+    def _persisted(response: requests.Response, total_size: int) -> int:
+        """Bytes persisted by the session, from its answer to a PUT"""
+        if response.status_code in (200, 201):
+            return total_size
+        if response.status_code == RESUME_INCOMPLETE:
+            match = re.fullmatch(r"bytes=0-(\d+)", response.headers.get("Range", ""))
+            return int(match.group(1)) + 1 if match else 0
+        logging.error(f"Upload session answered {response.status_code}: {response.text}")
+        raise StorageServiceError(f"Upload session answered {response.status_code}")
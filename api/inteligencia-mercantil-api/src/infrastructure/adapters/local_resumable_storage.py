@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+from typing import BinaryIO
+
+from src.application.errors.exceptions import StorageServiceError
+from src.domain.ports.resumable_storage import ResumableStorage
+
+PARTIAL_SUFFIX = ".part"
+
+
+class LocalResumableStorage(ResumableStorage):
+    """
+    Resumable uploads to a directory, a stand-in of GCS for development and tests. The bytes received are written
+    to a partial file, renamed to the name of the object once complete.
+    """
+
+    def __init__(self, root: str, buffer_size: int, chunk_granularity: int = 1):
+        self.root = Path(root).resolve()
+        self.buffer_size = buffer_size
+        self.chunk_granularity = chunk_granularity
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def start_upload(self, object_name: str, content_type: str, total_size: int) -> str:
+        path = self._path(object_name + PARTIAL_SUFFIX)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        return object_name + PARTIAL_SUFFIX
+
+    def upload_range(self, handle: str, stream: BinaryIO, offset: int, length: int, total_size: int) -> int:
+        path = self._path(handle)
+        if not path.exists():
+            raise StorageServiceError(f"The upload {handle} does not exist")
+        with open(path, "r+b") as file:
+            file.seek(offset)
+            file.truncate()
+            remaining = length
+            while remaining:
+                piece = stream.read(min(self.buffer_size, remaining))
+                if not piece:
+                    break
+                file.write(piece)
+                remaining -= len(piece)
+        return self.persisted_bytes(handle, total_size)
+
+    def persisted_bytes(self, handle: str, total_size: int) -> int:
+        path = self._path(handle)
+        if not path.exists():
+            raise StorageServiceError(f"The upload {handle} does not exist")
+        return path.stat().st_size
+
+    def complete_upload(self, handle: str, object_name: str) -> str:
+        path = self._path(object_name)
+        partial = self._path(handle)
+        if partial.exists():
+            os.replace(partial, path)
+        elif not path.exists():
+            raise StorageServiceError(f"The upload {handle} does not exist")
+        return path.as_uri()
+
+    def _path(self, name: str) -> Path:
+        path = (self.root / name).resolve()
+        if not path.is_relative_to(self.root):
+            raise StorageServiceError(f"{name} is outside of the storage directory")
+        return path
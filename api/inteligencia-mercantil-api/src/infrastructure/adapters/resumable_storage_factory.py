@@ -0,0 +1,27 @@
+import os
+
+from src.domain.ports.resumable_storage import ResumableStorage
+from src.infrastructure.adapters.gcs_resumable_storage import GCS_CHUNK_GRANULARITY, GCSResumableStorage
+from src.infrastructure.adapters.local_resumable_storage import LocalResumableStorage
+
+# Bytes of a range held in memory at once, and sent to GCS in a single request
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def create_resumable_storage() -> ResumableStorage:
+    """
+    Create the storage of the resumable uploads chosen by VIDEO_STORAGE_BACKEND: "gcs", the default, or "local",
+    a directory given by VIDEO_STORAGE_PATH.
+    """
+    buffer_size = int(os.getenv("VIDEO_UPLOAD_BUFFER_SIZE", DEFAULT_BUFFER_SIZE))
+    # Rounded down to a size GCS takes
+    buffer_size = max(buffer_size // GCS_CHUNK_GRANULARITY, 1) * GCS_CHUNK_GRANULARITY
+
+    backend = os.getenv("VIDEO_STORAGE_BACKEND", "gcs").lower()
+    if backend == "local":
+        # Taking the ranges GCS takes, so a client working against it works against GCS
+        return LocalResumableStorage(os.getenv("VIDEO_STORAGE_PATH", "/tmp/videos"), buffer_size,
+                                     GCS_CHUNK_GRANULARITY)
+    if backend == "gcs":
+        return GCSResumableStorage(buffer_size)
+    raise ValueError(f"Unknown VIDEO_STORAGE_BACKEND {backend}")
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import and_, or_
+from src.domain.models.analysis_job import AnalysisJob, AnalysisJobStatus
+from src.domain.models.video import VideoStatus
+from src.domain.ports.analysis_job_queue import AnalysisJobQueue
+from src.infrastructure.database.models import db, AnalysisJobModel, VideoModel
+
+# Longest error message kept on a job
+MAX_ERROR_LENGTH = 2000
+
+
+class SQLAlchemyAnalysisJobQueue(AnalysisJobQueue):
+    """
+    Queue of analysis jobs in the database. A job is claimed with SELECT ... FOR UPDATE SKIP LOCKED, so the workers
+    of every process take different jobs without waiting on each other.
+    """
+
+    def enqueue(self, video_id: str) -> AnalysisJob:
+        job = AnalysisJob(video_id=video_id)
+        db.session.merge(AnalysisJobModel(
+            video_id=job.video_id,
+            status=job.status.value,
+            attempts=job.attempts,
+            available_at=job.available_at,
+            created_at=job.created_at,
+            updated_at=job.updated_at
+        ))
+        db.session.commit()
+        return job
+
+    def claim(self, lease_seconds: int) -> Optional[AnalysisJob]:
+        now = datetime.utcnow()
+        job_model = (
+            AnalysisJobModel.query
+            .filter(or_(
+                and_(AnalysisJobModel.status == AnalysisJobStatus.PENDING.value,
+                     AnalysisJobModel.available_at <= now),
+                and_(AnalysisJobModel.status == AnalysisJobStatus.RUNNING.value,
+                     AnalysisJobModel.lease_expires_at < now)
+            ))
+            .order_by(AnalysisJobModel.available_at)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+
+        if not job_model:
+            db.session.commit()
+            return None
+
+        job_model.status = AnalysisJobStatus.RUNNING.value
+        job_model.attempts += 1
+        job_model.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        job_model.updated_at = now
+        job = self._to_job(job_model)
+        db.session.commit()
+
+        return job
+
+    def complete(self, job: AnalysisJob) -> None:
+        self._finish(job, AnalysisJobStatus.DONE, None, datetime.utcnow())
+
+    def retry(self, job: AnalysisJob, error: str, delay_seconds: float) -> None:
+        self._finish(job, AnalysisJobStatus.PENDING, error,
+                     datetime.utcnow() + timedelta(seconds=delay_seconds))
+
+    def fail(self, job: AnalysisJob, error: str) -> None:
+        self._finish(job, AnalysisJobStatus.FAILED, error, datetime.utcnow())
+
+    def recover(self) -> int:
+        orphans = (
+            db.session.query(VideoModel.id)
+            .outerjoin(AnalysisJobModel, AnalysisJobModel.video_id == VideoModel.id)
+            .filter(VideoModel.status.in_([VideoStatus.UPLOADED.value, VideoStatus.PROCESSING.value]))
+            .filter(AnalysisJobModel.video_id.is_(None))
+            .all()
+        )
+
+        now = datetime.utcnow()
+        for (video_id,) in orphans:
+            db.session.add(AnalysisJobModel(
+                video_id=video_id,
+                status=AnalysisJobStatus.PENDING.value,
+                attempts=0,
+                available_at=now,
+                created_at=now,
+                updated_at=now
+            ))
+        db.session.commit()
+
+        return len(orphans)
+
+    def _finish(self, job: AnalysisJob, status: AnalysisJobStatus, error: Optional[str],
+                available_at: datetime) -> None:
+        # A job whose lease expired may have been claimed again, by a worker that now owns it
+        job_model = AnalysisJobModel.query.filter_by(video_id=job.video_id, attempts=job.attempts).first()
+
+        if not job_model:
+            return
+
+        job_model.status = status.value
+        job_model.available_at = available_at
+        job_model.lease_expires_at = None
+        job_model.last_error = error[:MAX_ERROR_LENGTH] if error else None
+        job_model.updated_at = datetime.utcnow()
+
+        db.session.commit()
+
+    @staticmethod
+    def _to_job(job_model: AnalysisJobModel) -> AnalysisJob:
+        return AnalysisJob(
+            video_id=job_model.video_id,
+            status=AnalysisJobStatus(job_model.status),
+            attempts=job_model.attempts,
+            available_at=job_model.available_at,
+            lease_expires_at=job_model.lease_expires_at,
+            last_error=job_model.last_error,
+            created_at=job_model.created_at,
+            updated_at=job_model.updated_at
+        )
@@ -0,0 +1,65 @@
+import uuid
+from src.domain.models.upload_session import UploadSession, UploadStatus
+from src.domain.ports.upload_session_repository import UploadSessionRepository
+from src.infrastructure.database.models import db, UploadSessionModel
+
+
+class SQLAlchemyUploadSessionRepository(UploadSessionRepository):
+    def save(self, upload: UploadSession) -> UploadSession:
+        if not upload.id:
+            upload.id = str(uuid.uuid4())
+
+        upload_model = UploadSessionModel(
+            id=upload.id,
+            filename=upload.filename,
+            content_type=upload.content_type,
+            total_size=upload.total_size,
+            received_bytes=upload.received_bytes,
+            object_name=upload.object_name,
+            storage_handle=upload.storage_handle,
+            status=upload.status.value,
+            video_id=upload.video_id,
+            created_at=upload.created_at,
+            updated_at=upload.updated_at
+        )
+
+        db.session.add(upload_model)
+        db.session.commit()
+
+        return upload
+
+    def get_by_id(self, upload_id: str) -> UploadSession:
+        upload_model = UploadSessionModel.query.filter_by(id=upload_id).first()
+
+        if not upload_model:
+            return None
+
+        return UploadSession(
+            id=upload_model.id,
+            filename=upload_model.filename,
+            content_type=upload_model.content_type,
+            total_size=upload_model.total_size,
+            received_bytes=upload_model.received_bytes,
+            object_name=upload_model.object_name,
+            storage_handle=upload_model.storage_handle,
+            status=UploadStatus(upload_model.status),
+            video_id=upload_model.video_id,
+            created_at=upload_model.created_at,
+            updated_at=upload_model.updated_at
+        )
+
+    def update(self, upload: UploadSession) -> UploadSession:
+        upload_model = UploadSessionModel.query.filter_by(id=upload.id).first()
+
+        if not upload_model:
+            return None
+
+        upload_model.received_bytes = upload.received_bytes
+        upload_model.storage_handle = upload.storage_handle
+        upload_model.status = upload.status.value
+        upload_model.video_id = upload.video_id
+        upload_model.updated_at = upload.updated_at
+
+        db.session.commit()
+
+        return upload
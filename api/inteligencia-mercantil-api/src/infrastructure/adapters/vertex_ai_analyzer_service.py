@@ -1,9 +1,12 @@
 import os
+import threading
 from typing import Optional
 import google.cloud.aiplatform as aiplatform
 from google.cloud.aiplatform.gapic.schema import predict
 from src.domain.ports.video_analyzer_service import VideoAnalyzerService
 
+MODEL_NAME = "gemini-2.5-pro-preview-05-06"
+
 
 class VertexAIAnalyzerService(VideoAnalyzerService):
     def __init__(self):
@@ -21,6 +24,27 @@ class VertexAIAnalyzerService(VideoAnalyzerService):
         # Initialize the base Vertex AI client
         aiplatform.init(project=self.project_id, location=self.location)
 
+        # The model is loaded on the first analysis and shared by the workers of the process
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    def _get_model(self):
+        """
+        Get the generative model of the service, initializing Vertex AI and loading the model once.
+        """
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from vertexai.generative_models import GenerativeModel
+                    import vertexai
+
+                    # Initialize Vertex AI with explicit credentials if available
+                    vertexai.init(project=self.project_id, location=self.location)
+
+                    # Load the Gemini Pro Vision model
+                    self._model = GenerativeModel(MODEL_NAME)
+        return self._model
+
     def analyze_video(self, video_url: str) -> Optional[str]:
         """
         Analyze a video using Vertex AI
@@ -31,14 +55,9 @@ class VertexAIAnalyzerService(VideoAnalyzerService):
         try:
             # Using the Vertex AI Generative AI API for video analysis
             # For Gemini models, we need to use the VertexAI GenerativeModel
-            from vertexai.generative_models import GenerativeModel, Part
-            import vertexai
-
-            # Initialize Vertex AI with explicit credentials if available
-            vertexai.init(project=self.project_id, location=self.location)
+            from vertexai.generative_models import Part
 
-            # Load the Gemini Pro Vision model
-            multimodal_model = GenerativeModel("gemini-2.5-pro-preview-05-06")
+            multimodal_model = self._get_model()
 
             # Create a prompt for the model
             prompt = (
@@ -13,3 +13,36 @@ class VideoModel(db.Model):
     analysis_result = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class UploadSessionModel(db.Model):
+    __tablename__ = "video_uploads"
+
+    id = db.Column(db.String(36), primary_key=True)
+    filename = db.Column(db.String(255), nullable=False)
+    content_type = db.Column(db.String(255), nullable=False)
+    total_size = db.Column(db.BigInteger, nullable=False)
+    received_bytes = db.Column(db.BigInteger, nullable=False, default=0)
+    object_name = db.Column(db.String(512), nullable=False)
+    # The URI of a GCS resumable session is longer than a column of 255 characters
+    storage_handle = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(50), nullable=False, default="IN_PROGRESS")
+    video_id = db.Column(db.String(36), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class AnalysisJobModel(db.Model):
+    __tablename__ = "video_analysis_jobs"
+
+    video_id = db.Column(db.String(36), primary_key=True)
+    status = db.Column(db.String(50), nullable=False, default="PENDING")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    available_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # The workers look for the next due job on every poll
+    __table_args__ = (db.Index("ix_video_analysis_jobs_status_available_at", "status", "available_at"),)
@@ -0,0 +1,153 @@
+"""
+Pool of threads analyzing the videos of the durable job queue, started in every server process.
+
+The workers of all the processes claim jobs from the same queue, so at most GUNICORN_WORKERS times
+VIDEO_ANALYSIS_WORKERS videos are analyzed at once, however many are uploaded. A failed analysis is retried with
+exponential backoff up to VIDEO_ANALYSIS_MAX_ATTEMPTS times; a job whose worker died, with its process, is claimed
+again once its lease expires, so no analysis is lost on a restart.
+
+Environment:
+    VIDEO_ANALYSIS_WORKERS: Threads analyzing videos in each process, 0 to analyze none in it
+    VIDEO_ANALYSIS_MAX_ATTEMPTS: Attempts of an analysis before the video is marked as failed
+    VIDEO_ANALYSIS_RETRY_DELAY: Seconds before the first retry, doubled by every retry
+    VIDEO_ANALYSIS_MAX_RETRY_DELAY: Longest wait between two attempts, in seconds
+    VIDEO_ANALYSIS_LEASE_SECONDS: Seconds a worker holds a job, longer than the slowest analysis
+    VIDEO_ANALYSIS_POLL_INTERVAL: Seconds an idle worker waits before looking for a job again
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+
+from src.infrastructure.monitoring.metrics import REGISTRY
+
+ANALYSIS_WORKERS = int(os.getenv("VIDEO_ANALYSIS_WORKERS", 2))
+ANALYSIS_MAX_ATTEMPTS = int(os.getenv("VIDEO_ANALYSIS_MAX_ATTEMPTS", 3))
+ANALYSIS_RETRY_DELAY = float(os.getenv("VIDEO_ANALYSIS_RETRY_DELAY", 30))
+ANALYSIS_MAX_RETRY_DELAY = float(os.getenv("VIDEO_ANALYSIS_MAX_RETRY_DELAY", 900))
+ANALYSIS_LEASE_SECONDS = int(os.getenv("VIDEO_ANALYSIS_LEASE_SECONDS", 900))
+ANALYSIS_POLL_INTERVAL = float(os.getenv("VIDEO_ANALYSIS_POLL_INTERVAL", 5))
+
+ANALYSIS_JOBS = REGISTRY.counter(
+    "video_analysis_jobs_total", "Analysis attempts of the workers, by outcome", ("outcome",))
+
+_POOLS = []
+
+
+class AnalysisWorkerPool:
+    """
+    Fixed number of threads taking jobs from the queue, each in an application context of its own. The video
+    processor is created by the first job, in the thread of a worker, so its cloud clients are created once per
+    process and only when there is something to analyze.
+    """
+
+    def __init__(self, app, job_queue, processor_factory, workers=None, max_attempts=None, retry_delay=None,
+                 max_retry_delay=None, lease_seconds=None, poll_interval=None):
+        self.logger = logging.getLogger(__name__)
+        self.app = app
+        self.job_queue = job_queue
+        self.processor_factory = processor_factory
+        self.workers = ANALYSIS_WORKERS if workers is None else workers
+        self.max_attempts = max_attempts or ANALYSIS_MAX_ATTEMPTS
+        self.retry_delay = ANALYSIS_RETRY_DELAY if retry_delay is None else retry_delay
+        self.max_retry_delay = ANALYSIS_MAX_RETRY_DELAY if max_retry_delay is None else max_retry_delay
+        self.lease_seconds = lease_seconds or ANALYSIS_LEASE_SECONDS
+        self.poll_interval = ANALYSIS_POLL_INTERVAL if poll_interval is None else poll_interval
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """
+        Queue the videos left without a job, then start the workers.
+        """
+        if self.workers <= 0:
+            return
+        try:
+            with self.app.app_context():
+                recovered = self.job_queue.recover()
+            if recovered:
+                self.logger.info(f"Queued {recovered} videos waiting for an analysis without a job")
+        except Exception as e:
+            self.logger.error(f"Error recovering the videos without a job: {str(e)}")
+
+        for index in range(self.workers):
+            worker = threading.Thread(target=self._work, name=f"video-analysis-worker-{index}", daemon=True)
+            worker.start()
+            self._threads.append(worker)
+        _POOLS.append(self)
+        self.logger.info(f"Analyzing videos with {self.workers} workers")
+
+    def stop(self, timeout=30):
+        """
+        Stop taking jobs and wait for the analyses in progress. An analysis not finished within the timeout is
+        claimed again, by another process, once its lease expires.
+        """
+        deadline = time.monotonic() + timeout
+        self._stopping.set()
+        for worker in self._threads:
+            worker.join(_remaining(deadline))
+        self._threads = []
+
+    def backoff(self, attempts: int) -> float:
+        """Seconds before the attempt following a failed one"""
+        return min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
+
+    def run_once(self) -> bool:
+        """
+        Claim a job and run it.
+
+        Returns:
+            False if no job was due
+        """
+        with self.app.app_context():
+            job = self.job_queue.claim(self.lease_seconds)
+        if not job:
+            return False
+
+        final_attempt = job.attempts >= self.max_attempts
+        with self.app.app_context():
+            try:
+                analyzed = self.processor_factory().process_video(job.video_id, final_attempt=final_attempt)
+                error = None if analyzed else "The analysis of the video failed"
+            except Exception as e:
+                self.logger.error(f"Error processing video {job.video_id}: {str(e)}")
+                analyzed, error = False, str(e)
+
+            if analyzed:
+                self.job_queue.complete(job)
+                ANALYSIS_JOBS.inc(outcome="completed")
+            elif final_attempt:
+                self.job_queue.fail(job, error)
+                ANALYSIS_JOBS.inc(outcome="failed")
+            else:
+                delay = self.backoff(job.attempts)
+                self.logger.warning(f"Attempt {job.attempts} of video {job.video_id} failed, "
+                                    f"retrying in {delay} seconds: {error}")
+                self.job_queue.retry(job, error, delay)
+                ANALYSIS_JOBS.inc(outcome="retried")
+        return True
+
+    def _work(self):
+        while not self._stopping.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception as e:
+                self.logger.error(f"Error taking a video analysis job: {str(e)}")
+            self._stopping.wait(self.poll_interval)
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until a deadline of time.monotonic, never negative"""
+    return max(0.0, deadline - time.monotonic())
+
+
+def stop_worker_pools(timeout=30):
+    """Gracefully stop every worker pool of the process, within timeout seconds in total"""
+    deadline = time.monotonic() + timeout
+    while _POOLS:
+        _POOLS.pop().stop(_remaining(deadline))
+
+
+atexit.register(stop_worker_pools)
@@ -1,7 +1,14 @@
-import logging
+import re
+import threading
 
 from flask import Blueprint, request, jsonify
+from werkzeug.utils import secure_filename
+from src.application.errors.errors import InvalidFormatError, ValidationApiError
 from src.application.use_cases.video_processor import VideoProcessor
+from src.application.use_cases.video_upload import ResumableVideoUpload
+from src.infrastructure.adapters.resumable_storage_factory import create_resumable_storage
+from src.infrastructure.adapters.sqlalchemy_analysis_job_queue import SQLAlchemyAnalysisJobQueue
+from src.infrastructure.adapters.sqlalchemy_upload_session_repository import SQLAlchemyUploadSessionRepository
 from src.infrastructure.adapters.sqlalchemy_video_repository import SQLAlchemyVideoRepository
 from src.infrastructure.adapters.gcs_storage_service import GCSStorageService
 from src.infrastructure.adapters.vertex_ai_analyzer_service import VertexAIAnalyzerService
@@ -11,9 +18,55 @@ video_blueprint = Blueprint("video", __name__)
 
 # Initialize dependencies
 video_repository = SQLAlchemyVideoRepository()
-storage_service = GCSStorageService()
-analyzer_service = VertexAIAnalyzerService()
-video_processor = VideoProcessor(video_repository, storage_service, analyzer_service)
+upload_repository = SQLAlchemyUploadSessionRepository()
+analysis_queue = SQLAlchemyAnalysisJobQueue()
+# The cloud clients are created on first use, in the worker serving the request: their gRPC channels do not
+# survive the fork of the server processes
+storage_service = None
+analyzer_service = None
+video_processor = None
+resumable_upload = None
+_video_processor_lock = threading.Lock()
+
+CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+def get_video_processor():
+    """
+    Get the video processor of the process, creating the cloud clients on first use.
+    """
+    global storage_service, analyzer_service, video_processor
+    if video_processor is None:
+        with _video_processor_lock:
+            if video_processor is None:
+                storage_service = storage_service or GCSStorageService()
+                analyzer_service = analyzer_service or VertexAIAnalyzerService()
+                video_processor = VideoProcessor(video_repository, storage_service, analyzer_service, analysis_queue)
+    return video_processor
+
+
+def get_resumable_upload():
+    """
+    Get the resumable upload of the process, creating its storage on first use.
+    """
+    global resumable_upload
+    if resumable_upload is None:
+        processor = get_video_processor()
+        with _video_processor_lock:
+            if resumable_upload is None:
+                resumable_upload = ResumableVideoUpload(upload_repository, create_resumable_storage(), processor)
+    return resumable_upload
+
+
+def upload_response(upload):
+    return {
+        "upload_id": upload.id,
+        "filename": upload.filename,
+        "status": upload.status.value,
+        "total_size": upload.total_size,
+        "received_bytes": upload.received_bytes,
+        "video_id": upload.video_id,
+    }
 
 
 @video_blueprint.route("/upload", methods=["POST"])
@@ -24,26 +77,6 @@ def upload_video():
     Returns:
         A JSON response with the video ID and status
     """
-    from google.cloud import storage
-
-    # Verify GCS connection
-    try:
-        client = storage.Client()
-        bucket_name = 'market_intelligence_bucket'  # Replace with correct name if different
-
-        logging.info(f"Attempting to access bucket: {bucket_name}")
-        try:
-            bucket = client.get_bucket(bucket_name)
-            logging.info(f"✅ Bucket access confirmed: {bucket.name}")
-        except Exception as e:
-            logging.info(f"❌ Error accessing bucket: {e}")
-
-        # Continue with original logic...
-    except Exception as e:
-        logging.info(f"General GCS error: {e}")
-        # You can decide whether to propagate or handle the error
-        raise
-
     if "video" not in request.files:
         return jsonify({"error": "No video file in request"}), 400
     
@@ -53,7 +86,87 @@ def upload_video():
         return jsonify({"error": "Empty filename"}), 400
     
     # Process the uploaded video
-    video = video_processor.upload_video(video_file, video_file.filename)
+    video = get_video_processor().upload_video(video_file, video_file.filename)
+    
+    return jsonify({
+        "id": video.id,
+        "filename": video.filename,
+        "status": video.status.value,
+        "message": "Video uploaded successfully and queued for processing"
+    }), 200
+
+
+@video_blueprint.route("/uploads", methods=["POST"])
+def start_upload():
+    """
+    Start a resumable upload of a video, whose bytes are then sent in ranges
+    
+    Returns:
+        A JSON response with the upload ID and the size of the ranges to send
+    """
+    data = request.get_json(silent=True) or {}
+    filename = secure_filename(data.get("filename") or "")
+    if not filename:
+        raise ValidationApiError
+    
+    resumable = get_resumable_upload()
+    upload = resumable.start(filename, data.get("size"), data.get("content_type"))
+    
+    response = upload_response(upload)
+    response["chunk_size"] = resumable.storage.buffer_size
+    return jsonify(response), 201
+
+
+@video_blueprint.route("/uploads/<upload_id>", methods=["PUT"])
+def upload_range(upload_id):
+    """
+    Send the next range of a video, given by a Content-Range header as "bytes first-last/total"
+    
+    Args:
+        upload_id: The ID of the upload
+        
+    Returns:
+        A JSON response with the bytes received so far
+    """
+    match = CONTENT_RANGE.fullmatch(request.headers.get("Content-Range", ""))
+    if not match:
+        raise InvalidFormatError
+    first, last, total = (int(value) for value in match.groups())
+    length = last - first + 1
+    if request.content_length is not None and request.content_length != length:
+        raise InvalidFormatError
+    
+    # The body is read from the connection as it is streamed, never spooled to memory or disk
+    upload = get_resumable_upload().upload_range(upload_id, request.stream, first, length, total)
+    
+    return jsonify(upload_response(upload)), 200
+
+
+@video_blueprint.route("/uploads/<upload_id>", methods=["GET"])
+def get_upload(upload_id):
+    """
+    Get the bytes received of an upload, from where an interrupted upload resumes
+    
+    Args:
+        upload_id: The ID of the upload
+    """
+    upload = get_resumable_upload().status(upload_id)
+    
+    return jsonify(upload_response(upload)), 200
+
+
+@video_blueprint.route("/uploads/<upload_id>/complete", methods=["POST"])
+def complete_upload(upload_id):
+    """
+    Register the video of an upload whose bytes were all received, and queue it for processing
+    
+    Args:
+        upload_id: The ID of the upload
+        
+    Returns:
+        A JSON response with the video ID and status
+    """
+    video = get_resumable_upload().finalize(upload_id)
     
     return jsonify({
         "id": video.id,
@@ -74,7 +187,7 @@ def get_video_status(video_id):
     Returns:
         A JSON response with the video status and analysis result if available
     """
-    video = video_processor.get_video_status(video_id)
+    video = get_video_processor().get_video_status(video_id)
     
     if not video:
         return jsonify({"error": "Video not found"}), 404
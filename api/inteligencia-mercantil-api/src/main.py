@@ -6,23 +6,63 @@ from dotenv import load_dotenv
 from flask import Flask, jsonify
 from google.auth import default
 
-from src.interface.blueprints.video_blueprint import video_blueprint
+from src.interface.blueprints.video_blueprint import analysis_queue, get_video_processor, video_blueprint
 from src.infrastructure.database.models import db
 from .application.errors.errors import ApiError
 from .interface.blueprints.management_blueprint import management_blueprint
+from .infrastructure.monitoring.metrics import init_metrics
+from .infrastructure.workers.analysis_worker_pool import AnalysisWorkerPool, stop_worker_pools
+from .application.utils.structured_logging import configure_logging
 
 # Load environment variables
 load_dotenv()
 
-logging.basicConfig(level=logging.DEBUG)
-logging.getLogger().setLevel(logging.DEBUG)  # Root logger
+configure_logging('inteligencia-mercantil-api')
 
-# Gunicorn compatibility: Make Flask debugger and handlers talk to Gunicorn's logger
-gunicorn_error_logger = logging.getLogger('gunicorn.error')
-logging.getLogger().handlers = gunicorn_error_logger.handlers
-logging.getLogger('flask.app').handlers = gunicorn_error_logger.handlers
-logging.getLogger('flask.app').setLevel(logging.DEBUG)
-logging.getLogger('werkzeug').setLevel(logging.DEBUG)
+
+def configure_database(app):
+    """
+    Configure the database of the application from the environment.
+    """
+    DATABASE_URL = (
+        f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
+        f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+    )
+
+    app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+
+
+def create_schema():
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    app = Flask(__name__)
+    configure_database(app)
+    with app.app_context():
+        logging.debug('Creating database tables if they do not exist')
+        db.create_all()
+        db.engine.dispose()
+
+
+def start_analysis_workers(app):
+    """
+    Start the pool analyzing the queued videos in this process.
+    """
+    if os.getenv("TESTING", "False").lower() == "true":
+        return None
+    pool = AnalysisWorkerPool(app, analysis_queue, get_video_processor)
+    pool.start()
+    return pool
+
+
+def shutdown(timeout=30):
+    """
+    Stop the analysis workers after the analyses in progress, called by the server when a worker exits.
+    :param timeout: Seconds the shutdown may wait, in total.
+    """
+    stop_worker_pools(timeout)
 
 
 def create_app():
@@ -41,20 +81,12 @@ def create_app():
 
     logging.debug('Initializing microservice application')
     app = Flask(__name__)
+    init_metrics(app)
     logging.debug('Flask application instance created')
 
-    DATABASE_URL = (
-        f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
-        f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
-    )
-
-    # Configure database
-    app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
     # Initialize extensions
     logging.debug('Initializing database connection')
-    db.init_app(app)
+    configure_database(app)
     logging.debug('Database initialization completed')
 
     # Register blueprints
@@ -73,11 +105,14 @@ def create_app():
         }
         return jsonify(response), error.code
 
-    # Create database tables if they don't exist
-    with app.app_context():
-        logging.debug('Creating database tables if they do not exist')
-        db.create_all()
-        logging.debug('Database tables creation completed')
+    # Create database tables if they don't exist, unless the gunicorn master already did
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        with app.app_context():
+            logging.debug('Creating database tables if they do not exist')
+            db.create_all()
+            logging.debug('Database tables creation completed')
+
+    start_analysis_workers(app)
 
     return app
 
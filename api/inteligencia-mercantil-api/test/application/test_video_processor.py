@@ -62,6 +62,42 @@ class TestVideoProcessor:
         assert result.gcs_url == "gs://test-bucket/test.mp4"
         assert result.status == VideoStatus.UPLOADED
     
+    def test_upload_video_with_job_queue(self, mock_repository, mock_storage, mock_analyzer):
+        """Test that upload_video queues the analysis instead of starting a thread"""
+        # Arrange
+        job_queue = Mock()
+        processor = VideoProcessor(mock_repository, mock_storage, mock_analyzer, job_queue)
+        
+        # Act
+        with patch('threading.Thread') as mock_thread:
+            result = processor.upload_video(BytesIO(b"test video content"), "test.mp4")
+        
+        # Assert
+        job_queue.enqueue.assert_called_once_with("test-id")
+        mock_thread.assert_not_called()
+        assert result.status == VideoStatus.UPLOADED
+    
+    def test_process_video_failure_to_retry(self, processor, mock_repository, mock_analyzer):
+        """Test that a failed attempt that is not the last one leaves the video processing"""
+        # Arrange
+        video = Video(
+            id="test-id",
+            filename="test.mp4",
+            gcs_url="gs://test-bucket/test.mp4",
+            status=VideoStatus.UPLOADED
+        )
+        mock_repository.get_by_id.return_value = video
+        mock_analyzer.analyze_video.side_effect = Exception("Test error")
+        
+        # Act
+        result = processor.process_video("test-id", final_attempt=False)
+        
+        # Assert
+        assert result is False
+        mock_repository.update.assert_called_once()
+        assert video.status == VideoStatus.PROCESSING
+        assert video.analysis_result is None
+    
     def test_process_video_success(self, processor, mock_repository, mock_analyzer):
         """Test that process_video processes a video successfully"""
         # Arrange
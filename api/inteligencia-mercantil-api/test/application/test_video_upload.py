@@ -0,0 +1,137 @@
+import pytest
+from unittest.mock import Mock
+from io import BytesIO
+
+from src.application.errors.errors import (
+    InvalidFormatError,
+    UploadIncompleteError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+    ValidationApiError,
+)
+from src.application.use_cases.video_upload import ResumableVideoUpload
+from src.domain.models.upload_session import UploadStatus
+from src.domain.models.video import Video, VideoStatus
+from src.infrastructure.adapters.local_resumable_storage import LocalResumableStorage
+from test.infrastructure.mocks.mock_upload_session_repository import MockUploadSessionRepository
+
+CHUNK = 4
+CONTENT = b"0123456789abcdefghij"
+
+
+class TestResumableVideoUpload:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return LocalResumableStorage(str(tmp_path), buffer_size=3, chunk_granularity=CHUNK)
+
+    @pytest.fixture
+    def repository(self):
+        return MockUploadSessionRepository()
+
+    @pytest.fixture
+    def processor(self):
+        processor = Mock()
+        processor.register_video.side_effect = lambda filename, gcs_url: Video(
+            id="video-id", filename=filename, gcs_url=gcs_url, status=VideoStatus.UPLOADED
+        )
+        return processor
+
+    @pytest.fixture
+    def uploads(self, repository, storage, processor):
+        return ResumableVideoUpload(repository, storage, processor, max_upload_size=100)
+
+    def send(self, uploads, upload_id, offset, length):
+        return uploads.upload_range(upload_id, BytesIO(CONTENT[offset:offset + length]), offset, length,
+                                    len(CONTENT))
+
+    def test_upload_in_ranges(self, uploads, processor, tmp_path):
+        """Test that the ranges are written in order and finalize registers the video"""
+        # Arrange
+        upload = uploads.start("test.mp4", len(CONTENT), "video/mp4")
+
+        # Act
+        self.send(uploads, upload.id, 0, 8)
+        self.send(uploads, upload.id, 8, 8)
+        result = self.send(uploads, upload.id, 16, 4)
+        video = uploads.finalize(upload.id)
+
+        # Assert
+        assert result.received_bytes == len(CONTENT)
+        assert (tmp_path / upload.id / "test.mp4").read_bytes() == CONTENT
+        processor.register_video.assert_called_once_with("test.mp4", (tmp_path / upload.id / "test.mp4").as_uri())
+        assert video.id == "video-id"
+        assert uploads.status(upload.id).status == UploadStatus.COMPLETED
+
+    def test_finalize_twice_returns_the_same_video(self, uploads, processor):
+        """Test that finalizing a completed upload does not register the video again"""
+        # Arrange
+        upload = uploads.start("test.mp4", len(CONTENT), "video/mp4")
+        self.send(uploads, upload.id, 0, len(CONTENT))
+        uploads.finalize(upload.id)
+
+        # Act
+        uploads.finalize(upload.id)
+
+        # Assert
+        processor.register_video.assert_called_once()
+        processor.get_video_status.assert_called_once_with("video-id")
+
+    def test_resume_after_interrupted_range(self, uploads, storage, repository):
+        """Test that the bytes persisted by an interrupted request are recovered from storage"""
+        # Arrange
+        upload = uploads.start("test.mp4", len(CONTENT), "video/mp4")
+        # A request that persisted its bytes but died before recording them
+        storage.upload_range(upload.storage_handle, BytesIO(CONTENT[:8]), 0, 8, len(CONTENT))
+
+        # Act
+        status = uploads.status(upload.id)
+        result = self.send(uploads, upload.id, 8, 12)
+
+        # Assert
+        assert status.received_bytes == 8
+        assert result.received_bytes == len(CONTENT)
+
+    def test_range_not_continuing_the_upload(self, uploads):
+        """Test that a range must start at the bytes received"""
+        # Arrange
+        upload = uploads.start("test.mp4", len(CONTENT), "video/mp4")
+
+        # Act/Assert
+        with pytest.raises(UploadOffsetMismatchError):
+            self.send(uploads, upload.id, 4, 4)
+
+    def test_range_not_multiple_of_granularity(self, uploads):
+        """Test that ranges but the last one must be multiples of the granularity of the storage"""
+        # Arrange
+        upload = uploads.start("test.mp4", len(CONTENT), "video/mp4")
+
+        # Act/Assert
+        with pytest.raises(InvalidFormatError):
+            self.send(uploads, upload.id, 0, 5)
+
+    def test_finalize_incomplete_upload(self, uploads):
+        """Test that an upload cannot be finalized before every byte was received"""
+        # Arrange
+        upload = uploads.start("test.mp4", len(CONTENT), "video/mp4")
+        self.send(uploads, upload.id, 0, 8)
+
+        # Act/Assert
+        with pytest.raises(UploadIncompleteError):
+            uploads.finalize(upload.id)
+
+    def test_start_validations(self, uploads):
+        """Test the size and name of a new upload"""
+        # Act/Assert
+        with pytest.raises(ValidationApiError):
+            uploads.start("test.mp4", None, "video/mp4")
+        with pytest.raises(InvalidFormatError):
+            uploads.start("test.mp4", 0, "video/mp4")
+        with pytest.raises(UploadTooLargeError):
+            uploads.start("test.mp4", 101, "video/mp4")
+
+    def test_unknown_upload(self, uploads):
+        """Test that an unknown upload is not found"""
+        # Act/Assert
+        with pytest.raises(UploadNotFoundError):
+            uploads.status("unknown")
@@ -42,8 +42,8 @@ class TestFlaskAppEndToEnd:
         
         yield mocks
         
-        # Stop all patches
-        for p in patches:
+        # Stop all patches, the last started first: two of them patch the same session
+        for p in reversed(patches):
             p.stop()
 
     def test_app_starts_and_responds(self, mock_services):
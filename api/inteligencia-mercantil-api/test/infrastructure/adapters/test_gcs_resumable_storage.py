@@ -0,0 +1,102 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from io import BytesIO
+
+from src.application.errors.exceptions import StorageServiceError
+from src.infrastructure.adapters.gcs_resumable_storage import GCS_CHUNK_GRANULARITY, GCSResumableStorage
+
+SESSION_URL = "https://storage.googleapis.com/upload/session"
+
+
+def response(status_code, headers=None):
+    result = MagicMock()
+    result.status_code = status_code
+    result.headers = headers or {}
+    return result
+
+
+class TestGCSResumableStorage:
+    @pytest.fixture
+    def mock_storage_client(self):
+        with patch('google.cloud.storage.Client') as mock_client:
+            mock_blob = mock_client.return_value.bucket.return_value.blob.return_value
+            mock_blob.create_resumable_upload_session.return_value = SESSION_URL
+            yield mock_client, mock_blob
+
+    @pytest.fixture
+    def storage(self, mock_storage_client):
+        storage = GCSResumableStorage(GCS_CHUNK_GRANULARITY)
+        storage.http = MagicMock()
+        return storage
+
+    def test_start_upload(self, storage, mock_storage_client):
+        """Test that a resumable session of the size of the video is created"""
+        # Arrange
+        _, mock_blob = mock_storage_client
+
+        # Act
+        handle = storage.start_upload("upload/test.mp4", "video/mp4", 1000)
+
+        # Assert
+        assert handle == SESSION_URL
+        mock_blob.create_resumable_upload_session.assert_called_once_with(content_type="video/mp4", size=1000)
+
+    def test_upload_range_in_buffer_sized_pieces(self, storage):
+        """Test that a range is sent in pieces of the buffer size, with their Content-Range"""
+        # Arrange
+        total = 3 * GCS_CHUNK_GRANULARITY
+        storage.http.put.side_effect = [
+            response(308, {"Range": f"bytes=0-{GCS_CHUNK_GRANULARITY - 1}"}),
+            response(308, {"Range": f"bytes=0-{2 * GCS_CHUNK_GRANULARITY - 1}"}),
+        ]
+
+        # Act
+        persisted = storage.upload_range(SESSION_URL, BytesIO(b"x" * total), 0, 2 * GCS_CHUNK_GRANULARITY, total)
+
+        # Assert
+        assert persisted == 2 * GCS_CHUNK_GRANULARITY
+        ranges = [call.kwargs["headers"]["Content-Range"] for call in storage.http.put.call_args_list]
+        assert ranges == [
+            f"bytes 0-{GCS_CHUNK_GRANULARITY - 1}/{total}",
+            f"bytes {GCS_CHUNK_GRANULARITY}-{2 * GCS_CHUNK_GRANULARITY - 1}/{total}",
+        ]
+        assert all(len(call.kwargs["data"]) == GCS_CHUNK_GRANULARITY for call in storage.http.put.call_args_list)
+
+    def test_last_range_completes_the_session(self, storage):
+        """Test that the last byte closes the session"""
+        # Arrange
+        storage.http.put.return_value = response(200)
+
+        # Act
+        persisted = storage.upload_range(SESSION_URL, BytesIO(b"video"), 0, 5, 5)
+
+        # Assert
+        assert persisted == 5
+        assert storage.complete_upload(SESSION_URL, "upload/test.mp4") == "gs://test-bucket/upload/test.mp4"
+
+    def test_persisted_bytes(self, storage):
+        """Test that the progress of a session is queried with an empty PUT"""
+        # Arrange
+        storage.http.put.return_value = response(308, {"Range": "bytes=0-99"})
+
+        # Act
+        persisted = storage.persisted_bytes(SESSION_URL, 1000)
+
+        # Assert
+        assert persisted == 100
+        assert storage.http.put.call_args.kwargs["headers"] == {"Content-Range": "bytes */1000"}
+
+    def test_expired_session(self, storage):
+        """Test that an error of the session is a storage error"""
+        # Arrange
+        storage.http.put.return_value = response(410)
+
+        # Act/Assert
+        with pytest.raises(StorageServiceError):
+            storage.persisted_bytes(SESSION_URL, 1000)
+
+    def test_buffer_size_must_be_multiple_of_granularity(self, mock_storage_client):
+        """Test that GCS would not take the pieces of other buffer sizes"""
+        # Act/Assert
+        with pytest.raises(ValueError):
+            GCSResumableStorage(1000)
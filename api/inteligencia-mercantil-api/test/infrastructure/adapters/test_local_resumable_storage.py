@@ -0,0 +1,45 @@
+import pytest
+from io import BytesIO
+
+from src.application.errors.exceptions import StorageServiceError
+from src.infrastructure.adapters.local_resumable_storage import LocalResumableStorage
+
+
+class TestLocalResumableStorage:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return LocalResumableStorage(str(tmp_path), buffer_size=4)
+
+    def test_upload_and_complete(self, storage, tmp_path):
+        """Test that the ranges are written to a partial file renamed on completion"""
+        # Arrange
+        handle = storage.start_upload("upload/test.mp4", "video/mp4", 10)
+
+        # Act
+        first = storage.upload_range(handle, BytesIO(b"012345"), 0, 6, 10)
+        second = storage.upload_range(handle, BytesIO(b"6789"), 6, 4, 10)
+        url = storage.complete_upload(handle, "upload/test.mp4")
+
+        # Assert
+        assert (first, second) == (6, 10)
+        assert (tmp_path / "upload" / "test.mp4").read_bytes() == b"0123456789"
+        assert not (tmp_path / "upload" / "test.mp4.part").exists()
+        assert url == (tmp_path / "upload" / "test.mp4").as_uri()
+
+    def test_interrupted_range(self, storage):
+        """Test that a range cut short persists the bytes received"""
+        # Arrange
+        handle = storage.start_upload("test.mp4", "video/mp4", 10)
+
+        # Act
+        persisted = storage.upload_range(handle, BytesIO(b"012"), 0, 8, 10)
+
+        # Assert
+        assert persisted == 3
+        assert storage.persisted_bytes(handle, 10) == 3
+
+    def test_name_outside_of_the_directory(self, storage):
+        """Test that an object cannot be written outside of the storage directory"""
+        # Act/Assert
+        with pytest.raises(StorageServiceError):
+            storage.start_upload("../test.mp4", "video/mp4", 10)
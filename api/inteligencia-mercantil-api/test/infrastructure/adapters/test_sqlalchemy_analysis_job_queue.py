@@ -0,0 +1,105 @@
+import pytest
+from datetime import datetime, timedelta
+from flask import Flask
+
+from src.domain.models.analysis_job import AnalysisJobStatus
+from src.domain.models.video import VideoStatus
+from src.infrastructure.adapters.sqlalchemy_analysis_job_queue import SQLAlchemyAnalysisJobQueue
+from src.infrastructure.database.models import db, AnalysisJobModel, VideoModel
+
+
+class TestSQLAlchemyAnalysisJobQueue:
+    @pytest.fixture
+    def app(self):
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.remove()
+            db.drop_all()
+
+    @pytest.fixture
+    def queue(self, app):
+        return SQLAlchemyAnalysisJobQueue()
+
+    def test_claim_takes_the_job_with_a_lease(self, queue):
+        """Test that a claimed job is running, leased and counts the attempt"""
+        # Arrange
+        queue.enqueue("video-1")
+
+        # Act
+        job = queue.claim(60)
+
+        # Assert
+        assert job.video_id == "video-1"
+        assert job.status == AnalysisJobStatus.RUNNING
+        assert job.attempts == 1
+        assert job.lease_expires_at > datetime.utcnow()
+        assert queue.claim(60) is None
+
+    def test_retry_delays_the_job(self, queue):
+        """Test that a retried job is not due before its delay"""
+        # Arrange
+        queue.enqueue("video-1")
+        job = queue.claim(60)
+
+        # Act
+        queue.retry(job, "Vertex AI unavailable", 30)
+
+        # Assert
+        assert queue.claim(60) is None
+        job_model = db.session.get(AnalysisJobModel, "video-1")
+        assert job_model.status == AnalysisJobStatus.PENDING.value
+        assert job_model.last_error == "Vertex AI unavailable"
+
+    def test_expired_lease_is_claimed_again(self, queue):
+        """Test that the job of a dead worker is claimed again once its lease expired"""
+        # Arrange
+        queue.enqueue("video-1")
+        stale = queue.claim(60)
+        job_model = db.session.get(AnalysisJobModel, "video-1")
+        job_model.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+        # Act
+        job = queue.claim(60)
+        queue.complete(stale)
+
+        # Assert
+        assert job.attempts == 2
+        # The stale worker does not finish the job claimed again
+        assert db.session.get(AnalysisJobModel, "video-1").status == AnalysisJobStatus.RUNNING.value
+
+    def test_complete_and_fail(self, queue):
+        """Test that finished jobs are not claimed again"""
+        # Arrange
+        queue.enqueue("video-1")
+        queue.enqueue("video-2")
+
+        # Act
+        queue.complete(queue.claim(60))
+        queue.fail(queue.claim(60), "Analysis failed")
+
+        # Assert
+        assert queue.claim(60) is None
+        statuses = {job.video_id: job.status for job in AnalysisJobModel.query.all()}
+        assert set(statuses.values()) == {AnalysisJobStatus.DONE.value, AnalysisJobStatus.FAILED.value}
+
+    def test_recover_queues_videos_without_a_job(self, queue):
+        """Test that the videos waiting for an analysis without a job are queued"""
+        # Arrange
+        for video_id, status in (("uploaded", VideoStatus.UPLOADED), ("processing", VideoStatus.PROCESSING),
+                                 ("completed", VideoStatus.COMPLETED), ("queued", VideoStatus.UPLOADED)):
+            db.session.add(VideoModel(id=video_id, filename="test.mp4", gcs_url="gs://test-bucket/test.mp4",
+                                      status=status.value))
+        db.session.commit()
+        queue.enqueue("queued")
+
+        # Act
+        recovered = queue.recover()
+
+        # Assert
+        assert recovered == 2
+        assert {job.video_id for job in AnalysisJobModel.query.all()} == {"uploaded", "processing", "queued"}
@@ -79,3 +79,22 @@ class TestVertexAIAnalyzerService:
         
         # Assert
         assert result is None
+    
+    def test_analyze_video_reuses_the_model(self, service):
+        """Test that Vertex AI is initialized and the model loaded once for every analysis"""
+        # Arrange
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value.text = "Test analysis result"
+        
+        # Act
+        with patch('vertexai.init') as mock_init, \
+             patch('vertexai.generative_models.GenerativeModel', return_value=mock_model) as mock_gen_model, \
+             patch('vertexai.generative_models.Part.from_uri'):
+            
+            service.analyze_video("gs://test-bucket/first.mp4")
+            service.analyze_video("gs://test-bucket/second.mp4")
+        
+        # Assert
+        mock_init.assert_called_once()
+        mock_gen_model.assert_called_once()
+        assert mock_model.generate_content.call_count == 2
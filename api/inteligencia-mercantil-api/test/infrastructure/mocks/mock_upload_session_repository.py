@@ -0,0 +1,29 @@
+from dataclasses import replace
+from typing import Dict, Optional
+from src.domain.models.upload_session import UploadSession
+from src.domain.ports.upload_session_repository import UploadSessionRepository
+
+
+class MockUploadSessionRepository(UploadSessionRepository):
+    """
+    A mock implementation of the UploadSessionRepository for testing purposes.
+    This avoids database dependencies in tests.
+    """
+
+    def __init__(self):
+        """Initialize an empty repository"""
+        self.uploads: Dict[str, UploadSession] = {}
+
+    def save(self, upload: UploadSession) -> UploadSession:
+        self.uploads[upload.id] = replace(upload)
+        return upload
+
+    def get_by_id(self, upload_id: str) -> Optional[UploadSession]:
+        upload = self.uploads.get(upload_id)
+        return replace(upload) if upload else None
+
+    def update(self, upload: UploadSession) -> UploadSession:
+        if upload.id not in self.uploads:
+            return None
+        self.uploads[upload.id] = replace(upload)
+        return upload
@@ -0,0 +1 @@
+# Workers tests package
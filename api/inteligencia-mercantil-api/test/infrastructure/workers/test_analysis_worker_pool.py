@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import Mock
+from flask import Flask
+
+from src.domain.models.analysis_job import AnalysisJob, AnalysisJobStatus
+from src.infrastructure.workers.analysis_worker_pool import AnalysisWorkerPool
+
+
+class TestAnalysisWorkerPool:
+    @pytest.fixture
+    def job_queue(self):
+        return Mock()
+
+    @pytest.fixture
+    def processor(self):
+        return Mock()
+
+    @pytest.fixture
+    def pool(self, job_queue, processor):
+        return AnalysisWorkerPool(Flask(__name__), job_queue, lambda: processor, workers=1, max_attempts=3,
+                                  retry_delay=10, max_retry_delay=25, lease_seconds=60, poll_interval=0.01)
+
+    def test_no_job_due(self, pool, job_queue, processor):
+        """Test that a worker finds nothing to do when no job is due"""
+        # Arrange
+        job_queue.claim.return_value = None
+
+        # Act
+        result = pool.run_once()
+
+        # Assert
+        assert result is False
+        job_queue.claim.assert_called_once_with(60)
+        processor.process_video.assert_not_called()
+
+    def test_job_completed(self, pool, job_queue, processor):
+        """Test that an analyzed video completes its job"""
+        # Arrange
+        job = AnalysisJob(video_id="test-id", status=AnalysisJobStatus.RUNNING, attempts=1)
+        job_queue.claim.return_value = job
+        processor.process_video.return_value = True
+
+        # Act
+        result = pool.run_once()
+
+        # Assert
+        assert result is True
+        processor.process_video.assert_called_once_with("test-id", final_attempt=False)
+        job_queue.complete.assert_called_once_with(job)
+
+    def test_failed_attempt_retried_with_backoff(self, pool, job_queue, processor):
+        """Test that a failed attempt is retried after a delay doubled by every attempt"""
+        # Arrange
+        job = AnalysisJob(video_id="test-id", status=AnalysisJobStatus.RUNNING, attempts=2)
+        job_queue.claim.return_value = job
+        processor.process_video.side_effect = Exception("Vertex AI unavailable")
+
+        # Act
+        pool.run_once()
+
+        # Assert
+        job_queue.retry.assert_called_once_with(job, "Vertex AI unavailable", 20)
+        job_queue.complete.assert_not_called()
+
+    def test_last_attempt_marks_the_video(self, pool, job_queue, processor):
+        """Test that the last attempt lets the processor mark a failed video"""
+        # Arrange
+        job = AnalysisJob(video_id="test-id", status=AnalysisJobStatus.RUNNING, attempts=3)
+        job_queue.claim.return_value = job
+        processor.process_video.return_value = True
+
+        # Act
+        pool.run_once()
+
+        # Assert
+        processor.process_video.assert_called_once_with("test-id", final_attempt=True)
+        job_queue.complete.assert_called_once_with(job)
+
+    def test_last_attempt_error_fails_the_job(self, pool, job_queue, processor):
+        """Test that an error of the last attempt gives up the job"""
+        # Arrange
+        job = AnalysisJob(video_id="test-id", status=AnalysisJobStatus.RUNNING, attempts=3)
+        job_queue.claim.return_value = job
+        processor.process_video.side_effect = Exception("Database unavailable")
+
+        # Act
+        pool.run_once()
+
+        # Assert
+        job_queue.fail.assert_called_once_with(job, "Database unavailable")
+        job_queue.retry.assert_not_called()
+
+    def test_backoff_is_bounded(self, pool):
+        """Test that the delay between attempts does not exceed the maximum"""
+        # Act/Assert
+        assert [pool.backoff(attempts) for attempts in (1, 2, 3, 4)] == [10, 20, 25, 25]
+
+    def test_start_recovers_and_stop(self, pool, job_queue):
+        """Test that starting the pool queues the orphaned videos and stopping it ends the workers"""
+        # Arrange
+        job_queue.recover.return_value = 2
+        job_queue.claim.return_value = None
+
+        # Act
+        pool.start()
+        pool.stop(timeout=1)
+
+        # Assert
+        job_queue.recover.assert_called_once()
+        assert pool._threads == []
@@ -7,6 +7,7 @@ from io import BytesIO
 from datetime import datetime
 
 from src.main import create_app
+from src.domain.models.upload_session import UploadSession
 from src.domain.models.video import Video, VideoStatus
 
 
@@ -57,6 +58,14 @@ def mock_video_repository():
         yield mock_repo
 
 
+@pytest.fixture
+def mock_resumable_upload():
+    """Create a mock for the resumable upload used in the blueprint"""
+    with patch('src.interface.blueprints.video_blueprint.resumable_upload') as mock_upload:
+        mock_upload.storage.buffer_size = 8 * 1024 * 1024
+        yield mock_upload
+
+
 class TestVideoBlueprint:
     def test_upload_video_success(self, client, mock_video_processor):
         """Test successful video upload"""
@@ -240,3 +249,67 @@ class TestVideoBlueprint:
         
         # Verify repository was called
         mock_video_repository.list_all.assert_called_once()
+
+
+class TestResumableUploadBlueprint:
+    def test_start_upload(self, client, mock_resumable_upload):
+        """Test starting a resumable upload"""
+        # Arrange
+        mock_resumable_upload.start.return_value = UploadSession(id="upload-id", filename="test.mp4",
+                                                                 total_size=1000)
+        
+        # Act
+        response = client.post('/api/videos/uploads',
+                               json={"filename": "../test.mp4", "size": 1000, "content_type": "video/mp4"})
+        
+        # Assert
+        assert response.status_code == 201
+        result = json.loads(response.data)
+        assert result['upload_id'] == "upload-id"
+        assert result['received_bytes'] == 0
+        assert result['chunk_size'] == 8 * 1024 * 1024
+        mock_resumable_upload.start.assert_called_once_with("test.mp4", 1000, "video/mp4")
+    
+    def test_upload_range(self, client, mock_resumable_upload):
+        """Test sending a range given by its Content-Range header"""
+        # Arrange
+        mock_resumable_upload.upload_range.return_value = UploadSession(id="upload-id", filename="test.mp4",
+                                                                        total_size=1000, received_bytes=10)
+        
+        # Act
+        response = client.put('/api/videos/uploads/upload-id', data=b'0123456789',
+                              headers={"Content-Range": "bytes 0-9/1000"},
+                              content_type='application/octet-stream')
+        
+        # Assert
+        assert response.status_code == 200
+        assert json.loads(response.data)['received_bytes'] == 10
+        args = mock_resumable_upload.upload_range.call_args.args
+        assert args[0] == "upload-id"
+        assert args[2:] == (0, 10, 1000)
+    
+    def test_upload_range_without_content_range(self, client, mock_resumable_upload):
+        """Test that a range needs its Content-Range header"""
+        # Act
+        response = client.put('/api/videos/uploads/upload-id', data=b'0123456789',
+                              content_type='application/octet-stream')
+        
+        # Assert
+        assert response.status_code == 400
+        mock_resumable_upload.upload_range.assert_not_called()
+    
+    def test_complete_upload(self, client, mock_resumable_upload):
+        """Test finalizing an upload"""
+        # Arrange
+        mock_resumable_upload.finalize.return_value = Video(id="video-id", filename="test.mp4",
+                                                            status=VideoStatus.UPLOADED)
+        
+        # Act
+        response = client.post('/api/videos/uploads/upload-id/complete')
+        
+        # Assert
+        assert response.status_code == 200
+        result = json.loads(response.data)
+        assert result['id'] == "video-id"
+        assert result['status'] == VideoStatus.UPLOADED.value
+        mock_resumable_upload.finalize.assert_called_once_with("upload-id")
@@ -3,11 +3,6 @@ import logging
 from ..domain.entities.order_dto import OrderDTO
 from .errors.errors import OrderNotExistsError
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 class GetOrderById:
@@ -33,5 +28,5 @@ class GetOrderById:
         if not order:
             raise OrderNotExistsError
 
-        logger.debug(f"Order found: {order.to_dict()}")
+        logger.debug("Order found: %s", order_id)
         return order
\ No newline at end of file
@@ -1,13 +1,9 @@
 import logging
 
 from ..domain.entities.order_dto import OrderDTO
-from .errors.errors import OrdersNotFoundError
+from ..domain.entities.page_dto import PageDTO, page_size
+from .errors.errors import OrdersNotFoundError, ValidationApiError
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 class ListsOrders:
@@ -22,15 +18,31 @@ class ListsOrders:
         """
         self.order_repository = order_repository
 
-    def execute(self) -> list[OrderDTO]:
+    def execute(self, summary: bool = False) -> list[OrderDTO]:
         """
         List all orders.
+        :param summary: True to list only the summary columns of the orders.
         :return: A list of OrderDTO objects.
         """
         logger.debug("Listing all orders.")
-        orders = self.order_repository.list_orders()
+        orders = self.order_repository.list_orders(summary)
         if not orders:
             raise OrdersNotFoundError("No orders found.")
 
         logger.debug(f"Orders found: {len(orders)}")
-        return orders
\ No newline at end of file
+        return orders
+
+    def execute_page(self, limit: str = None, cursor: str = None, summary: bool = False) -> PageDTO:
+        """
+        List a page of orders, from the newest to the oldest.
+        :param limit: Requested page size, capped at the maximum page size.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to list only the summary columns of the orders.
+        :return: A PageDTO of OrderDTO objects.
+        """
+        logger.debug(f"Listing a page of orders, limit: {limit}, cursor: {cursor}")
+        try:
+            return self.order_repository.list_orders_page(page_size(limit), cursor, summary)
+        except ValueError as e:
+            logger.error(f"Invalid page request: {e}")
+            raise ValidationApiError
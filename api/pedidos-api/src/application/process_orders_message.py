@@ -1,15 +1,9 @@
-import logging
-
 from ..domain.entities.order_dto import OrderDTO
 from ..domain.entities.order_history_dto import OrderHistoryDTO
 from ..domain.entities.order_item_dto import OrderItemDTO
+from .utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ProcessOrdersMessage:
@@ -30,12 +24,12 @@ class ProcessOrdersMessage:
         """
         # Here you would implement the logic to process the message.
         # For example, updating the stock of products in the database.
-        logging.debug(f"Processing message: {message}")
+        logger.debug("Processing message", message=message)
         order = message.get("order")
         order_id = order.get("id")
 
         # Mapping the order items that compose the original order
-        logging.debug("Mapping order items.")
+        logger.debug("Mapping order items.")
         items = order.get("items", [])
         order_items = []
         for item in items:
@@ -51,7 +45,7 @@ class ProcessOrdersMessage:
             order_items.append(order_item)
 
         # Mapping the order history that compose the original order
-        logging.debug("Mapping order history.")
+        logger.debug("Mapping order history.")
         order_history = []
         history = OrderHistoryDTO(
             id=order.get("historyId"),
@@ -81,6 +75,6 @@ class ProcessOrdersMessage:
         )
 
         # Save the order to the repository
-        logging.debug(f"Saving order to repository: {order_dto}")
+        logger.debug("Saving order to repository", order=order_dto.to_dict)
         self.order_repository.create_order(order_dto)
-        logging.debug("Message processed successfully.")
+        logger.debug("Message processed successfully.")
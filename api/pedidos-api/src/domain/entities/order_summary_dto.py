@@ -0,0 +1,41 @@
+from datetime import datetime
+
+
+class OrderSummaryDTO:
+    def __init__(self, id: str, order_date: datetime, status: str, total: float, currency: str, client_id: str):
+        """
+        Order summary Data Transfer Object (DTO), the columns of an order shown in the order lists.
+        :param id:
+        :param order_date:
+        :param status:
+        :param total:
+        :param currency:
+        :param client_id:
+        """
+        self.id = id
+        self.order_date = order_date
+        self.status = status
+        self.total = total
+        self.currency = currency
+        self.client_id = client_id
+
+    def __repr__(self):
+        """
+        String representation of the OrderSummaryDTO.
+        :return:
+        """
+        return f"OrderSummaryDTO(order_id={self.id}, order_date={self.order_date}, status={self.status}, total={self.total}, currency={self.currency}, client_id={self.client_id})"
+
+    def to_dict(self):
+        """
+        Convert the OrderSummaryDTO to a dictionary representation.
+        :return:
+        """
+        return {
+            "id": self.id,
+            "date": self.order_date,
+            "status": self.status,
+            "total": self.total,
+            "currency": self.currency,
+            "clientId": self.client_id,
+        }
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 from ..entities.order_dto import OrderDTO
+from ..entities.order_summary_dto import OrderSummaryDTO
+from ..entities.page_dto import PageDTO
 
 
 class OrderDTORepository(ABC):
@@ -47,9 +49,21 @@ class OrderDTORepository(ABC):
         pass
 
     @abstractmethod
-    def list_orders(self) -> list[OrderDTO]:
+    def list_orders(self, summary: bool = False) -> list[OrderDTO | OrderSummaryDTO]:
         """
         List all orders.
-        :return: A list of OrderDTO objects.
+        :param summary: True to list only the summary columns of the orders.
+        :return: A list of OrderDTO objects, or OrderSummaryDTO objects if summary is True.
+        """
+        pass
+
+    @abstractmethod
+    def list_orders_page(self, limit: int, cursor: str = None, summary: bool = False) -> PageDTO:
+        """
+        List a page of orders, from the newest to the oldest.
+        :param limit: Maximum number of orders of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to list only the summary columns of the orders.
+        :return: A PageDTO of OrderDTO objects.
         """
         pass
@@ -1,6 +1,8 @@
 from ..dao.orders_dao import OrderDAO
 from ..mapper.orders_mapper import OrderMapper
 from ...domain.entities.order_dto import OrderDTO
+from ...domain.entities.order_summary_dto import OrderSummaryDTO
+from ...domain.entities.page_dto import PageDTO
 from ...domain.repositories.orders_repository import OrderDTORepository
 
 
@@ -16,11 +18,19 @@ class OrdersAdapter(OrderDTORepository):
         return OrderMapper.to_dto(order) if order else None
 
     def get_orders_by_client(self, client_id: str) -> list[OrderDTO]:
-        return OrderMapper.to_dto_list(OrderDAO.find_by_client_id(client_id))
+        return OrderMapper.to_dto_full_list(OrderDAO.find_by_client_id(client_id))
 
     def update_order(self, order_dto: OrderDTO) -> OrderDTO | None:
         updated = OrderDAO.update(OrderMapper.to_model(order_dto))
         return OrderMapper.to_dto(updated) if updated else None
 
-    def list_orders(self) -> list[OrderDTO]:
-        return OrderMapper.to_dto_list(OrderDAO.find_all())
+    def list_orders(self, summary: bool = False) -> list[OrderDTO | OrderSummaryDTO]:
+        return self._to_dto_list(OrderDAO.find_all(summary), summary)
+
+    def list_orders_page(self, limit: int, cursor: str = None, summary: bool = False) -> PageDTO:
+        orders, next_cursor = OrderDAO.find_page(limit, cursor, summary)
+        return PageDTO(self._to_dto_list(orders, summary), next_cursor)
+
+    @staticmethod
+    def _to_dto_list(orders: list, summary: bool) -> list[OrderDTO | OrderSummaryDTO]:
+        return OrderMapper.to_summary_dto_list(orders) if summary else OrderMapper.to_dto_full_list(orders)
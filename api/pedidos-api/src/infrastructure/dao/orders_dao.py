@@ -1,10 +1,21 @@
 from datetime import datetime, timezone
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from .pagination import paginate
 from ..database.declarative_base import Session
 from ..model.orders_model import OrderModel
 
+# Columns of an order shown in the order lists
+SUMMARY_COLUMNS = [
+    OrderModel.id,
+    OrderModel.order_date,
+    OrderModel.status,
+    OrderModel.total,
+    OrderModel.currency,
+    OrderModel.client_id,
+]
+
 
 class OrderDAO:
     """
@@ -12,33 +23,53 @@ class OrderDAO:
     """
 
     @classmethod
-    def find_all(cls) -> list[OrderModel]:
+    def _list_query(cls, session, summary: bool = False):
         """
-        Get all orders.
-        :return: List of OrderModel.
+        Query of an order list.
+        :param session: Session of the query.
+        :param summary: True to select only the summary columns, without relationships.
+        :return: The query, items and history of the orders are loaded with one query each.
         """
-        session = Session()
-        orders = session.query(OrderModel).order_by(OrderModel.order_date.desc()).all()
-        session.close()
-        return orders
+        if summary:
+            return session.query(*SUMMARY_COLUMNS)
+
+        return session.query(OrderModel).options(
+            selectinload(OrderModel.order_items),
+            selectinload(OrderModel.order_history)
+        )
+
+    @classmethod
+    def find_all(cls, summary: bool = False) -> list:
+        """
+        Get all orders, from the newest to the oldest.
+        :param summary: True to get only the summary columns of the orders.
+        :return: List of OrderModel, or of rows of the summary columns.
+        """
+        with Session() as session:
+            return cls._list_query(session, summary).order_by(OrderModel.order_date.desc()).all()
+
+    @classmethod
+    def find_page(cls, limit: int, cursor: str = None, summary: bool = False) -> tuple[list, str | None]:
+        """
+        Get a page of orders, from the newest to the oldest.
+        :param limit: Maximum number of orders of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :param summary: True to get only the summary columns of the orders.
+        :return: Tuple of (orders, cursor of the next page)
+        """
+        with Session() as session:
+            query = cls._list_query(session, summary)
+            return paginate(query, [OrderModel.order_date, OrderModel.id], limit, cursor, descending=True)
 
     @classmethod
     def find_by_client_id(cls, client_id: str) -> list[OrderModel]:
         """
-        Get order by Client ID.
+        Get the orders of a client.
         :param client_id: ID of the client to find.
-        :return: OrderModel if found, None otherwise.
+        :return: List of OrderModel.
         """
         with Session() as session:
-            # Load order and relationships in a single query
-            order = session.query(OrderModel) \
-                .options(
-                joinedload(OrderModel.order_items),
-                joinedload(OrderModel.order_history)
-            ) \
-                .filter(OrderModel.client_id == client_id) \
-                .first()
-            return order
+            return cls._list_query(session).filter(OrderModel.client_id == client_id).all()
 
     @classmethod
     def get_by_id(cls, order_id: str) -> OrderModel | None:
@@ -67,6 +98,8 @@ class OrderDAO:
         """
         session = Session()
         order.created_at = datetime.now(timezone.utc)
+        # The date is the sort key of the paginated listings, an order without one is sorted by its creation
+        order.order_date = order.order_date or order.created_at
         session.add(order)
         session.commit()
         session.refresh(order)
@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import literal, tuple_
+
+from ...domain.entities.page_dto import decode_cursor, encode_cursor
+
+
+def paginate(query, sort_columns: list, limit: int, cursor: str = None, descending: bool = False):
+    """
+    Applies keyset pagination to a query. Rows are sorted by the sort columns, which must be
+    unique together (end them with the primary key), and the cursor points after the last row
+    of the previous page, so every page is an index range scan regardless of its position.
+    :param query: The query of the model to paginate.
+    :param sort_columns: Columns of the sort key.
+    :param limit: Maximum number of rows of the page.
+    :param cursor: Cursor returned with the previous page, None for the first page.
+    :param descending: True to sort from the newest to the oldest rows.
+    :return: Tuple of (rows, next_cursor), next_cursor is None for the last page.
+    :raises ValueError: If the cursor is not valid for the sort columns.
+    """
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(sort_columns):
+            raise ValueError("Invalid cursor.")
+        keyset = tuple_(*sort_columns)
+        after = tuple_(*[literal(_coerce(column, value), column.type) for column, value in zip(sort_columns, values)])
+        query = query.filter(keyset < after if descending else keyset > after)
+
+    order = [column.desc() if descending else column.asc() for column in sort_columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in sort_columns])
+    return rows, next_cursor
+
+
+def _coerce(column, value):
+    """
+    Converts a value of a cursor back to the python type of its column.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if value is None:
+        raise ValueError("Invalid cursor.")
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is uuid.UUID:
+            return uuid.UUID(value)
+        return python_type(value)
+    except TypeError:
+        raise ValueError("Invalid cursor.")
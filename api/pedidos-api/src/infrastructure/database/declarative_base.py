@@ -1,21 +1,14 @@
-import os
-
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-
-db_user = os.environ.get('DB_USER')
-db_password = os.environ.get('DB_PASSWORD')
-db_host = os.environ.get('DB_HOST')
-db_port = os.environ.get('DB_PORT')
-db_name = os.environ.get('DB_NAME')
 
-db_path = os.environ.get('DATABASE_URL')
-if not db_path:
-    db_path = f'postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}'
+from .database_runtime import DatabaseRuntime
+from ..monitoring.metrics import REGISTRY
 
-engine = create_engine(db_path)
-Session = sessionmaker(bind=engine)
+# Engine of the service, with the pool settings of the environment
+database = DatabaseRuntime()
+engine = database.engine
+Session = database.session
+unit_of_work = database.unit_of_work
+database.register_metrics(REGISTRY)
 
 Base = declarative_base()
 
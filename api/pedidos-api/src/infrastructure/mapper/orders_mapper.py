@@ -4,6 +4,7 @@ from .order_history_mapper import OrderHistoryMapper
 from .order_item_mapper import OrderItemMapper
 from ..model.orders_model import OrderModel
 from ...domain.entities.order_dto import OrderDTO
+from ...domain.entities.order_summary_dto import OrderSummaryDTO
 
 
 class OrderMapper:
@@ -76,6 +77,25 @@ class OrderMapper:
             updated_at=updated_at
         )
 
+    @staticmethod
+    def to_summary_dto(row) -> OrderSummaryDTO | None:
+        """
+        Convert a row of the summary columns of an order to OrderSummaryDTO.
+        :param row: The row with the summary columns of an OrderModel.
+        :return: The converted OrderSummaryDTO object.
+        """
+        if row is None:
+            return None
+
+        return OrderSummaryDTO(
+            id=row.id,
+            order_date=row.order_date.isoformat() if row.order_date else None,
+            status=row.status,
+            total=row.total,
+            currency=row.currency,
+            client_id=row.client_id
+        )
+
     @staticmethod
     def to_model(order_dto: OrderDTO) -> OrderModel | None:
         """
@@ -138,3 +158,21 @@ class OrderMapper:
         :return: The converted list of OrderDTO objects.
         """
         return [OrderMapper.to_single_dto(order_model) for order_model in order_models]
+
+    @staticmethod
+    def to_dto_full_list(order_models: list[OrderModel]) -> list[OrderDTO]:
+        """
+        Convert a list of OrderModel, with their items and history loaded, to a list of OrderDTO.
+        :param order_models: The list of OrderModel objects to convert.
+        :return: The converted list of OrderDTO objects.
+        """
+        return [OrderMapper.to_dto(order_model) for order_model in order_models]
+
+    @staticmethod
+    def to_summary_dto_list(rows: list) -> list[OrderSummaryDTO]:
+        """
+        Convert a list of rows of the summary columns of an order to a list of OrderSummaryDTO.
+        :param rows: The rows with the summary columns of OrderModel.
+        :return: The converted list of OrderSummaryDTO objects.
+        """
+        return [OrderMapper.to_summary_dto(row) for row in rows]
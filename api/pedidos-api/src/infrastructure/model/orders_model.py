@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, Float, DateTime
+from sqlalchemy import Column, String, Float, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from ..database.declarative_base import Base
@@ -11,6 +11,10 @@ class OrderModel(Base):
     Order model for SQLAlchemy.
     """
     __tablename__ = 'orders'
+    __table_args__ = (
+        # Sort key of the paginated listing
+        Index('ix_orders_order_date_id', 'order_date', 'id'),
+    )
 
     id = Column(String, primary_key=True, nullable=False)
     status = Column(String, nullable=False)
@@ -19,7 +23,7 @@ class OrderModel(Base):
     total = Column(Float, nullable=False)
     currency = Column(String, nullable=False)
     client_id = Column(String, nullable=False)
-    order_date = Column(DateTime, default=datetime.utcnow())
+    order_date = Column(DateTime, nullable=False, default=datetime.utcnow)
     payment_id = Column(String, nullable=False)
     transaction_id = Column(String, nullable=False)
     transaction_status = Column(String, nullable=False)
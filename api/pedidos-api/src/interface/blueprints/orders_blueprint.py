@@ -1,17 +1,13 @@
 import logging
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
 from ..decorator.token_decorator import token_required
 from ...application.list_orders import ListsOrders
 from ...application.get_order_by_id import GetOrderById
+from ...application.errors.errors import ValidationApiError
 from ...infrastructure.adapters.order_adapter import OrdersAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 orders_adapter = OrdersAdapter()
@@ -19,6 +15,17 @@ orders_adapter = OrdersAdapter()
 orders_blueprint = Blueprint('orders', __name__, url_prefix='/api/v1/orders')
 
 
+def summary_view() -> bool:
+    """
+    Checks the view requested for an order list: 'full' (default) or 'summary'.
+    """
+    view = request.args.get('view', 'full')
+    if view not in ('full', 'summary'):
+        logger.error(f"Invalid order list view: {view}")
+        raise ValidationApiError
+    return view == 'summary'
+
+
 @orders_blueprint.route('', methods=['GET'])
 @token_required(['DIRECTIVO'])
 def list_orders():
@@ -27,7 +34,12 @@ def list_orders():
     """
     logger.debug("Starting order listing process...")
     use_case = ListsOrders(orders_adapter)
-    orders = use_case.execute()
+    summary = summary_view()
+    if 'limit' in request.args or 'cursor' in request.args:
+        page = use_case.execute_page(request.args.get('limit'), request.args.get('cursor'), summary)
+        return jsonify(page.to_dict()), 200
+
+    orders = use_case.execute(summary)
     return jsonify([order.to_dict() for order in orders]), 200
 
 @orders_blueprint.route('/<order_id>', methods=['GET'])
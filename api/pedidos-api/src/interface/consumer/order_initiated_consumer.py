@@ -1,15 +1,9 @@
-import logging
-
 from ...application.process_orders_message import ProcessOrdersMessage
 from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
 from ...infrastructure.adapters.order_adapter import OrdersAdapter
+from ...application.utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 class OrderInitiatedConsumer:
     """
@@ -29,7 +23,9 @@ class OrderInitiatedConsumer:
         try:
             self.processor.process(message)
         except Exception as e:
-            logging.error(f"Error processing order initiated message: {str(e)}")
+            logger.error("Error processing order initiated message: %s", e)
+            # Let the consumer retry the message and dead-letter it once out of retries
+            raise
 
     def start_consuming(self) -> None:
         """
@@ -1,4 +1,5 @@
 import logging
+import os
 import threading
 
 from dotenv import load_dotenv
@@ -9,10 +10,24 @@ loaded = load_dotenv('.env.development')
 from .interface.blueprints.management_blueprint import management_blueprint
 from .interface.blueprints.orders_blueprint import orders_blueprint
 from .application.errors.errors import ApiError
-from .infrastructure.database.declarative_base import Base, engine
+from .infrastructure.config.container import DependencyContainer
+from .infrastructure.database.declarative_base import Base, database, engine
+from .infrastructure.messaging.rabbitmq_consumer_runtime import stop_consumers
 from .interface.consumer.order_initiated_consumer import OrderInitiatedConsumer
+from .infrastructure.monitoring.metrics import init_metrics
+from .application.utils.structured_logging import configure_logging
+
+configure_logging('pedidos-api')
+
+
+def create_schema():
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    logging.debug(">> Create schema")
+    Base.metadata.create_all(engine)
+    engine.dispose()
 
-logging.basicConfig(level=logging.DEBUG)
 
 def initialize_rabbitmq_consumers():
     """Initialize all RabbitMQ consumers"""
@@ -21,16 +36,35 @@ def initialize_rabbitmq_consumers():
     order_initiated_consumer.start_consuming()
 
 
+def shutdown(timeout=30):
+    """
+    Stop the consumers after the messages in progress and release the connections of the process,
+    called by the server when a worker exits.
+    :param timeout: Seconds the shutdown may wait, in total.
+    """
+    stop_consumers(timeout)
+    engine.dispose()
+
+
 def create_app():
     """
     Create and configure the Flask application.
     """
     logging.debug('orders microservice started')
     app = Flask(__name__)
+    # One connection checkout per request, however many DAO calls it makes
+    database.init_app(app)
+    init_metrics(app)
+    # One token validator per process, so the requests share its cache
+    app.container = DependencyContainer()
 
     app.register_blueprint(management_blueprint)
     app.register_blueprint(orders_blueprint)
 
+    # Under gunicorn the master created the schema before forking the workers
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        create_schema()
+
     # Initialize the consumer
     logging.debug(">> Initialize the consumer")
     # Start consumers in a separate thread to not block the main application
@@ -40,10 +74,6 @@ def create_app():
     )
     consumer_thread.start()
 
-    # Create schema
-    logging.debug(">> Create schema")
-    Base.metadata.create_all(engine)
-
     @app.errorhandler(ApiError)
     def handle_error(error):
         """
@@ -0,0 +1,143 @@
+"""
+Benchmark of the order initiated messages in pedidos-api: the ProcessOrdersMessage use case (mapping and insert
+of the order with its items and history) at a given concurrency, as the consumer runs it, plus
+micro-benchmarks of the order mapper and the insert of an order.
+
+The messages are read from the file written by the checkout benchmark of clientes-api, or generated from the
+seed. The database is a SQLite file unless --database-url points to PostgreSQL.
+
+Run from the root of the service:
+    python -m test.benchmark.orders_message_benchmark --messages messages.json --output pedidos.json
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import uuid
+from datetime import datetime, timezone
+
+from .benchmark_runner import micro_benchmark, quiet_logging, report, run_stage, sqlite_stand_in, write_report
+
+ORDER_INITIATED_EXCHANGE = "order_initiated_exchange"
+
+
+def order_messages(seed: int, count: int, lines: int) -> list[dict]:
+    """Order initiated messages as published by clientes-api, generated from the seed"""
+    generator = random.Random(seed)
+    messages = []
+    for index in range(count):
+        order_id = str(uuid.UUID(int=generator.getrandbits(128), version=4))
+        items = []
+        for _ in range(lines):
+            quantity = generator.randint(1, 3)
+            unit_price = round(generator.uniform(5, 200), 2)
+            items.append({
+                "id": str(uuid.UUID(int=generator.getrandbits(128), version=4)),
+                "productId": str(uuid.UUID(int=generator.getrandbits(128), version=4)),
+                "quantity": quantity,
+                "unitPrice": unit_price,
+                "totalPrice": round(unit_price * quantity, 2),
+                "currency": "USD",
+            })
+        subtotal = round(sum(item["totalPrice"] for item in items), 2)
+        messages.append({"order": {
+            "id": order_id,
+            "orderDate": datetime.now(timezone.utc).isoformat(),
+            "status": "INICIADO",
+            "subtotal": subtotal,
+            "taxes": round(subtotal * 0.19, 2),
+            "total": round(subtotal * 1.19, 2),
+            "currency": "USD",
+            "clientId": f"client-{index % 50}",
+            "paymentId": f"payment-{index}",
+            "transactionStatus": "APPROVED",
+            "transactionDate": "2025-01-01T00:00:00",
+            "transactionId": f"tx-{index}",
+            "items": items,
+        }})
+    return messages
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", help="File of messages by exchange, written by the clientes-api benchmark")
+    parser.add_argument("--orders", type=int, default=500, help="Messages generated without a messages file")
+    parser.add_argument("--concurrency", type=int, default=8, help="Messages processed at the same time")
+    parser.add_argument("--warmup", type=int, default=20, help="Messages processed before measuring")
+    parser.add_argument("--lines", type=int, default=3, help="Items per generated order")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="Database of the benchmark, a new SQLite file by default")
+    parser.add_argument("--number", type=int, default=1000, help="Calls per round of the micro-benchmarks")
+    parser.add_argument("--output", help="File to write the report to, stdout by default")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> dict:
+    arguments = parse_arguments(argv)
+    quiet_logging(arguments.log_level)
+    # The engine of the service is created from the environment when its modules are imported
+    directory = tempfile.mkdtemp(prefix="pedidos-benchmark-")
+    os.environ["DATABASE_URL"] = arguments.database_url or f"sqlite:///{directory}/pedidos.db"
+    os.environ.setdefault("DB_POOL_SIZE", str(arguments.concurrency))
+
+    from src.application.process_orders_message import ProcessOrdersMessage
+    from src.infrastructure.adapters.order_adapter import OrdersAdapter
+    from src.infrastructure.dao.orders_dao import OrderDAO
+    from src.infrastructure.database.declarative_base import Base, engine, unit_of_work
+    from src.infrastructure.mapper.orders_mapper import OrderMapper
+
+    if arguments.messages:
+        with open(arguments.messages) as file:
+            messages = json.load(file)[ORDER_INITIATED_EXCHANGE]
+    else:
+        messages = order_messages(arguments.seed, arguments.orders + arguments.warmup, arguments.lines)
+
+    sqlite_stand_in(Base.metadata, engine)
+    Base.metadata.create_all(engine)
+    try:
+        processor = ProcessOrdersMessage(OrdersAdapter())
+
+        def process(message):
+            with unit_of_work():
+                processor.process(message)
+
+        stages = {
+            "pedidos.process_order_message": run_stage(process, messages, arguments.concurrency,
+                                                       min(arguments.warmup, len(messages) // 2)),
+        }
+
+        # Micro-benchmarks on an order of the run
+        order_model = OrderDAO.get_by_id(messages[0]["order"]["id"])
+        order = OrderMapper.to_dto(order_model)
+
+        def insert_order():
+            copy = OrderMapper.to_dto(order_model)
+            copy.id = str(uuid.uuid4())
+            for item in copy.order_items:
+                item.id = str(uuid.uuid4())
+                item.order_id = copy.id
+            for history in copy.order_history:
+                history.id = None
+                history.order_id = copy.id
+            OrderDAO.save(OrderMapper.to_model(copy))
+
+        micro = {
+            "pedidos.order_mapper.to_model": micro_benchmark(lambda: OrderMapper.to_model(order), arguments.number),
+            "pedidos.order_mapper.to_dto": micro_benchmark(lambda: OrderMapper.to_dto(order_model),
+                                                           arguments.number),
+            "pedidos.order_dao.save": micro_benchmark(insert_order, max(arguments.number // 10, 1)),
+        }
+    finally:
+        engine.dispose()
+
+    parameters = {key: getattr(arguments, key) for key in ("concurrency", "warmup", "seed", "number")}
+    parameters.update(messages=len(messages), database=engine.url.get_backend_name())
+    result = report("pedidos-api", parameters, stages, micro)
+    write_report(result, arguments.output)
+    return result
+
+
+if __name__ == "__main__":
+    main()
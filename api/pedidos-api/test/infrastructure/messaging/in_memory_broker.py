@@ -0,0 +1,138 @@
+import itertools
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+
+
+class InMemoryBroker:
+    """
+    Stand-in of a RabbitMQ broker for the consumer tests: durable queues of (properties, body) messages,
+    delivered to a single consumer per channel up to its prefetch count.
+    """
+
+    def __init__(self):
+        self.queues = {}
+        self.ack_frames = 0
+        self.condition = threading.Condition()
+
+    def publish(self, queue_name, body, properties=None):
+        with self.condition:
+            self.queues.setdefault(queue_name, deque()).append((properties, body))
+            self.condition.notify_all()
+
+    def messages(self, queue_name):
+        with self.condition:
+            return list(self.queues.get(queue_name, ()))
+
+
+class InMemoryChannel:
+    def __init__(self, connection):
+        self.connection = connection
+        self.broker = connection.broker
+        self.is_open = True
+        self.prefetch = 0
+        self.consumer = None
+        self.consumer_queue = None
+        self.unacked = {}
+        self._delivery_tags = itertools.count(1)
+
+    def queue_declare(self, queue, durable=False, passive=False):
+        with self.broker.condition:
+            messages = self.broker.queues.setdefault(queue, deque())
+            return SimpleNamespace(method=SimpleNamespace(message_count=len(messages)))
+
+    def exchange_declare(self, exchange, exchange_type, durable=False):
+        pass
+
+    def queue_bind(self, queue, exchange, routing_key):
+        pass
+
+    def basic_qos(self, prefetch_count):
+        self.prefetch = prefetch_count
+
+    def basic_consume(self, queue, on_message_callback):
+        self.consumer = (queue, on_message_callback)
+        self.consumer_queue = queue
+        return 'consumer-1'
+
+    def basic_cancel(self, consumer_tag):
+        self.consumer = None
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        with self.broker.condition:
+            self.broker.ack_frames += 1
+            if multiple:
+                for tag in [tag for tag in self.unacked if tag <= delivery_tag]:
+                    del self.unacked[tag]
+            elif self.unacked.pop(delivery_tag, None) is None:
+                raise AssertionError(f"Unknown delivery tag {delivery_tag}")
+            self.broker.condition.notify_all()
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        # Only the default exchange, routing to the queue named by the routing key
+        self.broker.publish(routing_key, body, properties)
+
+    def deliver(self):
+        """Deliver the ready messages up to the prefetch count, as the broker would"""
+        if self.consumer is None:
+            return False
+        queue_name, callback = self.consumer
+        delivered = False
+        while True:
+            with self.broker.condition:
+                messages = self.broker.queues.get(queue_name)
+                if not messages or (self.prefetch and len(self.unacked) >= self.prefetch):
+                    return delivered
+                properties, body = messages.popleft()
+                tag = next(self._delivery_tags)
+                self.unacked[tag] = (properties, body)
+            callback(self, SimpleNamespace(delivery_tag=tag), properties, body)
+            delivered = True
+
+    def close(self):
+        # Unacked messages go back to the queue
+        with self.broker.condition:
+            for properties, body in reversed(list(self.unacked.values())):
+                self.broker.queues[self.consumer_queue].appendleft((properties, body))
+            self.unacked = {}
+            self.is_open = False
+
+
+class InMemoryConnection:
+    def __init__(self, broker):
+        self.broker = broker
+        self.is_open = True
+        self.channels = []
+        self._callbacks = deque()
+
+    def channel(self):
+        self.channels.append(InMemoryChannel(self))
+        return self.channels[-1]
+
+    def add_callback_threadsafe(self, callback):
+        with self.broker.condition:
+            self._callbacks.append(callback)
+            self.broker.condition.notify_all()
+
+    def process_data_events(self, time_limit=0):
+        deadline = time.monotonic() + time_limit
+        while True:
+            with self.broker.condition:
+                callbacks = list(self._callbacks)
+                self._callbacks.clear()
+            for callback in callbacks:
+                callback()
+            delivered = any(channel.deliver() for channel in self.channels if channel.is_open)
+            if callbacks or delivered:
+                return
+            with self.broker.condition:
+                remaining = deadline - time.monotonic()
+                if self._callbacks:
+                    continue
+                if remaining <= 0:
+                    return
+                self.broker.condition.wait(remaining)
+
+    def close(self):
+        self.is_open = False
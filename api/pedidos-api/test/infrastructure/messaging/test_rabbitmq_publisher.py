@@ -0,0 +1,126 @@
+import inspect
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pika
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.channel import Channel
+
+from src.infrastructure.messaging.rabbitmq_publisher import RabbitMQPublisher
+
+
+class FakeChannel:
+    """Channel of the fake broker, confirming every published message when the connection processes events"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.is_open = True
+        self.exchange_declare = MagicMock()
+        self.published = []
+        self._impl = SimpleNamespace(confirm_delivery=self._confirm_delivery, basic_publish=self._basic_publish)
+
+    def _confirm_delivery(self, ack_nack_callback, callback):
+        self.ack_nack_callback = ack_nack_callback
+        self.connection.pending.append(lambda: callback(SimpleNamespace(method=pika.spec.Confirm.SelectOk())))
+
+    def _basic_publish(self, exchange, routing_key, body, properties):
+        self.published.append((exchange, routing_key, body))
+
+    def confirm(self, method):
+        self.ack_nack_callback(SimpleNamespace(method=method))
+
+    def close(self):
+        self.is_open = False
+
+
+class FakeConnection:
+    def __init__(self, confirm_method=pika.spec.Basic.Ack):
+        self.is_open = True
+        self.confirm_method = confirm_method
+        self.pending = []
+        self.channels = []
+        self.process_data_events = MagicMock(side_effect=self._process_data_events)
+
+    def channel(self):
+        self.channels.append(FakeChannel(self))
+        return self.channels[-1]
+
+    def _process_data_events(self, time_limit):
+        while self.pending:
+            self.pending.pop(0)()
+        channel = self.channels[-1]
+        if self.confirm_method and channel.published:
+            # Confirm all the published messages with a single multiple ack
+            channel.confirm(self.confirm_method(delivery_tag=len(channel.published), multiple=True))
+
+
+class TestRabbitMQPublisher(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = FakeConnection()
+        self.connection_manager = MagicMock()
+        self.connection_manager.get_connection.return_value = self.connection
+        self.publisher = RabbitMQPublisher(self.connection_manager, confirm_timeout=0.1)
+
+    def test_publish_many_reuses_channel_and_exchanges(self):
+        # Publish two batches
+        first = self.publisher.publish_many([("orders", "created", {"id": 1}), ("stock", "update", {"id": 1})])
+        second = self.publisher.publish_many([("orders", "created", {"id": 2})])
+
+        # Verify a single channel declared each exchange once
+        self.assertTrue(first)
+        self.assertTrue(second)
+        self.connection_manager.get_connection.assert_called_once()
+        self.assertEqual(len(self.connection.channels), 1)
+        channel = self.connection.channels[0]
+        self.assertEqual([call[1]['exchange'] for call in channel.exchange_declare.call_args_list],
+                         ["orders", "stock"])
+        self.assertEqual(channel.published[2], ("orders", "created", '{"id": 2}'))
+
+    def test_publish_many_returns_false_when_broker_rejects(self):
+        self.connection.confirm_method = pika.spec.Basic.Nack
+
+        self.assertFalse(self.publisher.publish_many([("orders", "created", {"id": 1})]))
+
+    def test_publish_many_returns_false_without_confirm(self):
+        self.connection.confirm_method = None
+
+        self.assertFalse(self.publisher.publish_many([("orders", "created", {"id": 1})]))
+
+    def test_publish_many_reopens_closed_channel(self):
+        # Close the channel after a first publish
+        self.publisher.publish_many([("orders", "created", {"id": 1})])
+        self.connection.channels[0].is_open = False
+
+        # Publish again
+        result = self.publisher.publish_many([("orders", "created", {"id": 2})])
+
+        # Verify the exchange was declared again on the new channel
+        self.assertTrue(result)
+        self.assertEqual(len(self.connection.channels), 2)
+        self.connection.channels[1].exchange_declare.assert_called_once()
+        self.connection_manager.return_connection.assert_called_once_with(self.connection)
+
+
+class TestPikaPrivateApi(unittest.TestCase):
+    """The publisher drives the channel wrapped by BlockingChannel, private to pika: a pika upgrade fails here"""
+
+    def test_blocking_channel_keeps_its_channel_in_impl(self):
+        impl = MagicMock(spec=Channel)
+        impl.channel_number = 1
+
+        channel = BlockingChannel(impl, MagicMock())
+
+        self.assertIs(channel._impl, impl)
+
+    def test_channel_publishes_and_confirms_without_blocking(self):
+        publish = inspect.signature(Channel.basic_publish).parameters
+        confirm = inspect.signature(Channel.confirm_delivery).parameters
+
+        self.assertLessEqual({"exchange", "routing_key", "body", "properties"}, set(publish))
+        self.assertLessEqual({"ack_nack_callback", "callback"}, set(confirm))
+
+
+if __name__ == '__main__':
+    unittest.main()
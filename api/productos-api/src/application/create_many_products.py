@@ -1,38 +1,133 @@
-import logging
+import uuid
 
+from ..domain.entities.product_dto import ProductDTO
+from ..domain.entities.product_import_result_dto import ProductImportResultDTO
 from ..domain.mapper.products_json_mapper import ProductsJsonMapper
+from .utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+REQUIRED_FIELDS = ('name', 'brand', 'description', 'stock', 'details', 'storage_conditions', 'price', 'currency',
+                   'delivery_time', 'manufacturer_id', 'images')
 
 
 class CreateManyProducts:
     """
     Use case for creating multiple products.
+    The products are validated row by row and loaded in chunks, each chunk is committed on its own.
     """
 
-    def __init__(self, repository):
+    def __init__(self, repository, import_repository=None, chunk_size: int = DEFAULT_CHUNK_SIZE, on_progress=None):
         """
         Initializes the CreateManyProducts use case with a product repository.
         :param repository:
+        :param import_repository: Optional ProductImportRepository tracking the progress of batched imports.
+        :param chunk_size: Number of products loaded per transaction.
+        :param on_progress: Optional callable receiving the ProductImportResultDTO after every chunk.
         """
         self.repository = repository
+        self.import_repository = import_repository
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
 
-    def process(self, message: dict) -> None:
+    def process(self, message: list[dict] | dict) -> ProductImportResultDTO:
         """
         Executes the creation of multiple products.
-        :param message: The message containing the products to be created.
-        """
-        logging.debug("Begin creating multiple products...")
-        logging.debug(f"Converting message to product list {message}...")
-        product_list = ProductsJsonMapper.from_json_to_dto_list(message)
-        if not product_list:
-            logging.error("No products found in the message.")
-            return
-        logging.debug(f"Creating {len(product_list)} products...")
-        self.repository.add_all(product_list)
-        logging.debug("End creating multiple products...")
+        :param message: The message containing the products to be created. Either the list of products, or
+                        a batch of an import: {"importId", "sequence", "last", "products"}.
+        :return: ProductImportResultDTO with the inserted and rejected rows.
+        """
+        if isinstance(message, dict):
+            import_id = message.get('importId') if self.import_repository else None
+            sequence = message.get('sequence', 0)
+            if import_id and self.import_repository.has_batch(import_id, sequence):
+                logger.warning("Batch %s of import %s already processed, skipping it.", sequence, import_id)
+                return ProductImportResultDTO()
+
+            result = self._create_products(message.get('products'))
+            if import_id:
+                self.import_repository.register_batch(import_id, sequence, message.get('last', False), result)
+            return result
+
+        return self._create_products(message)
+
+    def _create_products(self, products: list[dict]) -> ProductImportResultDTO:
+        logger.debug("Begin creating multiple products...")
+        result = ProductImportResultDTO()
+        chunk = []
+        for index, product_data in enumerate(products or []):
+            result.total += 1
+            try:
+                product = ProductsJsonMapper.from_json_to_dto(product_data)
+            except Exception as e:
+                result.reject(index, f"Invalid product data: {e}")
+                continue
+
+            error = self._validate(product)
+            if error:
+                result.reject(index, error)
+                continue
+
+            chunk.append((index, product))
+            if len(chunk) >= self.chunk_size:
+                self._load_chunk(chunk, result)
+                chunk = []
+
+        if chunk:
+            self._load_chunk(chunk, result)
+
+        if not result.total:
+            logger.error("No products found in the message.")
+            return result
+
+        logger.debug("End creating multiple products", result=result.to_dict)
+        return result
+
+    def _load_chunk(self, chunk: list[tuple[int, ProductDTO]], result: ProductImportResultDTO) -> None:
+        """
+        Loads a chunk of products. The rows of a failing chunk are loaded again one by one, so only the rows the
+        database refuses are rejected, without stopping the import.
+        """
+        try:
+            result.inserted += self.repository.add_chunk([product for _, product in chunk])
+        except Exception as e:
+            logger.error("Error saving chunk %s, loading its rows one by one: %s", result.chunks + 1, e)
+            for index, product in chunk:
+                try:
+                    result.inserted += self.repository.add_chunk([product])
+                except Exception as row_error:
+                    logger.error("Error saving product of row %s: %s", index, row_error)
+                    result.reject(index, "Error saving product.")
+        result.chunks += 1
+
+        logger.debug("Products import progress: %s/%s rows", result.inserted + len(result.rejected), result.total)
+        if self.on_progress:
+            self.on_progress(result)
+
+    @staticmethod
+    def _validate(product: ProductDTO) -> str | None:
+        """
+        Validates and normalizes a product read from a bulk import.
+        :return: The rejection reason, None if the product is valid.
+        """
+        missing = [field for field in REQUIRED_FIELDS if getattr(product, field) in (None, '', [], {})]
+        if missing:
+            return f"Missing required fields: {', '.join(missing)}"
+
+        try:
+            product.stock = int(product.stock)
+            product.price = float(product.price)
+            product.delivery_time = int(product.delivery_time)
+        except (TypeError, ValueError):
+            return "Invalid format for stock, price or delivery time."
+
+        if product.stock < 0 or product.price <= 0 or product.delivery_time <= 0:
+            return "Stock, price and delivery time must be positive numbers."
+
+        try:
+            uuid.UUID(str(product.manufacturer_id))
+        except ValueError:
+            return "Invalid manufacturer id."
+
+        return None
@@ -21,3 +21,8 @@ class ProductAlreadyExistsError(ApiError):
 class ProductNotExistsError(ApiError):
     code = 404
     description = "El producto no existe."
+
+
+class ProductImportNotExistsError(ApiError):
+    code = 404
+    description = "La carga de productos no existe."
@@ -1,12 +1,9 @@
 import logging
 
+from .errors.errors import ValidationApiError
+from ..domain.entities.page_dto import PageDTO, page_size
 from ..domain.entities.product_dto import ProductDTO
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 
@@ -29,3 +26,17 @@ class GetAllProducts:
         """
         logging.debug("Retrieving all products...")
         return self.repository.get_all()
+
+    def execute_page(self, limit: str = None, cursor: str = None) -> PageDTO:
+        """
+        Retrieves a page of products from the repository.
+        :param limit: Requested page size, capped at the maximum page size.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :return: A PageDTO of ProductDTO objects.
+        """
+        logging.debug(f"Retrieving a page of products, limit: {limit}, cursor: {cursor}")
+        try:
+            return self.repository.get_page(page_size(limit), cursor)
+        except ValueError as e:
+            logging.error(f"Invalid page request: {e}")
+            raise ValidationApiError
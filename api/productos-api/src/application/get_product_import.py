@@ -0,0 +1,33 @@
+import logging
+
+from .errors.errors import ProductImportNotExistsError
+from ..domain.entities.product_import_dto import ProductImportDTO
+
+logger = logging.getLogger(__name__)
+
+
+class GetProductImport:
+    """
+    Use case for retrieving the progress of a products bulk import.
+    """
+
+    def __init__(self, repository):
+        """
+        Initializes the GetProductImport use case with a product import repository.
+        :param repository: An instance of ProductImportRepository.
+        """
+        self.repository = repository
+
+    def execute(self, import_id: str) -> ProductImportDTO:
+        """
+        Retrieves a product import by its ID from the repository.
+        :param import_id: The ID of the import to retrieve.
+        :return: A ProductImportDTO object representing the import progress.
+        """
+        logging.debug(f"Retrieving product import with ID {import_id}...")
+        product_import = self.repository.get_by_id(import_id)
+        if not product_import:
+            logging.error(f"Product import with ID {import_id} not found.")
+            raise ProductImportNotExistsError
+
+        return product_import
@@ -0,0 +1,35 @@
+import logging
+
+from .errors.errors import ValidationApiError
+from ..domain.entities.product_dto import ProductDTO
+
+logger = logging.getLogger(__name__)
+
+MAX_PRODUCT_IDS = 1000
+
+
+class GetProductsByIds:
+    """
+    Use case for retrieving several products by their IDs in a single call.
+    """
+
+    def __init__(self, repository):
+        """
+        Initializes the GetProductsByIds use case with a product repository.
+        :param repository: An instance of ProductDTORepository.
+        """
+        self.repository = repository
+
+    def execute(self, product_ids: list[str]) -> list[ProductDTO]:
+        """
+        Retrieves the products of a list of IDs from the repository.
+        :param product_ids: The IDs of the products to retrieve.
+        :return: A list of ProductDTO, products that do not exist are not included.
+        """
+        if not isinstance(product_ids, list) or not product_ids or len(product_ids) > MAX_PRODUCT_IDS:
+            logging.error(f"Invalid product IDs list, between 1 and {MAX_PRODUCT_IDS} IDs are required.")
+            raise ValidationApiError
+
+        unique_ids = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+        logging.debug(f"Retrieving {len(unique_ids)} products by ID...")
+        return self.repository.get_by_ids(unique_ids)
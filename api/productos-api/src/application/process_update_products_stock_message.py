@@ -1,11 +1,7 @@
-import logging
+from ..domain.entities.stock_adjustment_result_dto import StockAdjustmentResultDTO, StockAdjustmentStatusEnum
+from .utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ProcessUpdateProductsStockMessage:
@@ -20,34 +16,39 @@ class ProcessUpdateProductsStockMessage:
         """
         self.product_repository = product_repository
 
-    def process(self, message: dict) -> None:
+    def process(self, message: dict) -> list[StockAdjustmentResultDTO]:
         """
         Process the message.
+        The stock of every product in the message is decreased in a single batch.
+        :return: List of StockAdjustmentResultDTO, one per product line.
         """
-        # Here you would implement the logic to process the message.
-        # For example, updating the stock of products in the database.
-        logging.debug(f"Processing message: {message}")
+        logger.debug("Processing message", message=message)
         product_list = message.get("products", [])
         if not product_list:
-            logging.error("No products found in the message.")
-            return
+            logger.error("No products found in the message.")
+            return []
 
+        results = []
+        adjustments = {}
         for product in product_list:
             product_id = product.get("productId")
-            logging.debug(f"Updating stock for product ID: {product_id}")
-            existing_product = self.product_repository.get_by_id(product_id)
-            if not existing_product:
-                logging.error(f"Product with ID {product_id} does not exist.")
-                continue
-
             quantity = product.get("quantity")
             if quantity is None or not isinstance(quantity, int) or quantity <= 0:
-                logging.error(f"Invalid quantity for product ID {product_id}. Quantity must be a positive integer.")
+                logger.error("Invalid quantity for product ID %s. Quantity must be a positive integer.", product_id)
+                results.append(StockAdjustmentResultDTO(product_id, quantity,
+                                                        StockAdjustmentStatusEnum.INVALID_QUANTITY))
                 continue
-            new_stock = existing_product.stock - quantity
-            existing_product.stock = new_stock
-            # Update the stock in the repository
-            self.product_repository.update(existing_product)
-            logging.debug(f"Updated stock for product {product_id} to {new_stock}")
+            # Lines of the same product are merged into a single decrement
+            adjustments[product_id] = adjustments.get(product_id, 0) + quantity
+
+        if adjustments:
+            results.extend(self.product_repository.decrease_stock(adjustments))
+
+        for result in results:
+            if result.status == StockAdjustmentStatusEnum.UPDATED:
+                logger.debug("Updated stock for product %s to %s", result.product_id, result.stock)
+            else:
+                logger.error("Stock for product %s was not updated: %s", result.product_id, result.status.value)
 
-        logging.debug("Message processed successfully.")
+        logger.debug("Message processed successfully.")
+        return results
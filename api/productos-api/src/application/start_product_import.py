@@ -0,0 +1,28 @@
+import logging
+import uuid
+
+from ..domain.entities.product_import_dto import ProductImportDTO
+
+logger = logging.getLogger(__name__)
+
+
+class StartProductImport:
+    """
+    Use case for starting a products bulk import, so its progress can be polled before its first batch is processed.
+    """
+
+    def __init__(self, repository):
+        """
+        Initializes the StartProductImport use case with a product import repository.
+        :param repository: An instance of ProductImportRepository.
+        """
+        self.repository = repository
+
+    def execute(self) -> ProductImportDTO:
+        """
+        Creates a pending product import.
+        :return: A ProductImportDTO object with the ID of the import.
+        """
+        import_id = str(uuid.uuid4())
+        logger.debug(f"Starting product import {import_id}...")
+        return self.repository.create(import_id)
@@ -0,0 +1,60 @@
+import datetime
+
+
+class ProductImportDTO:
+    def __init__(self,
+                 id: str,
+                 status: str,
+                 received_batches: int,
+                 total_batches: int | None,
+                 total: int,
+                 inserted: int,
+                 rejected: int,
+                 rejections: list[dict],
+                 created_at: datetime = None,
+                 updated_at: datetime = None):
+        """
+        Initiates a ProductImportDTO instance with the given parameters.
+
+        Args:
+            id (str): The import ID, shared by every batch of the import.
+            status (str): The import status.
+            received_batches (int): The number of batches processed so far.
+            total_batches (int): The number of batches of the import, None until the last batch is processed.
+            total (int): The number of rows processed so far.
+            inserted (int): The number of products inserted so far.
+            rejected (int): The number of rows rejected so far.
+            rejections (list[dict]): The first rejected rows, with the batch sequence, row and reason.
+            created_at (datetime): The creation date of the import.
+            updated_at (datetime): The last update date of the import.
+        """
+        self.id = id
+        self.status = status
+        self.received_batches = received_batches
+        self.total_batches = total_batches
+        self.total = total
+        self.inserted = inserted
+        self.rejected = rejected
+        self.rejections = rejections
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self):
+        return f"ProductImport(id='{self.id}', status={self.status}, inserted={self.inserted}, rejected={self.rejected})"
+
+    def to_dict(self):
+        """
+        Cast a ProductImportDTO instance to a dictionary.
+        """
+        return {
+            "id": self.id,
+            "status": self.status,
+            "receivedBatches": self.received_batches,
+            "totalBatches": self.total_batches,
+            "total": self.total,
+            "inserted": self.inserted,
+            "rejected": self.rejected,
+            "rejections": self.rejections,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at
+        }
@@ -0,0 +1,42 @@
+class ProductImportResultDTO:
+    def __init__(self,
+                 total: int = 0,
+                 inserted: int = 0,
+                 chunks: int = 0,
+                 rejected: list[dict] = None):
+        """
+        Initiates a ProductImportResultDTO instance with the given parameters.
+
+        Args:
+            total (int): The number of rows read.
+            inserted (int): The number of products inserted.
+            chunks (int): The number of chunks loaded.
+            rejected (list[dict]): The rejected rows, with the row index and the rejection reason.
+        """
+        self.total = total
+        self.inserted = inserted
+        self.chunks = chunks
+        self.rejected = rejected if rejected is not None else []
+
+    def __repr__(self):
+        return (f"ProductImportResult(total={self.total}, inserted={self.inserted}, "
+                f"rejected={len(self.rejected)}, chunks={self.chunks})")
+
+    def reject(self, row: int, reason: str) -> None:
+        """
+        Registers a rejected row.
+        :param row: Index of the row in the import.
+        :param reason: Reason of the rejection.
+        """
+        self.rejected.append({"row": row, "reason": reason})
+
+    def to_dict(self):
+        """
+        Cast a ProductImportResultDTO instance to a dictionary.
+        """
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "chunks": self.chunks,
+            "rejected": self.rejected
+        }
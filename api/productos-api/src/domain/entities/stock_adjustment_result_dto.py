@@ -0,0 +1,43 @@
+import enum
+
+
+class StockAdjustmentStatusEnum(enum.Enum):
+    UPDATED = "UPDATED"
+    NOT_FOUND = "NOT_FOUND"
+    INSUFFICIENT_STOCK = "INSUFFICIENT_STOCK"
+    INVALID_QUANTITY = "INVALID_QUANTITY"
+
+
+class StockAdjustmentResultDTO:
+    def __init__(self,
+                 product_id: str,
+                 quantity: int,
+                 status: StockAdjustmentStatusEnum,
+                 stock: int = None):
+        """
+        Initiates a StockAdjustmentResultDTO instance with the given parameters.
+
+        Args:
+            product_id (str): The product ID.
+            quantity (int): The quantity requested to be decreased.
+            status (StockAdjustmentStatusEnum): The result of the adjustment.
+            stock (int): The product stock after the adjustment, None if the product does not exist.
+        """
+        self.product_id = product_id
+        self.quantity = quantity
+        self.status = status
+        self.stock = stock
+
+    def __repr__(self):
+        return f"StockAdjustmentResult(product_id='{self.product_id}', status={self.status.value}, stock={self.stock})"
+
+    def to_dict(self):
+        """
+        Cast a StockAdjustmentResultDTO instance to a dictionary.
+        """
+        return {
+            "productId": self.product_id,
+            "quantity": self.quantity,
+            "status": self.status.value,
+            "stock": self.stock
+        }
@@ -21,16 +21,31 @@ class MessagingPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def send_many(self, messages: list[tuple[str, str, dict]]) -> bool:
+        """
+        Send several messages to the message broker, confirmed as a batch
+
+        Args:
+            messages: List of (exchange, routing_key, message) tuples
+
+        Returns:
+            bool: True if every message was sent successfully
+        """
+        pass
+
     @abstractmethod
     def consume_messages(self, queue: str, callback: Callable, exchange: str = None,
-                         routing_key: str = None) -> None:
+                         routing_key: str = None, workers: int = None) -> None:
         """
-        Set up a consumer to process messages from a queue
+        Set up a consumer to process messages from a queue.
+        A message whose callback raises is retried a bounded number of times, then dead-lettered.
 
         Args:
             queue: The queue to consume from
-            callback: Function to call when a message is received
+            callback: Function to call when a message is received, from several threads
             exchange: Optional exchange to bind the queue to
             routing_key: Optional routing key for the binding
+            workers: Optional number of messages processed concurrently
         """
         pass
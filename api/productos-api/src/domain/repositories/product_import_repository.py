@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from ..entities.product_import_dto import ProductImportDTO
+from ..entities.product_import_result_dto import ProductImportResultDTO
+
+
+class ProductImportRepository(ABC):
+
+    @abstractmethod
+    def get_by_id(self, import_id: str) -> ProductImportDTO:
+        """Get a product import by ID"""
+        pass
+
+    @abstractmethod
+    def create(self, import_id: str) -> ProductImportDTO:
+        """Create a pending product import"""
+        pass
+
+    @abstractmethod
+    def has_batch(self, import_id: str, sequence: int) -> bool:
+        """Check whether a batch of a product import was already processed"""
+        pass
+
+    @abstractmethod
+    def register_batch(self, import_id: str, sequence: int, last: bool, result: ProductImportResultDTO) -> bool:
+        """Add the result of a processed batch to the progress of a product import, once per batch"""
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
+from ..entities.page_dto import PageDTO
 from ..entities.product_dto import ProductDTO
+from ..entities.stock_adjustment_result_dto import StockAdjustmentResultDTO
 
 
 class ProductDTORepository(ABC):
@@ -10,11 +12,21 @@ class ProductDTORepository(ABC):
         """Get all products"""
         pass
 
+    @abstractmethod
+    def get_page(self, limit: int, cursor: str = None) -> PageDTO:
+        """Get a page of products sorted by name"""
+        pass
+
     @abstractmethod
     def get_by_id(self, id: str) -> ProductDTO:
         """Get product by ID"""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, ids: list[str]) -> list[ProductDTO]:
+        """Get products by a list of IDs"""
+        pass
+
     @abstractmethod
     def get_by_name(self, name: str) -> ProductDTO:
         """Get product by name"""
@@ -35,11 +47,21 @@ class ProductDTORepository(ABC):
         """Add multiple products"""
         pass
 
+    @abstractmethod
+    def add_chunk(self, products: list[ProductDTO]) -> int:
+        """Add a chunk of products in a single bulk load, returns the number of inserted products"""
+        pass
+
     @abstractmethod
     def update(self, product: ProductDTO) -> ProductDTO:
         """Update an existing product"""
         pass
 
+    @abstractmethod
+    def decrease_stock(self, adjustments: dict[str, int]) -> list[StockAdjustmentResultDTO]:
+        """Decrease the stock of multiple products in a single transaction"""
+        pass
+
     @abstractmethod
     def delete(self, id: str) -> None:
         """Delete a product by ID"""
@@ -1,6 +1,8 @@
 from ..dao.product_dao import ProductDAO
 from ..mapper.product_mapper import ProductMapper
+from ...domain.entities.page_dto import PageDTO
 from ...domain.entities.product_dto import ProductDTO
+from ...domain.entities.stock_adjustment_result_dto import StockAdjustmentResultDTO
 from ...domain.repositories.product_repository import ProductDTORepository
 
 
@@ -9,9 +11,16 @@ class ProductAdapter(ProductDTORepository):
     def get_all(self) -> list[ProductDTO]:
         return ProductMapper.to_dto_list(ProductDAO.find_all())
 
+    def get_page(self, limit: int, cursor: str = None) -> PageDTO:
+        products, next_cursor = ProductDAO.find_page(limit, cursor)
+        return PageDTO(ProductMapper.to_dto_list(products), next_cursor)
+
     def get_by_id(self, id: str) -> ProductDTO:
         return ProductMapper.to_dto(ProductDAO.find_by_id(id))
 
+    def get_by_ids(self, ids: list[str]) -> list[ProductDTO]:
+        return ProductMapper.to_dto_list(ProductDAO.find_by_ids(ids))
+
     def get_by_name(self, name: str) -> ProductDTO:
         return ProductMapper.to_dto(ProductDAO.find_by_name(name))
 
@@ -24,8 +33,14 @@ class ProductAdapter(ProductDTORepository):
     def add_all(self, products: list[ProductDTO]) -> None:
         ProductDAO.save_all(ProductMapper.to_domain_list(products))
 
+    def add_chunk(self, products: list[ProductDTO]) -> int:
+        return ProductDAO.bulk_insert(ProductMapper.to_row_list(products))
+
     def update(self, product: ProductDTO) -> ProductDTO:
         return ProductMapper.to_dto(ProductDAO.update(ProductMapper.to_domain(product)))
 
+    def decrease_stock(self, adjustments: dict[str, int]) -> list[StockAdjustmentResultDTO]:
+        return ProductDAO.decrease_stock(adjustments)
+
     def delete(self, id: str) -> None:
         ProductDAO.delete(id)
@@ -0,0 +1,20 @@
+from ..dao.product_import_dao import ProductImportDAO
+from ..mapper.product_import_mapper import ProductImportMapper
+from ...domain.entities.product_import_dto import ProductImportDTO
+from ...domain.entities.product_import_result_dto import ProductImportResultDTO
+from ...domain.repositories.product_import_repository import ProductImportRepository
+
+
+class ProductImportAdapter(ProductImportRepository):
+
+    def get_by_id(self, import_id: str) -> ProductImportDTO:
+        return ProductImportMapper.to_dto(ProductImportDAO.find_by_id(import_id))
+
+    def create(self, import_id: str) -> ProductImportDTO:
+        return ProductImportMapper.to_dto(ProductImportDAO.create(import_id))
+
+    def has_batch(self, import_id: str, sequence: int) -> bool:
+        return ProductImportDAO.has_batch(import_id, sequence)
+
+    def register_batch(self, import_id: str, sequence: int, last: bool, result: ProductImportResultDTO) -> bool:
+        return ProductImportDAO.register_batch(import_id, sequence, last, result)
@@ -1,7 +1,14 @@
+import io
+import json
+import uuid
 from datetime import datetime, timezone
 
+from sqlalchemy import JSON, bindparam, insert, select, update
+
 from ..database.declarative_base import Session
+from .pagination import paginate
 from ..model.product_model import ProductModel
+from ...domain.entities.stock_adjustment_result_dto import StockAdjustmentResultDTO, StockAdjustmentStatusEnum
 
 
 class ProductDAO:
@@ -34,6 +41,17 @@ class ProductDAO:
         session.close()
         return products
 
+    @classmethod
+    def find_page(cls, limit: int, cursor: str = None) -> tuple[list[ProductModel], str | None]:
+        """
+        Obtain a page of products sorted by name.
+        :param limit: Maximum number of products of the page.
+        :param cursor: Cursor returned with the previous page, None for the first page.
+        :return: Tuple of (products, cursor of the next page)
+        """
+        with Session() as session:
+            return paginate(session.query(ProductModel), [ProductModel.name, ProductModel.id], limit, cursor)
+
     @classmethod
     def find_by_id(cls, product_id: str) -> ProductModel | None:
         """
@@ -46,6 +64,27 @@ class ProductDAO:
         session.close()
         return product
 
+    @classmethod
+    def find_by_ids(cls, product_ids: list[str]) -> list[ProductModel]:
+        """
+        Find the products of a list of IDs with a single query.
+        :param product_ids: IDs of the products to find, invalid IDs are ignored.
+        :return: List of ProductModel found.
+        """
+        ids = set()
+        for product_id in product_ids:
+            try:
+                ids.add(uuid.UUID(str(product_id)))
+            except ValueError:
+                continue
+        if not ids:
+            return []
+
+        session = Session()
+        products = session.query(ProductModel).filter(ProductModel.id.in_(ids)).all()
+        session.close()
+        return products
+
     @classmethod
     def find_by_name(cls, name: str) -> ProductModel | None:
         """
@@ -124,6 +163,65 @@ class ProductDAO:
         finally:
             session.close()
 
+    @classmethod
+    def decrease_stock(cls, adjustments: dict[str, int]) -> list[StockAdjustmentResultDTO]:
+        """
+        Decrease the stock of multiple products in a single transaction.
+        The product rows are locked while the batch is applied, so concurrent decrements
+        of the same product are serialized, and products without enough stock are rejected.
+        :param adjustments: Dictionary of product ID to the quantity to decrease.
+        :return: List of StockAdjustmentResultDTO, one per product.
+        """
+        product_ids = {}
+        for product_id in adjustments:
+            try:
+                product_ids[product_id] = uuid.UUID(str(product_id))
+            except ValueError:
+                continue
+
+        session = Session()
+        try:
+            current_stock = {}
+            if product_ids:
+                rows = session.execute(
+                    select(ProductModel.id, ProductModel.stock)
+                    .where(ProductModel.id.in_(list(product_ids.values())))
+                    .order_by(ProductModel.id)
+                    .with_for_update()
+                ).all()
+                current_stock = {row.id: row.stock for row in rows}
+
+            results = []
+            updates = []
+            for product_id, quantity in adjustments.items():
+                stock = current_stock.get(product_ids.get(product_id))
+                if stock is None:
+                    results.append(StockAdjustmentResultDTO(product_id, quantity, StockAdjustmentStatusEnum.NOT_FOUND))
+                elif stock < quantity:
+                    results.append(StockAdjustmentResultDTO(product_id, quantity,
+                                                            StockAdjustmentStatusEnum.INSUFFICIENT_STOCK, stock))
+                else:
+                    updates.append({'b_id': product_ids[product_id], 'b_quantity': quantity})
+                    results.append(StockAdjustmentResultDTO(product_id, quantity,
+                                                            StockAdjustmentStatusEnum.UPDATED, stock - quantity))
+
+            if updates:
+                products = ProductModel.__table__
+                session.execute(
+                    update(products)
+                    .where(products.c.id == bindparam('b_id'))
+                    .where(products.c.stock >= bindparam('b_quantity'))
+                    .values(stock=products.c.stock - bindparam('b_quantity'), updatedAt=datetime.now(timezone.utc)),
+                    updates
+                )
+            session.commit()
+            return results
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
     @classmethod
     def delete(cls, product_id: str) -> None:
         """
@@ -146,3 +244,66 @@ class ProductDAO:
         session.add_all(products)
         session.commit()
         session.close()
+
+    @classmethod
+    def bulk_insert(cls, rows: list[dict]) -> int:
+        """
+        Insert a chunk of products in a single transaction without building ORM objects.
+        On PostgreSQL the rows are streamed with COPY FROM STDIN, other databases use a
+        single executemany INSERT.
+        :param rows: List of rows of the products table.
+        :return: Number of inserted products.
+        """
+        if not rows:
+            return 0
+
+        session = Session()
+        try:
+            if session.get_bind().dialect.name == 'postgresql':
+                cls._copy_rows(session, rows)
+            else:
+                session.execute(insert(ProductModel.__table__), rows)
+            session.commit()
+            return len(rows)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    @classmethod
+    def _copy_rows(cls, session, rows: list[dict]) -> None:
+        """
+        Load rows into the products table using PostgreSQL COPY FROM STDIN in CSV format.
+        :param session: Session holding the transaction.
+        :param rows: List of rows of the products table.
+        """
+        columns = list(rows[0].keys())
+        json_columns = {column.name for column in ProductModel.__table__.columns if isinstance(column.type, JSON)}
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(','.join(cls._to_copy_value(row[column], column in json_columns) for column in columns))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        column_list = ', '.join(f'"{column}"' for column in columns)
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f'COPY {ProductModel.__tablename__} ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                               buffer)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _to_copy_value(value, is_json: bool) -> str:
+        """
+        Convert a value to its COPY CSV field. COPY reads an unquoted empty field as NULL, so None is written
+        that way and every other value is quoted, keeping empty strings as empty strings.
+        """
+        if value is None:
+            return ''
+        if is_json:
+            value = json.dumps(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        return '"' + str(value).replace('"', '""') + '"'
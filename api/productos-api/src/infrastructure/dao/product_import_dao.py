@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import IntegrityError
+
+from ..database.declarative_base import Session
+from ..model.product_import_model import ProductImportBatchModel, ProductImportModel, ProductImportStatusEnum
+from ...domain.entities.product_import_result_dto import ProductImportResultDTO
+
+# Only the first rejections are kept, the counters always reflect every rejected row
+MAX_STORED_REJECTIONS = 100
+
+
+class ProductImportDAO:
+    """
+    Data Access Object for product imports.
+    """
+
+    @classmethod
+    def find_by_id(cls, import_id: str) -> ProductImportModel | None:
+        """
+        Find a product import by ID.
+        :param import_id: ID of the import to find.
+        :return: ProductImportModel if found, None otherwise.
+        """
+        session = Session()
+        product_import = session.query(ProductImportModel).filter(ProductImportModel.id == import_id).first()
+        session.close()
+        return product_import
+
+    @classmethod
+    def create(cls, import_id: str) -> ProductImportModel:
+        """
+        Create a pending product import, before any of its batches is published.
+        :param import_id: ID of the import.
+        :return: The created ProductImportModel.
+        """
+        session = Session()
+        try:
+            product_import = ProductImportModel(id=import_id, status=ProductImportStatusEnum.PENDING,
+                                                received_batches=0, total=0, inserted=0, rejected=0,
+                                                rejections=[], createdAt=datetime.now(timezone.utc))
+            session.add(product_import)
+            session.commit()
+            session.refresh(product_import)
+            return product_import
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    @classmethod
+    def has_batch(cls, import_id: str, sequence: int) -> bool:
+        """
+        Check whether a batch of a product import was already processed.
+        :param import_id: ID of the import.
+        :param sequence: Sequence number of the batch.
+        :return: True if the batch was registered.
+        """
+        session = Session()
+        try:
+            return session.get(ProductImportBatchModel, (import_id, sequence)) is not None
+        finally:
+            session.close()
+
+    @classmethod
+    def register_batch(cls, import_id: str, sequence: int, last: bool, result: ProductImportResultDTO) -> bool:
+        """
+        Add the result of a processed batch to a product import, creating the import on its first batch.
+        A batch already registered, e.g. a redelivered message, is ignored.
+        :param import_id: ID of the import.
+        :param sequence: Sequence number of the batch, starting at 0.
+        :param last: True if the batch is the last one of the import.
+        :param result: Result of the batch.
+        :return: False if the batch was already registered.
+        """
+        try:
+            return cls._register_batch(import_id, sequence, last, result)
+        except IntegrityError:
+            # Another consumer created the import, or registered the same batch, concurrently
+            return cls._register_batch(import_id, sequence, last, result)
+
+    @classmethod
+    def _register_batch(cls, import_id: str, sequence: int, last: bool, result: ProductImportResultDTO) -> bool:
+        session = Session()
+        try:
+            product_import = (session.query(ProductImportModel)
+                              .filter(ProductImportModel.id == import_id)
+                              .with_for_update()
+                              .first())
+            if not product_import:
+                product_import = ProductImportModel(id=import_id, status=ProductImportStatusEnum.PROCESSING,
+                                                    received_batches=0, total=0, inserted=0, rejected=0,
+                                                    rejections=[])
+                session.add(product_import)
+                session.flush()
+            elif session.get(ProductImportBatchModel, (import_id, sequence)) is not None:
+                session.rollback()
+                return False
+
+            session.add(ProductImportBatchModel(import_id=import_id, sequence=sequence))
+            if product_import.status == ProductImportStatusEnum.PENDING:
+                product_import.status = ProductImportStatusEnum.PROCESSING
+            product_import.received_batches += 1
+            product_import.total += result.total
+            product_import.inserted += result.inserted
+            product_import.rejected += len(result.rejected)
+
+            available = MAX_STORED_REJECTIONS - len(product_import.rejections)
+            if available > 0 and result.rejected:
+                product_import.rejections = product_import.rejections + [
+                    {"sequence": sequence, **rejection} for rejection in result.rejected[:available]
+                ]
+
+            if last:
+                product_import.total_batches = sequence + 1
+            if product_import.total_batches is not None and \
+                    product_import.received_batches >= product_import.total_batches:
+                product_import.status = ProductImportStatusEnum.COMPLETED
+
+            product_import.updatedAt = datetime.now(timezone.utc)
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
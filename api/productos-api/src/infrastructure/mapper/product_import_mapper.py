@@ -0,0 +1,28 @@
+from ..model.product_import_model import ProductImportModel
+from ...domain.entities.product_import_dto import ProductImportDTO
+
+
+class ProductImportMapper:
+
+    @staticmethod
+    def to_dto(product_import: ProductImportModel) -> ProductImportDTO | None:
+        """
+        Converts a ProductImportModel to a ProductImportDTO.
+        :param product_import:
+        :return:
+        """
+        if product_import is None:
+            return None
+
+        return ProductImportDTO(
+            id=product_import.id,
+            status=product_import.status.value,
+            received_batches=product_import.received_batches,
+            total_batches=product_import.total_batches,
+            total=product_import.total,
+            inserted=product_import.inserted,
+            rejected=product_import.rejected,
+            rejections=product_import.rejections,
+            created_at=product_import.createdAt.isoformat() if product_import.createdAt else None,
+            updated_at=product_import.updatedAt.isoformat() if product_import.updatedAt else None
+        )
@@ -1,5 +1,6 @@
 import datetime
 import json
+import uuid
 
 from ..model.product_model import ProductModel
 from ...domain.entities.product_dto import ProductDTO
@@ -41,6 +42,30 @@ class ProductMapper:
             updatedAt=updated
         )
 
+    @staticmethod
+    def to_row(product_dto: ProductDTO) -> dict:
+        """
+        Converts a ProductDTO to a row of the products table, used by the bulk loads.
+        :param product_dto:
+        :return:
+        """
+        return {
+            'id': product_dto.id or uuid.uuid4(),
+            'name': product_dto.name,
+            'brand': product_dto.brand,
+            'description': product_dto.description,
+            'stock': product_dto.stock,
+            'details': json.dumps(product_dto.details) if product_dto.details else None,
+            'storage_conditions': product_dto.storage_conditions,
+            'price': product_dto.price,
+            'currency': product_dto.currency,
+            'delivery_time': product_dto.delivery_time,
+            'manufacturer_id': product_dto.manufacturer_id,
+            'images': product_dto.images,
+            'createdAt': datetime.datetime.utcnow(),
+            'updatedAt': None
+        }
+
     @staticmethod
     def to_dto(product: ProductModel) -> ProductDTO | None:
         """
@@ -91,3 +116,12 @@ class ProductMapper:
         :return:
         """
         return [ProductMapper.to_domain(product_dto) for product_dto in products_dto]
+
+    @staticmethod
+    def to_row_list(products_dto: list[ProductDTO]) -> list[dict]:
+        """
+        Converts a list of ProductDTO to a list of rows of the products table.
+        :param products_dto:
+        :return:
+        """
+        return [ProductMapper.to_row(product_dto) for product_dto in products_dto]
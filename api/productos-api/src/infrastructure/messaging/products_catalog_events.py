@@ -0,0 +1,26 @@
+import logging
+
+from ...domain.ports.messaging_port import MessagingPort
+
+PRODUCTS_CATALOG_EXCHANGE = 'products_catalog_exchange'
+PRODUCTS_CATALOG_ROUTING_KEY = 'products_catalog_routing_key'
+
+STOCK_UPDATED_EVENT = 'STOCK_UPDATED'
+PRODUCTS_CREATED_EVENT = 'PRODUCTS_CREATED'
+
+logger = logging.getLogger(__name__)
+
+
+def publish_products_changed(messaging_port: MessagingPort, event: str, product_ids: list[str]) -> bool:
+    """
+    Notifies the catalog readers (the BFF caches) that products changed.
+    :param messaging_port: Port used to publish the event.
+    :param event: The kind of change, STOCK_UPDATED or PRODUCTS_CREATED.
+    :param product_ids: IDs of the changed products, empty when only the listing changed.
+    :return: True if the event was published.
+    """
+    logger.debug(f"Publishing products catalog event {event} for {len(product_ids)} products")
+    return messaging_port.send_message(PRODUCTS_CATALOG_EXCHANGE, PRODUCTS_CATALOG_ROUTING_KEY, {
+        'event': event,
+        'productIds': product_ids
+    })
@@ -1,11 +1,12 @@
-import json
 import logging
-import threading
-from contextlib import contextmanager
-
-import pika
 
 from .rabbitmq_connection_manager import RabbitMQConnectionManager
+from .rabbitmq_consumer_runtime import RabbitMQConsumerRuntime
+from .rabbitmq_publisher import RabbitMQPublisher
+from ..monitoring.metrics import REGISTRY
+
+PUBLISHED_MESSAGES = REGISTRY.counter("rabbitmq_published_messages_total", "Messages published, by exchange and outcome",
+                                      ("exchange", "outcome"))
 
 
 class RabbitMQMessagingAdapter:
@@ -14,114 +15,56 @@ class RabbitMQMessagingAdapter:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.connection_manager = RabbitMQConnectionManager()
-
-    @contextmanager
-    def _channel(self):
-        """Context manager for getting and returning connections"""
-        connection = self.connection_manager.get_connection()
-        channel = connection.channel()
-        try:
-            yield channel
-        finally:
-            channel.close()
-            self.connection_manager.return_connection(connection)
+        self.publisher = RabbitMQPublisher(self.connection_manager)
 
     def publish_message(self, exchange, routing_key, message, exchange_type='direct'):
-        """Publish a message to RabbitMQ"""
+        """Publish a message to RabbitMQ and wait for the broker to confirm it"""
         self.logger.debug(f"Publishing message to {exchange} with routing key {routing_key}")
+        return self.publish_many([(exchange, routing_key, message)], exchange_type)
 
-        try:
-            with self._channel() as channel:
-                # Declare exchange
-                channel.exchange_declare(
-                    exchange=exchange,
-                    exchange_type=exchange_type,
-                    durable=True
-                )
+    def publish_many(self, messages, exchange_type='direct'):
+        """
+        Publish several messages to RabbitMQ and wait for the broker to confirm all of them
 
-                # Publish message
-                channel.basic_publish(
-                    exchange=exchange,
-                    routing_key=routing_key,
-                    body=json.dumps(message),
-                    properties=pika.BasicProperties(
-                        delivery_mode=2,  # Make message persistent
-                        content_type='application/json'
-                    )
-                )
-                self.logger.debug(f"Message published successfully")
-                return True
+        Args:
+            messages: List of (exchange, routing_key, message) tuples
+            exchange_type: Type of the exchanges if they have to be declared
+
+        Returns:
+            bool: True if every message was confirmed by the broker
+        """
+        self.logger.debug(f"Publishing {len(messages)} messages")
+
+        try:
+            confirmed = self.publisher.publish_many(messages, exchange_type)
         except Exception as e:
-            self.logger.error(f"Failed to publish message: {str(e)}")
-            return False
+            self.logger.error(f"Failed to publish messages: {str(e)}")
+            confirmed = False
 
-    def setup_consumer(self, queue, callback, exchange=None, routing_key=None, exchange_type='direct'):
+        outcome = "confirmed" if confirmed else "failed"
+        for exchange, _, _ in messages:
+            PUBLISHED_MESSAGES.inc(exchange=exchange, outcome=outcome)
+        return confirmed
+
+    def setup_consumer(self, queue, callback, exchange=None, routing_key=None, exchange_type='direct', workers=None):
         """
         Set up a consumer for a queue with the given callback
 
         Args:
             queue: Queue name to consume from
-            callback: Function to process received messages
+            callback: Function to process received messages, called from several worker threads
             exchange: Optional exchange to bind the queue to
             routing_key: Optional routing key for binding
             exchange_type: Type of exchange if creating
+            workers: Number of worker threads, RABBITMQ_CONSUMER_WORKERS by default
         """
-
-        def consumer_thread():
-            try:
-                connection = self.connection_manager.get_connection()
-                channel = connection.channel()
-
-                # Declare queue
-                channel.queue_declare(queue=queue, durable=True)
-
-                # If exchange provided, declare and bind
-                if exchange and routing_key:
-                    channel.exchange_declare(
-                        exchange=exchange,
-                        exchange_type=exchange_type,
-                        durable=True
-                    )
-                    channel.queue_bind(
-                        queue=queue,
-                        exchange=exchange,
-                        routing_key=routing_key
-                    )
-
-                # Create wrapper for the callback to handle JSON parsing
-                def process_message(ch, method, properties, body):
-                    try:
-                        message = json.loads(body)
-                        callback(message)
-                        ch.basic_ack(delivery_tag=method.delivery_tag)
-                    except Exception as e:
-                        self.logger.error(f"Error processing message: {str(e)}")
-                        # Negative acknowledgment, message will be requeued
-                        ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-
-                # Set prefetch count to control concurrency
-                channel.basic_qos(prefetch_count=1)
-
-                # Start consuming
-                channel.basic_consume(queue=queue, on_message_callback=process_message)
-
-                self.logger.info(f"Started consuming from queue: {queue}")
-                channel.start_consuming()
-
-            except Exception as e:
-                self.logger.error(f"Consumer error: {str(e)}")
-                # Sleep briefly before reconnection attempt
-                import time
-                time.sleep(5)
-
-                # Try to restart the consumer
-                self.logger.info("Attempting to restart consumer...")
-                consumer_thread()
-            finally:
-                if 'connection' in locals() and connection.is_open:
-                    self.connection_manager.return_connection(connection)
-
-        # Start consumer in a separate thread
-        thread = threading.Thread(target=consumer_thread, daemon=True)
-        thread.start()
-        return thread
+        runtime = RabbitMQConsumerRuntime(
+            self.connection_manager,
+            queue,
+            callback,
+            exchange=exchange,
+            routing_key=routing_key,
+            exchange_type=exchange_type,
+            workers=workers
+        )
+        return runtime.start()
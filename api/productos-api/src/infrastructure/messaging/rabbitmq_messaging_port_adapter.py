@@ -14,12 +14,17 @@ class RabbitMQMessagingPortAdapter(MessagingPort):
         """Send a message to RabbitMQ"""
         return self.adapter.publish_message(exchange, routing_key, message)
 
+    def send_many(self, messages: list[tuple[str, str, dict]]) -> bool:
+        """Send several messages to RabbitMQ, confirmed as a batch"""
+        return self.adapter.publish_many(messages)
+
     def consume_messages(self, queue: str, callback: Callable, exchange: str = None,
-                         routing_key: str = None) -> None:
+                         routing_key: str = None, workers: int = None) -> None:
         """Set up a consumer for the specified queue"""
         return self.adapter.setup_consumer(
             queue=queue,
             callback=callback,
             exchange=exchange,
-            routing_key=routing_key
+            routing_key=routing_key,
+            workers=workers
         )
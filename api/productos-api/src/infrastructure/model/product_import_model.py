@@ -0,0 +1,43 @@
+import enum
+from datetime import datetime
+
+import sqlalchemy
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSON
+
+from ..database.declarative_base import Base
+
+
+class ProductImportStatusEnum(enum.Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    COMPLETED = "COMPLETED"
+
+
+class ProductImportModel(Base):
+    """
+    Product import model for SQLAlchemy, tracks the progress of a bulk upload.
+    """
+    __tablename__ = 'product_imports'
+
+    id = Column(String, primary_key=True)
+    status = Column(sqlalchemy.Enum(ProductImportStatusEnum), default=ProductImportStatusEnum.PROCESSING)
+    received_batches = Column(sqlalchemy.Integer, nullable=False, default=0)
+    total_batches = Column(sqlalchemy.Integer, nullable=True)
+    total = Column(sqlalchemy.Integer, nullable=False, default=0)
+    inserted = Column(sqlalchemy.Integer, nullable=False, default=0)
+    rejected = Column(sqlalchemy.Integer, nullable=False, default=0)
+    rejections = Column(JSON, nullable=False, default=list)
+    createdAt = Column(DateTime, nullable=True, default=datetime.utcnow)
+    updatedAt = Column(DateTime, nullable=True)
+
+
+class ProductImportBatchModel(Base):
+    """
+    Batch of a product import already processed, so a redelivered batch is not counted twice.
+    """
+    __tablename__ = 'product_import_batches'
+
+    import_id = Column(String, ForeignKey('product_imports.id', ondelete='CASCADE'), primary_key=True)
+    sequence = Column(sqlalchemy.Integer, primary_key=True)
+    createdAt = Column(DateTime, nullable=True, default=datetime.utcnow)
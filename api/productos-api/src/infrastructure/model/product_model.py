@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 
 import sqlalchemy
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSON
 
 from ..database.declarative_base import Base
@@ -13,6 +13,10 @@ class ProductModel(Base):
     Product model for SQLAlchemy.
     """
     __tablename__ = 'products'
+    __table_args__ = (
+        # Sort key of the paginated catalog
+        Index('ix_products_name_id', 'name', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
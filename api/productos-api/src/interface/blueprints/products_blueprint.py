@@ -8,14 +8,29 @@ from ...application.delete_product import DeleteProduct
 from ...application.errors.errors import ValidationApiError
 from ...application.get_all_products import GetAllProducts
 from ...application.get_product_by_id import GetProductById
+from ...application.get_product_import import GetProductImport
+from ...application.get_products_by_ids import GetProductsByIds
+from ...application.start_product_import import StartProductImport
 from ...application.update_product import UpdateProduct
 from ...domain.entities.product_dto import ProductDTO
 from ...infrastructure.adapters.product_adapter import ProductAdapter
+from ...infrastructure.adapters.product_import_adapter import ProductImportAdapter
 
 
 products_blueprint = Blueprint('products', __name__, url_prefix='/api/v1/products')
 
 products_adapter = ProductAdapter()
+product_import_adapter = ProductImportAdapter()
+
+
+def conditional_response(payload):
+    """
+    Builds a 200 response tagged with the ETag of its body, answered with a 304 when the
+    client already has it (If-None-Match), so the BFF caches can revalidate their entries.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @products_blueprint.route('/', methods=['POST'])
@@ -53,7 +68,24 @@ def create_product():
 @token_required(['DIRECTIVO', 'CLIENTE', 'VENDEDOR'])
 def get_all_products():
     use_case = GetAllProducts(products_adapter)
+    if 'limit' in request.args or 'cursor' in request.args:
+        page = use_case.execute_page(request.args.get('limit'), request.args.get('cursor'))
+        return conditional_response(page.to_dict())
+
     products = use_case.execute()
+    return conditional_response([product.to_dict() for product in products])
+
+
+@products_blueprint.route('/batch', methods=['POST'])
+@token_required(['DIRECTIVO', 'CLIENTE', 'VENDEDOR'])
+def get_products_by_ids():
+    data = request.get_json(silent=True)
+    if not data or 'ids' not in data:
+        logging.error("Missing required fields in request data.")
+        raise ValidationApiError
+
+    use_case = GetProductsByIds(products_adapter)
+    products = use_case.execute(data['ids'])
     return jsonify([product.to_dict() for product in products]), 200
 
 
@@ -62,7 +94,23 @@ def get_all_products():
 def get_product_by_id(product_id):
     use_case = GetProductById(products_adapter)
     product = use_case.execute(product_id)
-    return jsonify(product.to_dict()), 200
+    return conditional_response(product.to_dict())
+
+
+@products_blueprint.route('/imports', methods=['POST'])
+@token_required(['DIRECTIVO'])
+def start_product_import():
+    use_case = StartProductImport(product_import_adapter)
+    product_import = use_case.execute()
+    return jsonify(product_import.to_dict()), 201
+
+
+@products_blueprint.route('/imports/<string:import_id>', methods=['GET'])
+@token_required(['DIRECTIVO'])
+def get_product_import(import_id):
+    use_case = GetProductImport(product_import_adapter)
+    product_import = use_case.execute(import_id)
+    return jsonify(product_import.to_dict()), 200
 
 
 @products_blueprint.route('/<string:product_id>', methods=['PUT'])
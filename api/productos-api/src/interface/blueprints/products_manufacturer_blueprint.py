@@ -6,11 +6,6 @@ from ..decorator.token_decorator import token_required
 from ...application.get_product_by_manufacturer import GetProductByManufacturer
 from ...infrastructure.adapters.product_adapter import ProductAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 products_manufacturer_blueprint = Blueprint('products_manufacturers', __name__, url_prefix='/api/v1/manufacturers')
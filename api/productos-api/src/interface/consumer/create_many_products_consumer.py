@@ -1,15 +1,13 @@
-import logging
+import os
 
 from ...application.create_many_products import CreateManyProducts
+from ...infrastructure.messaging.products_catalog_events import publish_products_changed, PRODUCTS_CREATED_EVENT
 from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
 from ...infrastructure.adapters.product_adapter import ProductAdapter
+from ...infrastructure.adapters.product_import_adapter import ProductImportAdapter
+from ...application.utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 class CreateManyProductsConsumer:
     """
@@ -19,7 +17,8 @@ class CreateManyProductsConsumer:
     def __init__(self):
         products_adapter = ProductAdapter()
         self.messaging_port = RabbitMQMessagingPortAdapter()
-        self.processor = CreateManyProducts(products_adapter)
+        chunk_size = int(os.getenv('PRODUCTS_IMPORT_CHUNK_SIZE', '1000'))
+        self.processor = CreateManyProducts(products_adapter, ProductImportAdapter(), chunk_size=chunk_size)
 
     def process_message(self, message: dict) -> None:
         """
@@ -27,9 +26,15 @@ class CreateManyProductsConsumer:
         :param message: The message received from RabbitMQ
         """
         try:
-            self.processor.process(message)
+            result = self.processor.process(message)
         except Exception as e:
-            logging.error(f"Error processing creating many products: {str(e)}")
+            logger.error("Error processing creating many products: %s", e)
+            # Let the consumer retry the message and dead-letter it once out of retries
+            raise
+
+        if result.inserted:
+            # New products only change the listing, cached products are still valid
+            publish_products_changed(self.messaging_port, PRODUCTS_CREATED_EVENT, [])
 
     def start_consuming(self) -> None:
         """
@@ -1,15 +1,11 @@
-import logging
-
 from ...application.process_update_products_stock_message import ProcessUpdateProductsStockMessage
+from ...domain.entities.stock_adjustment_result_dto import StockAdjustmentStatusEnum
+from ...infrastructure.messaging.products_catalog_events import publish_products_changed, STOCK_UPDATED_EVENT
 from ...infrastructure.messaging.rabbitmq_messaging_port_adapter import RabbitMQMessagingPortAdapter
 from ...infrastructure.adapters.product_adapter import ProductAdapter
+from ...application.utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 class UpdateProductsStockConsumer:
     """
@@ -27,9 +23,15 @@ class UpdateProductsStockConsumer:
         :param message: The message received from RabbitMQ
         """
         try:
-            self.processor.process(message)
+            results = self.processor.process(message)
         except Exception as e:
-            logging.error(f"Error processing stock update message: {str(e)}")
+            logger.error("Error processing stock update message: %s", e)
+            # Let the consumer retry the message and dead-letter it once out of retries
+            raise
+
+        updated = [str(result.product_id) for result in results if result.status == StockAdjustmentStatusEnum.UPDATED]
+        if updated:
+            publish_products_changed(self.messaging_port, STOCK_UPDATED_EVENT, updated)
 
     def start_consuming(self) -> None:
         """
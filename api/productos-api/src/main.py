@@ -1,4 +1,5 @@
 import logging
+import os
 import threading
 
 from dotenv import load_dotenv
@@ -12,9 +13,22 @@ from .interface.consumer.update_products_stock_consumer import UpdateProductsSto
 from .interface.consumer.create_many_products_consumer import CreateManyProductsConsumer
 from .interface.blueprints.products_manufacturer_blueprint import products_manufacturer_blueprint
 from .application.errors.errors import ApiError
-from .infrastructure.database.declarative_base import Base, engine
+from .infrastructure.config.container import DependencyContainer
+from .infrastructure.database.declarative_base import Base, database, engine
+from .infrastructure.messaging.rabbitmq_consumer_runtime import stop_consumers
+from .infrastructure.monitoring.metrics import init_metrics
+from .application.utils.structured_logging import configure_logging
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging('productos-api')
+
+
+def create_schema():
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    logging.debug(">> Create schema")
+    Base.metadata.create_all(engine)
+    engine.dispose()
 
 
 def initialize_rabbitmq_consumers():
@@ -28,18 +42,37 @@ def initialize_rabbitmq_consumers():
     create_many_products_consumer.start_consuming()
 
 
+def shutdown(timeout=30):
+    """
+    Stop the consumers after the messages in progress and release the connections of the process,
+    called by the server when a worker exits.
+    :param timeout: Seconds the shutdown may wait, in total.
+    """
+    stop_consumers(timeout)
+    engine.dispose()
+
+
 def create_app():
     """
     Create and configure the Flask application.
     """
     logging.debug('products microservice started')
     app = Flask(__name__)
+    # One connection checkout per request, however many DAO calls it makes
+    database.init_app(app)
+    init_metrics(app)
+    # One token validator per process, so the requests share its cache
+    app.container = DependencyContainer()
 
     # Register blueprints
     app.register_blueprint(management_blueprint)
     app.register_blueprint(products_blueprint)
     app.register_blueprint(products_manufacturer_blueprint)
 
+    # Under gunicorn the master created the schema before forking the workers
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        create_schema()
+
     # Initialize the consumer
     logging.debug(">> Initialize the consumer")
     # Start consumers in a separate thread to not block the main application
@@ -49,10 +82,6 @@ def create_app():
     )
     consumer_thread.start()
 
-    # Create schema
-    logging.debug(">> Create schema")
-    Base.metadata.create_all(engine)
-
     @app.errorhandler(ApiError)
     def handle_error(error):
         """
@@ -1,103 +1,184 @@
 import unittest
+import uuid
 from unittest.mock import MagicMock, patch
 
 from src.application.create_many_products import CreateManyProducts
 
 
+def build_row(**overrides):
+    row = {
+        'manufacturer_id': str(uuid.uuid4()),
+        'name': 'Product',
+        'brand': 'Test Brand',
+        'description': 'Test Description',
+        'stock': '10',
+        'details': '{"weight": "1kg"}',
+        'storage_conditions': 'Cool and dry',
+        'price': '100.5',
+        'currency': 'USD',
+        'delivery_time': '3',
+        'images': 'img1.jpg,img2.jpg'
+    }
+    row.update(overrides)
+    return row
+
+
 class TestCreateManyProducts(unittest.TestCase):
 
     def setUp(self):
         self.repository = MagicMock()
-        self.use_case = CreateManyProducts(self.repository)
+        self.repository.add_chunk.side_effect = lambda products: len(products)
+        self.use_case = CreateManyProducts(self.repository, chunk_size=2)
+
+    def test_process_successful(self):
+        # Arrange
+        test_message = [build_row(name="Product 1"), build_row(name="Product 2")]
 
-    @patch('src.application.create_many_products.ProductsJsonMapper')
-    def test_process_successful(self, mock_mapper):
+        # Act
+        result = self.use_case.process(test_message)
+
+        # Assert
+        self.repository.add_chunk.assert_called_once()
+        products = self.repository.add_chunk.call_args[0][0]
+        self.assertEqual([p.name for p in products], ["Product 1", "Product 2"])
+        self.assertEqual(products[0].stock, 10)
+        self.assertEqual(products[0].price, 100.5)
+        self.assertEqual(products[0].delivery_time, 3)
+        self.assertEqual(result.to_dict(), {"total": 2, "inserted": 2, "chunks": 1, "rejected": []})
+
+    def test_process_loads_in_chunks(self):
         # Arrange
-        test_products = [
-            MagicMock(),
-            MagicMock()
+        test_message = [build_row(name=f"Product {i}") for i in range(5)]
+        progress = []
+        use_case = CreateManyProducts(self.repository, chunk_size=2, on_progress=lambda r: progress.append(r.inserted))
+
+        # Act
+        result = use_case.process(test_message)
+
+        # Assert
+        self.assertEqual(self.repository.add_chunk.call_count, 3)
+        self.assertEqual([len(c[0][0]) for c in self.repository.add_chunk.call_args_list], [2, 2, 1])
+        self.assertEqual(progress, [2, 4, 5])
+        self.assertEqual(result.inserted, 5)
+        self.assertEqual(result.chunks, 3)
+
+    def test_process_empty_product_list(self):
+        # Act
+        result = self.use_case.process([])
+
+        # Assert
+        self.repository.add_chunk.assert_not_called()
+        self.assertEqual(result.total, 0)
+
+    @patch('src.application.create_many_products.logger')
+    def test_process_logs_error_when_no_products(self, mock_logger):
+        # Act
+        self.use_case.process([])
+
+        # Assert
+        mock_logger.error.assert_called_once_with("No products found in the message.")
+
+    def test_process_handles_none_message(self):
+        # Act
+        result = self.use_case.process(None)
+
+        # Assert
+        self.repository.add_chunk.assert_not_called()
+        self.assertEqual(result.total, 0)
+
+    def test_process_rejects_invalid_rows(self):
+        # Arrange
+        test_message = [
+            build_row(name="Valid"),
+            build_row(brand=None),
+            build_row(stock="many"),
+            build_row(price="-1"),
+            build_row(manufacturer_id="123"),
+            build_row(details="invalid json {")
         ]
-        mock_mapper.from_json_to_dto_list.return_value = test_products
-        test_message = {"products": [{"name": "Product 1"}, {"name": "Product 2"}]}
 
         # Act
-        self.use_case.process(test_message)
+        result = self.use_case.process(test_message)
 
         # Assert
-        mock_mapper.from_json_to_dto_list.assert_called_once_with(test_message)
-        self.repository.add_all.assert_called_once_with(test_products)
+        self.assertEqual(result.inserted, 1)
+        self.assertEqual([r["row"] for r in result.rejected], [1, 2, 3, 4, 5])
+        self.assertIn("brand", result.rejected[0]["reason"])
 
-    @patch('src.application.create_many_products.ProductsJsonMapper')
-    def test_process_empty_product_list(self, mock_mapper):
+    def test_repository_error_rejects_only_failing_rows(self):
         # Arrange
-        mock_mapper.from_json_to_dto_list.return_value = []
-        test_message = {"products": []}
+        def add_chunk(products):
+            if any(product.name == "Bad" for product in products):
+                raise Exception("Database error")
+            return len(products)
+
+        self.repository.add_chunk.side_effect = add_chunk
+        test_message = [build_row(), build_row(name="Bad"), build_row()]
 
         # Act
-        self.use_case.process(test_message)
+        result = self.use_case.process(test_message)
 
         # Assert
-        mock_mapper.from_json_to_dto_list.assert_called_once_with(test_message)
-        self.repository.add_all.assert_not_called()
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual([r["row"] for r in result.rejected], [1])
+        self.assertEqual(result.rejected[0]["reason"], "Error saving product.")
+        self.assertEqual(result.chunks, 2)
 
-    @patch('src.application.create_many_products.ProductsJsonMapper')
-    @patch('src.application.create_many_products.logging')
-    def test_process_logs_correctly(self, mock_logging, mock_mapper):
+    def test_repository_unavailable_rejects_every_row(self):
         # Arrange
-        test_products = [MagicMock(), MagicMock()]
-        mock_mapper.from_json_to_dto_list.return_value = test_products
-        test_message = {"products": [{"name": "Product 1"}, {"name": "Product 2"}]}
+        self.repository.add_chunk.side_effect = Exception("Database error")
+        test_message = [build_row(), build_row(), build_row()]
 
         # Act
-        self.use_case.process(test_message)
+        result = self.use_case.process(test_message)
 
         # Assert
-        self.assertEqual(mock_logging.debug.call_count, 4)
-        mock_logging.debug.assert_any_call("Begin creating multiple products...")
-        mock_logging.debug.assert_any_call(f"Converting message to product list {test_message}...")
-        mock_logging.debug.assert_any_call(f"Creating {len(test_products)} products...")
-        mock_logging.debug.assert_any_call("End creating multiple products...")
-
-    @patch('src.application.create_many_products.ProductsJsonMapper')
-    @patch('src.application.create_many_products.logging')
-    def test_process_logs_error_when_no_products(self, mock_logging, mock_mapper):
+        self.assertEqual(result.inserted, 0)
+        self.assertEqual([r["row"] for r in result.rejected], [0, 1, 2])
+        self.assertEqual(result.chunks, 2)
+
+    def test_process_rejects_rows_without_details(self):
         # Arrange
-        mock_mapper.from_json_to_dto_list.return_value = []
-        test_message = {"products": []}
+        test_message = [build_row(details=None), build_row(details='{}'), build_row()]
 
         # Act
-        self.use_case.process(test_message)
+        result = self.use_case.process(test_message)
 
         # Assert
-        mock_logging.error.assert_called_once_with("No products found in the message.")
+        self.assertEqual(result.inserted, 1)
+        self.assertEqual([r["row"] for r in result.rejected], [0, 1])
+        self.assertIn("details", result.rejected[0]["reason"])
 
-    @patch('src.application.create_many_products.ProductsJsonMapper')
-    def test_process_handles_none_message(self, mock_mapper):
+    def test_process_import_batch_registers_progress(self):
         # Arrange
-        mock_mapper.from_json_to_dto_list.return_value = []
-        test_message = None
+        import_repository = MagicMock()
+        import_repository.has_batch.return_value = False
+        use_case = CreateManyProducts(self.repository, import_repository, chunk_size=2)
+        test_message = {"importId": "import-1", "sequence": 3, "last": True, "products": [build_row(), build_row()]}
 
         # Act
-        self.use_case.process(test_message)
+        result = use_case.process(test_message)
 
         # Assert
-        mock_mapper.from_json_to_dto_list.assert_called_once_with(None)
-        self.repository.add_all.assert_not_called()
+        self.assertEqual(result.inserted, 2)
+        import_repository.has_batch.assert_called_once_with("import-1", 3)
+        import_repository.register_batch.assert_called_once_with("import-1", 3, True, result)
 
-    @patch('src.application.create_many_products.ProductsJsonMapper')
-    def test_repository_error_propagates(self, mock_mapper):
+    def test_process_redelivered_batch_is_skipped(self):
         # Arrange
-        test_products = [MagicMock()]
-        mock_mapper.from_json_to_dto_list.return_value = test_products
-        self.repository.add_all.side_effect = Exception("Database error")
-        test_message = {"products": [{"name": "Product 1"}]}
+        import_repository = MagicMock()
+        import_repository.has_batch.return_value = True
+        use_case = CreateManyProducts(self.repository, import_repository, chunk_size=2)
+        test_message = {"importId": "import-1", "sequence": 3, "last": True, "products": [build_row(), build_row()]}
 
-        # Act & Assert
-        with self.assertRaises(Exception) as context:
-            self.use_case.process(test_message)
+        # Act
+        result = use_case.process(test_message)
 
-        self.assertEqual(str(context.exception), "Database error")
+        # Assert
+        self.assertEqual(result.total, 0)
+        self.repository.add_chunk.assert_not_called()
+        import_repository.register_batch.assert_not_called()
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,6 +1,10 @@
 from unittest.mock import Mock
 
+import pytest
+
+from src.application.errors.errors import ValidationApiError
 from src.application.get_all_products import GetAllProducts
+from src.domain.entities.page_dto import PageDTO, MAX_PAGE_SIZE
 from src.domain.entities.product_dto import ProductDTO
 
 
@@ -73,3 +77,30 @@ class TestGetAllProducts:
         # Verify result is an empty list
         assert isinstance(result, list)
         assert len(result) == 0
+
+    def test_get_products_page(self):
+        """Test retrieval of a page of products"""
+        self.mock_repository.get_page.return_value = PageDTO(self.sample_products, "next-cursor")
+
+        result = self.get_all_products_use_case.execute_page("2", "cursor")
+
+        self.mock_repository.get_page.assert_called_once_with(2, "cursor")
+        assert result.to_dict()["nextCursor"] == "next-cursor"
+        assert [item["id"] for item in result.to_dict()["items"]] == ["product-1", "product-2"]
+
+    def test_get_products_page_size_is_capped(self):
+        """Test the page size is capped at the maximum page size"""
+        self.mock_repository.get_page.return_value = PageDTO([])
+
+        self.get_all_products_use_case.execute_page("100000", None)
+
+        self.mock_repository.get_page.assert_called_once_with(MAX_PAGE_SIZE, None)
+
+    def test_get_products_page_invalid_request(self):
+        """Test invalid page sizes and cursors are rejected"""
+        self.mock_repository.get_page.side_effect = ValueError("Invalid cursor.")
+
+        with pytest.raises(ValidationApiError):
+            self.get_all_products_use_case.execute_page("0", None)
+        with pytest.raises(ValidationApiError):
+            self.get_all_products_use_case.execute_page("10", "not-a-cursor")
@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+import pytest
+from src.application.errors.errors import ProductImportNotExistsError
+from src.application.get_product_import import GetProductImport
+from src.domain.entities.product_import_dto import ProductImportDTO
+
+
+class TestGetProductImport:
+    def setup_method(self):
+        """Set up test environment before each test method"""
+        self.mock_repository = Mock()
+        self.use_case = GetProductImport(self.mock_repository)
+        self.import_id = "test-import-id-123"
+
+        self.sample_import = ProductImportDTO(
+            id=self.import_id,
+            status="PROCESSING",
+            received_batches=2,
+            total_batches=None,
+            total=1000,
+            inserted=998,
+            rejected=2,
+            rejections=[{"sequence": 0, "row": 4, "reason": "Invalid manufacturer id."}]
+        )
+
+    def test_get_product_import_successfully(self):
+        """Test successful retrieval of a product import"""
+        self.mock_repository.get_by_id.return_value = self.sample_import
+
+        result = self.use_case.execute(self.import_id)
+
+        self.mock_repository.get_by_id.assert_called_once_with(self.import_id)
+        assert result.to_dict()["receivedBatches"] == 2
+        assert result.to_dict()["inserted"] == 998
+
+    def test_get_product_import_not_found(self):
+        """Test error when the product import does not exist"""
+        self.mock_repository.get_by_id.return_value = None
+
+        with pytest.raises(ProductImportNotExistsError):
+            self.use_case.execute(self.import_id)
@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+import pytest
+from src.application.errors.errors import ValidationApiError
+from src.application.get_products_by_ids import GetProductsByIds, MAX_PRODUCT_IDS
+from src.domain.entities.product_dto import ProductDTO
+
+
+class TestGetProductsByIds:
+    def setup_method(self):
+        """Set up test environment before each test method"""
+        self.mock_repository = Mock()
+        self.use_case = GetProductsByIds(self.mock_repository)
+        self.sample_product = ProductDTO(
+            id="product-1",
+            name="Test Product",
+            brand="Test Brand",
+            manufacturer_id="test-manufacturer-id",
+            description="Test Description",
+            stock=10,
+            details={},
+            storage_conditions="Test Storage Conditions",
+            price=100.0,
+            currency="USD",
+            delivery_time=5,
+            images=[]
+        )
+
+    def test_get_products_by_ids_successfully(self):
+        """Test products are retrieved in a single repository call without duplicated IDs"""
+        self.mock_repository.get_by_ids.return_value = [self.sample_product]
+
+        result = self.use_case.execute(["product-1", "product-2", "product-1"])
+
+        self.mock_repository.get_by_ids.assert_called_once_with(["product-1", "product-2"])
+        assert result == [self.sample_product]
+
+    @pytest.mark.parametrize("product_ids", [[], None, "product-1", ["id"] * (MAX_PRODUCT_IDS + 1)])
+    def test_get_products_by_ids_invalid_list(self, product_ids):
+        """Test error when the list of IDs is invalid"""
+        with pytest.raises(ValidationApiError):
+            self.use_case.execute(product_ids)
+
+        self.mock_repository.get_by_ids.assert_not_called()
@@ -0,0 +1,24 @@
+import uuid
+from unittest.mock import Mock
+
+from src.application.start_product_import import StartProductImport
+from src.domain.entities.product_import_dto import ProductImportDTO
+
+
+class TestStartProductImport:
+    def setup_method(self):
+        """Set up test environment before each test method"""
+        self.mock_repository = Mock()
+        self.mock_repository.create.side_effect = lambda import_id: ProductImportDTO(
+            id=import_id, status="PENDING", received_batches=0, total_batches=None, total=0, inserted=0,
+            rejected=0, rejections=[])
+        self.use_case = StartProductImport(self.mock_repository)
+
+    def test_start_product_import(self):
+        """Test that a pending import is created with a new ID"""
+        result = self.use_case.execute()
+
+        import_id = self.mock_repository.create.call_args[0][0]
+        assert uuid.UUID(import_id)
+        assert result.to_dict()["id"] == import_id
+        assert result.to_dict()["status"] == "PENDING"
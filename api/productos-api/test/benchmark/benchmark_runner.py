@@ -0,0 +1,220 @@
+"""
+Measurement helpers of the checkout benchmarks: drive a stage at a given concurrency, time single operations
+with timeit, and write reports that can be compared between runs.
+
+A stage reports the latency percentiles (p50, p95, p99) of its operations and their throughput over the wall
+time of the stage; a micro-benchmark reports the time of a single call. Reports hold the parameters and the
+environment of the run, and compare() flags the stages that got slower than a baseline report.
+
+Each service is built on its own, so the services keep an identical copy of this module in test/benchmark.
+"""
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import timeit
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# Allowed slowdown of a stage before compare() reports it, as a fraction of the baseline
+DEFAULT_TOLERANCE = 0.15
+
+
+def percentile(values: list, fraction: float) -> float | None:
+    """Percentile of sorted values, interpolated between the closest ranks"""
+    if not values:
+        return None
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(latencies: list, failures: int = 0, wall_seconds: float = None) -> dict:
+    """Count, failures, percentiles in milliseconds and throughput of the operations of a stage"""
+    latencies = sorted(latencies)
+
+    def milliseconds(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "operations": len(latencies),
+        "failures": failures,
+        "p50Ms": milliseconds(percentile(latencies, 0.50)),
+        "p95Ms": milliseconds(percentile(latencies, 0.95)),
+        "p99Ms": milliseconds(percentile(latencies, 0.99)),
+        "meanMs": milliseconds(sum(latencies) / len(latencies)) if latencies else None,
+        "maxMs": milliseconds(latencies[-1]) if latencies else None,
+        "wallSeconds": round(wall_seconds, 4) if wall_seconds is not None else None,
+        "throughputPerSecond": round(len(latencies) / wall_seconds, 2) if wall_seconds else None,
+    }
+
+
+def run_stage(operation, inputs: list, concurrency: int = 1, warmup: int = 0) -> dict:
+    """
+    Call an operation once per input from a pool of threads and summarize the calls.
+    The first warmup inputs are run beforehand, sequentially and not measured, to fill the caches and pools.
+
+    Returns:
+        The summary of the measured calls; a call raising an exception counts as a failure
+    """
+    for item in inputs[:warmup]:
+        operation(item)
+    inputs = inputs[warmup:]
+
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+
+    def measured(item):
+        start = time.perf_counter()
+        try:
+            operation(item)
+        except Exception as e:
+            with lock:
+                failures.append(repr(e))
+            return
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        list(executor.map(measured, inputs))
+    summary = summarize(latencies, len(failures), time.perf_counter() - start)
+    if failures:
+        summary["firstFailure"] = failures[0]
+    return summary
+
+
+def micro_benchmark(function, number: int = 1000, repeat: int = 5) -> dict:
+    """
+    Time a function with timeit: repeat rounds of number calls each.
+    The best round is the least disturbed by the rest of the machine, the median shows the spread.
+    """
+    rounds = sorted(timeit.Timer(function).repeat(repeat=repeat, number=number))
+    return {
+        "calls": number * repeat,
+        "bestUs": round(rounds[0] / number * 1e6, 3),
+        "medianUs": round(percentile(rounds, 0.5) / number * 1e6, 3),
+    }
+
+
+def quiet_logging(level: str = "WARNING") -> None:
+    """
+    Keep the records below a level out of the measurements: the modules of the services log their payloads
+    at DEBUG, which would otherwise dominate the timings.
+    """
+    logging.basicConfig(level=level, stream=sys.stderr)
+    logging.disable(logging.getLevelName(level.upper()) - 1)
+
+
+def sqlite_stand_in(metadata, engine) -> None:
+    """
+    Adapt the schema of a service to a SQLite stand-in of PostgreSQL before creating it. The columns take the
+    values PostgreSQL takes and SQLite does not: ids as strings in the uuid columns, which SQLite keeps as text,
+    and ISO 8601 strings in the timestamp columns.
+    """
+    if engine.url.get_backend_name() != "sqlite":
+        return
+    from sqlalchemy import DateTime, String, TypeDecorator, Uuid
+
+    class UuidText(TypeDecorator):
+        impl = String(36)
+        cache_ok = True
+
+        def __init__(self, as_uuid: bool = True):
+            super().__init__()
+            self.as_uuid = as_uuid
+
+        def process_bind_param(self, value, dialect):
+            return str(value) if value is not None else None
+
+        def process_result_value(self, value, dialect):
+            return uuid.UUID(value) if value is not None and self.as_uuid else value
+
+    class IsoDateTime(TypeDecorator):
+        impl = DateTime
+        cache_ok = True
+
+        def process_bind_param(self, value, dialect):
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+    for table in metadata.tables.values():
+        for column in table.columns:
+            if isinstance(column.type, Uuid):
+                column.type = UuidText(column.type.as_uuid)
+            elif isinstance(column.type, DateTime):
+                column.type = IsoDateTime(timezone=column.type.timezone)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> dict:
+    """What a result depends on besides the code: the interpreter, the machine and the commit"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": _git_commit(),
+    }
+
+
+def report(service: str, parameters: dict, stages: dict, micro: dict = None) -> dict:
+    return {
+        "service": service,
+        "createdAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "parameters": parameters,
+        "environment": environment(),
+        "stages": stages,
+        "micro": micro or {},
+    }
+
+
+def write_report(data: dict, path: str = None) -> None:
+    """Write a report to a file, or to stdout without a path"""
+    text = json.dumps(data, indent=2)
+    if path:
+        with open(path, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+def compare(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """
+    Stages and micro-benchmarks slower than in a baseline report by more than the tolerance: a higher p95 or a
+    lower throughput for the stages, a higher best time for the micro-benchmarks.
+    Results of runs with other parameters are not comparable and are reported as such.
+    """
+    if current.get("parameters") != baseline.get("parameters"):
+        return [f"parameters differ from the baseline: {current.get('parameters')} != {baseline.get('parameters')}"]
+
+    regressions = []
+    for name, stage in current.get("stages", {}).items():
+        before = baseline.get("stages", {}).get(name)
+        if not before:
+            continue
+        if stage.get("p95Ms") and before.get("p95Ms") and stage["p95Ms"] > before["p95Ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95Ms']} ms -> {stage['p95Ms']} ms")
+        if (stage.get("throughputPerSecond") and before.get("throughputPerSecond")
+                and stage["throughputPerSecond"] < before["throughputPerSecond"] * (1 - tolerance)):
+            regressions.append(f"{name}: throughput {before['throughputPerSecond']}/s -> "
+                               f"{stage['throughputPerSecond']}/s")
+    for name, result in current.get("micro", {}).items():
+        before = baseline.get("micro", {}).get(name)
+        if before and result["bestUs"] > before["bestUs"] * (1 + tolerance):
+            regressions.append(f"{name}: {before['bestUs']} us -> {result['bestUs']} us")
+    return regressions
@@ -0,0 +1,129 @@
+"""
+Benchmark of the stock update messages in productos-api: the ProcessUpdateProductsStockMessage use case (one
+locked batch decrement per message) at a given concurrency, as the consumer runs it, plus micro-benchmarks of
+the product mapper and the inserts of products.
+
+The messages are read from the file written by the checkout benchmark of clientes-api, or generated from the
+seed; the products they update are created beforehand with enough stock for every message. The database is a
+SQLite file unless --database-url points to PostgreSQL.
+
+Run from the root of the service:
+    python -m test.benchmark.stock_update_benchmark --messages messages.json --output productos.json
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import uuid
+
+from .benchmark_runner import micro_benchmark, quiet_logging, report, run_stage, sqlite_stand_in, write_report
+
+UPDATE_STOCK_EXCHANGE = "update_stock_exchange"
+# Stock of every product, more than the messages of a run decrease
+INITIAL_STOCK = 10 ** 9
+
+
+def stock_messages(seed: int, count: int, products: int, lines: int) -> list[dict]:
+    """Stock update messages as published by clientes-api, generated from the seed"""
+    generator = random.Random(seed)
+    catalog = [str(uuid.UUID(int=generator.getrandbits(128), version=4)) for _ in range(products)]
+    return [{"products": [{"productId": product_id, "quantity": generator.randint(1, 3)}
+                          for product_id in generator.sample(catalog, min(lines, products))]}
+            for _ in range(count)]
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", help="File of messages by exchange, written by the clientes-api benchmark")
+    parser.add_argument("--orders", type=int, default=500, help="Messages generated without a messages file")
+    parser.add_argument("--concurrency", type=int, default=8, help="Messages processed at the same time")
+    parser.add_argument("--warmup", type=int, default=20, help="Messages processed before measuring")
+    parser.add_argument("--lines", type=int, default=3, help="Products per generated message")
+    parser.add_argument("--products", type=int, default=200, help="Products of the generated catalog")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="Database of the benchmark, a new SQLite file by default")
+    parser.add_argument("--number", type=int, default=1000, help="Calls per round of the micro-benchmarks")
+    parser.add_argument("--output", help="File to write the report to, stdout by default")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> dict:
+    arguments = parse_arguments(argv)
+    quiet_logging(arguments.log_level)
+    # The engine of the service is created from the environment when its modules are imported
+    directory = tempfile.mkdtemp(prefix="productos-benchmark-")
+    os.environ["DATABASE_URL"] = arguments.database_url or f"sqlite:///{directory}/productos.db"
+    os.environ.setdefault("DB_POOL_SIZE", str(arguments.concurrency))
+
+    from src.application.process_update_products_stock_message import ProcessUpdateProductsStockMessage
+    from src.domain.entities.product_dto import ProductDTO
+    from src.domain.entities.stock_adjustment_result_dto import StockAdjustmentStatusEnum
+    from src.infrastructure.adapters.product_adapter import ProductAdapter
+    from src.infrastructure.dao.product_dao import ProductDAO
+    from src.infrastructure.database.declarative_base import Base, engine, unit_of_work
+    from src.infrastructure.mapper.product_mapper import ProductMapper
+
+    if arguments.messages:
+        with open(arguments.messages) as file:
+            messages = json.load(file)[UPDATE_STOCK_EXCHANGE]
+    else:
+        messages = stock_messages(arguments.seed, arguments.orders + arguments.warmup, arguments.products,
+                                  arguments.lines)
+
+    def product(product_id: uuid.UUID):
+        return ProductDTO(id=product_id, name=f"Producto {product_id.hex[:8]}", brand="Marca",
+                          manufacturer_id=uuid.UUID(int=1), description="Producto del benchmark",
+                          stock=INITIAL_STOCK, details={"peso": "1 kg"}, storage_conditions="Ambiente",
+                          price=10.0, currency="USD", delivery_time=3, images=["https://example.com/1.png"])
+
+    sqlite_stand_in(Base.metadata, engine)
+    Base.metadata.create_all(engine)
+    try:
+        adapter = ProductAdapter()
+        product_ids = sorted({line["productId"] for message in messages for line in message["products"]})
+        adapter.add_chunk([product(uuid.UUID(product_id)) for product_id in product_ids])
+        processor = ProcessUpdateProductsStockMessage(adapter)
+
+        def process(message):
+            with unit_of_work():
+                results = processor.process(message)
+            rejected = [result for result in results if result.status != StockAdjustmentStatusEnum.UPDATED]
+            if rejected:
+                raise RuntimeError(f"Stock not updated: {rejected[0].status.value}")
+
+        stages = {
+            "productos.update_stock_message": run_stage(process, messages, arguments.concurrency,
+                                                        min(arguments.warmup, len(messages) // 2)),
+        }
+
+        # Micro-benchmarks on a product of the run
+        sample = ProductMapper.to_dto(ProductDAO.find_by_id(product_ids[0]))
+
+        def new_product():
+            return product(uuid.uuid4())
+
+        micro = {
+            "productos.product_mapper.to_domain": micro_benchmark(lambda: ProductMapper.to_domain(sample),
+                                                                  arguments.number),
+            "productos.product_mapper.to_row": micro_benchmark(lambda: ProductMapper.to_row(sample),
+                                                               arguments.number),
+            "productos.product_dao.save": micro_benchmark(
+                lambda: ProductDAO.save(ProductMapper.to_domain(new_product())), max(arguments.number // 10, 1)),
+            "productos.product_dao.bulk_insert_100": micro_benchmark(
+                lambda: ProductDAO.bulk_insert([ProductMapper.to_row(new_product()) for _ in range(100)]),
+                max(arguments.number // 100, 1)),
+        }
+    finally:
+        engine.dispose()
+
+    parameters = {key: getattr(arguments, key) for key in ("concurrency", "warmup", "seed", "number")}
+    parameters.update(messages=len(messages), database=engine.url.get_backend_name())
+    result = report("productos-api", parameters, stages, micro)
+    write_report(result, arguments.output)
+    return result
+
+
+if __name__ == "__main__":
+    main()
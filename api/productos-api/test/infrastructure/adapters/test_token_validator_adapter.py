@@ -0,0 +1,176 @@
+import time
+
+import jwt
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from src.domain.exceptions.authentication_error import AuthenticationError
+from src.infrastructure.adapters.token_validator_adapter import TokenValidatorAdapter
+from src.infrastructure.monitoring.metrics import Registry
+
+SECRET_KEY = "test-secret-key-for-token-validation"
+USER_DATA = {"id": "u1", "name": "Test User", "phone": "123", "email": "user@test.com", "role": "CLIENTE"}
+
+
+def build_token(exp_offset=1800, secret=SECRET_KEY):
+    now = int(time.time())
+    payload = {"iat": now, "exp": now + exp_offset, "email": USER_DATA["email"], "role": USER_DATA["role"]}
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+def ok_response():
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = dict(USER_DATA)
+    return response
+
+
+class TestTokenValidatorAdapter:
+    """Test suite for TokenValidatorAdapter"""
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_remote_without_secret_key(self, mock_get):
+        """Test every token is validated remotely when no signing key is configured"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users")
+
+        adapter.validate_token("token")
+        result = adapter.validate_token("token")
+
+        assert result == USER_DATA
+        assert mock_get.call_count == 2
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_uses_cache(self, mock_get):
+        """Test a verified token is only validated remotely once"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+        token = build_token()
+
+        first = adapter.validate_token(token)
+        second = adapter.validate_token(token)
+
+        assert first == second == USER_DATA
+        mock_get.assert_called_once()
+        assert adapter.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_invalid_signature(self, mock_get):
+        """Test a token signed with another key is rejected without remote call"""
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(build_token(secret="other-secret-key-for-token-validation"))
+
+        mock_get.assert_not_called()
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_expired(self, mock_get):
+        """Test an expired token is rejected without remote call"""
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(build_token(exp_offset=-10))
+
+        mock_get.assert_not_called()
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_cache_expires(self, mock_get):
+        """Test cached entries expire after the configured ttl"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY, cache_ttl=60)
+        token = build_token()
+        now = time.time()
+
+        with patch('src.infrastructure.adapters.token_validator_adapter.time') as mock_time:
+            mock_time.time.return_value = now
+            adapter.validate_token(token)
+            mock_time.time.return_value = now + 61
+            adapter.validate_token(token)
+
+        assert mock_get.call_count == 2
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_evicts_least_recently_used(self, mock_get):
+        """Test the cache never grows beyond its size"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY, cache_size=2)
+
+        for offset in (1000, 1001, 1002):
+            adapter.validate_token(build_token(exp_offset=offset))
+
+        assert adapter.stats()['size'] == 2
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_revoke_user(self, mock_get):
+        """Test revoked users are validated remotely again"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+        token = build_token()
+
+        adapter.validate_token(token)
+        adapter.revoke_user(USER_DATA["email"])
+        mock_get.return_value.status_code = 404
+
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(token)
+        assert adapter.stats()['size'] == 0
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_rejected_token_revokes_user(self, mock_get):
+        """Test a token rejected by the users API revokes the other cached tokens of the user"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+        cached = build_token(exp_offset=1000)
+        adapter.validate_token(cached)
+        mock_get.return_value.status_code = 404
+
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(build_token(exp_offset=1001))
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(cached)
+
+        assert mock_get.call_count == 3
+        assert adapter.stats()['size'] == 0
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_unavailable_users_api_keeps_cached_tokens(self, mock_get):
+        """Test an error of the users API does not revoke the cached tokens of the user"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+        cached = build_token(exp_offset=1000)
+        adapter.validate_token(cached)
+        mock_get.return_value.status_code = 503
+
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(build_token(exp_offset=1001))
+
+        assert adapter.validate_token(cached) == USER_DATA
+        assert adapter.stats()['size'] == 1
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_register_metrics(self, mock_get):
+        """Test the cache counters are published as metrics"""
+        mock_get.return_value = ok_response()
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+        registry = Registry()
+        adapter.register_metrics(registry)
+        token = build_token()
+
+        adapter.validate_token(token)
+        adapter.validate_token(token)
+        output = registry.render()
+
+        assert "auth_token_cache_hits_total 1" in output
+        assert "auth_token_cache_misses_total 1" in output
+        assert "auth_token_cache_entries 1" in output
+
+    @patch('src.infrastructure.adapters.token_validator_adapter.requests.get')
+    def test_validate_token_connection_error(self, mock_get):
+        """Test connection errors are raised as authentication errors"""
+        mock_get.side_effect = requests.RequestException("boom")
+        adapter = TokenValidatorAdapter("http://users", secret_key=SECRET_KEY)
+
+        with pytest.raises(AuthenticationError):
+            adapter.validate_token(build_token())
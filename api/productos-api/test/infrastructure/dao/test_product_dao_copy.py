@@ -0,0 +1,38 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.infrastructure.dao.product_dao import ProductDAO
+
+
+class TestProductDAOCopy(unittest.TestCase):
+    """Rows written for the PostgreSQL COPY of a products chunk"""
+
+    def test_to_copy_value(self):
+        self.assertEqual(ProductDAO._to_copy_value(None, False), '')
+        self.assertEqual(ProductDAO._to_copy_value('', False), '""')
+        self.assertEqual(ProductDAO._to_copy_value('Say "hi", bye', False), '"Say ""hi"", bye"')
+        self.assertEqual(ProductDAO._to_copy_value(10.5, False), '"10.5"')
+        self.assertEqual(ProductDAO._to_copy_value(datetime(2024, 1, 2, 3, 4, 5), False), '"2024-01-02T03:04:05"')
+        self.assertEqual(ProductDAO._to_copy_value({"temperature": "cold"}, True), '"{""temperature"": ""cold""}"')
+
+    def test_copy_rows_keeps_empty_strings_apart_from_nulls(self):
+        # Arrange
+        session = MagicMock()
+        cursor = session.connection.return_value.connection.cursor.return_value
+        copied = {}
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(sql=sql, data=buffer.read())
+        rows = [{"name": "Product", "description": "", "updatedAt": None, "images": ["a.png"]}]
+
+        # Act
+        ProductDAO._copy_rows(session, rows)
+
+        # Assert
+        self.assertEqual(copied["sql"], 'COPY products ("name", "description", "updatedAt", "images") '
+                                         'FROM STDIN WITH (FORMAT csv)')
+        self.assertEqual(copied["data"], '"Product","",,"[""a.png""]"\n')
+        cursor.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
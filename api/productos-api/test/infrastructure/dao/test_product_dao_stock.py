@@ -0,0 +1,96 @@
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import text
+
+from src.domain.entities.stock_adjustment_result_dto import StockAdjustmentStatusEnum
+from src.infrastructure.dao.product_dao import ProductDAO
+from src.infrastructure.database.declarative_base import Base, Session, engine
+from src.infrastructure.model.product_model import ProductModel
+
+
+def build_product(product_id, stock):
+    return ProductModel(id=product_id, name=f"Product {stock}", brand="Brand", description="Description",
+                        stock=stock, details="Details", storage_conditions={}, price=10.0, currency="COP",
+                        delivery_time=2, manufacturer_id=uuid.uuid4(), images=[])
+
+
+class TestProductDAODecreaseStock(unittest.TestCase):
+    """Batched stock decrement, on a real database"""
+
+    def setUp(self):
+        tables = [ProductModel.__table__]
+        Base.metadata.drop_all(engine, tables=tables)
+        Base.metadata.create_all(engine, tables=tables)
+        self.first, self.second, self.short = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        with Session() as session:
+            session.add_all([build_product(self.first, 10), build_product(self.second, 5),
+                             build_product(self.short, 1)])
+            session.commit()
+
+    def tearDown(self):
+        with engine.begin() as connection:
+            connection.execute(text("DROP TRIGGER IF EXISTS fail_stock_update"))
+
+    def stock(self, product_id):
+        with Session() as session:
+            return session.get(ProductModel, product_id).stock
+
+    def test_decreases_the_batch_in_one_commit(self):
+        sessions = []
+
+        def open_session():
+            session = Session()
+            session.commit = MagicMock(wraps=session.commit)
+            sessions.append(session)
+            return session
+
+        # Act
+        with patch('src.infrastructure.dao.product_dao.Session', side_effect=open_session):
+            results = ProductDAO.decrease_stock({str(self.first): 3, str(self.second): 5})
+
+        # Assert
+        self.assertEqual(len(sessions), 1)
+        sessions[0].commit.assert_called_once()
+        self.assertEqual([result.status for result in results],
+                         [StockAdjustmentStatusEnum.UPDATED, StockAdjustmentStatusEnum.UPDATED])
+        self.assertEqual([result.stock for result in results], [7, 0])
+        self.assertEqual(self.stock(self.first), 7)
+        self.assertEqual(self.stock(self.second), 0)
+
+    def test_reports_insufficient_stock_and_unknown_products_per_item(self):
+        unknown = str(uuid.uuid4())
+
+        # Act
+        results = ProductDAO.decrease_stock({str(self.first): 4, str(self.short): 2, unknown: 1, "not-a-uuid": 1})
+
+        # Assert
+        self.assertEqual([(result.product_id, result.status, result.stock) for result in results], [
+            (str(self.first), StockAdjustmentStatusEnum.UPDATED, 6),
+            (str(self.short), StockAdjustmentStatusEnum.INSUFFICIENT_STOCK, 1),
+            (unknown, StockAdjustmentStatusEnum.NOT_FOUND, None),
+            ("not-a-uuid", StockAdjustmentStatusEnum.NOT_FOUND, None),
+        ])
+        self.assertEqual(self.stock(self.first), 6)
+        self.assertEqual(self.stock(self.short), 1)
+
+    def test_failure_rolls_the_batch_back(self):
+        # Arrange: the update of the second product fails after the first one was applied
+        second_id = ProductModel.__table__.c.id.type.bind_processor(engine.dialect)(self.second)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TRIGGER fail_stock_update BEFORE UPDATE ON products "
+                f"WHEN NEW.id = '{second_id}' BEGIN SELECT RAISE(ABORT, 'stock update failed'); END"))
+
+        # Act
+        with self.assertRaises(Exception):
+            ProductDAO.decrease_stock({str(self.first): 3, str(self.second): 2})
+
+        # Assert
+        self.assertEqual(self.stock(self.first), 10)
+        self.assertEqual(self.stock(self.second), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
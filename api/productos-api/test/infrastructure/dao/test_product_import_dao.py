@@ -0,0 +1,70 @@
+import unittest
+
+from src.domain.entities.product_import_result_dto import ProductImportResultDTO
+from src.infrastructure.dao.product_import_dao import ProductImportDAO
+from src.infrastructure.database.declarative_base import Base, engine
+from src.infrastructure.model.product_import_model import ProductImportModel, ProductImportBatchModel, \
+    ProductImportStatusEnum
+
+
+def batch_result(total, inserted):
+    result = ProductImportResultDTO()
+    result.total = total
+    result.inserted = inserted
+    return result
+
+
+class TestProductImportDAO(unittest.TestCase):
+
+    def setUp(self):
+        tables = [ProductImportModel.__table__, ProductImportBatchModel.__table__]
+        Base.metadata.drop_all(engine, tables=tables)
+        Base.metadata.create_all(engine, tables=tables)
+
+    def test_create_pending_import(self):
+        # Act
+        ProductImportDAO.create("import-1")
+
+        # Assert
+        product_import = ProductImportDAO.find_by_id("import-1")
+        self.assertEqual(product_import.status, ProductImportStatusEnum.PENDING)
+        self.assertEqual(product_import.received_batches, 0)
+        self.assertIsNone(product_import.total_batches)
+
+    def test_redelivered_batch_is_counted_once(self):
+        # Arrange
+        ProductImportDAO.create("import-1")
+
+        # Act
+        first = ProductImportDAO.register_batch("import-1", 0, False, batch_result(10, 10))
+        again = ProductImportDAO.register_batch("import-1", 0, False, batch_result(10, 10))
+
+        # Assert
+        self.assertTrue(first)
+        self.assertFalse(again)
+        self.assertTrue(ProductImportDAO.has_batch("import-1", 0))
+        self.assertFalse(ProductImportDAO.has_batch("import-1", 1))
+        product_import = ProductImportDAO.find_by_id("import-1")
+        self.assertEqual(product_import.status, ProductImportStatusEnum.PROCESSING)
+        self.assertEqual(product_import.received_batches, 1)
+        self.assertEqual(product_import.total, 10)
+        self.assertEqual(product_import.inserted, 10)
+
+    def test_completed_after_every_batch(self):
+        # Act
+        ProductImportDAO.register_batch("import-1", 1, True, batch_result(5, 5))
+        ProductImportDAO.register_batch("import-1", 1, True, batch_result(5, 5))
+        waiting = ProductImportDAO.find_by_id("import-1")
+        ProductImportDAO.register_batch("import-1", 0, False, batch_result(10, 9))
+
+        # Assert
+        self.assertEqual(waiting.status, ProductImportStatusEnum.PROCESSING)
+        product_import = ProductImportDAO.find_by_id("import-1")
+        self.assertEqual(product_import.status, ProductImportStatusEnum.COMPLETED)
+        self.assertEqual(product_import.received_batches, 2)
+        self.assertEqual(product_import.total_batches, 2)
+        self.assertEqual(product_import.inserted, 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
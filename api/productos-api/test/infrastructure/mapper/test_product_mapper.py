@@ -149,4 +149,18 @@ class TestProductMapper:
 
         # Assert
         assert model.details is None
-        assert dto.details is None
\ No newline at end of file
+        assert dto.details is None
+    def test_to_row_list(self, product_dto):
+        # Arrange
+        product_dto.id = None
+
+        # Act
+        rows = ProductMapper.to_row_list([product_dto])
+
+        # Assert
+        assert len(rows) == 1
+        assert isinstance(rows[0]['id'], uuid.UUID)
+        assert rows[0]['details'] == json.dumps(product_dto.details)
+        assert rows[0]['manufacturer_id'] == product_dto.manufacturer_id
+        assert rows[0]['createdAt'] is not None
+        assert set(rows[0].keys()) == set(ProductModel.__table__.columns.keys())
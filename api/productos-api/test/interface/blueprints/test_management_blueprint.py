@@ -17,3 +17,21 @@ class TestManagementBlueprint:
 
         assert response.status_code == 200
         assert data['status'] == 'UP'
+
+    def test_database_pool(self, client):
+        response = client.get('/health/database')
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data['checkouts'] >= 0
+        assert 'saturation' in data
+
+    def test_metrics(self, client):
+        client.get('/health')
+        response = client.get('/metrics')
+        body = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        assert 'http_server_request_duration_seconds_count{method="GET",route="/health",status="200"}' in body
+        assert '# TYPE db_pool_checkouts_total counter' in body
@@ -125,6 +125,29 @@ class TestProductsBlueprint:
         assert isinstance(data, list)
         assert len(data) == 0
 
+    @patch('src.interface.blueprints.products_blueprint.GetAllProducts')
+    @patch('src.interface.decorator.token_decorator.container')
+    def test_get_products_not_modified(self, mock_container, mock_get_products, client):
+        # Mock token validation
+        mock_auth_service = Mock()
+        mock_auth_service.validate_token.return_value = {"role": "CLIENTE", "user_id": "test-user"}
+        mock_container.token_validator = mock_auth_service
+
+        mock_use_case_instance = Mock()
+        mock_use_case_instance.execute.return_value = []
+        mock_get_products.return_value = mock_use_case_instance
+
+        # First request returns the ETag of the listing
+        response = client.get('/api/v1/products/', headers=self.auth_header)
+        etag = response.headers['ETag']
+
+        # Revalidating with the same ETag returns no body
+        response = client.get('/api/v1/products/', headers={**self.auth_header, 'If-None-Match': etag})
+
+        assert etag
+        assert response.status_code == 304
+        assert response.data == b''
+
     # GET PRODUCT BY ID TESTS
     @patch('src.interface.blueprints.products_blueprint.GetProductById')
     @patch('src.interface.decorator.token_decorator.container')
@@ -0,0 +1,26 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.interface.consumer.create_many_products_consumer import CreateManyProductsConsumer
+
+
+class TestCreateManyProductsConsumer(unittest.TestCase):
+
+    def setUp(self):
+        with patch('src.interface.consumer.create_many_products_consumer.ProductAdapter'), \
+                patch('src.interface.consumer.create_many_products_consumer.ProductImportAdapter'), \
+                patch('src.interface.consumer.create_many_products_consumer.RabbitMQMessagingPortAdapter'):
+            self.consumer = CreateManyProductsConsumer()
+        self.consumer.processor = MagicMock()
+
+    def test_process_message_raises_when_processing_fails(self):
+        self.consumer.processor.process.side_effect = Exception("Database error")
+
+        with self.assertRaises(Exception):
+            self.consumer.process_message({"importId": "1", "products": []})
+
+        self.consumer.messaging_port.send_message.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
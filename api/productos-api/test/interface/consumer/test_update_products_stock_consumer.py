@@ -0,0 +1,54 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.interface.consumer.update_products_stock_consumer import UpdateProductsStockConsumer
+from src.infrastructure.messaging.rabbitmq_consumer_runtime import RETRIES_HEADER, RabbitMQConsumerRuntime
+from ...infrastructure.messaging.in_memory_broker import InMemoryBroker, InMemoryConnection
+from ...infrastructure.messaging.test_rabbitmq_consumer_runtime import wait_until
+
+
+class TestUpdateProductsStockConsumer(unittest.TestCase):
+
+    def setUp(self):
+        with patch('src.interface.consumer.update_products_stock_consumer.ProductAdapter'), \
+                patch('src.interface.consumer.update_products_stock_consumer.RabbitMQMessagingPortAdapter'):
+            self.consumer = UpdateProductsStockConsumer()
+        self.consumer.processor = MagicMock()
+        self.runtime = None
+
+    def tearDown(self):
+        if self.runtime:
+            self.runtime.stop(timeout=5)
+
+    def test_process_message_raises_when_processing_fails(self):
+        self.consumer.processor.process.side_effect = Exception("Database error")
+
+        with self.assertRaises(Exception):
+            self.consumer.process_message({"products": []})
+
+        self.consumer.messaging_port.send_message.assert_not_called()
+
+    def test_failed_stock_update_is_retried_then_dead_lettered(self):
+        self.consumer.processor.process.side_effect = Exception("Database error")
+        broker = InMemoryBroker()
+        connection_manager = MagicMock()
+        connection_manager.get_connection.return_value = InMemoryConnection(broker)
+        message = {"products": [{"productId": "1", "quantity": 2}]}
+        broker.publish("update_stock_queue", json.dumps(message))
+
+        self.runtime = RabbitMQConsumerRuntime(connection_manager, "update_stock_queue",
+                                               self.consumer.process_message, workers=1, max_retries=2)
+        self.runtime.start()
+
+        wait_until(lambda: self.runtime.stats.dead_lettered == 1)
+        self.assertEqual(self.consumer.processor.process.call_count, 3)
+        self.assertEqual(self.runtime.stats.retried, 2)
+        properties, body = broker.messages("update_stock_queue.dead-letter")[0]
+        self.assertEqual(json.loads(body), message)
+        self.assertEqual(properties.headers[RETRIES_HEADER], 2)
+        self.assertEqual(broker.messages("update_stock_queue"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import importlib.util
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src import main
+
+CONFIG_PATH = Path(__file__).parent.parent / 'gunicorn.conf.py'
+
+
+def load_config():
+    spec = importlib.util.spec_from_file_location('gunicorn_conf', CONFIG_PATH)
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    return config
+
+
+class TestGunicornConf(unittest.TestCase):
+
+    def setUp(self):
+        self.config = load_config()
+        self.server = MagicMock()
+        self.server.cfg.graceful_timeout = self.config.graceful_timeout
+
+    def test_workers_do_not_follow_the_cores_of_the_node(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('GUNICORN_WORKERS', None)
+            with patch('os.cpu_count', return_value=64):
+                config = load_config()
+
+        self.assertEqual(config.workers, 2)
+
+    @patch.dict(os.environ, {'GUNICORN_WORKERS': '5'})
+    def test_workers_from_environment(self):
+        self.assertEqual(load_config().workers, 5)
+
+    @patch.dict(os.environ, {}, clear=False)
+    @patch('src.main.create_schema')
+    def test_on_starting_creates_schema_and_flags_the_workers(self, mock_create_schema):
+        os.environ.pop('SCHEMA_CREATED', None)
+
+        self.config.on_starting(self.server)
+
+        mock_create_schema.assert_called_once()
+        self.assertEqual(os.environ['SCHEMA_CREATED'], 'true')
+
+    @patch.dict(os.environ, {'SCHEMA_CREATED': 'true'})
+    @patch('src.main.threading.Thread')
+    @patch('src.main.create_schema')
+    def test_create_app_skips_schema_created_by_the_master(self, mock_create_schema, mock_thread):
+        main.create_app()
+
+        mock_create_schema.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=False)
+    @patch('src.main.threading.Thread')
+    @patch('src.main.create_schema')
+    def test_create_app_creates_schema_without_server(self, mock_create_schema, mock_thread):
+        os.environ.pop('SCHEMA_CREATED', None)
+
+        main.create_app()
+
+        mock_create_schema.assert_called_once()
+
+    @patch('src.main.shutdown')
+    def test_worker_exit_shuts_down_within_graceful_timeout(self, mock_shutdown):
+        self.config.worker_exit(self.server, MagicMock())
+
+        mock_shutdown.assert_called_once_with(self.config.graceful_timeout)
+
+    @patch('src.main.engine')
+    @patch('src.main.stop_consumers')
+    def test_shutdown_gives_its_timeout_to_the_consumers(self, mock_stop_consumers, mock_engine):
+        main.shutdown(12)
+
+        mock_stop_consumers.assert_called_once_with(12)
+        mock_engine.dispose.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
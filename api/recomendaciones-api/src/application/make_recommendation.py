@@ -4,11 +4,6 @@ import logging
 from ..domain.entities.recommentation_result_dto import RecommendationResultDTO
 from ..domain.service.calculation_sales_service import CalculationSalesService
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 
@@ -6,8 +6,16 @@ from ...domain.exceptions.authentication_error import AuthenticationError
 from ...domain.exceptions.recommendation_error import RecommendationError
 from ...application.errors.errors import ApiError
 
+
+def _get_container() -> DependencyContainer:
+    """Container of the app, built once for an app created without one so its token cache is kept"""
+    if not hasattr(current_app, 'container'):
+        current_app.container = DependencyContainer()
+    return current_app.container
+
+
 # Create a proxy to access the dependency container
-container = LocalProxy(lambda: current_app.container if hasattr(current_app, 'container') else DependencyContainer())
+container = LocalProxy(_get_container)
 
 
 def token_required(authorized_roles=None):
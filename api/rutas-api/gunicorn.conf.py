@@ -0,0 +1,61 @@
+"""
+Gunicorn settings of a service, tunable from the environment.
+
+Every worker calls create_app after the fork (preload_app stays off), so the RabbitMQ consumers, outbox
+relay, worker pools and connections started by create_app belong to a single process instead of being shared
+by all of them. The master imports src.main too, to create the schema once so the workers do not race to
+create the same tables, so the import-time side effects of src.main and of the modules it imports, such as
+creating the database engine, also run in the master; it disposes of its connections before forking and then
+sets SCHEMA_CREATED, inherited by the workers, so their create_app skips the schema.
+
+Every worker holds its own database and RabbitMQ pools and starts its own background work, so the number of
+workers is fixed instead of following the cores of the node, which in a container are not those of its
+CPU limit.
+
+On shutdown a worker stops accepting connections, finishes the requests in progress within
+GUNICORN_GRACEFUL_TIMEOUT seconds and then releases its resources through src.main.shutdown, which waits for
+its background work for GUNICORN_GRACEFUL_TIMEOUT seconds at most in total.
+
+Each service is built on its own, so the services keep an identical copy of this file next to their Dockerfile.
+
+Environment:
+    PORT: Port to listen on, 5000 by default
+    GUNICORN_WORKERS: Worker processes, 2 by default
+    GUNICORN_THREADS: Threads serving requests in each worker
+    GUNICORN_TIMEOUT: Seconds a request may take before its worker is restarted
+    GUNICORN_GRACEFUL_TIMEOUT: Seconds the workers have to finish their requests on shutdown
+    GUNICORN_MAX_REQUESTS: Requests served by a worker before it is replaced, 0 to never replace it
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
+
+
+def on_starting(server):
+    """Create the schema in the master, before any worker starts"""
+    from src import main
+    create_schema = getattr(main, 'create_schema', None)
+    if create_schema:
+        create_schema()
+        os.environ['SCHEMA_CREATED'] = 'true'
+
+
+def worker_exit(server, worker):
+    """Stop the background work of the worker and close its connections, within the graceful timeout"""
+    from src import main
+    shutdown = getattr(main, 'shutdown', None)
+    if shutdown:
+        shutdown(server.cfg.graceful_timeout)
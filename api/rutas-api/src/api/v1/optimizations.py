@@ -58,3 +58,9 @@ def optimize_route(route_id):
         return jsonify({"error": f"Route with ID {route_id} not found"}), 404
     except OptimizationError as e:
         return jsonify({"error": str(e)}), 400
+
+
+@optimizations_blueprint.route('/optimizations/matrix-cache', methods=['GET'])
+def matrix_cache_stats():
+    """Hit rate of the distance matrix cache and upstream calls it saved."""
+    return jsonify(current_app.openroute_client.matrix_cache.stats.to_dict())
@@ -1,9 +1,8 @@
 from flask import Blueprint, request, jsonify, current_app
 from uuid import UUID
-import logging
+from ...application.utils.structured_logging import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger = get_logger(__name__)
 
 from ...application.commands.create_route_command import CreateRouteCommand
 from ...application.commands.update_route_command import UpdateRouteCommand
@@ -41,6 +40,16 @@ def list_routes():
     logger.debug("initializing GetRouteQuery with route repository")
     query = GetRouteQuery(route_repository=current_app.route_repository)
 
+    if request.args.get('view') == 'summary':
+        logger.debug("executing query to fetch a page of route summaries")
+        result = query.execute_summary_page(request.args.get('limit'), request.args.get('cursor'), user_id, due_to)
+        return jsonify(result)
+
+    if 'limit' in request.args or 'cursor' in request.args:
+        logger.debug("executing query to fetch a page of routes")
+        result = query.execute_page(request.args.get('limit'), request.args.get('cursor'), user_id, due_to)
+        return jsonify(result)
+
     logger.debug("executing query to fetch routes")
     result = query.execute_list(user_id=user_id, due_to=due_to)
 
@@ -1,11 +1,10 @@
-import logging
 from typing import Dict, Any, List
 from uuid import UUID
 
 from ...domain.entities.route import Route
+from ..utils.structured_logging import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger = get_logger(__name__)
 from ...domain.entities.waypoint import Waypoint
 from ...domain.services.route_service import RouteService
 from ...domain.repositories.route_repository import RouteRepository
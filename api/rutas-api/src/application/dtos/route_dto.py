@@ -1,13 +1,13 @@
 from typing import Dict, Any, List
 from uuid import UUID
 import json
-import logging
 
 from ...domain.entities.route import Route
+from ...domain.entities.route_summary import RouteSummary
 from ...domain.exceptions.domain_exceptions import InvalidRouteError, InvalidWaypointError
+from ..utils.structured_logging import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger = get_logger(__name__)
 
 
 def validate_route_dto(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -25,9 +25,9 @@ def validate_route_dto(data: Dict[str, Any]) -> Dict[str, Any]:
         InvalidWaypointError: If waypoint data is invalid
     """
     logger.debug("starting route validation")
-    logger.debug(f"validating data type: {type(data)}")
+    logger.debug("validating data type: %s", type(data))
     if not isinstance(data, dict):
-        logger.debug(f"invalid data type, expected dict, got: {type(data)}")
+        logger.debug("invalid data type, expected dict, got: %s", type(data))
         raise InvalidRouteError("Invalid route datatype. Must be a dictionary")
 
     # Validate required fields
@@ -38,7 +38,7 @@ def validate_route_dto(data: Dict[str, Any]) -> Dict[str, Any]:
 
     logger.debug("validating name field type and content")
     if not isinstance(data['name'], str) or not data['name'].strip():
-        logger.debug(f"invalid name field: {data.get('name')}")
+        logger.debug("invalid name field: %s", data.get('name'))
         raise InvalidRouteError("Route name must be a non-empty string")
 
     # Validate waypoints
@@ -50,9 +50,9 @@ def validate_route_dto(data: Dict[str, Any]) -> Dict[str, Any]:
 
     validated_waypoints = []
     for i, waypoint in enumerate(waypoints):
-        logger.debug(f"validating waypoint at index {i}")
+        logger.debug("validating waypoint at index %d", i)
         if not isinstance(waypoint, dict):
-            logger.debug(f"invalid waypoint type at index {i}, expected dict, got: {type(waypoint)}")
+            logger.debug("invalid waypoint type at index %d, expected dict, got: %s", i, type(waypoint))
             raise InvalidWaypointError(f"Waypoint at index {i} must be an object")
 
         # Validate required waypoint fields
@@ -70,22 +70,22 @@ def validate_route_dto(data: Dict[str, Any]) -> Dict[str, Any]:
             latitude = float(waypoint['latitude'])
             longitude = float(waypoint['longitude'])
         except (ValueError, TypeError):
-            logger.debug(
-                f"invalid coordinate values at index {i}: lat={waypoint['latitude']}, lon={waypoint['longitude']}")
+            logger.debug("invalid coordinate values at index %d: lat=%s, lon=%s", i, waypoint['latitude'],
+                         waypoint['longitude'])
             raise InvalidWaypointError(f"Waypoint at index {i} has invalid coordinates")
 
         # Validate latitude and longitude ranges
-        logger.debug(f"validating coordinate ranges at index {i}: lat={latitude}, lon={longitude}")
+        logger.debug("validating coordinate ranges at index %d: lat=%s, lon=%s", i, latitude, longitude)
         if not (-90 <= latitude <= 90):
-            logger.debug(f"invalid latitude at index {i}: {latitude}")
+            logger.debug("invalid latitude at index %d: %s", i, latitude)
             raise InvalidWaypointError(f"Waypoint at index {i} has invalid latitude (must be between -90 and 90)")
 
         if not (-180 <= longitude <= 180):
-            logger.debug(f"invalid longitude at index {i}: {longitude}")
+            logger.debug("invalid longitude at index %d: %s", i, longitude)
             raise InvalidWaypointError(f"Waypoint at index {i} has invalid longitude (must be between -180 and 180)")
 
         # Create validated waypoint
-        logger.debug(f"creating validated waypoint for index {i}")
+        logger.debug("creating validated waypoint for index %d", i)
         validated_waypoint = {
             'latitude': latitude,
             'longitude': longitude,
@@ -109,13 +109,13 @@ def validate_route_dto(data: Dict[str, Any]) -> Dict[str, Any]:
     logger.debug("checking for user_id in data")
     if 'user_id' in data and data['user_id']:
         try:
-            logger.debug(f"validating user_id: {data['user_id']}")
+            logger.debug("validating user_id: %s", data['user_id'])
             user_id = UUID(data['user_id']) if isinstance(data['user_id'], str) else data['user_id']
             validated_data['user_id'] = user_id
         except (ValueError, TypeError, AttributeError):
             raise InvalidRouteError("Invalid user_id")
 
-    logger.debug(f"route validation completed successfully with data: {validated_data}")
+    logger.debug("route validation completed successfully with data: %s", validated_data)
     return validated_data
 
 
@@ -151,3 +151,27 @@ def serialize_route(route: Route) -> Dict[str, Any]:
             for wp in route.waypoints
         ]
     }
+
+
+def serialize_route_summary(summary: RouteSummary) -> Dict[str, Any]:
+    """
+    Serialize a route summary to a dictionary.
+
+    Args:
+        summary: Route summary to serialize
+
+    Returns:
+        Dictionary representation of the route header, its waypoint count and bounding box
+    """
+    return {
+        'id': str(summary.id),
+        'name': summary.name,
+        'description': summary.description,
+        'user_id': str(summary.user_id) if summary.user_id else None,
+        'created_at': summary.created_at.isoformat(),
+        'updated_at': summary.updated_at.isoformat(),
+        'zone': summary.zone,
+        'due_to': summary.due_to.isoformat() if summary.due_to else None,
+        'waypoint_count': summary.waypoint_count,
+        'bbox': summary.bbox
+    }
@@ -1,13 +1,14 @@
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from uuid import UUID
-import logging
+from ..utils.structured_logging import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
+from ...domain.exceptions.domain_exceptions import InvalidPageError
 from ...domain.services.route_service import RouteService
 from ...domain.repositories.route_repository import RouteRepository
-from ..dtos.route_dto import serialize_route
+from ..dtos.route_dto import serialize_route, serialize_route_summary
 
 
 class GetRouteQuery:
@@ -68,3 +69,57 @@ class GetRouteQuery:
 
         logger.debug("returning %d filtered routes", len(routes_))
         return routes_
+
+    def execute_page(self, limit: Optional[str] = None, cursor: Optional[str] = None,
+                     user_id: Optional[UUID] = None, due_to: str = None) -> Dict[str, Any]:
+        """
+        Get a page of routes, optionally filtered by user ID and due date.
+
+        Args:
+            limit: Requested page size, capped at the maximum page size
+            cursor: Cursor returned with the previous page, None for the first page
+            user_id: Optional user ID to filter routes
+            due_to: Optional due date to filter routes by, in datetime.date format
+
+        Returns:
+            Dictionary with the serialized routes and the cursor of the next page
+        """
+        logger.debug("executing get_routes page with limit: %s, user_id: %s and due_to: %s", limit, user_id, due_to)
+        try:
+            due_date = datetime.strptime(due_to, "%Y-%m-%d").date() if due_to else None
+        except ValueError:
+            raise InvalidPageError(f"Invalid due date: {due_to}")
+
+        page = self.route_service.get_routes_page(limit, cursor, user_id, due_date)
+        return {
+            "items": [serialize_route(route) for route in page.items],
+            "nextCursor": page.next_cursor
+        }
+
+    def execute_summary_page(self, limit: Optional[str] = None, cursor: Optional[str] = None,
+                             user_id: Optional[UUID] = None, due_to: str = None) -> Dict[str, Any]:
+        """
+        Get a page of route summaries, with the waypoint count and bounding box of each route instead of its
+        waypoints.
+
+        Args:
+            limit: Requested page size, capped at the maximum page size
+            cursor: Cursor returned with the previous page, None for the first page
+            user_id: Optional user ID to filter routes
+            due_to: Optional due date to filter routes by, in datetime.date format
+
+        Returns:
+            Dictionary with the serialized route summaries and the cursor of the next page
+        """
+        logger.debug("executing get_routes summary page with limit: %s, user_id: %s and due_to: %s", limit, user_id,
+                     due_to)
+        try:
+            due_date = datetime.strptime(due_to, "%Y-%m-%d").date() if due_to else None
+        except ValueError:
+            raise InvalidPageError(f"Invalid due date: {due_to}")
+
+        page = self.route_service.get_route_summaries_page(limit, cursor, user_id, due_date)
+        return {
+            "items": [serialize_route_summary(summary) for summary in page.items],
+            "nextCursor": page.next_cursor
+        }
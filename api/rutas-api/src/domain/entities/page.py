@@ -0,0 +1,48 @@
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from ..exceptions.domain_exceptions import InvalidPageError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass
+class Page:
+    """A page of a keyset paginated listing."""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+
+
+def page_size(limit: Optional[str]) -> int:
+    """Parse the requested page size, capped at MAX_PAGE_SIZE."""
+    if limit is None or limit == "":
+        return DEFAULT_PAGE_SIZE
+
+    try:
+        size = int(limit)
+    except ValueError:
+        raise InvalidPageError(f"Invalid page size: {limit}")
+
+    if size < 1:
+        raise InvalidPageError("The page size must be a positive integer")
+    return min(size, MAX_PAGE_SIZE)
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key of the last item of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Decode a cursor created by encode_cursor."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError, UnicodeError):
+        raise InvalidPageError("Invalid cursor")
+
+    if not isinstance(values, list):
+        raise InvalidPageError("Invalid cursor")
+    return values
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+
+@dataclass
+class RouteSummary:
+    """Header of a route with the number of its waypoints and their bounding box, without the waypoints."""
+    id: UUID
+    name: str
+    description: Optional[str]
+    user_id: Optional[UUID]
+    created_at: datetime
+    updated_at: datetime
+    zone: Optional[str]
+    due_to: Optional[datetime]
+    waypoint_count: int = 0
+    bbox: Optional[List[float]] = None  # [min longitude, min latitude, max longitude, max latitude]
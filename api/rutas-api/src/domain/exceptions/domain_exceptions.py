@@ -21,3 +21,8 @@ class InvalidRouteError(DomainError):
 class InvalidWaypointError(DomainError):
     """Raised when a waypoint is invalid."""
     pass
+
+
+class InvalidPageError(DomainError):
+    """Raised when a page size or cursor is invalid."""
+    pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List, Optional, Union
 from uuid import UUID
 
+from ..entities.page import Page
 from ..entities.route import Route
 
 
@@ -50,6 +52,40 @@ class RouteRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_page(self, limit: int, cursor: Optional[str] = None, user_id: Optional[UUID] = None,
+                 due_to: Optional[date] = None) -> Page:
+        """
+        Get a page of routes, from the newest to the oldest.
+
+        Args:
+            limit: Maximum number of routes of the page
+            cursor: Cursor returned with the previous page, None for the first page
+            user_id: Optional user ID to filter routes by
+            due_to: Optional due date to filter routes by
+
+        Returns:
+            Page of routes
+        """
+        pass
+
+    @abstractmethod
+    def get_summary_page(self, limit: int, cursor: Optional[str] = None, user_id: Optional[UUID] = None,
+                         due_to: Optional[date] = None) -> Page:
+        """
+        Get a page of route summaries, from the newest to the oldest, without loading their waypoints.
+
+        Args:
+            limit: Maximum number of routes of the page
+            cursor: Cursor returned with the previous page, None for the first page
+            user_id: Optional user ID to filter routes by
+            due_to: Optional due date to filter routes by
+
+        Returns:
+            Page of route summaries, with the waypoint count and bounding box of each route
+        """
+        pass
+
     @abstractmethod
     def update(self, route_id: UUID, route_data: Union[Route, dict]) -> Optional[Route]:
         """
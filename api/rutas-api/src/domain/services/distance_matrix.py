@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_METERS = 6371008.8
+
+
+@dataclass
+class DistanceMatrix:
+    """Pairwise distances (meters) and durations (seconds) between the waypoints of a route."""
+    distances: np.ndarray
+    durations: np.ndarray
+
+
+class DistanceMatrixSource(ABC):
+    """Source of the distance matrix the route solver works on."""
+
+    @abstractmethod
+    def matrix(self, coordinates: List[Tuple[float, float]], profile: str = None) -> DistanceMatrix:
+        """
+        Build the matrix between the given coordinates.
+
+        Args:
+            coordinates: List of (longitude, latitude) coordinates
+            profile: Travel profile, e.g. driving-car
+
+        Returns:
+            The distance matrix, row i holding the legs starting at coordinate i
+        """
+        pass
+
+
+class HaversineMatrixSource(DistanceMatrixSource):
+    """
+    Great-circle distances between the coordinates, computed in process.
+    Durations are estimated from an average speed, since there is no road network.
+    """
+
+    def __init__(self, average_speed_kmh: float = 30):
+        self.average_speed = average_speed_kmh / 3.6
+
+    def matrix(self, coordinates: List[Tuple[float, float]], profile: str = None) -> DistanceMatrix:
+        points = np.radians(np.asarray(coordinates, dtype=float).reshape(-1, 2))
+        longitudes, latitudes = points[:, 0], points[:, 1]
+
+        delta_latitudes = latitudes[:, None] - latitudes[None, :]
+        delta_longitudes = longitudes[:, None] - longitudes[None, :]
+        a = np.sin(delta_latitudes / 2) ** 2 + \
+            np.cos(latitudes[:, None]) * np.cos(latitudes[None, :]) * np.sin(delta_longitudes / 2) ** 2
+        distances = 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+        return DistanceMatrix(distances=distances, durations=distances / self.average_speed)
@@ -1,25 +1,36 @@
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
+from .distance_matrix import DistanceMatrixSource, HaversineMatrixSource
+from .route_solver import RouteSolver
 from ..entities.route import Route
 from ..entities.waypoint import Waypoint
 from ..entities.optimization_result import OptimizationResult
 from ..exceptions.domain_exceptions import OptimizationError
 
+# Solvers of the visiting order: in process over a distance matrix, or by the OpenRoute Service
+LOCAL_SOLVER = 'local'
+OPENROUTE_SOLVER = 'openroute'
+
 
 class OptimizationService:
     """Service for route optimization."""
 
-    def __init__(self, openroute_client):
+    def __init__(self, openroute_client, matrix_source: Optional[DistanceMatrixSource] = None,
+                 route_solver: Optional[RouteSolver] = None, default_solver: str = LOCAL_SOLVER):
         self.openroute_client = openroute_client
+        self.matrix_source = matrix_source or HaversineMatrixSource()
+        self.route_solver = route_solver or RouteSolver()
+        self.default_solver = default_solver
 
     def optimize_route(self, route: Route, optimization_params: Optional[Dict[str, Any]] = None) -> OptimizationResult:
         """
-        Optimize a route using the OpenRoute Service.
+        Optimize a route, in process or using the OpenRoute Service.
 
         Args:
             route: The route to optimize
-            optimization_params: Parameters to customize the optimization
+            optimization_params: Parameters to customize the optimization, `solver` chooses between
+                'local' and 'openroute'
 
         Returns:
             An OptimizationResult containing the optimized route
@@ -28,7 +39,12 @@ class OptimizationService:
             raise OptimizationError("Route must have at least 2 waypoints to optimize")
 
         # Use default params if none provided
-        params = optimization_params or {}
+        params = dict(optimization_params or {})
+        solver = params.pop('solver', self.default_solver)
+        if solver == LOCAL_SOLVER:
+            return self._optimize_locally(route, params)
+        if solver != OPENROUTE_SOLVER:
+            raise OptimizationError(f"Unknown solver: {solver}")
 
         try:
             # Call the OpenRoute Service
@@ -46,6 +62,7 @@ class OptimizationService:
                 waypoint = route.waypoints[idx]
                 # Create a new waypoint with the updated order
                 new_waypoint = Waypoint(
+                    id=waypoint.id,
                     latitude=waypoint.latitude,
                     longitude=waypoint.longitude,
                     name=waypoint.name,
@@ -69,3 +86,43 @@ class OptimizationService:
 
         except Exception as e:
             raise OptimizationError(f"Error optimizing route: {str(e)}")
+
+    def _optimize_locally(self, route: Route, params: Dict[str, Any]) -> OptimizationResult:
+        """
+        Solve the visiting order in process over the distance matrix of the waypoints.
+        The first waypoint is the start of the route.
+        """
+        try:
+            matrix = self.matrix_source.matrix(
+                [wp.coordinates for wp in route.waypoints],
+                profile=params.get('profile', 'driving-car')
+            )
+        except Exception as e:
+            raise OptimizationError(f"Error building the distance matrix: {str(e)}")
+
+        round_trip = bool(params.get('roundTrip', False))
+        costs = matrix.distances if params.get('optimizationMode') == 'shortest' else matrix.durations
+        order = self.route_solver.solve(costs, round_trip=round_trip)
+
+        return OptimizationResult(
+            route_id=route.id,
+            optimized_waypoints=self._reorder(route.waypoints, order),
+            total_distance=RouteSolver.tour_cost(matrix.distances, order, round_trip),
+            total_duration=RouteSolver.tour_cost(matrix.durations, order, round_trip),
+            optimization_params={**params, 'solver': LOCAL_SOLVER}
+        )
+
+    @staticmethod
+    def _reorder(waypoints: List[Waypoint], order: List[int]) -> List[Waypoint]:
+        """Copies of the waypoints in the given order, numbered from 0"""
+        return [
+            Waypoint(
+                id=waypoints[idx].id,
+                latitude=waypoints[idx].latitude,
+                longitude=waypoints[idx].longitude,
+                name=waypoints[idx].name,
+                address=waypoints[idx].address,
+                order=i
+            )
+            for i, idx in enumerate(order)
+        ]
@@ -1,15 +1,15 @@
-import logging
-
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
+from ..entities.page import Page, page_size
 from ..entities.route import Route
 from ..entities.waypoint import Waypoint
 from ..repositories.route_repository import RouteRepository
 from ..exceptions.domain_exceptions import RouteNotFoundError
+from ...application.utils.structured_logging import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger = get_logger(__name__)
 
 
 class RouteService:
@@ -33,6 +33,16 @@ class RouteService:
         """Get all routes, optionally filtered by user ID."""
         return self.route_repository.get_all(user_id)
 
+    def get_routes_page(self, limit: Optional[str], cursor: Optional[str] = None, user_id: Optional[UUID] = None,
+                        due_to: Optional[date] = None) -> Page:
+        """Get a page of routes, optionally filtered by user ID and due date."""
+        return self.route_repository.get_page(page_size(limit), cursor, user_id, due_to)
+
+    def get_route_summaries_page(self, limit: Optional[str], cursor: Optional[str] = None,
+                                 user_id: Optional[UUID] = None, due_to: Optional[date] = None) -> Page:
+        """Get a page of route summaries, optionally filtered by user ID and due date."""
+        return self.route_repository.get_summary_page(page_size(limit), cursor, user_id, due_to)
+
     def update_route(self, route_id: UUID, updates: dict) -> Route:
         """
         Update a route with the provided updates.
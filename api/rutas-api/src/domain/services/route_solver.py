@@ -0,0 +1,127 @@
+import time
+from typing import List
+
+import numpy as np
+
+# Improvements smaller than this are ignored, so rounding errors do not make the search loop
+EPSILON = 1e-9
+# Longest run of consecutive stops moved by an Or-opt move
+OR_OPT_MAX_SEGMENT = 3
+
+
+class RouteSolver:
+    """
+    Solves the visiting order of the stops of a route over a cost matrix.
+
+    The first stop is the start of the route and keeps its place. A nearest neighbor tour is improved with 2-opt
+    (reversing a run of stops) and Or-opt (moving a run of up to three stops elsewhere) moves until no move
+    improves it or the time budget runs out. Each pass evaluates all the moves of a stop at once with NumPy, and
+    ties are broken by the lowest index, so the same matrix always gives the same order when the search finishes
+    within the budget. The matrix may be asymmetric, e.g. durations of one-way streets.
+    """
+
+    def __init__(self, time_budget: float = 0.5):
+        self.time_budget = time_budget
+
+    def solve(self, costs: np.ndarray, round_trip: bool = False) -> List[int]:
+        """
+        Find a short visiting order.
+
+        Args:
+            costs: Square matrix of the cost of going from stop i to stop j
+            round_trip: True if the route returns to its start
+
+        Returns:
+            The indices of the stops in visiting order, starting with 0
+        """
+        size = len(costs)
+        if size <= 2:
+            return list(range(size))
+
+        # A last virtual stop closes the tour: the start again for a round trip, otherwise a stop at no cost
+        # from everywhere, so both cases are solved as a path ending at a fixed stop.
+        end = size
+        matrix = np.zeros((size + 1, size + 1))
+        matrix[:size, :size] = costs
+        if round_trip:
+            matrix[:, end] = matrix[:, 0]
+            matrix[end, :] = matrix[0, :]
+        np.fill_diagonal(matrix, 0)
+
+        deadline = time.monotonic() + self.time_budget
+        tour = np.array(self._nearest_neighbor(matrix[:size, :size]) + [end])
+        improved = True
+        while improved and time.monotonic() < deadline:
+            improved = self._two_opt(matrix, tour, deadline)
+            improved = self._or_opt(matrix, tour, deadline) or improved
+        return tour[:-1].tolist()
+
+    @staticmethod
+    def tour_cost(costs: np.ndarray, order: List[int], round_trip: bool = False) -> float:
+        """Total cost of visiting the stops in the given order"""
+        if len(order) < 2:
+            return 0.0
+        stops = list(order) + ([order[0]] if round_trip else [])
+        return float(np.sum(np.asarray(costs)[stops[:-1], stops[1:]]))
+
+    @staticmethod
+    def _nearest_neighbor(costs: np.ndarray) -> List[int]:
+        """Tour from the start always going to the closest stop not visited yet"""
+        size = len(costs)
+        visited = np.zeros(size, dtype=bool)
+        tour = [0]
+        visited[0] = True
+        for _ in range(size - 1):
+            candidates = np.where(visited, np.inf, costs[tour[-1]])
+            nearest = int(np.argmin(candidates))
+            tour.append(nearest)
+            visited[nearest] = True
+        return tour
+
+    @staticmethod
+    def _two_opt(matrix: np.ndarray, tour: np.ndarray, deadline: float) -> bool:
+        """Reverse the run of stops tour[i..j] that shortens the tour most, for each i"""
+        last = len(tour) - 1
+        improved = False
+        for i in range(1, last - 1):
+            if time.monotonic() >= deadline:
+                break
+            # Cost of the legs inside the tour, forward and backward, to price reversals on asymmetric matrices
+            forward = np.concatenate(([0], np.cumsum(matrix[tour[:-1], tour[1:]])))
+            backward = np.concatenate(([0], np.cumsum(matrix[tour[1:], tour[:-1]])))
+
+            j = np.arange(i + 1, last)
+            before, first, lasts, after = tour[i - 1], tour[i], tour[j], tour[j + 1]
+            delta = matrix[before, lasts] + matrix[first, after] - matrix[before, first] - matrix[lasts, after] \
+                + (backward[j] - backward[i]) - (forward[j] - forward[i])
+            best = int(np.argmin(delta))
+            if delta[best] < -EPSILON:
+                tour[i:j[best] + 1] = tour[i:j[best] + 1][::-1].copy()
+                improved = True
+        return improved
+
+    @staticmethod
+    def _or_opt(matrix: np.ndarray, tour: np.ndarray, deadline: float) -> bool:
+        """Move the run of stops starting at each position to the place where it shortens the tour most"""
+        improved = False
+        for length in range(1, OR_OPT_MAX_SEGMENT + 1):
+            i = 1
+            while i + length < len(tour):
+                if time.monotonic() >= deadline:
+                    return improved
+                segment = tour[i:i + length]
+                rest = np.concatenate((tour[:i], tour[i + length:]))
+                before, after = tour[i - 1], tour[i + length]
+                removal = matrix[before, segment[0]] + matrix[segment[-1], after] - matrix[before, after]
+
+                # Insert between rest[k] and rest[k + 1]
+                starts, ends = rest[:-1], rest[1:]
+                insertion = matrix[starts, segment[0]] + matrix[segment[-1], ends] - matrix[starts, ends]
+                delta = insertion - removal
+                best = int(np.argmin(delta))
+                if delta[best] < -EPSILON:
+                    tour[:] = np.concatenate((rest[:best + 1], segment, rest[best + 1:]))
+                    improved = True
+                else:
+                    i += 1
+        return improved
@@ -21,6 +21,16 @@ class Config:
     OPENROUTE_API_KEY = os.environ.get('OPENROUTE_API_KEY', '')
     OPENROUTE_BASE_URL = os.environ.get('OPENROUTE_BASE_URL', 'https://api.openrouteservice.org')
 
+    # Route optimization config: 'local' solves the order in process, 'openroute' asks the OpenRoute Service
+    ROUTE_SOLVER = os.environ.get('ROUTE_SOLVER', 'local')
+    ROUTE_SOLVER_TIME_BUDGET = float(os.environ.get('ROUTE_SOLVER_TIME_BUDGET', '0.5'))
+    ROUTE_AVERAGE_SPEED_KMH = float(os.environ.get('ROUTE_AVERAGE_SPEED_KMH', '30'))
+    # Matrix of the local solver: 'haversine' in process, 'openroute' road legs from the cached matrix endpoint
+    ROUTE_MATRIX_SOURCE = os.environ.get('ROUTE_MATRIX_SOURCE', 'haversine')
+    MATRIX_CACHE_SIZE = int(os.environ.get('MATRIX_CACHE_SIZE', '200000'))
+    MATRIX_CACHE_PRECISION = int(os.environ.get('MATRIX_CACHE_PRECISION', '5'))
+    MATRIX_CACHE_MAX_AGE_DAYS = int(os.environ.get('MATRIX_CACHE_MAX_AGE_DAYS', '30'))
+
 
 class TestConfig(Config):
     """Test configuration."""
@@ -0,0 +1,128 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+from ...application.utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# A cached leg: (distance in meters, duration in seconds)
+Leg = Tuple[float, float]
+# A pair of coordinate keys: (origin, destination)
+Pair = Tuple[str, str]
+
+
+def coordinate_key(coordinate: Tuple[float, float], precision: int = 5) -> str:
+    """Key of a (longitude, latitude) coordinate, rounded so nearby points share their legs (5 decimals ~ 1 m)"""
+    longitude, latitude = coordinate
+    return f"{round(longitude, precision):.{precision}f},{round(latitude, precision):.{precision}f}"
+
+
+class MatrixCacheStats:
+    """Hits and misses of the matrix cache, and the upstream matrix calls it saved"""
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.upstream_calls = 0
+        self.saved_calls = 0
+        self._lock = threading.Lock()
+
+    def increment(self, **counters) -> None:
+        with self._lock:
+            for counter, amount in counters.items():
+                setattr(self, counter, getattr(self, counter) + amount)
+
+    def to_dict(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.store_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.store_hits) / lookups, 4) if lookups else None,
+            "upstream_calls": self.upstream_calls,
+            "saved_calls": self.saved_calls,
+        }
+
+
+class MatrixCache:
+    """
+    Two-tier cache of the distance and duration between pairs of coordinates, by travel profile.
+
+    Legs are looked up in an in-process LRU first, then in the persistent store shared by every instance; the
+    legs found in the store are kept in the LRU. Only the pairs missing from both have to be requested upstream.
+    """
+
+    def __init__(self, store=None, max_entries: int = 200000, precision: int = 5):
+        self.store = store
+        self.max_entries = max_entries
+        self.precision = precision
+        self.stats = MatrixCacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, coordinate: Tuple[float, float]) -> str:
+        return coordinate_key(coordinate, self.precision)
+
+    def get_many(self, profile: str, pairs: Iterable[Pair]) -> Dict[Pair, Leg]:
+        """
+        Find the cached legs of the given pairs.
+
+        Returns:
+            The legs found, by pair; the missing pairs are not in the dictionary
+        """
+        pairs = list(dict.fromkeys(pairs))
+        found = {}
+        with self._lock:
+            for pair in pairs:
+                leg = self._entries.get((profile, pair))
+                if leg is not None:
+                    self._entries.move_to_end((profile, pair))
+                    found[pair] = leg
+        memory_hits = len(found)
+
+        missing = [pair for pair in pairs if pair not in found]
+        store_hits = 0
+        if missing and self.store is not None:
+            try:
+                stored = self.store.get_many(profile, missing)
+            except Exception as e:
+                logger.warning("matrix cache store lookup failed: %s", e)
+                stored = {}
+            store_hits = len(stored)
+            found.update(stored)
+            self._remember(profile, stored)
+
+        self.stats.increment(memory_hits=memory_hits, store_hits=store_hits,
+                             misses=len(pairs) - memory_hits - store_hits)
+        return found
+
+    def put_many(self, profile: str, legs: Dict[Pair, Leg]) -> None:
+        """Cache legs requested upstream, in both tiers"""
+        if not legs:
+            return
+        self._remember(profile, legs)
+        if self.store is not None:
+            try:
+                self.store.put_many(profile, legs)
+            except Exception as e:
+                logger.warning("matrix cache store update failed: %s", e)
+
+    def _remember(self, profile: str, legs: Dict[Pair, Leg]) -> None:
+        with self._lock:
+            for pair, leg in legs.items():
+                self._entries[(profile, pair)] = leg
+                self._entries.move_to_end((profile, pair))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def missing_rectangle(keys: List[str], missing: Iterable[Pair]) -> Tuple[List[int], List[int]]:
+    """
+    Sources and destinations covering the missing pairs, as indices of the keys: the matrix endpoint answers a
+    rectangle of sources by destinations, so every missing pair is in the rectangle of their rows and columns.
+    """
+    index = {key: i for i, key in enumerate(keys)}
+    sources = sorted({index[origin] for origin, _ in missing})
+    destinations = sorted({index[destination] for _, destination in missing})
+    return sources, destinations
@@ -1,13 +1,24 @@
+import numpy as np
 import requests
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 
+from .matrix_cache import MatrixCache, missing_rectangle
+from ...domain.services.distance_matrix import DistanceMatrix, DistanceMatrixSource
 
-class OpenRouteServiceClient:
+# Seconds to wait for the OpenRoute Service, and most sources x destinations answered by a matrix request
+REQUEST_TIMEOUT = 30
+MATRIX_MAX_ELEMENTS = 3500
+
+
+class OpenRouteServiceClient(DistanceMatrixSource):
     """Client for the OpenRoute Service API."""
 
-    def __init__(self, api_key: str, base_url: str = "https://api.openrouteservice.org"):
+    def __init__(self, api_key: str, base_url: str = "https://api.openrouteservice.org",
+                 matrix_cache: Optional[MatrixCache] = None, matrix_max_elements: int = MATRIX_MAX_ELEMENTS):
         self.api_key = api_key
         self.base_url = base_url
+        self.matrix_cache = matrix_cache or MatrixCache()
+        self.matrix_max_elements = matrix_max_elements
         self.headers = {
             "Authorization": api_key,
             "Content-Type": "application/json",
@@ -77,3 +88,78 @@ class OpenRouteServiceClient:
             }
 
         return {"error": "No routes found in the response"}
+
+    def matrix(self, coordinates: List[Tuple[float, float]], profile: str = None) -> DistanceMatrix:
+        """
+        Build the road distance and duration matrix between the coordinates.
+        Cached legs are reused and only the missing pairs are requested to the matrix endpoint.
+
+        Args:
+            coordinates: List of (longitude, latitude) coordinates
+            profile: Travel profile, driving-car by default
+
+        Returns:
+            The distance matrix between the coordinates
+        """
+        profile = profile or "driving-car"
+        keys = [self.matrix_cache.key(coordinate) for coordinate in coordinates]
+        unique_keys = list(dict.fromkeys(keys))
+        pairs = [(origin, destination) for origin in unique_keys for destination in unique_keys
+                 if origin != destination]
+
+        legs = self.matrix_cache.get_many(profile, pairs)
+        missing = [pair for pair in pairs if pair not in legs]
+        if missing:
+            fetched = self._request_matrix(unique_keys, missing, profile)
+            self.matrix_cache.put_many(profile, fetched)
+            legs.update(fetched)
+        else:
+            self.matrix_cache.stats.increment(saved_calls=1)
+
+        size = len(keys)
+        distances = np.zeros((size, size))
+        durations = np.zeros((size, size))
+        for i, origin in enumerate(keys):
+            for j, destination in enumerate(keys):
+                if origin != destination:
+                    distances[i, j], durations[i, j] = legs[(origin, destination)]
+        return DistanceMatrix(distances=distances, durations=durations)
+
+    def _request_matrix(self, keys: List[str], missing: List[Tuple[str, str]], profile: str) -> Dict:
+        """
+        Request the legs of the missing pairs, in as many calls as the element limit of the endpoint requires.
+        """
+        sources, destinations = missing_rectangle(keys, missing)
+        locations = [[float(value) for value in key.split(",")] for key in keys]
+        rows_per_call = max(1, self.matrix_max_elements // len(destinations))
+
+        legs = {}
+        for start in range(0, len(sources), rows_per_call):
+            chunk = sources[start:start + rows_per_call]
+            response = requests.post(
+                f"{self.base_url}/v2/matrix/{profile}",
+                headers=self.headers,
+                json={
+                    "locations": locations,
+                    "sources": chunk,
+                    "destinations": destinations,
+                    "metrics": ["distance", "duration"],
+                    "units": "m"
+                },
+                timeout=REQUEST_TIMEOUT
+            )
+            self.matrix_cache.stats.increment(upstream_calls=1)
+            if response.status_code != 200:
+                raise Exception(f"OpenRoute Service API error ({response.status_code}): {response.text}")
+
+            result = response.json()
+            for row, source in enumerate(chunk):
+                for column, destination in enumerate(destinations):
+                    if source == destination:
+                        continue
+                    distance = result["distances"][row][column]
+                    duration = result["durations"][row][column]
+                    if distance is None or duration is None:
+                        raise Exception(f"No route between {keys[source]} and {keys[destination]}")
+                    legs[(keys[source], keys[destination])] = (distance, duration)
+        return legs
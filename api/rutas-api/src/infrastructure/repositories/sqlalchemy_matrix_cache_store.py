@@ -0,0 +1,89 @@
+import datetime
+from typing import Dict, Iterable
+
+from sqlalchemy import Column, String, Float, DateTime
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .sqlalchemy_route_repository import Base
+from ..external.matrix_cache import Leg, Pair
+from ...application.utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Insert statements supporting ON CONFLICT DO UPDATE, per database dialect
+UPSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+# Legs per insert statement, below the bound parameters a statement may have
+PUT_BATCH_SIZE = 5000
+
+
+class MatrixLegEntity(Base):
+    __tablename__ = "matrix_legs"
+
+    profile = Column(String, primary_key=True)
+    origin = Column(String, primary_key=True)
+    destination = Column(String, primary_key=True)
+    distance = Column(Float, nullable=False)
+    duration = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+
+class SQLAlchemyMatrixCacheStore:
+    """
+    Persistent tier of the matrix cache: the legs requested to the OpenRoute Service by any instance.
+    """
+
+    def __init__(self, session: Session, max_age_days: int = 30):
+        self.session = session
+        self.max_age_days = max_age_days
+
+    def get_many(self, profile: str, pairs: Iterable[Pair]) -> Dict[Pair, Leg]:
+        pairs = set(pairs)
+        if not pairs:
+            return {}
+
+        query = self.session.query(MatrixLegEntity).filter(
+            MatrixLegEntity.profile == profile,
+            MatrixLegEntity.origin.in_({origin for origin, _ in pairs}),
+            MatrixLegEntity.destination.in_({destination for _, destination in pairs})
+        )
+        if self.max_age_days:
+            since = datetime.datetime.utcnow() - datetime.timedelta(days=self.max_age_days)
+            query = query.filter(MatrixLegEntity.updated_at >= since)
+
+        try:
+            rows = query.all()
+        finally:
+            # Release the connection, the lookup does not write anything
+            self.session.rollback()
+        return {(row.origin, row.destination): (row.distance, row.duration) for row in rows
+                if (row.origin, row.destination) in pairs}
+
+    def put_many(self, profile: str, legs: Dict[Pair, Leg]) -> None:
+        if not legs:
+            return
+
+        upsert = UPSERTS[self.session.get_bind().dialect.name]
+        now = datetime.datetime.utcnow()
+        rows = [
+            {"profile": profile, "origin": origin, "destination": destination, "distance": distance,
+             "duration": duration, "updated_at": now}
+            for (origin, destination), (distance, duration) in legs.items()
+        ]
+        try:
+            for start in range(0, len(rows), PUT_BATCH_SIZE):
+                statement = upsert(MatrixLegEntity).values(rows[start:start + PUT_BATCH_SIZE])
+                statement = statement.on_conflict_do_update(
+                    index_elements=["profile", "origin", "destination"],
+                    set_={"distance": statement.excluded.distance, "duration": statement.excluded.duration,
+                          "updated_at": statement.excluded.updated_at}
+                )
+                self.session.execute(statement)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        logger.debug("stored %d matrix legs of profile '%s'", len(legs), profile)
@@ -1,19 +1,21 @@
 from typing import List, Optional, Union, Dict, Any
 from uuid import UUID, uuid4
 import datetime
-import logging
 
-from sqlalchemy import Column, String, Float, ForeignKey, Integer, DateTime, Date
+from sqlalchemy import Column, String, Float, ForeignKey, Integer, DateTime, Date, Index, func, insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Session
+from sqlalchemy.orm import relationship, selectinload, Session
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 
+from .pagination import paginate
+from ...domain.entities.page import Page
 from ...domain.entities.route import Route
+from ...domain.entities.route_summary import RouteSummary
 from ...domain.entities.waypoint import Waypoint
 from ...domain.repositories.route_repository import RouteRepository
+from ...application.utils.structured_logging import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger = get_logger(__name__)
 
 
 Base = declarative_base()
@@ -21,6 +23,10 @@ Base = declarative_base()
 
 class WaypointEntity(Base):
     __tablename__ = "waypoints"
+    __table_args__ = (
+        # Waypoints of a route in visiting order, for the listings and the summaries
+        Index("ix_waypoints_route_id_order", "route_id", "order"),
+    )
 
     id = Column(PgUUID(as_uuid=True), primary_key=True)
     route_id = Column(
@@ -38,12 +44,16 @@ class WaypointEntity(Base):
 
 class RouteEntity(Base):
     __tablename__ = "routes"
+    __table_args__ = (
+        # Sort key of the paginated listing of a user
+        Index("ix_routes_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(PgUUID(as_uuid=True), primary_key=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     user_id = Column(PgUUID(as_uuid=True), nullable=False)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     zone = Column(String, nullable=False)
     due_to = Column(DateTime, nullable=True)
@@ -84,11 +94,10 @@ class SQLAlchemyRouteRepository(RouteRepository):
             logger.debug("route entity created in temporary state before waypoints addition - route_id: '%s', name: '%s'",
                          db_route.id, db_route.name)
 
-            # Now add the waypoints with the route ID
-            for i, waypoint in enumerate(route.waypoints):
-                db_waypoint = WaypointEntity(
+            # Insert all the waypoints in a single statement
+            waypoints = [
+                Waypoint(
                     id=waypoint.id,
-                    route_id=db_route.id,
                     name=waypoint.name,
                     latitude=waypoint.latitude,
                     longitude=waypoint.longitude,
@@ -96,7 +105,22 @@ class SQLAlchemyRouteRepository(RouteRepository):
                     order=i,
                     created_at=waypoint.created_at,
                 )
-                self.session.add(db_waypoint)
+                for i, waypoint in enumerate(route.waypoints)
+            ]
+            if waypoints:
+                self.session.execute(insert(WaypointEntity), [
+                    {
+                        "id": waypoint.id,
+                        "route_id": db_route.id,
+                        "name": waypoint.name,
+                        "latitude": waypoint.latitude,
+                        "longitude": waypoint.longitude,
+                        "address": waypoint.address,
+                        "order": waypoint.order,
+                        "created_at": waypoint.created_at,
+                    }
+                    for waypoint in waypoints
+                ])
 
             # Commit all changes
             self.session.commit()
@@ -109,8 +133,8 @@ class SQLAlchemyRouteRepository(RouteRepository):
         logger.debug("successfully committed route and %d waypoints to database - route_id: '%s'", len(route.waypoints),
                      db_route.id)
 
-        # Get the newly created route with waypoints
-        return self._to_domain(db_route)
+        # The waypoints just inserted are returned as they are, without loading them again
+        return self._to_domain(db_route, waypoints)
 
     def get_by_id(self, route_id: UUID) -> Optional[Route]:
         logger.debug("attempting to fetch route from database with id: '%s'", route_id)
@@ -127,24 +151,80 @@ class SQLAlchemyRouteRepository(RouteRepository):
     def get_all(self, user_id: Optional[UUID] = None) -> List[Route]:
         logger.debug("starting to fetch routes from database")
 
-        query = self.session.query(RouteEntity)
+        # The waypoints of all the routes are loaded with a single additional query
+        query = self.session.query(RouteEntity).options(selectinload(RouteEntity.waypoints))
         if user_id:
             logger.debug("filtering routes by user_id: '%s'", user_id)
             query = query.filter(RouteEntity.user_id == user_id)
-        
+
         db_routes = query.all()
         logger.debug("retrieved %d routes from database", len(db_routes))
 
-        routes = []
-        for db_route in db_routes:
-            logger.debug("converting route to domain model - id: '%s', name: '%s'", db_route.id, db_route.name)
-            routes.append(self._to_domain(db_route))
+        routes = [self._to_domain(db_route) for db_route in db_routes]
 
         logger.info("successfully fetched and converted %d routes from database, user_id filter: '%s'", len(routes),
                     user_id)
 
         return routes
 
+    def get_page(self, limit: int, cursor: Optional[str] = None, user_id: Optional[UUID] = None,
+                 due_to: Optional[datetime.date] = None) -> Page:
+        logger.debug("starting to fetch a page of routes from database - limit: %d, user_id: '%s', due_to: '%s'",
+                     limit, user_id, due_to)
+
+        query = self._filter(self.session.query(RouteEntity).options(selectinload(RouteEntity.waypoints)),
+                             user_id, due_to)
+
+        db_routes, next_cursor = paginate(query, [RouteEntity.created_at, RouteEntity.id], limit, cursor,
+                                          descending=True)
+        logger.debug("retrieved %d routes from database, last page: %s", len(db_routes), next_cursor is None)
+
+        return Page(items=[self._to_domain(db_route) for db_route in db_routes], next_cursor=next_cursor)
+
+    def get_summary_page(self, limit: int, cursor: Optional[str] = None, user_id: Optional[UUID] = None,
+                         due_to: Optional[datetime.date] = None) -> Page:
+        logger.debug("starting to fetch a page of route summaries from database - limit: %d, user_id: '%s', "
+                     "due_to: '%s'", limit, user_id, due_to)
+
+        headers = [RouteEntity.id, RouteEntity.name, RouteEntity.description, RouteEntity.user_id,
+                   RouteEntity.created_at, RouteEntity.updated_at, RouteEntity.zone, RouteEntity.due_to]
+        query = self._filter(self.session.query(*headers), user_id, due_to)
+        rows, next_cursor = paginate(query, [RouteEntity.created_at, RouteEntity.id], limit, cursor, descending=True)
+
+        # Waypoint counts and bounding boxes are aggregated in the database, for the routes of the page only
+        aggregates = {}
+        if rows:
+            aggregates = {
+                aggregate.route_id: aggregate
+                for aggregate in self.session.query(
+                    WaypointEntity.route_id,
+                    func.count(WaypointEntity.id).label("waypoint_count"),
+                    func.min(WaypointEntity.longitude).label("min_longitude"),
+                    func.min(WaypointEntity.latitude).label("min_latitude"),
+                    func.max(WaypointEntity.longitude).label("max_longitude"),
+                    func.max(WaypointEntity.latitude).label("max_latitude"),
+                ).filter(WaypointEntity.route_id.in_([row.id for row in rows])).group_by(WaypointEntity.route_id)
+            }
+        logger.debug("retrieved %d route summaries from database, last page: %s", len(rows), next_cursor is None)
+
+        summaries = []
+        for row in rows:
+            aggregate = aggregates.get(row.id)
+            summaries.append(RouteSummary(
+                id=row.id,
+                name=row.name,
+                description=row.description,
+                user_id=row.user_id,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                zone=row.zone,
+                due_to=row.due_to,
+                waypoint_count=aggregate.waypoint_count if aggregate else 0,
+                bbox=[aggregate.min_longitude, aggregate.min_latitude, aggregate.max_longitude,
+                      aggregate.max_latitude] if aggregate else None,
+            ))
+        return Page(items=summaries, next_cursor=next_cursor)
+
     def update(self, route_id: UUID, route_data: Union[Route, dict]) -> Optional[Route]:
         logger.info("Starting `update` method for route ID: %s with data: %s", route_id, route_data)
 
@@ -257,26 +337,32 @@ class SQLAlchemyRouteRepository(RouteRepository):
         logger.info("Route with ID %s deleted successfully.", route_id)
         return True
 
-    def _to_domain(self, db_route: RouteEntity) -> Route:
-        """Convert SQLAlchemy model to domain model"""
-        logger.debug("converting database route entity to domain model - id: '%s', name: '%s', waypoints: %d",
-                     db_route.id, db_route.name, len(db_route.waypoints))
-
-        waypoints = []
-        for db_waypoint in sorted(db_route.waypoints, key=lambda wp: wp.order):
-            waypoint = Waypoint(
-                id=db_waypoint.id,
-                name=db_waypoint.name,
-                latitude=db_waypoint.latitude,
-                longitude=db_waypoint.longitude,
-                address=db_waypoint.address,
-                created_at=db_waypoint.created_at,
-                order=db_waypoint.order,
-            )
-            waypoints.append(waypoint)
-
-        logger.debug("finished converting %d waypoints for route - id: '%s', first_waypoint: '%s'", len(waypoints),
-                     db_route.id, waypoints[0].name if waypoints else "none")
+    @staticmethod
+    def _filter(query, user_id: Optional[UUID] = None, due_to: Optional[datetime.date] = None):
+        """Filter a query of routes by user and due date"""
+        if user_id:
+            query = query.filter(RouteEntity.user_id == user_id)
+        if due_to:
+            day_start = datetime.datetime.combine(due_to, datetime.time.min)
+            query = query.filter(RouteEntity.due_to >= day_start,
+                                 RouteEntity.due_to < day_start + datetime.timedelta(days=1))
+        return query
+
+    def _to_domain(self, db_route: RouteEntity, waypoints: Optional[List[Waypoint]] = None) -> Route:
+        """Convert SQLAlchemy model to domain model, with the given waypoints or the ones of the entity"""
+        if waypoints is None:
+            waypoints = [
+                Waypoint(
+                    id=db_waypoint.id,
+                    name=db_waypoint.name,
+                    latitude=db_waypoint.latitude,
+                    longitude=db_waypoint.longitude,
+                    address=db_waypoint.address,
+                    created_at=db_waypoint.created_at,
+                    order=db_waypoint.order,
+                )
+                for db_waypoint in sorted(db_route.waypoints, key=lambda wp: wp.order)
+            ]
 
         return Route(
             id=db_route.id,
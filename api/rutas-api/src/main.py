@@ -1,6 +1,4 @@
 import os
-import logging
-import sys
 
 from flask import Flask, jsonify
 from dotenv import load_dotenv
@@ -13,53 +11,85 @@ loaded = load_dotenv('.env.development')
 from .api.v1.routes import routes_blueprint
 from .api.v1.optimizations import optimizations_blueprint
 from .infrastructure.config import Config
+from .infrastructure.external.matrix_cache import MatrixCache
 from .infrastructure.external.openroute_service_client import OpenRouteServiceClient
+from .infrastructure.repositories.sqlalchemy_matrix_cache_store import SQLAlchemyMatrixCacheStore
 from .infrastructure.repositories.sqlalchemy_route_repository import Base, SQLAlchemyRouteRepository
+from .domain.services.distance_matrix import HaversineMatrixSource
 from .domain.services.optimization_service import OptimizationService
+from .domain.services.route_solver import RouteSolver
 from .api.error_handlers import register_error_handlers
+from .infrastructure.monitoring.metrics import REGISTRY, init_metrics
+from .application.utils.structured_logging import configure_logging
 
+configure_logging('rutas-api')
 
-# Configure the logging handler to output to stdout (Kubernetes reads from stdout/stderr)
-handler = logging.StreamHandler(sys.stdout)
-handler.setLevel(logging.DEBUG)  # Allow DEBUG messages in the output handler
-formatter = logging.Formatter(
-    fmt='[%(asctime)s] [%(levelname)s] %(name)s: %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-handler.setFormatter(formatter)
+# Engine of the app created by this process, released on shutdown
+_engine = None
 
-# Get the root logger and configure it
-logging.basicConfig(level=logging.DEBUG, handlers=[handler])
 
-# Optional: Configure specific logger (SQLAlchemyRouteRepository in this case)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+def create_schema(config_class=Config):
+    """Create the missing tables, without keeping connections open for processes forked afterwards"""
+    engine = create_engine(config_class.SQLALCHEMY_DATABASE_URI)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+
+def shutdown(timeout=30):
+    """Release the connections of the process, called by the server when a worker exits within timeout seconds"""
+    if _engine is not None:
+        _engine.dispose()
 
 
 def create_app(config_class=Config):
+    global _engine
+
     app = Flask(__name__)
+    init_metrics(app)
     app.config.from_object(config_class)
 
     # Register CORS | discuss with team
     #    CORS(app)
 
     # Setup database
-    engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'])
+    engine = _engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'])
     session_factory = sessionmaker(bind=engine)
     session = scoped_session(session_factory)
 
-    # Create tables if they don't exist
-    Base.metadata.create_all(engine)
+    # Create tables if they don't exist, unless the gunicorn master already did
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        Base.metadata.create_all(engine)
 
     # Initialize repositories
     route_repository = SQLAlchemyRouteRepository(session=session)
 
     # Initialize services
+    matrix_cache = MatrixCache(
+        store=SQLAlchemyMatrixCacheStore(session, max_age_days=app.config.get('MATRIX_CACHE_MAX_AGE_DAYS', 30)),
+        max_entries=app.config.get('MATRIX_CACHE_SIZE', 200000),
+        precision=app.config.get('MATRIX_CACHE_PRECISION', 5)
+    )
+    REGISTRY.collector(
+        "route_matrix_cache_lookups_total", "counter", "Legs looked up in the matrix cache, by result",
+        lambda: [({"result": result}, getattr(matrix_cache.stats, result))
+                 for result in ("memory_hits", "store_hits", "misses")])
+    REGISTRY.collector(
+        "route_matrix_upstream_calls_total", "counter", "Matrix calls made to the OpenRoute Service",
+        lambda: [({}, matrix_cache.stats.upstream_calls)])
     openroute_client = OpenRouteServiceClient(
         api_key=app.config['OPENROUTE_API_KEY'],
-        base_url=app.config['OPENROUTE_BASE_URL']
+        base_url=app.config['OPENROUTE_BASE_URL'],
+        matrix_cache=matrix_cache
+    )
+    matrix_source = HaversineMatrixSource(average_speed_kmh=app.config.get('ROUTE_AVERAGE_SPEED_KMH', 30))
+    if app.config.get('ROUTE_MATRIX_SOURCE', 'haversine') == 'openroute':
+        matrix_source = openroute_client
+    optimization_service = OptimizationService(
+        openroute_client=openroute_client,
+        matrix_source=matrix_source,
+        route_solver=RouteSolver(time_budget=app.config.get('ROUTE_SOLVER_TIME_BUDGET', 0.5)),
+        default_solver=app.config.get('ROUTE_SOLVER', 'local')
     )
-    optimization_service = OptimizationService(openroute_client=openroute_client)
 
     # Add services to app context
     app.route_repository = route_repository
@@ -89,7 +119,4 @@ def create_app(config_class=Config):
 if __name__ == "__main__":
     app = create_app()
 
-    import logging
-    logging.basicConfig(level=logging.DEBUG)
-
     app.run(host="0.0.0.0", port=5000, debug=True)
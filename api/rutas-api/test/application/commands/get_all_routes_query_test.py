@@ -1,8 +1,12 @@
 import pytest
+from datetime import date, datetime
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 from src.application.queries.get_route_query import GetRouteQuery
+from src.domain.entities.page import Page
 from src.domain.entities.route import Route
+from src.domain.entities.route_summary import RouteSummary
+from src.domain.exceptions.domain_exceptions import InvalidPageError
 from src.domain.entities.waypoint import Waypoint
 
 
@@ -66,3 +70,42 @@ class TestGetAllRoutesQuery:
 
         # Assert
         assert results == []
+
+    def test_execute_page_returns_items_and_next_cursor(self):
+        # Arrange
+        user_ = uuid4()
+        route = Route(id=uuid4(), name="Route 1", description="First test route", user_id=user_, waypoints=[])
+        self.route_repository.get_page.return_value = Page(items=[route], next_cursor="next")
+
+        # Act
+        result = self.query.execute_page(limit="1", user_id=user_, due_to="2025-05-10")
+
+        # Assert
+        assert [r["name"] for r in result["items"]] == ["Route 1"]
+        assert result["nextCursor"] == "next"
+        self.route_repository.get_page.assert_called_once_with(1, None, user_, date(2025, 5, 10))
+
+    def test_execute_page_rejects_invalid_limit(self):
+        # Act & Assert
+        with pytest.raises(InvalidPageError):
+            self.query.execute_page(limit="0")
+        self.route_repository.get_page.assert_not_called()
+
+    def test_execute_summary_page_returns_counts_without_waypoints(self):
+        # Arrange
+        user_ = uuid4()
+        summary = RouteSummary(id=uuid4(), name="Route 1", description=None, user_id=user_,
+                               created_at=datetime(2025, 5, 1), updated_at=datetime(2025, 5, 1), zone="north",
+                               due_to=datetime(2025, 5, 10), waypoint_count=2, bbox=[-74.2, 4.5, -74.1, 4.6])
+        self.route_repository.get_summary_page.return_value = Page(items=[summary], next_cursor=None)
+
+        # Act
+        result = self.query.execute_summary_page(user_id=user_)
+
+        # Assert
+        assert result["items"][0]["waypoint_count"] == 2
+        assert result["items"][0]["bbox"] == [-74.2, 4.5, -74.1, 4.6]
+        assert "waypoints" not in result["items"][0]
+        assert result["nextCursor"] is None
+        self.route_repository.get_summary_page.assert_called_once_with(50, None, user_, None)
+        self.route_repository.get_page.assert_not_called()
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.route import Route
+from src.domain.entities.waypoint import Waypoint
+from src.domain.exceptions.domain_exceptions import OptimizationError
+from src.domain.services.optimization_service import OptimizationService
+
+
+class TestOptimizationService:
+
+    def setup_method(self):
+        self.openroute_client = MagicMock()
+        self.service = OptimizationService(openroute_client=self.openroute_client)
+        latitudes = [4.50, 4.58, 4.52, 4.56]
+        self.route = Route(
+            id=uuid4(),
+            name="Test Route",
+            waypoints=[Waypoint(latitude=latitude, longitude=-74.1, name=f"Stop {i}", order=i)
+                       for i, latitude in enumerate(latitudes)]
+        )
+
+    def test_optimize_route_locally(self):
+        # Execute
+        result = self.service.optimize_route(self.route)
+
+        # Verify the stops are reordered without calling the OpenRoute Service
+        self.openroute_client.optimize_route.assert_not_called()
+        assert [wp.name for wp in result.optimized_waypoints] == ["Stop 0", "Stop 2", "Stop 3", "Stop 1"]
+        assert [wp.order for wp in result.optimized_waypoints] == [0, 1, 2, 3]
+        assert result.optimized_waypoints[1].id == self.route.waypoints[2].id
+        assert 8000 < result.total_distance < 9500
+        assert result.total_duration > 0
+        assert result.optimization_params == {"solver": "local"}
+
+    def test_optimize_route_with_openroute_solver(self):
+        self.openroute_client.optimize_route.return_value = {
+            "waypoint_order": [0, 1, 2, 3],
+            "legs": [{"distance": 100, "duration": 10}, {"distance": 200, "duration": 20}]
+        }
+
+        # Execute
+        result = self.service.optimize_route(self.route, {"solver": "openroute", "profile": "driving-car"})
+
+        # Verify the solver is not sent to the OpenRoute Service
+        self.openroute_client.optimize_route.assert_called_once()
+        assert self.openroute_client.optimize_route.call_args[1]["params"] == {"profile": "driving-car"}
+        assert result.total_distance == 300
+
+    def test_optimize_route_with_unknown_solver(self):
+        with pytest.raises(OptimizationError):
+            self.service.optimize_route(self.route, {"solver": "unknown"})
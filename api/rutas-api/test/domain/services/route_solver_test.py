@@ -0,0 +1,75 @@
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from src.domain.services.distance_matrix import HaversineMatrixSource
+from src.domain.services.route_solver import RouteSolver
+
+
+def random_coordinates(size, seed=7):
+    rng = np.random.default_rng(seed)
+    return list(zip(rng.uniform(-74.2, -74.0, size), rng.uniform(4.5, 4.8, size)))
+
+
+def optimal_cost(costs, round_trip=False):
+    return min(RouteSolver.tour_cost(costs, [0] + list(order), round_trip)
+               for order in itertools.permutations(range(1, len(costs))))
+
+
+class TestRouteSolver:
+
+    def setup_method(self):
+        self.solver = RouteSolver(time_budget=5)
+
+    def test_haversine_matrix(self):
+        # Bogotá to Medellín, about 240 km
+        matrix = HaversineMatrixSource(average_speed_kmh=36).matrix([(-74.0721, 4.7110), (-75.5636, 6.2518)])
+
+        assert matrix.distances[0, 0] == 0
+        assert 235000 < matrix.distances[0, 1] < 245000
+        assert matrix.distances[0, 1] == matrix.distances[1, 0]
+        assert matrix.durations[0, 1] == matrix.distances[0, 1] / 10
+
+    def test_solve_orders_stops_along_a_line(self):
+        # Stops on a meridian, shuffled after the start
+        latitudes = [4.50, 4.58, 4.52, 4.56, 4.51, 4.54]
+        matrix = HaversineMatrixSource().matrix([(-74.1, latitude) for latitude in latitudes])
+
+        order = self.solver.solve(matrix.distances)
+
+        assert [latitudes[i] for i in order] == sorted(latitudes)
+
+    def test_solve_small_routes_optimally(self):
+        for seed in range(5):
+            costs = HaversineMatrixSource().matrix(random_coordinates(8, seed)).distances
+
+            assert RouteSolver.tour_cost(costs, self.solver.solve(costs)) == pytest.approx(optimal_cost(costs))
+            assert RouteSolver.tour_cost(costs, self.solver.solve(costs, round_trip=True), True) == \
+                   pytest.approx(optimal_cost(costs, round_trip=True))
+
+    def test_solve_asymmetric_matrix(self):
+        costs = np.random.default_rng(3).uniform(1, 100, (7, 7))
+
+        order = self.solver.solve(costs)
+
+        assert order[0] == 0
+        assert sorted(order) == list(range(7))
+        assert RouteSolver.tour_cost(costs, order) <= RouteSolver.tour_cost(costs, RouteSolver._nearest_neighbor(costs))
+
+    def test_solve_200_stops_quickly_and_deterministically(self):
+        costs = HaversineMatrixSource().matrix(random_coordinates(200)).distances
+
+        started = time.monotonic()
+        order = RouteSolver(time_budget=1).solve(costs)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5
+        assert order == RouteSolver(time_budget=1).solve(costs)
+        assert sorted(order) == list(range(200))
+        assert RouteSolver.tour_cost(costs, order) < RouteSolver.tour_cost(costs, RouteSolver._nearest_neighbor(costs))
+
+    def test_solve_trivial_routes(self):
+        assert self.solver.solve(np.zeros((0, 0))) == []
+        assert self.solver.solve(np.array([[0, 5], [5, 0]])) == [0, 1]
@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.external.matrix_cache import MatrixCache, coordinate_key, missing_rectangle
+from src.infrastructure.external.openroute_service_client import OpenRouteServiceClient
+from src.infrastructure.repositories.sqlalchemy_matrix_cache_store import SQLAlchemyMatrixCacheStore
+from src.infrastructure.repositories.sqlalchemy_route_repository import Base
+
+COORDINATES = [(-74.1, 4.50), (-74.1, 4.58), (-74.1, 4.52)]
+
+
+def matrix_response(request_body):
+    """Fake matrix answer: the leg from i to j is 100 * i + j meters and as many seconds"""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "distances": [[100 * i + j for j in request_body["destinations"]] for i in request_body["sources"]],
+        "durations": [[100 * i + j for j in request_body["destinations"]] for i in request_body["sources"]],
+    }
+    return response
+
+
+class TestMatrixCache:
+
+    def setup_method(self):
+        self.cache = MatrixCache(max_entries=2)
+
+    def test_coordinate_key_rounds_nearby_points_together(self):
+        assert coordinate_key((-74.1000001, 4.5000004)) == coordinate_key((-74.1, 4.5)) == "-74.10000,4.50000"
+
+    def test_least_recently_used_leg_is_evicted(self):
+        self.cache.put_many("driving-car", {("a", "b"): (1, 1), ("b", "a"): (2, 2)})
+        self.cache.get_many("driving-car", [("a", "b")])
+        self.cache.put_many("driving-car", {("a", "c"): (3, 3)})
+
+        found = self.cache.get_many("driving-car", [("a", "b"), ("b", "a"), ("a", "c")])
+
+        assert found == {("a", "b"): (1, 1), ("a", "c"): (3, 3)}
+
+    def test_missing_rectangle(self):
+        sources, destinations = missing_rectangle(["a", "b", "c"], [("c", "a"), ("a", "c")])
+
+        assert sources == [0, 2]
+        assert destinations == [0, 2]
+
+
+class TestOpenRouteServiceMatrix:
+
+    def setup_method(self):
+        self.client = OpenRouteServiceClient(api_key="key", base_url="http://ors")
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        self.requests.append(json)
+        return matrix_response(json)
+
+    @pytest.fixture(autouse=True)
+    def patch_post(self):
+        self.requests = []
+        with patch("src.infrastructure.external.openroute_service_client.requests.post", side_effect=self.post):
+            yield
+
+    def test_repeated_route_does_not_call_upstream(self):
+        first = self.client.matrix(COORDINATES)
+        second = self.client.matrix(COORDINATES)
+
+        assert len(self.requests) == 1
+        assert (first.distances == second.distances).all()
+        assert second.distances[2, 1] == 201
+        stats = self.client.matrix_cache.stats.to_dict()
+        assert stats["upstream_calls"] == 1
+        assert stats["saved_calls"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_only_missing_pairs_are_requested(self):
+        self.client.matrix(COORDINATES[:2])
+        result = self.client.matrix(COORDINATES)
+
+        assert len(self.requests) == 2
+        assert self.requests[1]["sources"] == [0, 1, 2]
+        assert self.requests[1]["destinations"] == [0, 1, 2]
+        assert result.durations[0, 1] == 1
+
+    def test_large_matrices_are_split_by_rows(self):
+        self.client.matrix_max_elements = 6
+
+        result = self.client.matrix(COORDINATES)
+
+        assert [request["sources"] for request in self.requests] == [[0, 1], [2]]
+        assert result.distances[2, 0] == 200
+
+    def test_unreachable_pair_raises(self):
+        def unreachable(url, headers=None, json=None, timeout=None):
+            response = matrix_response(json)
+            response.json.return_value["distances"][0][1] = None
+            return response
+
+        with patch("src.infrastructure.external.openroute_service_client.requests.post", side_effect=unreachable):
+            with pytest.raises(Exception):
+                self.client.matrix(COORDINATES)
+
+
+class TestSQLAlchemyMatrixCacheStore:
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.store = SQLAlchemyMatrixCacheStore(self.session)
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_put_and_get_many(self):
+        self.store.put_many("driving-car", {("a", "b"): (10.0, 5.0), ("b", "a"): (12.0, 6.0)})
+        self.store.put_many("driving-car", {("a", "b"): (11.0, 5.5)})
+
+        assert self.store.get_many("driving-car", [("a", "b"), ("b", "a"), ("a", "c")]) == {
+            ("a", "b"): (11.0, 5.5),
+            ("b", "a"): (12.0, 6.0),
+        }
+        assert self.store.get_many("cycling-regular", [("a", "b")]) == {}
+
+    def test_legs_of_another_instance_skip_upstream(self):
+        MatrixCache(store=self.store).put_many("driving-car", {("a", "b"): (10.0, 5.0)})
+        cache = MatrixCache(store=self.store)
+
+        assert cache.get_many("driving-car", [("a", "b")]) == {("a", "b"): (10.0, 5.0)}
+        assert cache.stats.store_hits == 1
+        cache.get_many("driving-car", [("a", "b")])
+        assert cache.stats.memory_hits == 1
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.route import Route
+from src.domain.entities.waypoint import Waypoint
+from src.infrastructure.repositories.sqlalchemy_route_repository import Base, SQLAlchemyRouteRepository
+
+
+class TestSQLAlchemyRouteRepository:
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = SQLAlchemyRouteRepository(self.session)
+        self.user_id = uuid4()
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def teardown_method(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _route(self, name, stops, created_at=None):
+        return Route(
+            name=name,
+            user_id=self.user_id,
+            zone="north",
+            due_to=datetime(2025, 5, 10, 8),
+            created_at=created_at or datetime.utcnow(),
+            waypoints=[Waypoint(latitude=latitude, longitude=longitude, name=f"{name} {i}")
+                       for i, (longitude, latitude) in enumerate(stops)]
+        )
+
+    def test_create_inserts_waypoints_in_one_statement(self):
+        route = self.repository.create(self._route("Route", [(-74.1, 4.5), (-74.2, 4.6), (-74.0, 4.7)]))
+
+        inserts = [statement for statement in self.statements if statement.startswith("INSERT INTO waypoints")]
+        assert len(inserts) == 1
+        assert [wp.order for wp in route.waypoints] == [0, 1, 2]
+        assert [wp.name for wp in self.repository.get_by_id(route.id).waypoints] == ["Route 0", "Route 1", "Route 2"]
+
+    def test_listings_load_waypoints_with_one_query(self):
+        now = datetime.utcnow()
+        for i in range(5):
+            self.repository.create(self._route(f"Route {i}", [(-74.1, 4.5), (-74.2, 4.6)],
+                                               created_at=now - timedelta(minutes=i)))
+        self.session.expunge_all()
+
+        self.statements.clear()
+        routes = self.repository.get_all(self.user_id)
+        assert len(routes) == 5
+        assert all(len(route.waypoints) == 2 for route in routes)
+        assert len([statement for statement in self.statements if statement.startswith("SELECT")]) == 2
+
+        self.session.expunge_all()
+        self.statements.clear()
+        page = self.repository.get_page(3, user_id=self.user_id)
+        assert [route.name for route in page.items] == ["Route 0", "Route 1", "Route 2"]
+        assert len([statement for statement in self.statements if statement.startswith("SELECT")]) == 2
+
+    def test_summary_page_has_counts_and_bounding_boxes(self):
+        now = datetime.utcnow()
+        self.repository.create(self._route("Empty", [], created_at=now))
+        self.repository.create(self._route("Full", [(-74.1, 4.5), (-74.2, 4.6), (-74.0, 4.7)],
+                                            created_at=now - timedelta(minutes=1)))
+        self.repository.create(self._route("Old", [(-74.1, 4.5)], created_at=now - timedelta(minutes=2)))
+
+        page = self.repository.get_summary_page(2, user_id=self.user_id)
+        empty, full = page.items
+
+        assert (empty.name, empty.waypoint_count, empty.bbox) == ("Empty", 0, None)
+        assert (full.name, full.waypoint_count) == ("Full", 3)
+        assert full.bbox == [-74.2, 4.5, -74.0, 4.7]
+        assert page.next_cursor is not None
+
+        last_page = self.repository.get_summary_page(2, cursor=page.next_cursor, user_id=self.user_id)
+        assert [summary.name for summary in last_page.items] == ["Old"]
+        assert last_page.next_cursor is None
+
+    def test_pages_cover_every_route_once_with_shared_dates(self):
+        start = datetime(2025, 5, 1, 8)
+        # Routes created in the same minute share their sort date, the id breaks the tie
+        created = [self.repository.create(self._route(f"Route {i}", [(-74.1, 4.5)],
+                                                      created_at=start + timedelta(minutes=i // 3)))
+                   for i in range(11)]
+        expected = [route.id for route in sorted(created, key=lambda route: (route.created_at, route.id),
+                                                 reverse=True)]
+
+        for get_page in (self.repository.get_page, self.repository.get_summary_page):
+            ids, cursor, pages = [], None, 0
+            while True:
+                page = get_page(3, cursor=cursor, user_id=self.user_id)
+                ids.extend(route.id for route in page.items)
+                pages += 1
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+
+            assert ids == expected
+            assert len(set(ids)) == len(ids)
+            assert pages == 4
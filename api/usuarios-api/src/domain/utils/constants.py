@@ -2,10 +2,12 @@
 
 """This module defines project-level constants."""
 
+import os
+
 EMAIL_PATTERN = r'[^@]+@[^@]+\.[^@]+'
 PASSWORD_PATTERN = r'^[a-zA-Z0-9]+$'
 
-JWT_KEY = "D5*F?_1?-d$f*1"
+JWT_KEY = os.getenv("JWT_KEY", "D5*F?_1?-d$f*1")
 JWT_ALGORITHM = "HS256"
 
 DEFAULT_TIMEZONE = "America/Bogota"
@@ -9,11 +9,6 @@ from ...application.find_user_by_role import FindUserByRole
 from ...domain.entities.user_dto import UserDTO
 from ...infrastructure.adapters.user_adapter import UserAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 user_blueprint = Blueprint('users', __name__, url_prefix='/api/v1/users')
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from dotenv import load_dotenv
 from flask import Flask, jsonify
@@ -8,9 +9,28 @@ loaded = load_dotenv('.env.development')
 from .interface.blueprints.management_blueprint import management_blueprint
 from .interface.blueprints.users_blueprint import user_blueprint
 from .application.errors.errors import ApiError
-from .infrastructure.database.declarative_base import Base, engine
+from .infrastructure.database.declarative_base import Base, database, engine
+from .infrastructure.monitoring.metrics import init_metrics
+from .application.utils.structured_logging import configure_logging
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging('usuarios-api')
+
+
+def create_schema():
+    """
+    Create the missing tables, then close the connections so processes forked afterwards open their own.
+    """
+    logging.debug(">> Create schema")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+
+def shutdown(timeout=30):
+    """
+    Release the resources of the process, called by the server when a worker exits.
+    :param timeout: Seconds the shutdown may wait, in total.
+    """
+    engine.dispose()
 
 
 def create_app():
@@ -19,14 +39,17 @@ def create_app():
     """
     logging.debug('users microservice started')
     app = Flask(__name__)
+    # One connection checkout per request, however many DAO calls it makes
+    database.init_app(app)
+    init_metrics(app)
 
     # Register blueprints
     app.register_blueprint(management_blueprint)
     app.register_blueprint(user_blueprint)
 
-    # Create schema
-    logging.debug(">> Create schema")
-    Base.metadata.create_all(engine)
+    # Under gunicorn the master created the schema before forking the workers
+    if os.getenv('SCHEMA_CREATED') != 'true':
+        create_schema()
 
     # Error handling
     @app.errorhandler(ApiError)
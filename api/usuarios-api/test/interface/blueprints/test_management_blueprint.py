@@ -17,3 +17,13 @@ class TestManagementBlueprint:
         # Assert
         assert response.status_code == 200
         assert data['status'] == 'UP'
+
+    def test_database_pool(self, client):
+        # Act
+        response = client.get('/health/database')
+        data = response.get_json()
+
+        # Assert
+        assert response.status_code == 200
+        assert data['checkouts'] >= 0
+        assert 'saturation' in data
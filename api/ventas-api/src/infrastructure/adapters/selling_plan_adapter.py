@@ -5,11 +5,6 @@ from ..mapper.selling_plan_mapper import SellingPlanMapper
 from ...domain.entities.selling_plan_dto import SellingPlanDTO
 from ...domain.repositories.selling_plan_repository import SellingPlanRepository
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 
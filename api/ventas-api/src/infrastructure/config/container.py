@@ -2,6 +2,7 @@
 import os
 
 from ..adapters.token_validator_adapter import TokenValidatorAdapter
+from ..monitoring.metrics import REGISTRY
 from ...domain.ports.token_validator import TokenValidatorPort
 
 
@@ -11,7 +12,14 @@ class DependencyContainer:
     def __init__(self):
         # Configure the token validator with the users API URL from environment
         users_api_url = os.getenv("USERS_API_URL", "http://users-api:5000")
-        self._token_validator = TokenValidatorAdapter(users_api_url)
+        # Tokens are verified locally when the signing key is available
+        self._token_validator = TokenValidatorAdapter(
+            users_api_url,
+            secret_key=os.getenv("JWT_KEY"),
+            cache_size=int(os.getenv("TOKEN_CACHE_SIZE", "1024")),
+            cache_ttl=int(os.getenv("TOKEN_CACHE_TTL", "300"))
+        )
+        self._token_validator.register_metrics(REGISTRY)
 
     @property
     def token_validator(self) -> TokenValidatorPort:
@@ -9,11 +9,6 @@ from ...application.get_clients_by_salesman import GetClientsBySalesman
 from ...domain.entities.client_salesman_dto import ClientSalesmanDTO
 from ...infrastructure.adapters.client_salesman_adapter import ClientSalesmanAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 
 client_salesman_adapter = ClientSalesmanAdapter()
 
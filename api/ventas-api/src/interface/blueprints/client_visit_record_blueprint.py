@@ -10,11 +10,6 @@ from ...application.get_visits_by_salesman import GetVisitsBySalesman
 from ...domain.entities.client_visit_record_dto import ClientVisitRecordDTO
 from ...infrastructure.adapters.client_visit_record_adapter import ClientVisitRecordAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 
 client_visit_record_adapter = ClientVisitRecordAdapter()
 
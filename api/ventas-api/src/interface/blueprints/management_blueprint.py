@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify
 
+from ...infrastructure.database.declarative_base import database
+
 management_blueprint = Blueprint('management', __name__)
 
 
@@ -9,3 +11,11 @@ def health_check():
     Health check endpoint to verify if the service is running.
     """
     return jsonify({"status": "UP"}), 200
+
+
+@management_blueprint.route('/health/database', methods=['GET'])
+def database_pool():
+    """
+    Connection pool of the service: checkouts, the time they waited for a connection and the pool saturation.
+    """
+    return jsonify(database.stats.to_dict()), 200
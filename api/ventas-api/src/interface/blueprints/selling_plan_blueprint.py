@@ -12,11 +12,6 @@ from ...application.errors.errors import ValidationApiError, ResourceNotFoundErr
 from ...domain.entities.selling_plan_dto import SellingPlanDTO
 from ...infrastructure.adapters.selling_plan_adapter import SellingPlanAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 
 selling_plan_adapter = SellingPlanAdapter()
 
@@ -1,19 +1,13 @@
-import logging
 import os
 
 import requests
 
 from .salesman_adapter import SalesmanAdapter
+from ..utils.structured_logging import get_logger
 
 SALES_API_URL = os.environ.get('SALES_API_URL', 'http://localhost:5106/api/v1/sales')
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ClientVisitRecordsAdapter:
@@ -37,13 +31,14 @@ class ClientVisitRecordsAdapter:
         logger.debug("Getting client visit records")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{SALES_API_URL}/api/v1/salesman/{salesman_id}/visits", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
         if response.status_code == 200:
-            records = response.json()
+            records = body
             # Decorate the response
             decorated_records = [self._decorate_response(jwt, record) for record in records]
             return decorated_records, response.status_code
-        return response.json(), response.status_code
+        return body, response.status_code
 
     def get_client_visit_record(self, jwt, salesman_id, record_id):
         """
@@ -56,14 +51,15 @@ class ClientVisitRecordsAdapter:
         logger.debug(f"Getting client visit record: {record_id}")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{SALES_API_URL}/api/v1/salesman/{salesman_id}/visits/{record_id}", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
         if response.status_code == 200:
-            record = response.json()
+            record = body
             # Decorate the response
             decorated_record = self._decorate_response(jwt, record)
             return decorated_record, response.status_code
         else:
-            return response.json(), response.status_code
+            return body, response.status_code
 
     def add_client_visit_record(self, jwt, salesman_id, data):
         """
@@ -76,8 +72,9 @@ class ClientVisitRecordsAdapter:
         logger.debug("Adding client visit record")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{SALES_API_URL}/api/v1/salesman/{salesman_id}/visits", json=data, headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def _decorate_response(self, jwt, record):
         """
@@ -5,16 +5,11 @@ from datetime import datetime, timedelta
 import requests
 
 from .products_adapter import ProductsAdapter
+from ..utils.structured_logging import get_logger
 
 CLIENTS_API_URL = os.environ.get('CLIENTS_API_URL', 'http://localhost:5101')
 
-# Configure logging once at module level
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ClientsAdapter:
@@ -48,19 +43,22 @@ class ClientsAdapter:
         if response.status_code in [201, 402]:
             self._enrich_product_information(jwt, response_data, response.status_code)
 
-        logger.debug(f"Response received from API: {response_data}")
+        logger.debug("Response received from API", status=response.status_code, body=response_data)
         return response_data, response.status_code
 
-    def lists_orders(self, jwt, client_id):
+    def lists_orders(self, jwt, client_id, page_params=None):
         """
         List orders for a specific client.
         :param jwt: JWT token for authorization.
         :param client_id: The ID of the client to list orders for.
+        :param page_params: Optional pagination params (limit and cursor) and view forwarded to the clients API.
         :return: Tuple of (orders_data, status_code)
         """
         logger.debug("Listing orders for client")
         headers = {'Authorization': f'Bearer {jwt}'}
         params = {'clientId': client_id}
+        if page_params:
+            params.update(page_params)
 
         # List the orders
         response = requests.get(
@@ -71,7 +69,7 @@ class ClientsAdapter:
 
         response_data = response.json()
 
-        logger.debug(f"Response received from API: {response_data}")
+        logger.debug("Response received from API", status=response.status_code, body=response_data)
         return response_data, response.status_code
 
     def get_order_by_id(self, jwt, order_id):
@@ -96,14 +94,15 @@ class ClientsAdapter:
         if response.status_code == 200:
             self._enrich_product_information(jwt, response_data, response.status_code)
 
-        logger.debug(f"Response received from API: {response_data}")
+        logger.debug("Response received from API", status=response.status_code, body=response_data)
         return response_data, response.status_code
 
-    def get_orders_by_salesman_id(self, jwt, salesman_id):
+    def get_orders_by_salesman_id(self, jwt, salesman_id, page_params=None):
         """
         Get orders by salesman ID.
         :param jwt: JWT token for authorization
         :param salesman_id: The ID of the salesman to retrieve
+        :param page_params: Optional pagination params (limit and cursor) and view forwarded to the clients API
         :return: Tuple of (orders_data, status_code)
         """
         logger.debug("Listing orders for salesman_id")
@@ -113,12 +112,13 @@ class ClientsAdapter:
         # List the orders
         response = requests.get(
             f"{CLIENTS_API_URL}/api/v1/clients/orders/salesman/{salesman_id}",
-            headers=headers
+            headers=headers,
+            params=page_params
         )
 
         response_data = response.json()
 
-        logger.debug(f"Response received from API: {response_data}")
+        logger.debug("Response received from API", status=response.status_code, body=response_data)
         return response_data, response.status_code
 
     def _enrich_product_information(self, jwt, order_data, status_code):
@@ -131,11 +131,13 @@ class ClientsAdapter:
         logging.debug("Enriching product information")
         products = order_data.get('orderDetails', [])
 
+        products_data, _ = self.products_adapter.get_products_by_ids(
+            jwt, [product.get('productId') for product in products])
+
         for product in products:
-            product_id = product.get('productId')
-            product_data, response_status = self.products_adapter.get_product_by_id(jwt, product_id)
+            product_data = products_data.get(str(product.get('productId')))
 
-            if product_data and response_status == 200:
+            if product_data:
                 # Add product information
                 product['name'] = product_data.get('name')
                 product['brand'] = product_data.get('brand')
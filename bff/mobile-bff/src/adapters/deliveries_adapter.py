@@ -1,17 +1,12 @@
-import logging
 import os
 
 import requests
 
-DELIVERIES_API_URL = os.environ.get('DELIVERIES_API_URL', 'http://localhost:5000')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+DELIVERIES_API_URL = os.environ.get('DELIVERIES_API_URL', 'http://localhost:5000')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DeliveriesAdapter:
@@ -24,9 +19,10 @@ class DeliveriesAdapter:
             headers={'Authorization': f'Bearer {jwt}'}
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_delivery_for_customer(jwt, delivery_id, customer_id):
@@ -38,13 +34,14 @@ class DeliveriesAdapter:
             params={'customer_id': customer_id}
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def create_delivery(jwt, delivery_data):
-        logger.debug(f"creating a delivery with data {delivery_data}")
+        logger.debug("creating a delivery", delivery_data=delivery_data)
 
         response = requests.post(
             url=f"{DELIVERIES_API_URL}/api/seller/deliveries",
@@ -52,9 +49,10 @@ class DeliveriesAdapter:
             json=delivery_data
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_seller_deliveries(jwt, seller_id):
@@ -66,9 +64,10 @@ class DeliveriesAdapter:
             params={'seller_id': seller_id}
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_delivery_for_seller(jwt, delivery_id, seller_id):
@@ -80,13 +79,14 @@ class DeliveriesAdapter:
             params={'seller_id': seller_id}
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def update_delivery(jwt, delivery_id, delivery_data):
-        logger.debug(f"updating delivery with ID: {delivery_id} with data: {delivery_data}")
+        logger.debug("updating delivery with ID: %s", delivery_id, delivery_data=delivery_data)
 
         response = requests.put(
             url=f"{DELIVERIES_API_URL}/api/seller/deliveries/{delivery_id}",
@@ -94,9 +94,10 @@ class DeliveriesAdapter:
             json=delivery_data
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def delete_delivery(jwt, delivery_id, seller_id):
@@ -117,7 +118,7 @@ class DeliveriesAdapter:
 
     @staticmethod
     def add_status_update(jwt, delivery_id, status_data):
-        logger.debug(f"adding status update to delivery with ID: {delivery_id} with data: {status_data}")
+        logger.debug("adding status update to delivery with ID: %s", delivery_id, status_data=status_data)
 
         response = requests.post(
             url=f"{DELIVERIES_API_URL}/api/seller/deliveries/{delivery_id}/status",
@@ -125,13 +126,14 @@ class DeliveriesAdapter:
             json=status_data
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def update_status_update(jwt, status_update_id, status_data):
-        logger.debug(f"updating status update with ID: {status_update_id} with data: {status_data}")
+        logger.debug("updating status update with ID: %s", status_update_id, status_data=status_data)
 
         response = requests.put(
             url=f"{DELIVERIES_API_URL}/api/seller/status/{status_update_id}",
@@ -139,9 +141,10 @@ class DeliveriesAdapter:
             json=status_data
         )
 
-        logger.debug(f"response received from entregas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from entregas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def delete_status_update(jwt, status_update_id, seller_id):
@@ -1,17 +1,12 @@
-import logging
 import os
 
 import requests
 
-SALES_API_URL = os.environ.get('SALES_API_URL', 'http://localhost:5106/api/v1/sales')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+SALES_API_URL = os.environ.get('SALES_API_URL', 'http://localhost:5106/api/v1/sales')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class SalesmanAdapter:
@@ -26,8 +21,9 @@ class SalesmanAdapter:
         logger.debug("Getting clients by salesman")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{SALES_API_URL}/api/v1/salesman/{salesman_id}/clients", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def associate_client(self, jwt, salesman_id, client_data):
         """
@@ -40,5 +36,6 @@ class SalesmanAdapter:
         logger.debug("Associating client with salesman")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{SALES_API_URL}/api/v1/salesman/{salesman_id}/clients", json=client_data, headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
@@ -1,16 +1,11 @@
-import logging
 import os
 import requests
 
-VIDEOS_API_URL = os.environ.get('MARKET_INTELLIGENCE_API_URL', 'http://localhost:5000')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+VIDEOS_API_URL = os.environ.get('MARKET_INTELLIGENCE_API_URL', 'http://localhost:5000')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class VideosAdapter:
@@ -36,9 +31,10 @@ class VideosAdapter:
             files=files
         )
 
-        logger.debug(f"response received from videos api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from videos api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_video_status(jwt, video_id):
@@ -59,9 +55,10 @@ class VideosAdapter:
             headers={'Authorization': f'Bearer {jwt}'}
         )
 
-        logger.debug(f"response received from videos api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from videos api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def list_videos(jwt):
@@ -81,6 +78,7 @@ class VideosAdapter:
             headers={'Authorization': f'Bearer {jwt}'}
         )
 
-        logger.debug(f"response received from videos api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from videos api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
\ No newline at end of file
+        return body, response.status_code
\ No newline at end of file
@@ -5,11 +5,6 @@ from flask import Blueprint, jsonify, request
 
 from ..adapters.client_visit_records_adapter import ClientVisitRecordsAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 client_visit_record_blueprint = Blueprint('client_visit_record', __name__, url_prefix='/bff/v1/mobile/salesman')
@@ -4,13 +4,8 @@ import logging
 from flask import Blueprint, jsonify, request
 
 from ..adapters.clients_adapter import ClientsAdapter
-from ..utils.commons import token_required
+from ..utils.commons import token_required, order_list_params
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 orders_blueprint = Blueprint('orders', __name__, url_prefix='/bff/v1/mobile/clients/orders')
@@ -43,7 +38,7 @@ def list_orders(jwt):
     logging.debug("Listing orders in BFF Mobile.")
     adapter = ClientsAdapter()
     client_id = request.args.get('clientId')
-    return adapter.lists_orders(jwt, client_id)
+    return adapter.lists_orders(jwt, client_id, order_list_params())
 
 @orders_blueprint.route('/<order_id>', methods=['GET'])
 @token_required
@@ -71,4 +66,4 @@ def list_orders_by_salesman(jwt, salesman_id):
     logging.debug("Received request to list orders by salesman.")
     logging.debug("Listing orders by salesman in BFF Mobile.")
     adapter = ClientsAdapter()
-    return adapter.get_orders_by_salesman_id(jwt, salesman_id)
\ No newline at end of file
+    return adapter.get_orders_by_salesman_id(jwt, salesman_id, order_list_params())
\ No newline at end of file
@@ -4,11 +4,6 @@ from flask import Blueprint, request
 from ..adapters.deliveries_adapter import DeliveriesAdapter
 from ..utils.commons import validate_token
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 deliveries_blueprint = Blueprint('deliveries', __name__, url_prefix='/bff/v1/mobile/deliveries')
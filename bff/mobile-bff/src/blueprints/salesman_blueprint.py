@@ -5,11 +5,6 @@ from flask import Blueprint, jsonify, request
 
 from ..adapters.salesman_adapter import SalesmanAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 salesman_blueprint = Blueprint('salesman', __name__, url_prefix='/bff/v1/mobile/salesman')
@@ -3,11 +3,6 @@ from flask import Blueprint, jsonify, request
 
 from ..adapters.users_adapter import UsersAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 logger = logging.getLogger(__name__)
 
 users_blueprint = Blueprint('users', __name__, url_prefix='/bff/v1/mobile/users')
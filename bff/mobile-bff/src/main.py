@@ -1,4 +1,5 @@
 import logging
+import os
 
 from dotenv import load_dotenv
 from flask import Flask
@@ -14,8 +15,11 @@ from .blueprints.salesman_blueprint import salesman_blueprint
 from .blueprints.client_visit_record_blueprint import client_visit_record_blueprint
 from .blueprints.deliveries_blueprint import deliveries_blueprint
 from .blueprints.videos_blueprint import videos_blueprint
+from .messaging.consumer.products_catalog_consumer import ProductsCatalogConsumer
+from .utils.structured_logging import configure_logging
+from .utils.metrics import init_metrics
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging('mobile-bff')
 
 
 def create_app():
@@ -24,6 +28,7 @@ def create_app():
     """
     logging.debug('BFF users microservice started')
     app = Flask(__name__)
+    init_metrics(app)
 
     # Register blueprints
     app.register_blueprint(management_blueprint)
@@ -36,6 +41,11 @@ def create_app():
     app.register_blueprint(deliveries_blueprint)
     app.register_blueprint(videos_blueprint)
 
+    # Invalidate the products cache on catalog events, without a broker the cache relies on its TTL
+    if os.getenv('RABBITMQ_HOST'):
+        logging.debug(">> Initialize the products catalog consumer")
+        ProductsCatalogConsumer().start_consuming()
+
     return app
 
 
@@ -28,7 +28,7 @@ class TestClientsAdapter(unittest.TestCase):
     def test_create_order_success(self):
         # Mock both the client adapter's post and the product adapter's get
         with patch('src.adapters.clients_adapter.requests.post') as mock_post, \
-                patch('src.adapters.products_adapter.requests.get') as mock_product_get:
+                patch('src.adapters.products_adapter.http_session.post') as mock_product_get:
             # Set up client order response
             mock_response = Mock()
             mock_response.status_code = 201
@@ -41,15 +41,15 @@ class TestClientsAdapter(unittest.TestCase):
             }
             mock_post.return_value = mock_response
 
-            # Set up product get response
+            # Set up products batch response
             mock_product_response = Mock()
             mock_product_response.status_code = 200
-            mock_product_response.json.return_value = {
+            mock_product_response.json.return_value = [{
                 "id": "product789",
                 "name": "Test Product",
                 "brand": "Test Brand",
                 "deliveryTime": 3
-            }
+            }]
             mock_product_get.return_value = mock_product_response
 
             # Call method
@@ -63,7 +63,7 @@ class TestClientsAdapter(unittest.TestCase):
     def test_create_order_pending_payment(self):
         # Mock both the client adapter's post and the product adapter's get
         with patch('src.adapters.clients_adapter.requests.post') as mock_post, \
-                patch('src.adapters.products_adapter.requests.get') as mock_product_get:
+                patch('src.adapters.products_adapter.http_session.post') as mock_product_get:
             # Set up client order response
             mock_response = Mock()
             mock_response.status_code = 402
@@ -76,15 +76,15 @@ class TestClientsAdapter(unittest.TestCase):
             }
             mock_post.return_value = mock_response
 
-            # Set up product get response
+            # Set up products batch response
             mock_product_response = Mock()
             mock_product_response.status_code = 200
-            mock_product_response.json.return_value = {
+            mock_product_response.json.return_value = [{
                 "id": "product789",
                 "name": "Test Product",
                 "brand": "Test Brand",
                 "deliveryTime": 3
-            }
+            }]
             mock_product_get.return_value = mock_product_response
 
             # Call method
@@ -122,7 +122,7 @@ class TestClientsAdapter(unittest.TestCase):
     def test_get_order_by_id(self):
         # Mock both the client adapter's get and the product adapter's get
         with patch('src.adapters.clients_adapter.requests.get') as mock_get, \
-                patch('src.adapters.products_adapter.requests.get') as mock_product_get:
+                patch('src.adapters.products_adapter.http_session.post') as mock_product_get:
             # Set up client order response
             mock_response = Mock()
             mock_response.status_code = 200
@@ -135,15 +135,15 @@ class TestClientsAdapter(unittest.TestCase):
             }
             mock_get.return_value = mock_response
 
-            # Set up product get response
+            # Set up products batch response
             mock_product_response = Mock()
             mock_product_response.status_code = 200
-            mock_product_response.json.return_value = {
+            mock_product_response.json.return_value = [{
                 "id": "product789",
                 "name": "Test Product",
                 "brand": "Test Brand",
                 "deliveryTime": 3
-            }
+            }]
             mock_product_get.return_value = mock_product_response
 
             # Call method
@@ -151,7 +151,8 @@ class TestClientsAdapter(unittest.TestCase):
 
             # Assertions
             self.assertEqual(status_code, 200)
-            self.assertEqual(result["id"], 'product789')  # Use self.mock_order_id, not 'product789'
+            self.assertEqual(result["id"], self.mock_order_id)
+            self.assertEqual(result["orderDetails"][0]["name"], "Test Product")
 
 
 
@@ -165,16 +166,16 @@ class TestClientsAdapter(unittest.TestCase):
         }
 
         # Mock the product adapter's get
-        with patch('src.adapters.products_adapter.requests.get') as mock_product_get:
-            # Set up product get response
+        with patch('src.adapters.products_adapter.http_session.post') as mock_product_get:
+            # Set up products batch response
             mock_product_response = Mock()
             mock_product_response.status_code = 200
-            mock_product_response.json.return_value = {
+            mock_product_response.json.return_value = [{
                 "id": "product789",
                 "name": "Test Product",
                 "brand": "Test Brand",
                 "deliveryTime": 3
-            }
+            }]
             mock_product_get.return_value = mock_product_response
 
             # Call method
@@ -195,7 +196,7 @@ class TestClientsAdapter(unittest.TestCase):
     def test_create_order_with_salesman_success(self):
         # Mock both the client adapter's post and the product adapter's get
         with patch('src.adapters.clients_adapter.requests.post') as mock_post, \
-                patch('src.adapters.products_adapter.requests.get') as mock_product_get:
+                patch('src.adapters.products_adapter.http_session.post') as mock_product_get:
             # Set up client order response
             mock_response = Mock()
             mock_response.status_code = 201
@@ -209,15 +210,15 @@ class TestClientsAdapter(unittest.TestCase):
             }
             mock_post.return_value = mock_response
 
-            # Set up product get response
+            # Set up products batch response
             mock_product_response = Mock()
             mock_product_response.status_code = 200
-            mock_product_response.json.return_value = {
+            mock_product_response.json.return_value = [{
                 "id": "product789",
                 "name": "Test Product",
                 "brand": "Test Brand",
                 "deliveryTime": 3
-            }
+            }]
             mock_product_get.return_value = mock_product_response
 
             # Call method
@@ -246,7 +247,8 @@ class TestClientsAdapter(unittest.TestCase):
             # Assertions
             mock_get.assert_called_once_with(
                 f"http://localhost:5101/api/v1/clients/orders/salesman/{self.salesman_id}",
-                headers={'Authorization': f'Bearer {self.mock_jwt}'}
+                headers={'Authorization': f'Bearer {self.mock_jwt}'},
+                params=None
             )
             self.assertEqual(status_code, 200)
             self.assertEqual(len(result), 2)
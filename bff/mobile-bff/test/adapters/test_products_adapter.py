@@ -2,11 +2,13 @@ import unittest
 from unittest.mock import patch, Mock
 
 from src.adapters.products_adapter import ProductsAdapter
+from src.utils.products_cache import products_cache
 
 
 class TestProductsAdapter(unittest.TestCase):
 
     def setUp(self):
+        products_cache.invalidate()
         self.products_adapter = ProductsAdapter()
         self.jwt = "fake_jwt_token"
         self.product_id = "123e4567-e89b-12d3-a456-426614174000"
@@ -25,7 +27,7 @@ class TestProductsAdapter(unittest.TestCase):
         }
         self.expected_headers = {'Authorization': f'Bearer {self.jwt}'}
 
-    @patch('src.adapters.products_adapter.requests.get')
+    @patch('src.adapters.products_adapter.http_session.get')
     def test_get_all_products(self, mock_get):
         # Mock the response
         mock_response = Mock()
@@ -40,7 +42,7 @@ class TestProductsAdapter(unittest.TestCase):
         self.assertEqual(result, [self.product_data])
         self.assertEqual(status_code, 200)
 
-    @patch('src.adapters.products_adapter.requests.get')
+    @patch('src.adapters.products_adapter.http_session.get')
     def test_get_product_by_id(self, mock_get):
         # Mock the response
         mock_response = Mock()
@@ -55,6 +57,80 @@ class TestProductsAdapter(unittest.TestCase):
         self.assertEqual(result, self.product_data)
         self.assertEqual(status_code, 200)
 
-    
+
+    @patch('src.adapters.products_adapter.http_session.get')
+    def test_get_product_by_id_served_from_cache(self, mock_get):
+        # Mock the response
+        mock_response = Mock()
+        mock_response.json.return_value = self.product_data
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"v1"'}
+        mock_get.return_value = mock_response
+
+        # Call the method twice with the same token
+        self.products_adapter.get_product_by_id(self.jwt, self.product_id)
+        result, status_code = ProductsAdapter().get_product_by_id(self.jwt, self.product_id)
+
+        # Verify the second call did not reach the products API
+        self.assertEqual(result, self.product_data)
+        self.assertEqual(status_code, 200)
+        mock_get.assert_called_once()
+
+    @patch('src.adapters.products_adapter.http_session.get')
+    def test_get_all_products_revalidates_unknown_token(self, mock_get):
+        # Mock the first response and the not modified revalidation
+        first_response = Mock()
+        first_response.json.return_value = [self.product_data]
+        first_response.status_code = 200
+        first_response.headers = {'ETag': '"v1"'}
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [first_response, not_modified]
+
+        # Call the method with two different tokens
+        self.products_adapter.get_all_products(self.jwt)
+        result, status_code = self.products_adapter.get_all_products("other_jwt_token")
+
+        # Verify the cached listing was revalidated with its ETag
+        self.assertEqual(result, [self.product_data])
+        self.assertEqual(status_code, 200)
+        self.assertEqual(mock_get.call_args[1]['headers']['If-None-Match'], '"v1"')
+
+    @patch('src.adapters.products_adapter.http_session.get')
+    def test_get_product_by_id_after_invalidation(self, mock_get):
+        # Mock the response
+        mock_response = Mock()
+        mock_response.json.return_value = self.product_data
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        # Invalidate the product between both calls
+        self.products_adapter.get_product_by_id(self.jwt, self.product_id)
+        products_cache.invalidate_products([self.product_id])
+        self.products_adapter.get_product_by_id(self.jwt, self.product_id)
+
+        # Verify the product was requested again
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('src.adapters.products_adapter.http_session.post')
+    def test_get_products_by_ids(self, mock_post):
+        # Mock the response
+        mock_response = Mock()
+        mock_response.json.return_value = [dict(self.product_data, id=self.product_id)]
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        # Call the method twice, the second call is served by the memo
+        result, status_code = self.products_adapter.get_products_by_ids(self.jwt, [self.product_id, self.product_id])
+        self.products_adapter.get_products_by_ids(self.jwt, [self.product_id])
+
+        # Verify the result
+        self.assertEqual(result[self.product_id]["name"], "Test Product")
+        self.assertEqual(status_code, 200)
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args[1]['json'], {'ids': [self.product_id]})
+
+
 if __name__ == '__main__':
     unittest.main()
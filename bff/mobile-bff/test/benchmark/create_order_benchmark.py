@@ -0,0 +1,161 @@
+"""
+Benchmark of the checkout in mobile-bff: POST /bff/v1/mobile/clients/orders/ at a given concurrency, i.e. the
+call to clientes-api followed by the enrichment of the order with the products of productos-api, plus a
+micro-benchmark of the enrichment.
+
+clientes-api and productos-api are replaced by a local HTTP server answering like them, after an optional
+delay, so the stage measures the BFF and its HTTP calls; the APIs have benchmarks of their own.
+
+Run from the root of the service:
+    python -m test.benchmark.create_order_benchmark --orders 500 --concurrency 8 --output mobile-bff.json
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .benchmark_runner import micro_benchmark, quiet_logging, report, run_stage, write_report
+
+
+class UpstreamStandIn:
+    """Local server answering the order creation of clientes-api and the product batches of productos-api"""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if upstream.delay:
+                    time.sleep(upstream.delay)
+                if self.path == '/api/v1/clients/orders':
+                    order_id = str(uuid.uuid4())
+                    details = [dict(detail, id=str(uuid.uuid4()), orderId=order_id)
+                               for detail in body['orderDetails']]
+                    self._reply(201, dict(body, id=order_id, status='COMPLETADO', orderDetails=details))
+                elif self.path == '/api/v1/products/batch':
+                    self._reply(200, [{"id": product_id, "name": f"Producto {product_id[:8]}", "brand": "Marca",
+                                       "deliveryTime": 3} for product_id in body['ids']])
+                else:
+                    self._reply(404, {"msg": "Not found"})
+
+            def _reply(self, status, data):
+                payload = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def order_requests(seed: int, count: int, products: int, lines: int) -> list[dict]:
+    """Order requests of the mobile app, generated from the seed so every run orders the same"""
+    generator = random.Random(seed)
+    catalog = [str(uuid.UUID(int=generator.getrandbits(128), version=4)) for _ in range(products)]
+    requests = []
+    for index in range(count):
+        details = [{"productId": product_id, "quantity": generator.randint(1, 3), "unitPrice": 10.0,
+                    "totalPrice": 10.0, "currency": "USD"}
+                   for product_id in generator.sample(catalog, min(lines, products))]
+        subtotal = sum(detail["quantity"] * detail["unitPrice"] for detail in details)
+        requests.append({
+            "clientId": f"client-{index % 50}",
+            "quantity": sum(detail["quantity"] for detail in details),
+            "subtotal": subtotal,
+            "tax": round(subtotal * 0.19, 2),
+            "total": round(subtotal * 1.19, 2),
+            "currency": "USD",
+            "payment": {"amount": round(subtotal * 1.19, 2), "cardNumber": "4111111111111111", "cvv": "123",
+                        "expiryDate": "12/30", "currency": "USD"},
+            "clientInfo": {"name": f"Cliente {index}", "address": "Calle 1 # 2-3", "phone": "3001234567",
+                           "email": f"cliente{index}@example.com"},
+            "orderDetails": details,
+        })
+    return requests
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=500, help="Orders created, after the warmup")
+    parser.add_argument("--concurrency", type=int, default=8, help="Orders created at the same time")
+    parser.add_argument("--warmup", type=int, default=20, help="Orders created before measuring")
+    parser.add_argument("--lines", type=int, default=3, help="Products per order")
+    parser.add_argument("--products", type=int, default=200, help="Products of the catalog")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--upstream-delay", type=float, default=0, help="Seconds the stand-in APIs take per call")
+    parser.add_argument("--number", type=int, default=1000, help="Calls per round of the micro-benchmarks")
+    parser.add_argument("--output", help="File to write the report to, stdout by default")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> dict:
+    arguments = parse_arguments(argv)
+    upstream = UpstreamStandIn(arguments.upstream_delay).start()
+    # The URLs of the APIs are read from the environment when the modules of the BFF are imported
+    os.environ["CLIENTS_API_URL"] = upstream.url
+    os.environ["PRODUCTS_API_URL"] = upstream.url
+    os.environ["LOG_LEVEL"] = arguments.log_level
+
+    from src.adapters.clients_adapter import ClientsAdapter
+    from src.main import create_app
+    quiet_logging(arguments.log_level)
+
+    app = create_app()
+    headers = {"Authorization": "Bearer benchmark", "salesman-id": "salesman-1"}
+    try:
+        def create_order(order_data):
+            response = app.test_client().post('/bff/v1/mobile/clients/orders/', json=order_data, headers=headers)
+            if response.status_code != 201:
+                raise RuntimeError(f"Order not created, status {response.status_code}")
+
+        requests = order_requests(arguments.seed, arguments.orders + arguments.warmup, arguments.products,
+                                  arguments.lines)
+        stages = {"bff.create_order": run_stage(create_order, requests, arguments.concurrency, arguments.warmup)}
+
+        # The enrichment of an order, with its products already retrieved by the adapter
+        adapter = ClientsAdapter()
+        order = dict(requests[0])
+
+        def enrich():
+            adapter._enrich_product_information("benchmark", order, 201)
+
+        enrich()
+        micro = {"bff.enrich_product_information": micro_benchmark(enrich, arguments.number)}
+    finally:
+        upstream.stop()
+
+    parameters = {key: getattr(arguments, key) for key in
+                  ("orders", "concurrency", "warmup", "lines", "products", "seed", "upstream_delay", "number")}
+    result = report("mobile-bff", parameters, stages, micro)
+    write_report(result, arguments.output)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -123,7 +123,8 @@ def test_list_orders_success(client):
         MockAdapter.assert_called_once()
         mock_instance.lists_orders.assert_called_once_with(
             'fake_token',
-            '123e4567-e89b-12d3-a456-426614174000'
+            '123e4567-e89b-12d3-a456-426614174000',
+            {}
         )
 
 def test_list_orders_missing_token(client):
@@ -163,7 +164,8 @@ def test_list_orders_by_salesman_success(client):
         MockAdapter.assert_called_once()
         mock_instance.get_orders_by_salesman_id.assert_called_once_with(
             'fake_token',
-            '123e4567-e89b-12d3-a456-426614174000'
+            '123e4567-e89b-12d3-a456-426614174000',
+            {}
         )
 
 def test_list_orders_by_salesman_missing_token(client):
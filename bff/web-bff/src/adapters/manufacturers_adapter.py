@@ -1,32 +1,30 @@
 import os
-import logging
 
 import requests
 
-MANUFACTURERS_API_URL = os.environ.get('MANUFACTURERS_API_URL', 'http://localhost:5100')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+MANUFACTURERS_API_URL = os.environ.get('MANUFACTURERS_API_URL', 'http://localhost:5100')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ManufacturersAdapter:
 
-    def get_all_manufacturers(self, jwt):
+    def get_all_manufacturers(self, jwt, page_params=None):
         """
         Get all manufacturers.
         :param jwt: JWT token for authorization.
+        :param page_params: Optional pagination params (limit and cursor) forwarded to the manufacturers API.
         :return: The all manufacturers data
         """
         logger.debug("Getting all manufacturers")
         headers = {'Authorization': f'Bearer {jwt}'}
-        response = requests.get(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        response = requests.get(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/", headers=headers,
+                                params=page_params)
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def get_manufacturer_by_id(self, jwt, manufacturer_id):
         """
@@ -38,8 +36,9 @@ class ManufacturersAdapter:
         logger.debug(f"Getting manufacturer by ID {manufacturer_id}")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/{manufacturer_id}", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def get_manufacturer_by_nit(self, jwt, nit):
         """
@@ -52,8 +51,9 @@ class ManufacturersAdapter:
         headers = {'Authorization': f'Bearer {jwt}'}
         query_params = {'nit': nit}
         response = requests.get(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/search", headers=headers, params=query_params)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def create_manufacturer(self, jwt, manufacturer_data):
         """
@@ -65,8 +65,9 @@ class ManufacturersAdapter:
         logger.debug(f"Creating manufacturer {manufacturer_data['name']}")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/", headers=headers, json=manufacturer_data)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def update_manufacturer(self, jwt, manufacturer_id,  manufacturer_data):
         """
@@ -79,8 +80,9 @@ class ManufacturersAdapter:
         logger.debug(f"Updating manufacturer {manufacturer_data['name']}")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.put(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/{manufacturer_id}", headers=headers, json=manufacturer_data)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
 
     def delete_manufacturer(self, jwt, manufacturer_id):
@@ -107,5 +109,6 @@ class ManufacturersAdapter:
         logger.debug(f"Creating bulk manufacturer")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{MANUFACTURERS_API_URL}/api/v1/manufacturers/bulk-upload", headers=headers, json=manufacturers_data)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
\ No newline at end of file
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
\ No newline at end of file
@@ -1,34 +1,30 @@
-import logging
 import os
 
 import requests
 
 from .products_adapter import ProductsAdapter
+from ..utils.structured_logging import get_logger
 
 ORDERS_API_URL = os.environ.get('ORDERS_API_URL', 'http://localhost:5100')
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class OrdersAdapter:
 
-    def list_orders(self, jwt):
+    def list_orders(self, jwt, page_params=None):
         """
         List all orders.
         :param jwt: JWT token for authorization.
+        :param page_params: Optional pagination params (limit and cursor) and view forwarded to the orders API.
         :return: The orders data
         """
         logger.debug("Listing all orders")
         headers = {'Authorization': f'Bearer {jwt}'}
-        response = requests.get(f"{ORDERS_API_URL}/api/v1/orders", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        response = requests.get(f"{ORDERS_API_URL}/api/v1/orders", headers=headers, params=page_params)
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def get_order_by_id(self, jwt, order_id):
         """
@@ -44,9 +40,9 @@ class OrdersAdapter:
         if response.status_code == 200:
             order_data = response.json()
             order_data = self._decorate_order(jwt, order_data)
-            logger.debug(f"Order decorated: {order_data}")
+            logger.debug("Order decorated", order_data=order_data)
 
-        logger.debug(f"Response received from API: {order_data}")
+        logger.debug("Response received from API", body=order_data)
         return order_data, response.status_code
 
     def _decorate_order(self, jwt, order_data):
@@ -59,8 +55,8 @@ class OrdersAdapter:
         product_adapter = ProductsAdapter()
         order_items = order_data.get('orderItems', [])
 
+        products, _ = product_adapter.get_products_by_ids(jwt, [item['productId'] for item in order_items])
         for item in order_items:
-            product_data, _ = product_adapter.get_product_by_id(jwt, item['productId'])
-            item['productName'] = product_data.get('name')
+            item['productName'] = products.get(str(item['productId']), {}).get('name')
 
         return order_data
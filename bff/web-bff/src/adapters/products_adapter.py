@@ -1,31 +1,68 @@
-import logging
 import os
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.products_cache import products_cache, product_key, products_key
+from ..utils.structured_logging import get_logger
 
 PRODUCTS_API_URL = os.environ.get('PRODUCTS_API_URL', 'http://localhost:5100')
+PRODUCTS_BATCH_SIZE = int(os.environ.get('PRODUCTS_BATCH_SIZE', '500'))
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+# Keep-alive connections to the products API shared by every request of the process
+http_session = requests.Session()
+http_session.mount('http://', HTTPAdapter(pool_maxsize=int(os.environ.get('PRODUCTS_API_POOL_SIZE', '10'))))
+http_session.mount('https://', HTTPAdapter(pool_maxsize=int(os.environ.get('PRODUCTS_API_POOL_SIZE', '10'))))
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ProductsAdapter:
-    def get_all_products(self, jwt):
+    def __init__(self):
+        # Products already retrieved by this adapter, adapters are created per request
+        self._products_memo = {}
+
+    def get_products_by_ids(self, jwt, product_ids):
+        """
+        Get several products by ID with a single call to the products API.
+        Products already retrieved by this adapter are not requested again.
+        :param jwt: JWT token for authorization.
+        :param product_ids: IDs of the products to retrieve.
+        :return: Dictionary of product ID to product data, and the status code
+        """
+        product_ids = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+        missing = [product_id for product_id in product_ids if product_id not in self._products_memo]
+        logger.debug(f"Getting {len(product_ids)} products by ID, {len(missing)} not retrieved yet")
+
+        status_code = 200
+        headers = {'Authorization': f'Bearer {jwt}'}
+        for start in range(0, len(missing), PRODUCTS_BATCH_SIZE):
+            response = http_session.post(f"{PRODUCTS_API_URL}/api/v1/products/batch", headers=headers,
+                                         json={'ids': missing[start:start + PRODUCTS_BATCH_SIZE]})
+            status_code = response.status_code
+            if status_code != 200:
+                logger.error(f"Error getting products by ID: {status_code}")
+                break
+            for product in response.json():
+                self._products_memo[str(product['id'])] = product
+
+        products = {product_id: self._products_memo[product_id] for product_id in product_ids
+                    if product_id in self._products_memo}
+        return products, status_code
+
+    def get_all_products(self, jwt, page_params=None):
         """
         Get all products.
         :param jwt: JWT token for authorization.
+        :param page_params: Optional pagination params (limit and cursor) forwarded to the products API.
         :return: The all products data
         """
         logger.debug("Getting all products")
-        headers = {'Authorization': f'Bearer {jwt}'}
-        response = requests.get(f"{PRODUCTS_API_URL}/api/v1/products", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        url = f"{PRODUCTS_API_URL}/api/v1/products"
+        if page_params:
+            url = f"{url}?{urlencode(page_params)}"
+        return self._cached_get(jwt, products_key(page_params), url)
 
     def get_product_by_id(self, jwt, product_id):
         """
@@ -35,10 +72,39 @@ class ProductsAdapter:
         :return: The product data
         """
         logger.debug(f"Getting product by ID {product_id}")
+        return self._cached_get(jwt, product_key(product_id), f"{PRODUCTS_API_URL}/api/v1/products/{product_id}")
+
+    @staticmethod
+    def _cached_get(jwt, key, url):
+        """
+        Read-through of the products cache.
+        Fresh responses are served from memory, stale ones are revalidated with their ETag.
+        :param jwt: JWT token for authorization.
+        :param key: Key of the response in the cache.
+        :param url: URL of the resource in the products API.
+        :return: The response data and the status code
+        """
+        cached = products_cache.get(key)
+        if cached and cached[2] and products_cache.is_authorized(jwt):
+            logger.debug(f"Serving {key} from the products cache")
+            return cached[0], 200
+
         headers = {'Authorization': f'Bearer {jwt}'}
-        response = requests.get(f"{PRODUCTS_API_URL}/api/v1/products/{product_id}", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        if cached and cached[1]:
+            headers['If-None-Match'] = cached[1]
+        response = http_session.get(url, headers=headers)
+
+        if response.status_code == 304 and cached:
+            logger.debug(f"{key} not modified, refreshing the cached response")
+            products_cache.put(key, cached[0], cached[1])
+            products_cache.authorize(jwt)
+            return cached[0], 200
+
+        data = response.json()
+        if response.status_code == 200:
+            products_cache.put(key, data, response.headers.get('ETag'))
+            products_cache.authorize(jwt)
+        return data, response.status_code
 
     def get_products_by_manufacturer(self, jwt, manufacturer_id):
         """
@@ -51,8 +117,9 @@ class ProductsAdapter:
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{PRODUCTS_API_URL}/api/v1/manufacturers/{manufacturer_id}/products",
                                 headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def create_product(self, jwt, product_data):
         """
@@ -64,8 +131,11 @@ class ProductsAdapter:
         logger.debug("Creating a new product")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{PRODUCTS_API_URL}/api/v1/products", headers=headers, json=product_data)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        if response.status_code == 201:
+            products_cache.invalidate_products([])
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def update_product(self, jwt, product_id, product_data):
         """
@@ -78,8 +148,11 @@ class ProductsAdapter:
         logger.debug(f"Updating product with ID {product_id}")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.put(f"{PRODUCTS_API_URL}/api/v1/products/{product_id}", headers=headers, json=product_data)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        if response.status_code == 200:
+            products_cache.invalidate_products([product_id])
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def delete_product(self, jwt, product_id):
         """
@@ -92,5 +165,29 @@ class ProductsAdapter:
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.delete(f"{PRODUCTS_API_URL}/api/v1/products/{product_id}", headers=headers)
         if response.status_code == 204:
+            products_cache.invalidate_products([product_id])
             return {}, response.status_code
         return response.json(), response.status_code
+
+    def start_product_import(self, jwt):
+        """
+        Start a products bulk import, pending until its first batch is processed.
+        :param jwt: JWT token for authorization.
+        :return: The import data, with its ID
+        """
+        logger.debug("Starting a product import")
+        headers = {'Authorization': f'Bearer {jwt}'}
+        response = requests.post(f"{PRODUCTS_API_URL}/api/v1/products/imports", headers=headers)
+        return response.json(), response.status_code
+
+    def get_product_import(self, jwt, import_id):
+        """
+        Get the progress of a products bulk import.
+        :param jwt: JWT token for authorization.
+        :param import_id: ID of the import returned by the bulk upload.
+        :return: The import progress data
+        """
+        logger.debug(f"Getting product import {import_id}")
+        headers = {'Authorization': f'Bearer {jwt}'}
+        response = requests.get(f"{PRODUCTS_API_URL}/api/v1/products/imports/{import_id}", headers=headers)
+        return response.json(), response.status_code
@@ -1,26 +1,28 @@
 import csv
 import io
-import logging
+import os
+import uuid
 
+from .products_adapter import ProductsAdapter
 from ..messaging.producer.products_bulk_producer import ProductsBulkProducer
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+BATCH_SIZE = int(os.getenv('PRODUCTS_BULK_BATCH_SIZE', '500'))
 
 
 class ProductsBulkAdapter:
-    def __init__(self):
+    def __init__(self, batch_size: int = BATCH_SIZE):
         self.producer = ProductsBulkProducer()
+        self.batch_size = batch_size
 
-    def process_file(self, file):
+    def process_file(self, file, jwt=None):
         """
         Process the uploaded CSV file.
         :param file: The uploaded file object.
+        :param jwt: JWT token of the user, to start the import in the products API before publishing its batches.
         :return: A response indicating the result of the processing.
         """
         logger.debug("Beginning file processing...")
@@ -41,20 +43,68 @@ class ProductsBulkAdapter:
         logger.debug("File size is within the limit")
         # Read the CSV file
         logger.debug("Reading the CSV file...")
-        products = []
         # Decode the file stream to a text stream
         text_stream = io.TextIOWrapper(file.stream, encoding='utf-8')
 
         logger.debug("Decoding the file stream...")
         csv_reader = csv.DictReader(text_stream)
-        for row in csv_reader:
-            products.append(row)
-        # Here we would process the products
+
+        # The rows are published in batches while the file is read, one batch is held back
+        # so the last one can be flagged
         logger.debug("Processing the products...")
-        self.producer.produce(products)
+        import_id = None
+        total = 0
+        sequence = 0
+        previous = None
+        for batch in self._read_batches(csv_reader):
+            total += len(batch)
+            if import_id is None:
+                import_id = self._start_import(jwt)
+            if previous is not None:
+                self.producer.produce_batch(import_id, sequence, previous, last=False)
+                sequence += 1
+            previous = batch
+
+        if previous is not None:
+            self.producer.produce_batch(import_id, sequence, previous, last=True)
 
         logger.debug("Finished processing the file")
         return {
             "message": "File successfully uploaded and processed",
-            "productsToProcessed": f"{len(products)} products"
+            "productsToProcessed": f"{total} products",
+            "importId": import_id if total else None
         }
+
+    @staticmethod
+    def _start_import(jwt):
+        """
+        Start the import in the products API, so its progress can be polled as soon as the upload returns.
+        The products API creates an import it does not know on its first batch, so an import it could not start
+        still gets processed under an ID generated here.
+        :param jwt: JWT token of the user.
+        :return: The ID of the import.
+        """
+        if jwt:
+            try:
+                body, status = ProductsAdapter().start_product_import(jwt)
+                if status == 201:
+                    return body["id"]
+                logger.warning("Could not start the import in the products API: %s %s", status, body)
+            except Exception as e:
+                logger.warning("Could not start the import in the products API: %s", e)
+        return str(uuid.uuid4())
+
+    def _read_batches(self, rows):
+        """
+        Groups the rows of the file in batches.
+        :param rows: Iterable of rows.
+        :return: Generator of lists of at most batch_size rows.
+        """
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
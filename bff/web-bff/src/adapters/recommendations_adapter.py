@@ -1,19 +1,13 @@
-import logging
 import os
 
 import requests
 
 from .products_adapter import ProductsAdapter
+from ..utils.structured_logging import get_logger
 
 RECOMMENDATIONS_API_URL = os.environ.get('RECOMMENDATIONS_API_URL', 'http://localhost:5200')
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class RecommendationsAdapter:
@@ -26,10 +20,11 @@ class RecommendationsAdapter:
         logger.debug("Getting all recommendations")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{RECOMMENDATIONS_API_URL}/api/v1/recommendations", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
         recommendations_data = None
         if response.status_code == 200:
-            recommendations_data = response.json()
+            recommendations_data = body
             for recommendation in recommendations_data:
                 recommendation = self._decorate_recommendation_data(jwt, recommendation)
                 logger.debug(f"Recommendation decorated: {recommendation}")
@@ -47,12 +42,13 @@ class RecommendationsAdapter:
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{RECOMMENDATIONS_API_URL}/api/v1/recommendations", json=recommendation_data,
                                  headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
         recommendation_data = None
         if response.status_code == 201:
-            recommendation_data = response.json()
+            recommendation_data = body
             recommendation_data = self._decorate_recommendation_data(jwt, recommendation_data)
-            logger.debug(f"Recommendation decorated: {recommendation_data}")
+            logger.debug("Recommendation decorated", recommendation_data=recommendation_data)
 
         return recommendation_data, response.status_code
 
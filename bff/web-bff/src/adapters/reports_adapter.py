@@ -1,19 +1,13 @@
-import logging
 import os
 
 import requests
 
 from .products_adapter import ProductsAdapter
+from ..utils.structured_logging import get_logger
 
 CLIENTS_API_URL = os.environ.get('CLIENTS_API_URL', 'http://localhost:5100')
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
-
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class ReportsAdapter:
@@ -31,8 +25,9 @@ class ReportsAdapter:
         logger.debug(f"Getting report by user ID {user_id}")
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.get(f"{CLIENTS_API_URL}/api/v1/reports/{user_id}", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def generate_report(self, jwt, data):
         """
@@ -41,19 +36,48 @@ class ReportsAdapter:
         :param data: Data to generate the report with.
         :return: The report data
         """
-        logger.debug(f"Generating report with data {data}")
+        logger.debug("Generating report", data=data)
         headers = {'Authorization': f'Bearer {jwt}'}
         response = requests.post(f"{CLIENTS_API_URL}/api/v1/reports/generate", headers=headers, json=data)
-        logger.debug(f"Response received from API: {response.json()}")
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
 
         report_data = None
         if response.status_code == 200 and data.get('type') == 'PRODUCTOS_MAS_VENDIDOS':
-            report_data = response.json()
+            report_data = body
             report_data = self._decorate_products_report(jwt, report_data)
-            logger.debug(f"Report decorated: {report_data}")
+            logger.debug("Report decorated", report_data=report_data)
 
         return report_data, response.status_code
 
+    def request_report_job(self, jwt, data):
+        """
+        Request a report to be generated in the background.
+        :param jwt: JWT token for authorization.
+        :param data: Data to generate the report with.
+        :return: The pending report job
+        """
+        logger.debug("Requesting report job", data=data)
+        headers = {'Authorization': f'Bearer {jwt}'}
+        response = requests.post(f"{CLIENTS_API_URL}/api/v1/reports/jobs", headers=headers, json=data)
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
+
+    def get_report_job(self, jwt, job_id):
+        """
+        Get the status of a report job.
+        :param jwt: JWT token for authorization.
+        :param job_id: ID of the report job.
+        :return: The report job, with the URL of the report once completed
+        """
+        logger.debug(f"Getting report job {job_id}")
+        headers = {'Authorization': f'Bearer {jwt}'}
+        response = requests.get(f"{CLIENTS_API_URL}/api/v1/reports/jobs/{job_id}", headers=headers)
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
+
     def _decorate_products_report(self, jwt, report_data):
         """
         Decorate the order with product details.
@@ -64,8 +88,8 @@ class ReportsAdapter:
         product_adapter = ProductsAdapter()
         data = report_data.get('reportData', [])
 
+        products, _ = product_adapter.get_products_by_ids(jwt, [item['productId'] for item in data])
         for item in data:
-            product_data, _ = product_adapter.get_product_by_id(jwt, item['productId'])
-            item['productName'] = product_data.get('name')
+            item['productName'] = products.get(str(item['productId']), {}).get('name')
 
         return report_data
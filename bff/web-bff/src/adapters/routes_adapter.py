@@ -1,23 +1,18 @@
-import logging
 import os
 
 import requests
 
-ROUTES_API_URL = os.environ.get('ROUTES_API_URL', 'http://localhost:5100')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+ROUTES_API_URL = os.environ.get('ROUTES_API_URL', 'http://localhost:5100')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class RoutesAdapter:
     @staticmethod
     def create_route(jwt, route_data):
-        logger.debug(f"creating a route with data {route_data}")
+        logger.debug("creating a route", route_data=route_data)
 
         response = requests.post(
             url=f"{ROUTES_API_URL}/api/v1/routes",
@@ -25,12 +20,13 @@ class RoutesAdapter:
             json=route_data
         )
 
-        logger.debug(f"response received from routes api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from routes api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
-    def get_user_routes_by_date(jwt, user_id, parsed_date):
+    def get_user_routes_by_date(jwt, user_id, parsed_date, page_params=None):
         logger.debug(f"getting user::{user_id} routes by date")
 
         params = {"user_id": user_id}
@@ -38,15 +34,19 @@ class RoutesAdapter:
         if parsed_date:
             params["due_to"] = parsed_date.isoformat()
 
+        if page_params:
+            params.update(page_params)
+
         response = requests.get(
             url=f"{ROUTES_API_URL}/api/v1/routes",
             headers={'Authorization': f'Bearer {jwt}'},
             params=params
         )
 
-        logger.debug(f"response received from routes api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from routes api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_route_by_id(jwt, route_id):
@@ -57,13 +57,14 @@ class RoutesAdapter:
             headers={'Authorization': f'Bearer {jwt}'}
         )
 
-        logger.debug(f"response received from routes api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from routes api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def update_route_by_id(jwt, route_id, route_data):
-        logger.debug(f"updating route with ID: {route_id} with data: {route_data}")
+        logger.debug("updating route with ID: %s", route_id, route_data=route_data)
 
         response = requests.put(
             url=f"{ROUTES_API_URL}/api/v1/routes/{route_id}",
@@ -71,9 +72,10 @@ class RoutesAdapter:
             json=route_data
         )
 
-        logger.debug(f"response received from routes api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from routes api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def delete_route_by_id(jwt, route_id):
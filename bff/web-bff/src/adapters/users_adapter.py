@@ -1,17 +1,12 @@
-import logging
 import os
 
 import requests
 
-USERS_API_URL = os.environ.get('USERS_API_URL', 'http://localhost:5100/api/v1/users')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+USERS_API_URL = os.environ.get('USERS_API_URL', 'http://localhost:5100/api/v1/users')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class UsersAdapter:
@@ -24,8 +19,9 @@ class UsersAdapter:
         """
         logger.debug(f"Creating user with data: {user_data['name']}, {user_data['email']}, {user_data['role']}")
         response = requests.post(f"{USERS_API_URL}", json=user_data)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def authorize(self, email, password):
         """
@@ -36,8 +32,9 @@ class UsersAdapter:
         """
         logger.debug(f"Authorizing user with email: {email}")
         response = requests.post(f"{USERS_API_URL}/auth", json={"email": email, "password": password})
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
 
     def get_user_info(self, token):
         """
@@ -48,5 +45,6 @@ class UsersAdapter:
         logger.debug(f"Getting user info with token: {token}")
         headers = {'Authorization':  token}
         response = requests.get(f"{USERS_API_URL}/me", headers=headers)
-        logger.debug(f"Response received from API: {response.json()}")
-        return response.json(), response.status_code
+        body = response.json()
+        logger.debug("Response received from API", status=response.status_code, body=body)
+        return body, response.status_code
@@ -1,23 +1,18 @@
-import logging
 import os
 
 import requests
 
-WAREHOUSES_API_URL = os.environ.get('WAREHOUSES_API_URL', 'http://localhost:5069')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+WAREHOUSES_API_URL = os.environ.get('WAREHOUSES_API_URL', 'http://localhost:5069')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class WarehouseAdapter:
     @staticmethod
     def create_warehouse(jwt, warehouse_data):
-        logger.debug(f"creating a warehouse with data {warehouse_data}")
+        logger.debug("creating a warehouse", warehouse_data=warehouse_data)
 
         response = requests.post(
             url=f"{WAREHOUSES_API_URL}/api/v1/warehouses",
@@ -25,9 +20,10 @@ class WarehouseAdapter:
             json=warehouse_data
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_warehouse_by_id(jwt, warehouse_id):
@@ -38,9 +34,10 @@ class WarehouseAdapter:
             headers={'Authorization': f'Bearer {jwt}'}
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_all_warehouses(jwt, administrator_id: str = None):
@@ -56,13 +53,14 @@ class WarehouseAdapter:
             params=params
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def update_warehouse_by_id(jwt, warehouse_id, warehouse_data):
-        logger.debug(f"updating warehouse with ID: {warehouse_id} with data: {warehouse_data}")
+        logger.debug("updating warehouse with ID: %s", warehouse_id, warehouse_data=warehouse_data)
 
         response = requests.put(
             url=f"{WAREHOUSES_API_URL}/api/v1/warehouses/{warehouse_id}",
@@ -70,9 +68,10 @@ class WarehouseAdapter:
             json=warehouse_data
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def delete_warehouse_by_id(jwt, warehouse_id):
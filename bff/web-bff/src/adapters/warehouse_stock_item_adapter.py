@@ -1,23 +1,18 @@
-import logging
 import os
 
 import requests
 
-WAREHOUSES_API_URL = os.environ.get('WAREHOUSES_API_URL', 'http://localhost:5069')
+from ..utils.structured_logging import get_logger
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+WAREHOUSES_API_URL = os.environ.get('WAREHOUSES_API_URL', 'http://localhost:5069')
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class WarehouseStockItemAdapter:
     @staticmethod
     def create_warehouse_stock_item(jwt, warehouse_stock_item_data):
-        logger.debug(f"creating a warehouse stock item with data {warehouse_stock_item_data}")
+        logger.debug("creating a warehouse stock item", warehouse_stock_item_data=warehouse_stock_item_data)
 
         response = requests.post(
             url=f"{WAREHOUSES_API_URL}/api/v1/warehouse-stock-items",
@@ -25,9 +20,10 @@ class WarehouseStockItemAdapter:
             json=warehouse_stock_item_data
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def get_warehouse_stock_item_by_id(jwt, item_id):
@@ -38,26 +34,30 @@ class WarehouseStockItemAdapter:
             headers={'Authorization': f'Bearer {jwt}'}
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
-    def get_warehouse_stock_items_by_warehouse(jwt, warehouse_id):
+    def get_warehouse_stock_items_by_warehouse(jwt, warehouse_id, page_params=None):
         logger.debug(f"getting all warehouse stock items for warehouse ID: {warehouse_id}")
 
         response = requests.get(
             url=f"{WAREHOUSES_API_URL}/api/v1/warehouse-stock-items/warehouse/{warehouse_id}",
-            headers={'Authorization': f'Bearer {jwt}'}
+            headers={'Authorization': f'Bearer {jwt}'},
+            params=page_params
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def update_warehouse_stock_item_by_id(jwt, item_id, warehouse_stock_item_data):
-        logger.debug(f"updating warehouse stock item with ID: {item_id} with data: {warehouse_stock_item_data}")
+        logger.debug("updating warehouse stock item with ID: %s", item_id,
+                     warehouse_stock_item_data=warehouse_stock_item_data)
 
         response = requests.put(
             url=f"{WAREHOUSES_API_URL}/api/v1/warehouse-stock-items/{item_id}",
@@ -65,9 +65,10 @@ class WarehouseStockItemAdapter:
             json=warehouse_stock_item_data
         )
 
-        logger.debug(f"response received from bodegas api: {response.json()}")
+        body = response.json()
+        logger.debug("response received from bodegas api", status=response.status_code, body=body)
 
-        return response.json(), response.status_code
+        return body, response.status_code
 
     @staticmethod
     def delete_warehouse_stock_item_by_id(jwt, item_id):
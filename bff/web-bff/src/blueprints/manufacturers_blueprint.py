@@ -5,12 +5,8 @@ from flask import Blueprint, jsonify, request
 
 from ..adapters.manufacturers_adapter import ManufacturersAdapter
 from ..adapters.products_adapter import ProductsAdapter
+from ..utils.commons import page_params
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 manufacturers_blueprint = Blueprint('manufacturers', __name__, url_prefix='/bff/v1/web/manufacturers')
@@ -37,7 +33,7 @@ def get_all_manufacturers(jwt):
     logging.debug("Received request to get all manufacturers.")
     logging.debug("Retrieving all manufacturers from BFF Web.")
     adapter = ManufacturersAdapter()
-    return adapter.get_all_manufacturers(jwt)
+    return adapter.get_all_manufacturers(jwt, page_params())
 
 
 @manufacturers_blueprint.route('/<manufacturer_id>', methods=['GET'])
@@ -4,12 +4,8 @@ import functools
 from flask import Blueprint, request, jsonify
 
 from ..adapters.orders_adapter import OrdersAdapter
+from ..utils.commons import order_list_params
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 orders_blueprint = Blueprint('orders', __name__, url_prefix='/bff/v1/web/orders')
@@ -34,7 +30,7 @@ def get_all_orders(jwt):
     logger.debug("Received request to get all orders.")
     logger.debug("Retrieving all orders from BFF Web.")
     adapter = OrdersAdapter()
-    return adapter.list_orders(jwt)
+    return adapter.list_orders(jwt, order_list_params())
 
 @orders_blueprint.route('/<order_id>', methods=['GET'])
 @token_required
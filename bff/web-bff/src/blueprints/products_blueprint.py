@@ -5,12 +5,8 @@ from flask import Blueprint, jsonify, request
 
 from ..adapters.products_adapter import ProductsAdapter
 from ..adapters.products_bulk_adapter import ProductsBulkAdapter
+from ..utils.commons import conditional_response, page_params
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 products_blueprint = Blueprint('products', __name__, url_prefix='/bff/v1/web/products')
@@ -37,7 +33,7 @@ def get_all_products(jwt):
     logging.debug("Received request to get all products.")
     logging.debug("Retrieving all products from BFF Web.")
     adapter = ProductsAdapter()
-    return adapter.get_all_products(jwt)
+    return conditional_response(*adapter.get_all_products(jwt, page_params()))
 
 
 @products_blueprint.route('/<product_id>', methods=['GET'])
@@ -46,7 +42,7 @@ def get_product_by_id(product_id, jwt):
     logging.debug(f"Received request to get product with ID: {product_id}")
     logging.debug("Retrieving product by ID from BFF Web.")
     adapter = ProductsAdapter()
-    return adapter.get_product_by_id(jwt, product_id)
+    return conditional_response(*adapter.get_product_by_id(jwt, product_id))
 
 
 @products_blueprint.route('/', methods=['POST'])
@@ -103,7 +99,14 @@ def bulk_products(jwt):
         logging.debug("Received request to process bulk products.")
         logging.debug("Processing bulk products in BFF Web.")
         adapter = ProductsBulkAdapter()
-        return adapter.process_file(file)
+        return adapter.process_file(file, jwt)
     else:
         return jsonify({"message": "Invalid file format"}), 400
 
+
+@products_blueprint.route('/bulk/<import_id>', methods=['GET'])
+@token_required
+def get_bulk_products_status(import_id, jwt):
+    logging.debug(f"Received request to get the status of bulk import {import_id}.")
+    adapter = ProductsAdapter()
+    return adapter.get_product_import(jwt, import_id)
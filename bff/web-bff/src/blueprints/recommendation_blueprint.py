@@ -5,11 +5,6 @@ from flask import Blueprint, request, jsonify
 
 from ..adapters.recommendations_adapter import RecommendationsAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 recommendation_blueprint = Blueprint('recommendations', __name__, url_prefix='/bff/v1/web/recommendations')
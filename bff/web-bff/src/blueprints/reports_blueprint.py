@@ -5,11 +5,6 @@ from flask import Blueprint, request, jsonify
 
 from ..adapters.reports_adapter import ReportsAdapter
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 reports_blueprint = Blueprint('reports', __name__, url_prefix='/bff/v1/web/reports')
@@ -54,4 +49,30 @@ def generate_report(jwt):
     logger.debug("Generating report from BFF Web.")
     data = request.get_json()
     adapter = ReportsAdapter()
-    return adapter.generate_report(jwt, data)
\ No newline at end of file
+    return adapter.generate_report(jwt, data)
+
+@reports_blueprint.route('/jobs', methods=['POST'])
+@token_required
+def request_report_job(jwt):
+    """
+    Request a report to be generated in the background.
+    :param jwt: JWT token for authorization.
+    :return: The pending report job
+    """
+    logger.debug("Received request to generate report in the background.")
+    data = request.get_json()
+    adapter = ReportsAdapter()
+    return adapter.request_report_job(jwt, data)
+
+@reports_blueprint.route('/jobs/<job_id>', methods=['GET'])
+@token_required
+def get_report_job(job_id, jwt):
+    """
+    Get the status of a report job.
+    :param job_id: ID of the report job.
+    :param jwt: JWT token for authorization.
+    :return: The report job
+    """
+    logger.debug(f"Received request to get report job: {job_id}")
+    adapter = ReportsAdapter()
+    return adapter.get_report_job(jwt, job_id)
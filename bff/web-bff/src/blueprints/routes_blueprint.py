@@ -4,13 +4,8 @@ from datetime import datetime
 from flask import Blueprint, request
 
 from ..adapters.routes_adapter import RoutesAdapter
-from ..utils.commons import validate_token
+from ..utils.commons import validate_token, page_params
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 routes_blueprint = Blueprint('routes', __name__, url_prefix='/bff/v1/web/routes')
@@ -69,4 +64,4 @@ def get_user_routes(user_id, jwt):
         parsed_date = None
 
     adapter = RoutesAdapter()
-    return adapter.get_user_routes_by_date(jwt, user_id, parsed_date)
+    return adapter.get_user_routes_by_date(jwt, user_id, parsed_date, page_params())
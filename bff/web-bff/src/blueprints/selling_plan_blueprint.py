@@ -4,11 +4,6 @@ from flask import Blueprint, request, jsonify
 from ..adapters.selling_plan_adapter import SellingPlanAdapter
 from ..utils.commons import validate_token   # Use your decorator like @validate_token
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 selling_plan_blueprint = Blueprint('selling_plan', __name__, url_prefix='/bff/v1/web/selling-plans')
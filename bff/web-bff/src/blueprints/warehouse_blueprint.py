@@ -5,11 +5,6 @@ from flask import Blueprint, request
 from ..adapters.warehouse_adapter import WarehouseAdapter
 from ..utils.commons import validate_token
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 warehouse_blueprint = Blueprint('warehouse', __name__, url_prefix='/bff/v1/web/warehouses')
@@ -3,13 +3,8 @@ import logging
 from flask import Blueprint, request
 
 from ..adapters.warehouse_stock_item_adapter import WarehouseStockItemAdapter
-from ..utils.commons import validate_token
+from ..utils.commons import validate_token, page_params
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 warehouse_stock_item_blueprint = Blueprint('warehouse_stock_item', __name__, url_prefix='/bff/v1/web/warehouse-stock-items')
@@ -42,7 +37,7 @@ def get_warehouse_stock_items_by_warehouse(warehouse_id, jwt):
     """Get all warehouse stock items for a warehouse."""
     logger.debug(f"received request to get all warehouse stock items for warehouse with id: {warehouse_id}")
     adapter = WarehouseStockItemAdapter()
-    return adapter.get_warehouse_stock_items_by_warehouse(jwt, warehouse_id)
+    return adapter.get_warehouse_stock_items_by_warehouse(jwt, warehouse_id, page_params())
 
 
 @warehouse_stock_item_blueprint.route('/<item_id>', methods=['PUT'])
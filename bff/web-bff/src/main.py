@@ -1,4 +1,5 @@
 import logging
+import os
 
 from dotenv import load_dotenv
 from flask import Flask
@@ -17,8 +18,11 @@ from .blueprints.warehouse_blueprint import warehouse_blueprint
 from .blueprints.warehouse_stock_item_blueprint import warehouse_stock_item_blueprint
 from .blueprints.reports_blueprint import reports_blueprint
 from .blueprints.recommendation_blueprint import recommendation_blueprint
+from .messaging.consumer.products_catalog_consumer import ProductsCatalogConsumer
+from .utils.structured_logging import configure_logging
+from .utils.metrics import init_metrics
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging('web-bff')
 
 
 def create_app():
@@ -27,6 +31,7 @@ def create_app():
     """
     logging.debug('BFF users microservice started')
     app = Flask(__name__)
+    init_metrics(app)
 
     # Register blueprints
     app.register_blueprint(management_blueprint)
@@ -51,6 +56,11 @@ def create_app():
         }
     }, supports_credentials=True)
 
+    # Invalidate the products cache on catalog events, without a broker the cache relies on its TTL
+    if os.getenv('RABBITMQ_HOST'):
+        logging.debug(">> Initialize the products catalog consumer")
+        ProductsCatalogConsumer().start_consuming()
+
     return app
 
 
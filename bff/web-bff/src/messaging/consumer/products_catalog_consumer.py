@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+import time
+
+import pika
+
+from ...utils.metrics import REGISTRY
+from ...utils.products_cache import products_cache
+from ...utils.structured_logging import get_logger
+
+RABBITMQ_USER = os.getenv('RABBITMQ_USER')
+RABBITMQ_PASSWORD = os.getenv('RABBITMQ_PASSWORD')
+RABBITMQ_HOST = os.getenv('RABBITMQ_HOST')
+RABBITMQ_PORT = os.getenv('RABBITMQ_PORT')
+
+EXCHANGE = 'products_catalog_exchange'
+ROUTING_KEY = 'products_catalog_routing_key'
+RETRY_DELAY = 5
+
+CONSUMED_MESSAGES = REGISTRY.counter("rabbitmq_consumed_messages_total", "Messages processed by the consumers, by outcome",
+                                     ("queue", "outcome"))
+
+
+logger = get_logger(__name__)
+
+
+class ProductsCatalogConsumer:
+    """
+    Invalidates the products cache when the products API publishes a catalog change
+    (stock updates and bulk imports). Every BFF process binds its own exclusive queue,
+    so all of them receive every event.
+    """
+
+    def __init__(self, cache=products_cache):
+        self.cache = cache
+
+    def process_message(self, message: dict) -> None:
+        """
+        Process a message received from the queue.
+        :param message: The catalog event: {"event", "productIds"}
+        """
+        logger.debug("Products catalog event received: %s", message.get('event'))
+        self.cache.invalidate_products(message.get('productIds'))
+
+    def start_consuming(self) -> threading.Thread:
+        """
+        Start consuming catalog events in a daemon thread.
+        """
+        thread = threading.Thread(target=self._consume, daemon=True)
+        thread.start()
+        return thread
+
+    def _consume(self) -> None:
+        while True:
+            try:
+                connection = pika.BlockingConnection(
+                    pika.ConnectionParameters(
+                        host=RABBITMQ_HOST,
+                        port=RABBITMQ_PORT,
+                        credentials=pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASSWORD)
+                    )
+                )
+                channel = connection.channel()
+                channel.exchange_declare(exchange=EXCHANGE, exchange_type='direct', durable=True)
+                queue = channel.queue_declare(queue='', exclusive=True).method.queue
+                channel.queue_bind(queue=queue, exchange=EXCHANGE, routing_key=ROUTING_KEY)
+                channel.basic_consume(queue=queue, on_message_callback=self._on_message, auto_ack=True)
+
+                # Events published while disconnected were lost, start from an empty cache
+                self.cache.invalidate()
+                logger.info("Started consuming products catalog events")
+                channel.start_consuming()
+            except pika.exceptions.AMQPError as e:
+                logger.error("Products catalog consumer error: %s, retrying in %d seconds", e, RETRY_DELAY)
+                time.sleep(RETRY_DELAY)
+
+    def _on_message(self, channel, method, properties, body) -> None:
+        try:
+            self.process_message(json.loads(body))
+            CONSUMED_MESSAGES.inc(queue=EXCHANGE, outcome="succeeded")
+        except Exception as e:
+            logger.error("Error processing products catalog event: %s", e)
+            self.cache.invalidate()
+            CONSUMED_MESSAGES.inc(queue=EXCHANGE, outcome="failed")
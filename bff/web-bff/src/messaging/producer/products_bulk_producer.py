@@ -1,43 +1,118 @@
 import json
-import logging
 import os
+import threading
 
 import pika
 
+from ...utils.metrics import REGISTRY
+from ...utils.structured_logging import get_logger
+
 RABBITMQ_USER = os.getenv('RABBITMQ_USER')
 RABBITMQ_PASSWORD = os.getenv('RABBITMQ_PASSWORD')
 RABBITMQ_HOST = os.getenv('RABBITMQ_HOST')
 RABBITMQ_PORT = os.getenv('RABBITMQ_PORT')
 
-logging.basicConfig(
-    level=logging.DEBUG,  # Set logging level to DEBUG (captures everything)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log format
-    datefmt='%Y-%m-%d %H:%M:%S'  # Date and time format
-)
+QUEUE = 'create_multiple_products_queue'
+EXCHANGE = 'create_multiple_products_exchange'
+ROUTING_KEY = 'create_multiple_products_routing_key'
+
+PUBLISHED_MESSAGES = REGISTRY.counter("rabbitmq_published_messages_total", "Messages published, by exchange and outcome",
+                                      ("exchange", "outcome"))
 
-logger = logging.getLogger(__name__)
+
+logger = get_logger(__name__)
 
 
 class ProductsBulkProducer:
+    """
+    Publishes bulk products messages. The connection and channel are opened once and
+    shared by every upload, and reopened if the broker closes them.
+    """
+    _connection = None
+    _channel = None
+    _lock = threading.Lock()
 
-    @staticmethod
-    def produce(message):
-        connection = pika.BlockingConnection(
-            pika.ConnectionParameters(
-                host=RABBITMQ_HOST,
-                port=RABBITMQ_PORT,
-                credentials=pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASSWORD)
-            )
-        )
-        channel = connection.channel()
-        channel.queue_declare(queue='create_multiple_products_queue', durable=True)
+    @classmethod
+    def produce(cls, message):
+        """
+        Publishes a message to the create multiple products exchange.
+        :param message: The message to publish.
+        """
+        body = json.dumps(message)
+        with cls._lock:
+            try:
+                try:
+                    cls._publish(body)
+                except pika.exceptions.AMQPError as e:
+                    # The shared connection was dropped, retry once on a new one
+                    logger.warning("Publishing failed, reconnecting to RabbitMQ: %s", e)
+                    cls._reset()
+                    cls._publish(body)
+            except Exception:
+                PUBLISHED_MESSAGES.inc(exchange=EXCHANGE, outcome="failed")
+                raise
+        PUBLISHED_MESSAGES.inc(exchange=EXCHANGE, outcome="published")
+        logger.info('<< Message sent to queue')
+
+    @classmethod
+    def produce_batch(cls, import_id: str, sequence: int, products: list[dict], last: bool):
+        """
+        Publishes a batch of products of a bulk import.
+        :param import_id: ID shared by every batch of the import.
+        :param sequence: Sequence number of the batch, starting at 0.
+        :param products: Products of the batch.
+        :param last: True if the batch is the last one of the import.
+        """
+        cls.produce({
+            "importId": import_id,
+            "sequence": sequence,
+            "last": last,
+            "products": products
+        })
+
+    @classmethod
+    def close(cls):
+        """
+        Closes the shared connection.
+        """
+        with cls._lock:
+            cls._reset()
+
+    @classmethod
+    def _publish(cls, body):
+        channel = cls._get_channel()
         channel.basic_publish(
-            exchange='create_multiple_products_exchange',
-            routing_key='create_multiple_products_routing_key',
-            body=json.dumps(message),
+            exchange=EXCHANGE,
+            routing_key=ROUTING_KEY,
+            body=body,
             properties=pika.BasicProperties(
                 delivery_mode=2
             )
         )
-        connection.close()
-        logger.info('<< Message sent to queue')
+
+    @classmethod
+    def _get_channel(cls):
+        if cls._connection is None or not cls._connection.is_open or cls._channel is None or not cls._channel.is_open:
+            cls._reset()
+            cls._connection = pika.BlockingConnection(
+                pika.ConnectionParameters(
+                    host=RABBITMQ_HOST,
+                    port=RABBITMQ_PORT,
+                    credentials=pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASSWORD)
+                )
+            )
+            cls._channel = cls._connection.channel()
+            cls._channel.queue_declare(queue=QUEUE, durable=True)
+        return cls._channel
+
+    @classmethod
+    def _reset(cls):
+        connection = cls._connection
+        cls._connection = None
+        cls._channel = None
+        if connection is not None:
+            try:
+                if connection.is_open:
+                    connection.close()
+            except pika.exceptions.AMQPError:
+                pass
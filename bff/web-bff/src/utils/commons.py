@@ -48,3 +48,33 @@ def validate_token(f):
         return f(*args, **kwargs)
 
     return decorated_function
+
+
+def conditional_response(data, status_code):
+    """
+    Builds the response of a cacheable GET. Successful responses are tagged with the ETag
+    of their body and answered with a 304 when the client already has them (If-None-Match).
+    """
+    response = jsonify(data)
+    response.status_code = status_code
+    if status_code == 200:
+        response.add_etag()
+        response = response.make_conditional(request)
+    return response
+
+
+def page_params():
+    """
+    Pagination params (limit and cursor) of the request, forwarded as they are to the APIs.
+    """
+    return {param: request.args[param] for param in ('limit', 'cursor') if param in request.args}
+
+
+def order_list_params():
+    """
+    Pagination params and view (full or summary) of an order list request, forwarded as they are to the APIs.
+    """
+    params = page_params()
+    if 'view' in request.args:
+        params['view'] = request.args['view']
+    return params
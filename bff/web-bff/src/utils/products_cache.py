@@ -0,0 +1,156 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from .structured_logging import get_logger
+
+ALL_PRODUCTS_KEY = 'products'
+
+logger = get_logger(__name__)
+
+
+def product_key(product_id) -> str:
+    """
+    Key of a single product in the cache.
+    """
+    return f"product:{product_id}"
+
+
+def products_key(params=None) -> str:
+    """
+    Key of a page of the products listing, the whole listing when there are no params.
+    """
+    if not params:
+        return ALL_PRODUCTS_KEY
+    return f"{ALL_PRODUCTS_KEY}?{urlencode(sorted(params.items()))}"
+
+
+class ProductsCache:
+    """
+    Bounded in-process LRU of the products API responses, shared by every request of the process.
+    Entries expire after a TTL and keep the ETag of the response, so a stale entry is revalidated
+    with If-None-Match instead of being downloaded again.
+    Cached responses are only served to tokens the products API accepted in the last TTL.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: int = 60):
+        """
+        :param max_size: Maximum number of responses kept in memory.
+        :param ttl: Seconds a response (and an accepted token) is served without asking the products API.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, etag, data)
+        self._tokens = OrderedDict()  # jwt -> expires_at
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        """
+        Gets a cached response.
+        :param key: Key of the response.
+        :return: Tuple of (data, etag, fresh), None if the response is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            expires_at, etag, data = entry
+            fresh = expires_at > time.monotonic()
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return data, etag, fresh
+
+    def put(self, key: str, data, etag: str = None) -> None:
+        """
+        Caches a response for a full TTL.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, etag, data)
+            self._entries.move_to_end(key)
+            self._evict(self._entries)
+
+    def invalidate(self, keys=None) -> None:
+        """
+        Drops cached responses.
+        :param keys: Keys to drop, every response is dropped when None.
+        """
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+                return
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Drops the cached responses whose key starts with a prefix.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def invalidate_products(self, product_ids=None) -> None:
+        """
+        Drops every page of the listing and the given products.
+        :param product_ids: IDs of the changed products, every product is dropped when None.
+        """
+        if product_ids is None:
+            logger.debug("Invalidating every cached product")
+            self.invalidate()
+            return
+
+        logger.debug("Invalidating the products listing and %d cached products", len(product_ids))
+        self.invalidate([ALL_PRODUCTS_KEY] + [product_key(product_id) for product_id in product_ids])
+        self.invalidate_prefix(f"{ALL_PRODUCTS_KEY}?")
+
+    def authorize(self, jwt: str) -> None:
+        """
+        Registers a token accepted by the products API.
+        """
+        with self._lock:
+            self._tokens[jwt] = time.monotonic() + self.ttl
+            self._tokens.move_to_end(jwt)
+            self._evict(self._tokens)
+
+    def is_authorized(self, jwt: str) -> bool:
+        """
+        Checks if a token was accepted by the products API in the last TTL.
+        """
+        with self._lock:
+            expires_at = self._tokens.get(jwt)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._tokens[jwt]
+                return False
+            return True
+
+    def stats(self) -> dict:
+        """
+        Returns the cache usage counters.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "tokens": len(self._tokens),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def _evict(self, entries: OrderedDict) -> None:
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+
+products_cache = ProductsCache(
+    max_size=int(os.getenv('PRODUCTS_CACHE_SIZE', '1024')),
+    ttl=int(os.getenv('PRODUCTS_CACHE_TTL', '60'))
+)
@@ -24,7 +24,8 @@ class TestOrdersAdapter(unittest.TestCase):
         # Assert
         mock_get.assert_called_once_with(
             "http://localhost:5100/api/v1/orders",
-            headers={'Authorization': 'Bearer test_jwt_token'}
+            headers={'Authorization': 'Bearer test_jwt_token'},
+            params=None
         )
         self.assertEqual(result, {"orders": [{"id": 1}, {"id": 2}]})
         self.assertEqual(status_code, 200)
@@ -89,8 +90,8 @@ class TestOrdersAdapter(unittest.TestCase):
         mock_products_adapter_class.return_value = mock_products_adapter
 
         # Mock product data returned by the product adapter
-        mock_products_adapter.get_product_by_id.return_value = (
-            {"id": 101, "name": "Test Product"},
+        mock_products_adapter.get_products_by_ids.return_value = (
+            {"101": {"id": 101, "name": "Test Product"}, "102": {"id": 102, "name": "Test Product"}},
             200
         )
 
@@ -106,10 +107,8 @@ class TestOrdersAdapter(unittest.TestCase):
         result = self.adapter._decorate_order(self.test_jwt, order_data)
 
         # Assert
-        # Check that get_product_by_id was called twice (once for each product)
-        self.assertEqual(mock_products_adapter.get_product_by_id.call_count, 2)
-        mock_products_adapter.get_product_by_id.assert_any_call(self.test_jwt, 101)
-        mock_products_adapter.get_product_by_id.assert_any_call(self.test_jwt, 102)
+        # Check that the products were requested in a single call
+        mock_products_adapter.get_products_by_ids.assert_called_once_with(self.test_jwt, [101, 102])
 
         # Check that the order was decorated with product names
         self.assertEqual(result["orderItems"][0]["productName"], "Test Product")
@@ -129,4 +128,5 @@ class TestOrdersAdapter(unittest.TestCase):
 
         # Assert
         mock_logger.debug.assert_any_call("Listing all orders")
-        mock_logger.debug.assert_any_call("Response received from API: {'orders': []}")
+        mock_logger.debug.assert_any_call("Response received from API", status=200, body={"orders": []})
+        mock_response.json.assert_called_once()
@@ -33,6 +33,75 @@ class TestProductsBulkAdapter(unittest.TestCase):
         # Assert
         self.assertEqual(result["message"], "File successfully uploaded and processed")
         self.assertEqual(result["productsToProcessed"], "2 products")
+        self.assertIsNotNone(result["importId"])
+
+    @patch('pika.BlockingConnection')
+    @patch('src.adapters.products_bulk_adapter.ProductsBulkProducer')
+    def test_process_file_publishes_batches(self, mock_producer_class, mock_connection):
+        # Arrange
+        mock_producer = MagicMock()
+        mock_producer_class.return_value = mock_producer
+        adapter = ProductsBulkAdapter(batch_size=2)
+        rows = "\n".join(f"Product{i},{i}.99,Description" for i in range(5))
+
+        mock_file = MagicMock()
+        mock_file.stream = io.BytesIO(f"name,price,description\n{rows}".encode('utf-8'))
+
+        # Act
+        result = adapter.process_file(mock_file)
+
+        # Assert
+        calls = mock_producer.produce_batch.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual({c[0][0] for c in calls}, {result["importId"]})
+        self.assertEqual([c[0][1] for c in calls], [0, 1, 2])
+        self.assertEqual([len(c[0][2]) for c in calls], [2, 2, 1])
+        self.assertEqual([c[1]["last"] for c in calls], [False, False, True])
+        self.assertEqual(calls[0][0][2][0], {"name": "Product0", "price": "0.99", "description": "Description"})
+        self.assertEqual(result["productsToProcessed"], "5 products")
+
+    @patch('pika.BlockingConnection')
+    @patch('src.adapters.products_bulk_adapter.ProductsAdapter')
+    @patch('src.adapters.products_bulk_adapter.ProductsBulkProducer')
+    def test_process_file_starts_the_import(self, mock_producer_class, mock_products_adapter_class, mock_connection):
+        # Arrange
+        mock_producer = MagicMock()
+        mock_producer_class.return_value = mock_producer
+        mock_products_adapter_class.return_value.start_product_import.return_value = (
+            {"id": "import-1", "status": "PENDING"}, 201)
+        adapter = ProductsBulkAdapter(batch_size=1)
+
+        mock_file = MagicMock()
+        mock_file.stream = io.BytesIO(self.csv_content.encode('utf-8'))
+
+        # Act
+        result = adapter.process_file(mock_file, "jwt")
+
+        # Assert
+        mock_products_adapter_class.return_value.start_product_import.assert_called_once_with("jwt")
+        self.assertEqual(result["importId"], "import-1")
+        self.assertEqual({c[0][0] for c in mock_producer.produce_batch.call_args_list}, {"import-1"})
+
+    @patch('pika.BlockingConnection')
+    @patch('src.adapters.products_bulk_adapter.ProductsAdapter')
+    @patch('src.adapters.products_bulk_adapter.ProductsBulkProducer')
+    def test_process_file_import_not_started(self, mock_producer_class, mock_products_adapter_class,
+                                             mock_connection):
+        # Arrange
+        mock_producer = MagicMock()
+        mock_producer_class.return_value = mock_producer
+        mock_products_adapter_class.return_value.start_product_import.side_effect = Exception("Unavailable")
+        adapter = ProductsBulkAdapter()
+
+        mock_file = MagicMock()
+        mock_file.stream = io.BytesIO(self.csv_content.encode('utf-8'))
+
+        # Act
+        result = adapter.process_file(mock_file, "jwt")
+
+        # Assert
+        self.assertIsNotNone(result["importId"])
+        mock_producer.produce_batch.assert_called_once()
 
     @patch('pika.BlockingConnection')
     @patch('src.adapters.products_bulk_adapter.ProductsBulkProducer')
@@ -74,6 +143,7 @@ class TestProductsBulkAdapter(unittest.TestCase):
         self.assertEqual(result["message"], "File successfully uploaded and processed")
         self.assertEqual(result["productsToProcessed"], "0 products")
         mock_producer.produce.assert_not_called()
+        mock_producer.produce_batch.assert_not_called()
 
     @patch('pika.BlockingConnection')
     @patch('src.adapters.products_bulk_adapter.ProductsBulkProducer')
@@ -113,10 +113,10 @@ class TestReportsAdapter(unittest.TestCase):
         # Mock products adapter
         mock_products_adapter = MagicMock()
         mock_products_adapter_class.return_value = mock_products_adapter
-        mock_products_adapter.get_product_by_id.side_effect = [
-            ({"id": "prod1", "name": "Product 1"}, 200),
-            ({"id": "prod2", "name": "Product 2"}, 200)
-        ]
+        mock_products_adapter.get_products_by_ids.return_value = (
+            {"prod1": {"id": "prod1", "name": "Product 1"}, "prod2": {"id": "prod2", "name": "Product 2"}},
+            200
+        )
 
         # Act
         result, status_code = self.adapter.generate_report(self.test_jwt, report_data)
@@ -127,9 +127,7 @@ class TestReportsAdapter(unittest.TestCase):
             headers={'Authorization': f'Bearer {self.test_jwt}'},
             json=report_data
         )
-        self.assertEqual(mock_products_adapter.get_product_by_id.call_count, 2)
-        mock_products_adapter.get_product_by_id.assert_any_call(self.test_jwt, "prod1")
-        mock_products_adapter.get_product_by_id.assert_any_call(self.test_jwt, "prod2")
+        mock_products_adapter.get_products_by_ids.assert_called_once_with(self.test_jwt, ["prod1", "prod2"])
         self.assertEqual(result, expected_decorated_response)
         self.assertEqual(status_code, 200)
 
@@ -75,7 +75,7 @@ def test_get_all_manufacturers_success(client, mock_token):
         # Assert
         assert response.status_code == 200
         assert json.loads(response.data) == expected_response
-        mock_adapter_instance.get_all_manufacturers.assert_called_once_with(mock_token)
+        mock_adapter_instance.get_all_manufacturers.assert_called_once_with(mock_token, {})
 
 
 def test_get_manufacturer_by_id_success(client, mock_token, mock_manufacturer_data):
@@ -31,7 +31,36 @@ class TestOrdersBlueprint(unittest.TestCase):
         # Assert
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json, {"orders": [{"id": 1}, {"id": 2}]})
-        mock_adapter.list_orders.assert_called_once_with(self.test_jwt)
+        mock_adapter.list_orders.assert_called_once_with(self.test_jwt, {})
+
+    @patch('src.blueprints.orders_blueprint.OrdersAdapter')
+    def test_get_orders_page_forwards_pagination(self, mock_adapter_class):
+        # Arrange
+        mock_adapter = MagicMock()
+        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.list_orders.return_value = ({"items": [{"id": 1}], "nextCursor": "next"}, 200)
+
+        # Act
+        response = self.client.get('/bff/v1/web/orders?limit=1&cursor=abc&other=1', headers=self.auth_header)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["nextCursor"], "next")
+        mock_adapter.list_orders.assert_called_once_with(self.test_jwt, {"limit": "1", "cursor": "abc"})
+
+    @patch('src.blueprints.orders_blueprint.OrdersAdapter')
+    def test_get_orders_summary_forwards_view(self, mock_adapter_class):
+        # Arrange
+        mock_adapter = MagicMock()
+        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.list_orders.return_value = ([{"id": 1, "status": "OK"}], 200)
+
+        # Act
+        response = self.client.get('/bff/v1/web/orders?view=summary', headers=self.auth_header)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        mock_adapter.list_orders.assert_called_once_with(self.test_jwt, {"view": "summary"})
 
     def test_get_all_orders_missing_token(self):
         # Act
@@ -100,7 +129,7 @@ class TestOrdersBlueprint(unittest.TestCase):
 
         # Assert
         self.assertEqual(response.status_code, 200)
-        mock_adapter.list_orders.assert_called_once_with(self.test_jwt)
+        mock_adapter.list_orders.assert_called_once_with(self.test_jwt, {})
 
     @patch('src.blueprints.orders_blueprint.logger')
     @patch('src.blueprints.orders_blueprint.OrdersAdapter')
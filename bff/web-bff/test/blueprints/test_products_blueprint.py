@@ -75,7 +75,7 @@ def test_get_all_products_success(client, mock_token):
         # Assert
         assert response.status_code == 200
         assert json.loads(response.data) == expected_products
-        mock_adapter_instance.get_all_products.assert_called_once_with(mock_token)
+        mock_adapter_instance.get_all_products.assert_called_once_with(mock_token, {})
 
 
 def test_get_all_products_unauthorized(client):
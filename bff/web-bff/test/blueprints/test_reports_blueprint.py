@@ -175,4 +175,42 @@ class TestReportsBlueprint:
 
         # Assert
         assert response.status_code == 200
-        mock_adapter.get_report_by_user_id.assert_called_once_with('raw_token_without_bearer', user_id)
\ No newline at end of file
+        mock_adapter.get_report_by_user_id.assert_called_once_with('raw_token_without_bearer', user_id)
+    @patch('src.blueprints.reports_blueprint.ReportsAdapter')
+    def test_request_report_job_success(self, mock_adapter_class, client):
+        # Arrange
+        request_data = {"userId": "user123", "type": "VENTAS_POR_MES"}
+        expected_response = {"jobId": "job-1", "status": "PENDIENTE"}
+
+        mock_adapter = MagicMock()
+        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.request_report_job.return_value = (expected_response, 202)
+
+        # Act
+        response = client.post(
+            '/bff/v1/web/reports/jobs',
+            headers={'Authorization': 'Bearer test_token'},
+            json=request_data
+        )
+
+        # Assert
+        assert response.status_code == 202
+        assert json.loads(response.data) == expected_response
+        mock_adapter.request_report_job.assert_called_once_with('test_token', request_data)
+
+    @patch('src.blueprints.reports_blueprint.ReportsAdapter')
+    def test_get_report_job_success(self, mock_adapter_class, client):
+        # Arrange
+        expected_response = {"jobId": "job-1", "status": "COMPLETADO", "url": "report_url"}
+
+        mock_adapter = MagicMock()
+        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.get_report_job.return_value = (expected_response, 200)
+
+        # Act
+        response = client.get('/bff/v1/web/reports/jobs/job-1', headers={'Authorization': 'Bearer test_token'})
+
+        # Assert
+        assert response.status_code == 200
+        assert json.loads(response.data) == expected_response
+        mock_adapter.get_report_job.assert_called_once_with('test_token', 'job-1')
@@ -2,11 +2,22 @@ import json
 import unittest
 from unittest.mock import patch, MagicMock
 
+import pika
+
 from src.messaging.producer.products_bulk_producer import ProductsBulkProducer
 
 
 class TestProductsBulkProducer(unittest.TestCase):
 
+    def setUp(self):
+        # The connection is shared between calls, every test starts without one
+        ProductsBulkProducer._connection = None
+        ProductsBulkProducer._channel = None
+
+    def tearDown(self):
+        ProductsBulkProducer._connection = None
+        ProductsBulkProducer._channel = None
+
     @patch('src.messaging.producer.products_bulk_producer.pika.BlockingConnection')
     def test_produce_message_successfully(self, mock_connection):
         # Arrange
@@ -28,8 +39,55 @@ class TestProductsBulkProducer(unittest.TestCase):
         self.assertEqual(call_args['routing_key'], 'create_multiple_products_routing_key')
         self.assertEqual(call_args['body'], json.dumps(test_message))
 
-        # Verify connection was closed
-        mock_connection.return_value.close.assert_called_once()
+        # Verify connection is kept open for the next messages
+        mock_connection.return_value.close.assert_not_called()
+
+    @patch('src.messaging.producer.products_bulk_producer.pika.BlockingConnection')
+    def test_produce_reuses_channel(self, mock_connection):
+        # Arrange
+        mock_channel = MagicMock()
+        mock_connection.return_value.channel.return_value = mock_channel
+
+        # Act
+        ProductsBulkProducer.produce({"products": []})
+        ProductsBulkProducer.produce({"products": []})
+
+        # Assert
+        mock_connection.assert_called_once()
+        mock_channel.queue_declare.assert_called_once()
+        self.assertEqual(mock_channel.basic_publish.call_count, 2)
+
+    @patch('src.messaging.producer.products_bulk_producer.pika.BlockingConnection')
+    def test_produce_reconnects_when_connection_fails(self, mock_connection):
+        # Arrange
+        broken_channel = MagicMock()
+        broken_channel.basic_publish.side_effect = pika.exceptions.AMQPConnectionError("closed")
+        new_channel = MagicMock()
+        first_connection, second_connection = MagicMock(), MagicMock()
+        first_connection.channel.return_value = broken_channel
+        second_connection.channel.return_value = new_channel
+        mock_connection.side_effect = [first_connection, second_connection]
+
+        # Act
+        ProductsBulkProducer.produce({"products": []})
+
+        # Assert
+        self.assertEqual(mock_connection.call_count, 2)
+        new_channel.basic_publish.assert_called_once()
+
+    @patch('src.messaging.producer.products_bulk_producer.pika.BlockingConnection')
+    def test_produce_batch(self, mock_connection):
+        # Arrange
+        mock_channel = MagicMock()
+        mock_connection.return_value.channel.return_value = mock_channel
+        products = [{"name": "Test Product"}]
+
+        # Act
+        ProductsBulkProducer.produce_batch("import-1", 2, products, last=True)
+
+        # Assert
+        body = json.loads(mock_channel.basic_publish.call_args[1]['body'])
+        self.assertEqual(body, {"importId": "import-1", "sequence": 2, "last": True, "products": products})
 
     @patch('src.messaging.producer.products_bulk_producer.pika.BlockingConnection')
     @patch('src.messaging.producer.products_bulk_producer.logger')
@@ -59,4 +117,4 @@ class TestProductsBulkProducer(unittest.TestCase):
         # Verify that ConnectionParameters was called with the right environment variables
         connection_params_call = mock_connection.call_args[0][0]
         self.assertEqual(connection_params_call.host, 'localhost')
-        self.assertEqual(connection_params_call.port, 5672)
\ No newline at end of file
+        self.assertEqual(connection_params_call.port, 5672)
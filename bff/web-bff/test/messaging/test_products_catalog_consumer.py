@@ -0,0 +1,83 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from src.messaging.consumer.products_catalog_consumer import ProductsCatalogConsumer
+from src.utils.products_cache import ProductsCache, ALL_PRODUCTS_KEY, product_key
+
+
+class TestProductsCatalogConsumer(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ProductsCache(max_size=10, ttl=60)
+        self.cache.put(ALL_PRODUCTS_KEY, [{"id": "1"}, {"id": "2"}])
+        self.cache.put(product_key("1"), {"id": "1"})
+        self.cache.put(product_key("2"), {"id": "2"})
+        self.consumer = ProductsCatalogConsumer(self.cache)
+
+    def test_stock_updated_invalidates_listing_and_products(self):
+        # Act
+        self.consumer.process_message({"event": "STOCK_UPDATED", "productIds": ["1"]})
+
+        # Assert
+        self.assertIsNone(self.cache.get(ALL_PRODUCTS_KEY))
+        self.assertIsNone(self.cache.get(product_key("1")))
+        self.assertIsNotNone(self.cache.get(product_key("2")))
+
+    def test_products_created_only_invalidates_listing(self):
+        # Act
+        self.consumer.process_message({"event": "PRODUCTS_CREATED", "productIds": []})
+
+        # Assert
+        self.assertIsNone(self.cache.get(ALL_PRODUCTS_KEY))
+        self.assertIsNotNone(self.cache.get(product_key("1")))
+
+    def test_invalid_message_clears_cache(self):
+        # Act
+        self.consumer._on_message(MagicMock(), MagicMock(), MagicMock(), b"not json")
+
+        # Assert
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_message_body_is_decoded(self):
+        # Act
+        self.consumer._on_message(MagicMock(), MagicMock(), MagicMock(),
+                                  json.dumps({"event": "STOCK_UPDATED", "productIds": ["2"]}).encode())
+
+        # Assert
+        self.assertIsNone(self.cache.get(product_key("2")))
+        self.assertIsNotNone(self.cache.get(product_key("1")))
+
+
+class TestProductsCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        # Arrange
+        cache = ProductsCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.put("c", 3)
+
+        # Assert
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a")[0], 1)
+
+    def test_expired_entry_is_stale(self):
+        # Arrange
+        cache = ProductsCache(max_size=2, ttl=0)
+        cache.put("a", 1, '"v1"')
+
+        # Act
+        data, etag, fresh = cache.get("a")
+
+        # Assert
+        self.assertEqual((data, etag, fresh), (1, '"v1"', False))
+        cache.authorize("jwt")
+        self.assertFalse(cache.is_authorized("jwt"))
+
+
+if __name__ == '__main__':
+    unittest.main()
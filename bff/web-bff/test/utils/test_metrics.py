@@ -0,0 +1,78 @@
+import unittest
+
+from flask import Flask
+
+from src.utils.metrics import Registry, init_metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_counter_is_rendered_by_labels(self):
+        registry = Registry()
+        counter = registry.counter('orders_total', 'Orders', ('outcome',))
+
+        counter.inc(outcome='created')
+        counter.inc(2, outcome='created')
+        counter.inc(outcome='failed')
+
+        body = registry.render()
+        self.assertIn('# TYPE orders_total counter', body)
+        self.assertIn('orders_total{outcome="created"} 3', body)
+        self.assertIn('orders_total{outcome="failed"} 1', body)
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = Registry()
+        histogram = registry.histogram('latency_seconds', 'Latency', buckets=(0.1, 1))
+
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        body = registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', body)
+        self.assertIn('latency_seconds_bucket{le="1"} 2', body)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', body)
+        self.assertIn('latency_seconds_sum 3.55', body)
+        self.assertIn('latency_seconds_count 3', body)
+
+    def test_collector_is_read_when_rendered_and_can_be_replaced(self):
+        registry = Registry()
+        values = {'backlog': 1}
+        registry.collector('backlog_messages', 'gauge', 'Backlog', lambda: [({'queue': 'q'}, values['backlog'])])
+        values['backlog'] = 4
+
+        self.assertIn('backlog_messages{queue="q"} 4', registry.render())
+
+        registry.collector('backlog_messages', 'gauge', 'Backlog', lambda: [({'queue': 'q'}, 7)])
+        self.assertIn('backlog_messages{queue="q"} 7', registry.render())
+
+    def test_failing_collector_does_not_break_the_others(self):
+        registry = Registry()
+        registry.collector('broken', 'gauge', 'Broken', lambda: 1 / 0)
+        registry.counter('working_total', 'Working').inc()
+
+        body = registry.render()
+        self.assertIn('# broken unavailable', body)
+        self.assertIn('working_total 1', body)
+
+    def test_requests_are_measured_and_served(self):
+        app = Flask(__name__)
+        app.add_url_rule('/items/<item_id>', 'item', lambda item_id: 'ok')
+        self.assertTrue(init_metrics(app, environ={}))
+
+        client = app.test_client()
+        client.get('/items/1')
+        response = client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('route="/items/<item_id>"', response.get_data(as_text=True))
+
+    def test_metrics_can_be_disabled(self):
+        app = Flask(__name__)
+
+        self.assertFalse(init_metrics(app, environ={'METRICS_ENABLED': 'false'}))
+        self.assertEqual(app.test_client().get('/metrics').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
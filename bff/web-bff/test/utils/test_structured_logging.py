@@ -0,0 +1,83 @@
+import io
+import json
+import logging
+import unittest
+
+from src.utils.structured_logging import Redactor, Sampler, configure_logging, get_logger
+
+
+class TestStructuredLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.root_handlers = logging.getLogger().handlers[:]
+        self.root_level = logging.getLogger().level
+        self.stream = io.StringIO()
+        self.logger = get_logger('test.structured_logging')
+
+    def tearDown(self):
+        # Drop the sampling rates and give the root logger its handlers back
+        configure_logging(stream=io.StringIO(), environ={})
+        root = logging.getLogger()
+        root.handlers[:] = self.root_handlers
+        root.setLevel(self.root_level)
+
+    def records(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_fields_are_written_as_json_and_redacted(self):
+        configure_logging('web-bff', self.stream, {'LOG_LEVEL': 'DEBUG'})
+
+        self.logger.debug("Order %s received", "1", order={"cardNumber": "4111111111111111", "cvv": "123",
+                                                           "items": [{"securityCode": "1"}], "total": 10})
+
+        record, = self.records()
+        self.assertEqual(record["message"], "Order 1 received")
+        self.assertEqual(record["service"], "web-bff")
+        self.assertEqual(record["fields"]["order"], {"cardNumber": "***", "cvv": "***",
+                                                     "items": [{"securityCode": "***"}], "total": 10})
+
+    def test_payloads_are_not_evaluated_below_the_level(self):
+        configure_logging(stream=self.stream, environ={'LOG_LEVEL': 'INFO'})
+        calls = []
+
+        self.logger.debug("Response received", body=lambda: calls.append(1))
+        self.logger.info("Response received", body=lambda: calls.append(1) or {"id": 1})
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([record["fields"]["body"] for record in self.records()], [{"id": 1}])
+
+    def test_records_are_sampled_per_logger(self):
+        configure_logging(stream=self.stream, environ={'LOG_LEVEL': 'DEBUG', 'LOG_SAMPLE_RATES': 'test=0.25'})
+
+        for i in range(8):
+            self.logger.debug("record %s", i)
+            logging.getLogger('test.plain').info("plain %s", i)
+        self.logger.warning("always kept")
+
+        messages = [record["message"] for record in self.records()]
+        self.assertEqual(messages, ["record 0", "plain 0", "record 4", "plain 4", "always kept"])
+
+    def test_text_format_redacts_messages(self):
+        configure_logging(stream=self.stream, environ={'LOG_LEVEL': 'DEBUG', 'LOG_FORMAT': 'text'})
+
+        logging.getLogger('test.plain').debug("payload {'cardNumber': '4111111111111111', 'cvv': 123}")
+
+        line = self.stream.getvalue()
+        self.assertIn("'cardNumber': '***'", line)
+        self.assertIn("'cvv': ***", line)
+        self.assertNotIn("4111", line)
+
+    def test_sampler_rate_of_closest_ancestor(self):
+        sampler = Sampler({'src': 1, 'src.adapters': 0.5, 'src.adapters.noisy': 0})
+
+        self.assertEqual([sampler.keep('src.adapters.orders', logging.DEBUG) for _ in range(4)],
+                         [True, False, True, False])
+        self.assertFalse(sampler.keep('src.adapters.noisy', logging.INFO))
+        self.assertTrue(sampler.keep('src.adapters.noisy', logging.ERROR))
+        self.assertTrue(sampler.keep('src.blueprints', logging.DEBUG))
+
+    def test_redactor_matches_field_names_loosely(self):
+        redactor = Redactor()
+
+        self.assertEqual(redactor.redact({"card_number": "1", "CVV": "2", "name": "x"}),
+                         {"card_number": "***", "CVV": "***", "name": "x"})
@@ -0,0 +1,110 @@
+"""
+Benchmark of the whole checkout, run locally: mobile-bff create_order, clientes-api CreateOrder and the relay
+of its outbox, then pedidos-api and productos-api processing the messages relayed by clientes-api.
+
+Each stage runs in its own service, from the root of the service with the interpreter running this script, so
+the dependencies of every service must be installed in it. The messages of clientes-api go through a file to the
+benchmarks of pedidos-api and productos-api. The reports of the services are merged into a single report, and
+compared with a previous one given as --baseline: the command fails when a stage got slower.
+
+PostgreSQL databases, e.g. those of local_postgres_db, can replace the SQLite stand-ins of the APIs:
+    python deployment/local_development/checkout_benchmark.py --orders 1000 --concurrency 16 \\
+        --clientes-database-url postgresql://... --output checkout.json --baseline previous-checkout.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from shared.benchmark_runner import DEFAULT_TOLERANCE, compare, environment, write_report  # noqa: E402
+
+COLUMNS = ("operations", "failures", "p50Ms", "p95Ms", "p99Ms", "throughputPerSecond")
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--number", type=int, default=1000, help="Calls per round of the micro-benchmarks")
+    parser.add_argument("--payment-delay", type=float, default=0)
+    for service in ("clientes", "pedidos", "productos"):
+        parser.add_argument(f"--{service}-database-url",
+                            help=f"Database of {service}-api, a new SQLite file by default")
+    parser.add_argument("--output", help="File to write the merged report to")
+    parser.add_argument("--baseline", help="Report of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown, as a fraction of the baseline")
+    return parser.parse_args(argv)
+
+
+def run(service: str, module: str, arguments: list, directory: Path) -> dict:
+    output = directory / f"{Path(service).name}.json"
+    command = [sys.executable, "-m", module, *arguments, "--output", str(output)]
+    print(f"Running {service}: {' '.join(command[2:])}", file=sys.stderr)
+    subprocess.run(command, cwd=ROOT / service, check=True)
+    return json.loads(output.read_text())
+
+
+def print_table(merged: dict) -> None:
+    print(f"{'stage':40}" + "".join(f"{column:>20}" for column in COLUMNS))
+    for name, stage in merged["stages"].items():
+        print(f"{name:40}" + "".join(f"{str(stage.get(column)):>20}" for column in COLUMNS))
+    print(f"\n{'micro-benchmark':40}{'bestUs':>20}{'medianUs':>20}")
+    for name, result in merged["micro"].items():
+        print(f"{name:40}{result['bestUs']:>20}{result['medianUs']:>20}")
+
+
+def main(argv=None) -> int:
+    arguments = parse_arguments(argv)
+    directory = Path(tempfile.mkdtemp(prefix="checkout-benchmark-"))
+    messages = directory / "messages.json"
+
+    common = ["--concurrency", str(arguments.concurrency), "--warmup", str(arguments.warmup),
+              "--seed", str(arguments.seed), "--number", str(arguments.number)]
+    orders = ["--orders", str(arguments.orders), "--lines", str(arguments.lines),
+              "--products", str(arguments.products)]
+
+    def database(service):
+        url = getattr(arguments, f"{service}_database_url")
+        return ["--database-url", url] if url else []
+
+    reports = [
+        run("bff/mobile-bff", "test.benchmark.create_order_benchmark", common + orders, directory),
+        run("api/clientes-api", "test.benchmark.checkout_benchmark",
+            common + orders + database("clientes") + ["--payment-delay", str(arguments.payment_delay),
+                                          "--messages-out", str(messages)], directory),
+        run("api/pedidos-api", "test.benchmark.orders_message_benchmark",
+            common + database("pedidos") + ["--messages", str(messages)], directory),
+        run("api/productos-api", "test.benchmark.stock_update_benchmark",
+            common + database("productos") + ["--messages", str(messages)], directory),
+    ]
+
+    merged = {
+        "parameters": {report["service"]: report["parameters"] for report in reports},
+        "environment": environment(),
+        "stages": {name: stage for report in reports for name, stage in report["stages"].items()},
+        "micro": {name: result for report in reports for name, result in report["micro"].items()},
+    }
+    if arguments.output:
+        write_report(merged, arguments.output)
+    print_table(merged)
+
+    if arguments.baseline:
+        regressions = compare(merged, json.loads(Path(arguments.baseline).read_text()), arguments.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())